@@ -101,6 +101,7 @@ from src.controllers.timer_controller import TimerController
 from src.controllers.settings_controller import SettingsController
 from src.views.main_window import MainWindow
 from src.utils.resources import get_icon, apply_stylesheet, get_system_theme
+from src.utils.persistence import get_persistence_service
 
 def _select_meeting_by_day(controller, main_window):
     """Select the appropriate meeting based on day of week"""
@@ -197,6 +198,18 @@ def _run_startup_cleanup(controller, main_window):
         date_str = meeting.date.strftime("%Y-%m-%d")
         filename = f"{meeting.meeting_type.value}_{date_str}_{meeting.language}.json"
         active_files.add(filename)
+    # Keep the meeting a crashed session can be recovered from
+    recovery_file = main_window.timer_controller.session_manager.recovery_meeting_file()
+    if recovery_file:
+        active_files.add(recovery_file)
+
+    # Cache files of the upcoming issues in the current language
+    try:
+        from src.utils.epub_scraper import EPUBMeetingScraper
+        protected_cache_files = EPUBMeetingScraper(settings.language).files_in_use()
+    except Exception as e:
+        logging.getLogger("OnTime").warning("Could not list cache files in use: %s", e)
+        protected_cache_files = set()
 
     # Resolve cache dir (same path used by epub_scraper and scraper)
     try:
@@ -213,9 +226,21 @@ def _run_startup_cleanup(controller, main_window):
         cache_dir=cache_dir,
         retention_days=settings.data_cleanup.retention_days,
         active_meeting_files=active_files,
-        parent=main_window
+        parent=main_window,
+        meeting_index=controller.meeting_index,
+        cache_budget_bytes=settings.data_cleanup.cache_budget_mb * 1024 * 1024,
+        protected_cache_files=protected_cache_files,
+        meeting_db_path=controller.meeting_store.db_path if controller.meeting_store else None
     )
 
+    # Quitting stops the run between two files; the next start goes on
+    def stop_cleanup():
+        worker.requestInterruption()
+        worker.wait()
+
+    app = QApplication.instance()
+    app.aboutToQuit.connect(stop_cleanup)
+
     def on_cleanup_finished(result):
         # Defer UI updates to the next event-loop iteration so they never
         # overlap with a Windows COM synchronous call (0x8001010d crash).
@@ -233,15 +258,58 @@ def _run_startup_cleanup(controller, main_window):
                     icon="toast-info"
                 )
         QTimer.singleShot(0, _show)
+        app.aboutToQuit.disconnect(stop_cleanup)
         worker.deleteLater()
 
     worker.finished.connect(on_cleanup_finished, Qt.ConnectionType.QueuedConnection)
     worker.start()
 
 
+def _start_issue_prefetch(controller, main_window):
+    """Prepare upcoming workbook and Watchtower issues in the background while idle."""
+    from src.models.settings import MeetingSourceMode
+    from src.models.timer import TimerState
+    from src.utils.issue_prefetch import IssuePrefetchScheduler
+
+    source = controller.settings_manager.settings.meeting_source
+    if source.mode != MeetingSourceMode.WEB_SCRAPING or not source.auto_update_meetings:
+        return None
+
+    scheduler = IssuePrefetchScheduler(
+        language=lambda: controller.settings_manager.settings.language,
+        is_busy=lambda: main_window.timer_controller.timer.state != TimerState.STOPPED,
+        parent=main_window
+    )
+    QApplication.instance().aboutToQuit.connect(scheduler.stop)
+    scheduler.start()
+    return scheduler
+
+
+def _parse_args(argv):
+    """Parse OnTime's own options, leaving the rest for Qt"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="OnTime", add_help=False)
+    parser.add_argument(
+        "--trace", nargs="?", const="", default=None, metavar="FILE",
+        help="Profile the timer hot path and write the result to FILE on exit"
+    )
+    parser.add_argument(
+        "--trace-format", choices=("chrome", "json"), default="chrome",
+        help="Chrome trace events or a JSON summary (default: chrome)"
+    )
+    parser.add_argument(
+        "--stall-threshold", type=int, default=250, metavar="MS",
+        help="Log GUI event-loop stalls longer than MS milliseconds (0 disables the watchdog)"
+    )
+    args, remaining = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + remaining
+
+
 def main():
     """Application entry point"""
     start_time = time.perf_counter()
+    args, qt_argv = _parse_args(sys.argv)
 
     from src.config import USER_DATA_DIR
     from src.utils.helpers import setup_logging, setup_crash_handlers
@@ -252,11 +320,29 @@ def main():
     setup_crash_handlers(log_dir=log_dir)
     logger = logging.getLogger("OnTime")
 
-    app = QApplication(sys.argv)
+    app = QApplication(qt_argv)
     app.setApplicationName("OnTime")
     app.setOrganizationName("OnTime")
     app.setWindowIcon(get_icon("app_icon"))
 
+    # Write any queued settings/meeting saves before the event loop exits
+    app.aboutToQuit.connect(lambda: get_persistence_service().flush())
+
+    # Sample the GUI thread whenever the event loop stalls
+    if args.stall_threshold > 0:
+        from src.utils.stall_watchdog import start_stall_watchdog
+        watchdog = start_stall_watchdog(args.stall_threshold)
+        app.aboutToQuit.connect(watchdog.stop)
+
+    # Tracing patches the hot path classes, so enable it before they are instantiated
+    if args.trace is not None:
+        from src.utils.profiling import get_tracer
+        tracer = get_tracer()
+        tracer.enable()
+        trace_path = Path(args.trace) if args.trace else log_dir / f"ontime-trace-{datetime.now():%Y%m%d-%H%M%S}.json"
+        app.aboutToQuit.connect(lambda: tracer.dump(trace_path, args.trace_format))
+        logger.info("Tracing enabled; %s trace will be written to %s", args.trace_format, trace_path)
+
     from src import __version__
     logger.info("OnTime Meeting Timer v%s starting", __version__)
 
@@ -322,6 +408,9 @@ def main():
     # Run data cleanup in background (non-blocking, off main thread)
     QTimer.singleShot(0, lambda: _run_startup_cleanup(controller, main_window))
 
+    # Prepare the next meeting issues ahead of time (background, when idle)
+    QTimer.singleShot(0, lambda: _start_issue_prefetch(controller, main_window))
+
     sys.exit(app.exec())
     
 if __name__ == "__main__":
@@ -3,21 +3,30 @@ Controller for managing meetings in the OnTime Meeting Timer application.
 """
 import os
 import json
+import logging
 import re
+import sqlite3
 from datetime import datetime, time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QMessageBox
 from PyQt6.QtWidgets import QDialog
 
-from src.models.meeting import Meeting, MeetingType, MeetingSection, MeetingPart, MeetingSource
+from src.models.meeting import Meeting, MeetingType, MeetingSection, MeetingPart
 from src.models.settings import SettingsManager, MeetingSourceMode
 from src.models.meeting_template import MeetingTemplate, TemplateType
+from src.models.meeting_store import MeetingStore
+from src.models.meeting_index import MeetingIndex
+from src.models.meeting_serializer import meeting_to_dict, meeting_from_dict
 from src.utils.epub_scraper import EPUBMeetingScraper
 from src.utils.helpers import safe_json_load, safe_json_save
+from src.utils.part_localization import get_part_translations, localize_part_title
+from src.utils.persistence import get_persistence_service
 from src.views.weekend_song_editor import WeekendSongEditorDialog
 
+logger = logging.getLogger("OnTime.MeetingController")
+
 
 class MeetingController(QObject):
     """Controller for managing meeting data"""
@@ -53,160 +62,50 @@ class MeetingController(QObject):
         
         # Initialize template manager
         self.template_manager = MeetingTemplate()
+        
+        # Metadata index of the meeting JSON files
+        self.meeting_index = MeetingIndex(
+            self.meetings_dir, os.path.join(self.data_dir, "meeting_index.json")
+        )
+        
+        # Meeting history database (None means meetings are stored as JSON files)
+        self.meeting_store: Optional[MeetingStore] = None
+        if self.settings_manager.settings.meeting_source.use_meeting_database:
+            self.meeting_store = self._open_meeting_store()
+    
+    def _open_meeting_store(self) -> Optional[MeetingStore]:
+        """Open the meeting database, importing the JSON meeting files the first time"""
+        try:
+            store = MeetingStore(os.path.join(self.data_dir, "meetings.db"))
+            if not store.json_migrated:
+                # Flush queued JSON saves so the import sees the latest files
+                get_persistence_service().flush()
+                store.import_json_dir(self.meetings_dir)
+            return store
+        except sqlite3.Error as e:
+            logger.error("Could not open meeting database, using JSON files: %s", e)
+            return None
+    
+    def export_meetings_to_json(self, output_dir: str) -> int:
+        """Export the meeting database as JSON files, returning the number written"""
+        if self.meeting_store is None:
+            return 0
+        return self.meeting_store.export_json(output_dir)
     
     def _localize_meeting_parts(self, meeting: Meeting) -> Meeting:
         """Replace pattern-based titles with localized text"""
-        
-        translations = self._get_translations(meeting.language)
-        
+        language = meeting.language
         for section in meeting.sections:
             for part in section.parts:
-                title = part.title
-                
-                # Handle opening song and prayer
-                if title.startswith("OPENING_SONG_PRAYER"):
-                    if "|" in title:
-                        # Format: "OPENING_SONG_PRAYER|99"
-                        song_num = title.split("|")[1]
-                        part.title = f"{translations['song']} {song_num} {translations['and_prayer']}"
-                    else:
-                        # Format: "OPENING_SONG_PRAYER" (no song number)
-                        part.title = f"{translations['opening_song_prayer']}"
-                
-                # Handle middle song
-                elif title.startswith("MIDDLE_SONG"):
-                    if "|" in title:
-                        # Format: "MIDDLE_SONG|99"
-                        song_num = title.split("|")[1]
-                        part.title = f"{translations['song']} {song_num}"
-                    else:
-                        # Format: "MIDDLE_SONG 99" or "MIDDLE_SONG"
-                        song_match = re.search(r'MIDDLE_SONG\s+(\d+)', title)
-                        if song_match:
-                            song_num = song_match.group(1)
-                            part.title = f"{translations['song']} {song_num}"
-                        else:
-                            part.title = translations['song']
-                
-                # Handle closing song and prayer
-                elif title.startswith("CLOSING_SONG_PRAYER"):
-                    if "|" in title:
-                        # Format: "CLOSING_SONG_PRAYER|100"
-                        song_num = title.split("|")[1]
-                        part.title = f"{translations['song']} {song_num} {translations['and_prayer']}"
-                    else:
-                        # Format: "CLOSING_SONG_PRAYER [100" or just "CLOSING_SONG_PRAYER"
-                        song_match = re.search(r'CLOSING_SONG_PRAYER\s*\[?(\d+)', title)
-                        if song_match:
-                            song_num = song_match.group(1)
-                            part.title = f"{translations['song']} {song_num} {translations['and_prayer']}"
-                        else:
-                            part.title = f"{translations['closing_song_prayer']}"
-                
-                # Handle comments
-                elif title == "OPENING_COMMENTS":
-                    part.title = translations['opening_comments']
-                elif title == "CONCLUDING_COMMENTS":
-                    part.title = translations['concluding_comments']
+                title = localize_part_title(language, part.title)
+                if title != part.title:
+                    part.title = title
         
         return meeting
 
-    def _get_translations(self, language: str) -> dict:
-        """Get translations for ANY language (scalable to 20+)"""
-        translations = {
-            "en": {
-                "song": "Song",
-                "and_prayer": "and Prayer",
-                "opening_comments": "Opening Comments",
-                "concluding_comments": "Concluding Comments",
-                "opening_song_prayer": "Opening Song and Prayer",
-                "closing_song_prayer": "Closing Song and Prayer",
-                "service_talk": "Service Talk",
-                "co_talk": "Circuit Overseer Talk"
-            },
-            "it": {
-                "song": "Cantico",
-                "and_prayer": "e preghiera",
-                "opening_comments": "Commenti introduttivi",
-                "concluding_comments": "Commenti conclusivi",
-                "opening_song_prayer": "Cantico iniziale e preghiera",
-                "closing_song_prayer": "Cantico finale e preghiera",
-                "service_talk": "Discorso di servizio",
-                "co_talk": "Discorso del sorvegliante di circoscrizione"
-            },
-            "fr": {
-                "song": "Cantique",
-                "and_prayer": "et prière",
-                "opening_comments": "Paroles d'introduction",
-                "concluding_comments": "Commentaires de conclusion",
-                "opening_song_prayer": "Cantique d'ouverture et prière",
-                "closing_song_prayer": "Cantique de clôture et prière",
-                "service_talk": "Discours de service",
-                "co_talk": "Discours du surveillant de circonscription"
-            },
-            "es": {
-                "song": "Canción",
-                "and_prayer": "y oración",
-                "opening_comments": "Palabras de introducción",
-                "concluding_comments": "Comentarios finales",
-                "opening_song_prayer": "Canción inicial y oración",
-                "closing_song_prayer": "Canción final y oración",
-                "service_talk": "Discurso de servicio",
-                "co_talk": "Discurso del superintendente de circuito"
-            },
-            "de": {
-                "song": "Lied",
-                "and_prayer": "und Gebet",
-                "opening_comments": "Einleitende Worte",
-                "concluding_comments": "Schlussworte",
-                "opening_song_prayer": "Eingangslied und Gebet",
-                "closing_song_prayer": "Schlusslied und Gebet",
-                "service_talk": "Dienstgespräch",
-                "co_talk": "Ansprache des Kreisaufsehers"
-            },
-            "pt": {
-                "song": "Cântico",
-                "and_prayer": "e oração",
-                "opening_comments": "Comentários introdutórios",
-                "concluding_comments": "Comentários finais",
-                "opening_song_prayer": "Cântico inicial e oração",
-                "closing_song_prayer": "Cântico final e oração",
-                "service_talk": "Discurso de serviço",
-                "co_talk": "Discurso do superintendente de circuito"
-            },
-            "ja": {
-                "song": "歌",
-                "and_prayer": "と祈り",
-                "opening_comments": "開会の言葉",
-                "concluding_comments": "結びの言葉",
-                "opening_song_prayer": "開会の歌と祈り",
-                "closing_song_prayer": "閉会の歌と祈り",
-                "service_talk": "奉仕の話",
-                "co_talk": "巡回監督の話"
-            },
-            "ko": {
-                "song": "노래",
-                "and_prayer": "및 기도",
-                "opening_comments": "개회사",
-                "concluding_comments": "폐회사",
-                "opening_song_prayer": "개회 노래 및 기도",
-                "closing_song_prayer": "폐회 노래 및 기도",
-                "service_talk": "봉사 연설",
-                "co_talk": "순회 감독자 연설"
-            },
-            "zh": {
-                "song": "歌曲",
-                "and_prayer": "和祈祷",
-                "opening_comments": "开场白",
-                "concluding_comments": "结束语",
-                "opening_song_prayer": "开场歌曲和祈祷",
-                "closing_song_prayer": "结束歌曲和祈祷",
-                "service_talk": "服务讲话",
-                "co_talk": "巡回监督讲话"
-            }
-            # Add more languages as needed
-        }
-        return translations.get(language, translations["en"])  # Fallback to English
+    def _get_translations(self, language: str) -> Mapping[str, str]:
+        """Get part title translations for a language (falls back to English)"""
+        return get_part_translations(language)
     
     def load_meetings(self):
         """Load the most recent meetings"""
@@ -231,8 +130,11 @@ class MeetingController(QObject):
     def update_meetings_from_web(self):
         """Update meetings from the web"""
         try:
-            # Update scraper language
-            self.scraper.language = self.settings_manager.settings.language
+            # Switch scraper on language change (codes and grammars are per language;
+            # connections are shared, so a new scraper is cheap)
+            language = self.settings_manager.settings.language
+            if self.scraper.language != language:
+                self.scraper = EPUBMeetingScraper(language)
 
             # Fetch meetings
             meetings = self.scraper.update_meetings()
@@ -403,23 +305,22 @@ class MeetingController(QObject):
         if meeting_source_mode == MeetingSourceMode.TEMPLATE_BASED:
             # Create meetings from templates
             meetings = self._create_meetings_from_templates()
+        elif self.meeting_store is not None:
+            # One indexed query per type, preferring scraped over manual
+            for meeting_type in (MeetingType.MIDWEEK, MeetingType.WEEKEND):
+                meeting = self.meeting_store.load_best(meeting_type)
+                if meeting is not None:
+                    meetings[meeting_type] = meeting
         else:
             try:
-                # Get all meeting files
-                meeting_files = [f for f in os.listdir(self.meetings_dir)
-                               if f.endswith('.json')]
-
-                # Group by meeting type
-                midweek_files = [f for f in meeting_files if 'midweek' in f.lower()]
-                weekend_files = [f for f in meeting_files if 'weekend' in f.lower()]
-
-                # Sort by date (assuming filename contains date)
-                midweek_files.sort(reverse=True)
-                weekend_files.sort(reverse=True)
+                # Only new or changed files are read; the rest come from the index
+                self.meeting_index.refresh()
 
                 # Load most recent of each type, preferring scraped over manual
-                meetings[MeetingType.MIDWEEK] = self._load_best_meeting(midweek_files)
-                meetings[MeetingType.WEEKEND] = self._load_best_meeting(weekend_files)
+                for meeting_type in (MeetingType.MIDWEEK, MeetingType.WEEKEND):
+                    meetings[meeting_type] = self._load_best_meeting(
+                        self.meeting_index.candidates(meeting_type)
+                    )
 
                 # Remove None entries
                 meetings = {k: v for k, v in meetings.items() if v is not None}
@@ -500,10 +401,13 @@ class MeetingController(QObject):
     def _load_meeting_file(self, file_path: str) -> Optional[Meeting]:
         """Load a meeting from a file"""
         try:
+            # Make sure a queued save of this file is on disk before reading it
+            get_persistence_service().flush(file_path)
+
             with open(file_path, 'r', encoding='utf-8') as f:
                 meeting_data = json.load(f)
                 
-                meeting = Meeting.from_dict(meeting_data)
+                meeting = meeting_from_dict(meeting_data)
                 
                 # Localize meeting parts
                 meeting = self._localize_meeting_parts(meeting)
@@ -514,45 +418,41 @@ class MeetingController(QObject):
             return None
     
     def _load_best_meeting(self, files: List[str]) -> Optional[Meeting]:
-        """Load the best meeting from a list of files, preferring scraped over manual.
+        """Load the first readable meeting from files ordered by preference.
 
-        Files should already be sorted by date (most recent first).
-        Scraped meetings are preferred because manual (user-created) meetings
-        may have test/placeholder data that shouldn't override real meeting content.
+        MeetingIndex.candidates() orders scraped meetings before manual ones,
+        most recent first. Scraped meetings are preferred because manual
+        (user-created) meetings may have test/placeholder data that shouldn't
+        override real meeting content.
         """
-        if not files:
-            return None
-
-        # Try to find the most recent scraped meeting first
-        best_scraped = None
-        best_manual = None
-
         for filename in files:
             meeting = self._load_meeting_file(
                 os.path.join(self.meetings_dir, filename)
             )
-            if not meeting:
-                continue
-
-            if meeting.source == MeetingSource.SCRAPED and best_scraped is None:
-                best_scraped = meeting
-                break  # Most recent scraped meeting found, no need to continue
-            elif meeting.source == MeetingSource.MANUAL and best_manual is None:
-                best_manual = meeting
-                # Don't break — keep looking for a scraped one
+            if meeting:
+                return meeting
 
-        return best_scraped or best_manual
+        return None
 
     def save_meeting(self, meeting: Meeting):
-        """Save a meeting to a file"""
+        """Save a meeting to the meeting database, or to a file when the database is not used"""
         # Create filename with date, meeting type, and language
         date_str = meeting.date.strftime("%Y-%m-%d")
         filename = f"{meeting.meeting_type.value}_{date_str}_{meeting.language}.json"
         file_path = os.path.join(self.meetings_dir, filename)
+
+        saved = False
+        if self.meeting_store is not None:
+            try:
+                self.meeting_store.save_meeting(meeting)
+                saved = True
+            except sqlite3.Error as e:
+                logger.error("Error saving meeting to database, saving to file: %s", e)
         
-        # Save meeting data
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(meeting.to_dict(), f, indent=2)
+        if not saved:
+            # Queue meeting data for saving (written in the background)
+            content = get_persistence_service().save_json(file_path, meeting_to_dict(meeting), indent=2)
+            self.meeting_index.update(filename, meeting, content)
         
         # Add to recent meetings list if not already there
         if file_path not in self.settings_manager.settings.recent_meetings:
@@ -667,17 +567,8 @@ class MeetingController(QObject):
         return meeting
     
     def get_part_indices(self, meeting: Meeting, global_part_index: int) -> Tuple[int, int]:
-        """Convert global part index to section and part indices"""
-        current_index = 0
-        
-        for section_index, section in enumerate(meeting.sections):
-            for part_index, part in enumerate(section.parts):
-                if current_index == global_part_index:
-                    return section_index, part_index
-                current_index += 1
-        
-        # If not found, return invalid indices
-        return -1, -1
+        """Convert global part index to section and part indices (-1, -1 if not found)"""
+        return meeting.get_part_indices(global_part_index)
     
     def edit_part_at_global_index(self, meeting: Meeting, global_part_index: int, 
                                  updated_part: MeetingPart) -> bool:
@@ -355,4 +355,9 @@ class SettingsController(QObject):
     def set_data_cleanup_retention_days(self, days: int):
         """Set data retention period in days"""
         self.settings_manager.settings.data_cleanup.retention_days = max(7, min(365, days))
+        self.settings_manager.save_settings()
+
+    def set_data_cleanup_cache_budget(self, megabytes: int):
+        """Set the size limit of the EPUB and web scraper caches in MB"""
+        self.settings_manager.settings.data_cleanup.cache_budget_mb = max(20, min(10240, megabytes))
         self.settings_manager.save_settings()
\ No newline at end of file
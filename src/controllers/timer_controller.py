@@ -3,13 +3,15 @@ Controller for managing timer functionality in the OnTime Meeting Timer applicat
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Collection, Iterable, List, Mapping, Optional, Tuple
 from enum import Enum
 from PyQt6.QtCore import QTimer
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.controllers.settings_controller import SettingsController
 from src.models.meeting import Meeting, MeetingPart, MeetingType
+from src.models.redistribution import plan_redistribution
+from src.models.schedule import MeetingSchedule
 from src.models.timer import Timer, TimerState
 from src.models.session import SessionManager, SessionState
 from src.config import USER_DATA_DIR
@@ -38,6 +40,7 @@ class TimerController(QObject):
     meeting_countdown_updated = pyqtSignal(int, str)  # seconds remaining, formatted message
     durations_redistributed = pyqtSignal(list)  # [(global_idx, old_min, new_min), ...]
     durations_reset = pyqtSignal()
+    section_slack_updated = pyqtSignal(list)  # [seconds ahead of plan or None, ...] per section
     
     def __init__(self, settings_controller: SettingsController):
         """Initialize the TimerController with a settings controller"""
@@ -73,6 +76,11 @@ class TimerController(QObject):
         self._target_end_time = None  # Based on organizational standard or custom meeting target
         self._remaining_parts_duration = 0
         
+        # Planned schedule, rebuilt only when the meeting changes
+        self._schedule: Optional[MeetingSchedule] = None
+        self._schedule_key = None
+        self._section_slack: List[Optional[int]] = []
+        
         # Meeting countdown tracking
         self._countdown_timer = QTimer(self)
         self._countdown_timer.setInterval(1000)  # Update every second
@@ -97,6 +105,11 @@ class TimerController(QObject):
         self.current_meeting = meeting
         self.current_part_index = -1
         self.parts_list = meeting.get_all_parts()
+        self._schedule = None
+        self._section_slack = []
+        
+        # Build the schedule and transition flags up front
+        self.schedule
         
         # Stop any previous timer and show current time
         self.timer.stop()
@@ -289,8 +302,9 @@ class TimerController(QObject):
             remaining_time += 0
         
         # 2. Add duration of all future parts
-        for i in range(self.current_part_index + 1, len(self.parts_list)):
-            remaining_time += self.parts_list[i].duration_seconds
+        schedule = self.schedule
+        future_time = schedule.durations_between(self.current_part_index + 1, len(self.parts_list))
+        remaining_time += future_time
         
         # 3. Add remaining transitions
         remaining_transitions = self._calculate_remaining_transitions()
@@ -309,6 +323,27 @@ class TimerController(QObject):
         # Emit signal with updated prediction
         self.predicted_end_time_updated.emit(self._original_end_time, self._predicted_end_time, self._target_end_time)
         
+        # Per-section slack is in whole minutes, so it only changes when the
+        # prediction drifts past a minute
+        if self.current_part_index < len(self.parts_list):
+            deadline = self.timer.deadline
+            if self.timer.state == TimerState.RUNNING and deadline is not None:
+                # From the deadline rather than the whole seconds left, so it
+                # runs down exactly as fast as now advances
+                current_remaining = max(0.0, deadline - now.timestamp())
+            else:
+                current_remaining = self._current_remaining_seconds()
+            previous = next((slack for slack in self._section_slack if slack is not None), None)
+            section_slack = schedule.section_slack(
+                self.current_part_index,
+                (now - self._meeting_start_time).total_seconds(),
+                current_remaining,
+                previous
+            )
+            if section_slack != self._section_slack:
+                self._section_slack = section_slack
+                self.section_slack_updated.emit(section_slack)
+        
         # Debug logging
         logger.debug(
             "Predicted end time: now=%s, part=%d/%d, state=%s, "
@@ -318,7 +353,7 @@ class TimerController(QObject):
             self.current_part_index + 1, len(self.parts_list),
             self.timer.state,
             max(0, self.timer.remaining_seconds) if self.timer.state != TimerState.OVERTIME else 0,
-            sum(self.parts_list[i].duration_seconds for i in range(self.current_part_index + 1, len(self.parts_list))),
+            future_time,
             remaining_transitions,
             remaining_time, remaining_time / 60,
             self._predicted_end_time.strftime('%H:%M:%S'),
@@ -331,6 +366,60 @@ class TimerController(QObject):
                 self._predicted_end_time, now
             )
     
+    @property
+    def schedule(self) -> Optional[MeetingSchedule]:
+        """Planned schedule of the current meeting, rebuilt only after the meeting changes"""
+        if not self.current_meeting:
+            return None
+        # The meeting itself, not its id: a new meeting may reuse the id of a freed one
+        key = (self.current_meeting, self.current_meeting.generation)
+        if self._schedule is None or self._schedule_key[0] is not key[0] or self._schedule_key[1] != key[1]:
+            section_of = self.current_meeting.section_indices
+            section_count = len(self.current_meeting.sections)
+            if len(section_of) != len(self.parts_list):
+                # Parts list no longer matches the meeting; treat it as one section
+                section_of = [0] * len(self.parts_list)
+                section_count = 1
+            self._schedule = MeetingSchedule(
+                self.current_meeting.meeting_type, self.parts_list, section_of, section_count
+            )
+            self._schedule_key = key
+        return self._schedule
+    
+    def _current_remaining_seconds(self) -> int:
+        """Planned seconds left in the running part (0 once it is in overtime)"""
+        if self.timer.state in [TimerState.RUNNING, TimerState.PAUSED]:
+            return max(0, self.timer.remaining_seconds)
+        return 0
+    
+    def simulate_end_times(self, overruns: Iterable[Tuple[int, int]]) -> List[datetime]:
+        """Predicted end time for each (part index, overrun seconds) what-if query
+        
+        Each query is answered independently from the cached schedule.
+        """
+        schedule = self.schedule
+        if schedule is None or not 0 <= self.current_part_index < len(self.parts_list):
+            return []
+        now = datetime.now()
+        return [now + timedelta(seconds=seconds) for seconds in schedule.predicted_ends(
+            self.current_part_index, self._current_remaining_seconds(), overruns
+        )]
+    
+    def latest_start_time(self, part_index: int, end_time: Optional[datetime] = None) -> Optional[datetime]:
+        """Latest time a part can start for the meeting to end by end_time (default: target end)"""
+        schedule = self.schedule
+        end_time = end_time or self._target_end_time
+        if schedule is None or not self._meeting_start_time or end_time is None:
+            return None
+        if not 0 <= part_index < len(self.parts_list):
+            return None
+        deadline_offset = (end_time - self._meeting_start_time).total_seconds()
+        return self._meeting_start_time + timedelta(seconds=schedule.latest_start(part_index, deadline_offset))
+    
+    def section_slack(self) -> List[Optional[int]]:
+        """Seconds each section is ahead of plan (negative when behind, None once ended)"""
+        return list(self._section_slack)
+    
     def _calculate_planned_elapsed_time(self) -> float:
         """Calculate how much time should have elapsed based on current part position"""
         if self.current_part_index < 0:
@@ -388,125 +477,19 @@ class TimerController(QObject):
         """Get total number of transitions in the meeting"""
         if not self.current_meeting:
             return 0
-
-        if self.current_meeting.meeting_type == MeetingType.WEEKEND:
-            return min(1, len(self.current_meeting.sections) - 1)  # Max 1 for weekend
-
-        # For midweek, count all parts except those that don't get transitions
-        count = 0
-        all_parts = [part for section in self.current_meeting.sections for part in section.parts]
-        total_parts = len(all_parts)
-
-        for i, part in enumerate(all_parts):
-            # Skip last part (no transition after it)
-            if i >= total_parts - 1:
-                continue
-
-            # Skip Opening Song/Prayer (first part)
-            if i == 0:
-                continue
-
-            # Skip CBS (3rd-to-last, typically 30 min)
-            if i == total_parts - 3 and part.duration_minutes >= 25:
-                continue
-
-            # Skip Concluding Comments / Review and Preview (2nd-to-last)
-            if i == total_parts - 2:
-                continue
-
-            count += 1
-
-        return count
+        return self.schedule.transitions.total
     
     def _calculate_remaining_transitions(self) -> int:
         """Calculate how many chairman transitions are left"""
         if not self.current_meeting or self.current_part_index < 0:
             return 0
-
-        if self.current_meeting.meeting_type == MeetingType.WEEKEND:
-            # Weekend meetings: find current section and count remaining section transitions
-            current_section_index = -1
-            part_count = 0
-            for section_index, section in enumerate(self.current_meeting.sections):
-                for part in section.parts:
-                    if part_count == self.current_part_index:
-                        current_section_index = section_index
-                        break
-                    part_count += 1
-                if current_section_index != -1:
-                    break
-
-            if current_section_index != -1:
-                remaining_sections = len(self.current_meeting.sections) - current_section_index - 1
-                return min(remaining_sections, 1)  # Max 1 transition for weekend
-            return 0
-
-        # For midweek, count remaining parts that get transitions
-        count = 0
-        all_parts = [part for section in self.current_meeting.sections for part in section.parts]
-        total_parts = len(all_parts)
-
-        for i in range(self.current_part_index, total_parts):
-            # Skip last part (no transition after it)
-            if i >= total_parts - 1:
-                continue
-
-            part = all_parts[i]
-
-            # Skip Opening Song/Prayer (first part)
-            if i == 0:
-                continue
-
-            # Skip CBS (3rd-to-last, typically 30 min)
-            if i == total_parts - 3 and part.duration_minutes >= 25:
-                continue
-
-            # Skip Concluding Comments / Review and Preview (2nd-to-last)
-            if i == total_parts - 2:
-                continue
-
-            count += 1
-
-        return count
+        return self.schedule.transitions.remaining_from(self.current_part_index)
 
     def _should_add_chairman_transition(self):
         """Check if we should add a chairman transition between parts"""
         if not self.current_meeting or not self.parts_list:
             return False
-
-        # Don't add transition if we're at the last part
-        if self.current_part_index < 0 or self.current_part_index >= len(self.parts_list) - 1:
-            return False
-
-        if self.current_meeting.meeting_type == MeetingType.WEEKEND:
-            # Add transition only before part at index 1 or 2
-            next_index = self.current_part_index + 1
-            if next_index in [1, 2]:
-                return True
-            return False
-
-        # Midweek meeting logic
-        if self.current_meeting.meeting_type == MeetingType.MIDWEEK:
-            current_part = self.parts_list[self.current_part_index]
-            total_parts = len(self.parts_list)
-
-            # NO transition after Opening Song/Prayer (first part)
-            if self.current_part_index == 0:
-                return False
-
-            # NO transition after Congregation Bible Study (3rd-to-last, typically 30 min)
-            if self.current_part_index == total_parts - 3 and current_part.duration_minutes >= 25:
-                return False
-
-            # NO transition after Concluding Comments / Review and Preview (2nd-to-last)
-            if self.current_part_index == total_parts - 2:
-                return False
-
-            # All other parts get transitions
-            return True
-
-        # Default: allow transition
-        return True
+        return self.schedule.transitions.has_transition_after(self.current_part_index)
     
     def _start_chairman_transition(self):
         """Start a 1-minute chairman transition period with meeting-specific text"""
@@ -671,11 +654,15 @@ class TimerController(QObject):
         # Update predicted end time since we've changed the duration
         self._update_predicted_end_time()
 
-    def redistribute_durations_for_end_time(self, target_end_time: datetime, from_part_index: int) -> dict:
-        """Redistribute part durations from from_part_index onward to end meeting at target_end_time.
+    def preview_redistribution(self, target_end_time: datetime, from_part_index: int,
+                               locked_parts: Collection[int] = (),
+                               min_minutes: Optional[Mapping[int, int]] = None,
+                               max_minutes: Optional[Mapping[int, int]] = None) -> dict:
+        """Plan a redistribution without changing any part (dry run).
 
-        Returns dict with 'success', 'error' (if failed), 'adjusted_parts' list of
-        (global_index, old_minutes, new_minutes) tuples.
+        Takes the same arguments as redistribute_durations_for_end_time. Returns
+        dict with 'success', 'error' (if failed), 'adjusted_parts' list of
+        (global_index, old_minutes, new_minutes) tuples and the planned 'end_time'.
         """
         now = datetime.now()
 
@@ -687,114 +674,51 @@ class TimerController(QObject):
         if from_part_index < self.current_part_index or from_part_index >= len(self.parts_list):
             return {'success': False, 'error': 'Invalid part index'}
 
-        # Build section map: global_part_index -> section_index
-        section_map = []
-        for sec_idx, section in enumerate(self.current_meeting.sections):
-            for _ in section.parts:
-                section_map.append(sec_idx)
-
-        # Calculate available time from now to target
-        total_available = (target_end_time - now).total_seconds()
-
-        # Subtract locked time (parts before from_part_index that we're NOT adjusting)
-        locked_time = 0.0
-        if from_part_index > self.current_part_index:
-            # Current part's remaining time is locked
-            locked_time += max(0, self.timer.remaining_seconds)
-            # Parts between current+1 and from-1 are locked
-            for i in range(self.current_part_index + 1, from_part_index):
-                locked_time += self.parts_list[i].duration_seconds
-            # Transitions in locked range
-            for i in range(self.current_part_index, from_part_index - 1):
-                if i + 1 < len(section_map) and section_map[i] != section_map[i + 1]:
-                    locked_time += 60
-        elif from_part_index == self.current_part_index:
-            # Nothing locked — we're adjusting from the current part
-            pass
-
-        available_for_adjusted = total_available - locked_time
-
-        # Subtract transitions within the adjusted range
-        for i in range(from_part_index, len(self.parts_list) - 1):
-            if section_map[i] != section_map[i + 1]:
-                available_for_adjusted -= 60
-
-        # Parts to adjust
-        parts_to_adjust = self.parts_list[from_part_index:]
-        if not parts_to_adjust:
-            return {'success': False, 'error': 'No parts to adjust'}
-
-        # For the current part, only its remaining time is adjustable
-        is_current_included = (from_part_index == self.current_part_index)
-        current_elapsed = 0
-        if is_current_included:
-            current_elapsed = self.timer.elapsed_seconds
+        result = plan_redistribution(
+            self.parts_list,
+            self.schedule.transitions.between,
+            self.current_part_index,
+            self.timer.elapsed_seconds,
+            self.timer.remaining_seconds,
+            from_part_index,
+            (target_end_time - now).total_seconds(),
+            locked=locked_parts,
+            min_minutes=min_minutes,
+            max_minutes=max_minutes
+        )
+        if result['success']:
+            result['end_time'] = now + timedelta(seconds=result.pop('planned_seconds'))
+        return result
+
+    def redistribute_durations_for_end_time(self, target_end_time: datetime, from_part_index: int,
+                                            locked_parts: Collection[int] = (),
+                                            min_minutes: Optional[Mapping[int, int]] = None,
+                                            max_minutes: Optional[Mapping[int, int]] = None) -> dict:
+        """Redistribute part durations from from_part_index onward to end meeting at target_end_time.
 
-        # Calculate original durations (use original_duration_minutes if previously adjusted)
-        originals_seconds = []
-        for i, part in enumerate(parts_to_adjust):
-            orig = (part.original_duration_minutes or part.duration_minutes) * 60
-            if i == 0 and is_current_included:
-                # For current part, only the remaining portion participates
-                orig = max(0, orig - current_elapsed)
-            originals_seconds.append(orig)
-
-        sum_originals = sum(originals_seconds)
-        if sum_originals <= 0:
-            return {'success': False, 'error': 'No adjustable time in selected parts'}
-
-        # Validate minimum time
-        min_time_needed = len(parts_to_adjust) * 60  # 1 min per part minimum
-        if is_current_included:
-            # Current part needs at least enough for its elapsed + 1 min
-            min_time_needed = (len(parts_to_adjust) - 1) * 60 + max(60, current_elapsed + 60)
-
-        if available_for_adjusted < min_time_needed:
-            mins_needed = int(min_time_needed / 60)
-            mins_available = int(available_for_adjusted / 60)
-            return {
-                'success': False,
-                'error': f'Not enough time: need at least {mins_needed} min, '
-                         f'but only {mins_available} min available'
-            }
-
-        # Distribute proportionally
-        ratio = available_for_adjusted / sum_originals
-        adjusted_parts = []
-        allocated_seconds = 0
-
-        for i, part in enumerate(parts_to_adjust):
-            global_idx = from_part_index + i
+        Parts in locked_parts keep their duration; min_minutes and max_minutes
+        bound the new duration of a part by global index (default at least 1 min).
 
+        Returns dict with 'success', 'error' (if failed), 'adjusted_parts' list of
+        (global_index, old_minutes, new_minutes) tuples.
+        """
+        result = self.preview_redistribution(target_end_time, from_part_index,
+                                             locked_parts, min_minutes, max_minutes)
+        if not result['success']:
+            return result
+
+        adjusted_parts = result['adjusted_parts']
+        for global_idx, _, new_minutes in adjusted_parts:
+            part = self.parts_list[global_idx]
             # Save original if first time adjusting
             if part.original_duration_minutes is None:
                 part.original_duration_minutes = part.duration_minutes
-
-            old_minutes = part.duration_minutes
-
-            if i == len(parts_to_adjust) - 1:
-                # Last part gets remainder
-                remaining_available = available_for_adjusted - allocated_seconds
-                if i == 0 and is_current_included:
-                    new_minutes = max(1, round((remaining_available + current_elapsed) / 60))
-                else:
-                    new_minutes = max(1, round(remaining_available / 60))
-            else:
-                new_seconds = originals_seconds[i] * ratio
-                if i == 0 and is_current_included:
-                    # Add back elapsed time to get full duration
-                    new_minutes = max(1, round((new_seconds + current_elapsed) / 60))
-                    allocated_seconds += (new_minutes * 60) - current_elapsed
-                else:
-                    new_minutes = max(1, round(new_seconds / 60))
-                    allocated_seconds += new_minutes * 60
-
             part.duration_minutes = new_minutes
-            adjusted_parts.append((global_idx, old_minutes, new_minutes))
 
         # Update current part's timer if it was adjusted
-        if is_current_included:
-            new_total = parts_to_adjust[0].duration_seconds
+        if adjusted_parts and adjusted_parts[0][0] == self.current_part_index:
+            current_elapsed = self.timer.elapsed_seconds
+            new_total = self.parts_list[self.current_part_index].duration_seconds
             new_remaining = max(0, new_total - current_elapsed)
             self.timer._total_seconds = new_total
             self.timer._remaining_seconds = new_remaining
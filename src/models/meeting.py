@@ -1,9 +1,18 @@
 """
 Meeting data models for the OnTime Meeting Timer application.
+
+The model classes use __slots__ to keep per-part memory small. A Meeting
+caches a flattened view of its parts (global index -> (section, part)
+map, durations in an array('i') and a content hash). Sections and parts
+know the meeting or section holding them, so a change to one of them bumps
+the change counter of its own meeting only, which invalidates that
+meeting's cached view the next time it is used.
 """
-from dataclasses import dataclass
+import hashlib
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import Enum
 
 class MeetingType(Enum):
@@ -17,7 +26,88 @@ class MeetingSource(Enum):
     SCRAPED = "scraped"    # Auto-fetched from web (EPUB scraper)
     MANUAL = "manual"      # User-created via the meeting editor
 
-@dataclass
+
+def _tracked(items, owner) -> 'TrackedList':
+    """items as a TrackedList reporting its changes to owner, whose items they become"""
+    tracked = items if isinstance(items, TrackedList) else TrackedList(items)
+    tracked.owner = owner
+    for item in tracked:
+        object.__setattr__(item, '_owner', owner)
+    return tracked
+
+
+class TrackedList(list):
+    """List of sections or parts that reports in-place changes to its owner
+
+    The owner is the meeting or section holding the list; items added to the
+    list get it as their owner too, so their own changes reach the meeting.
+    """
+    __slots__ = ('owner',)
+
+    def _changed(self, start: int = 0):
+        """Adopt the items from start on and tell the owner about the change"""
+        owner = getattr(self, 'owner', None)
+        if owner is None:
+            return
+        for index in range(start, len(self)):
+            object.__setattr__(self[index], '_owner', owner)
+        owner._changed()
+
+    def append(self, item):
+        super().append(item)
+        self._changed(len(self) - 1)
+
+    def extend(self, items):
+        start = len(self)
+        super().extend(items)
+        self._changed(start)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed(len(self))
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed(len(self))
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._changed(len(self))
+
+    def reverse(self):
+        super().reverse()
+        self._changed(len(self))
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed(len(self))
+
+    def __iadd__(self, items):
+        start = len(self)
+        result = super().__iadd__(items)
+        self._changed(start)
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._changed(len(self))
+        return result
+
+
+@dataclass(slots=True)
 class MeetingPart:
     """Represents a single part in a meeting"""
     title: str
@@ -26,6 +116,14 @@ class MeetingPart:
     notes: str = ""
     is_completed: bool = False
     original_duration_minutes: Optional[int] = None  # Pre-adjustment duration (None = not adjusted)
+    _owner: Optional['MeetingSection'] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Not set yet while the part is being constructed
+        owner = getattr(self, '_owner', None)
+        if owner is not None:
+            owner._changed()
     
     @property
     def duration_seconds(self) -> int:
@@ -57,11 +155,25 @@ class MeetingPart:
             original_duration_minutes=data.get('original_duration_minutes')
         )
 
-@dataclass
+@dataclass(slots=True)
 class MeetingSection:
     """Represents a section of a meeting containing multiple parts"""
     title: str
     parts: List[MeetingPart]
+    _owner: Optional['Meeting'] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        if name == 'parts':
+            value = _tracked(value, self)
+        object.__setattr__(self, name, value)
+        if name != '_owner':
+            self._changed()
+
+    def _changed(self):
+        """Tell the meeting holding this section that the section or one of its parts changed"""
+        owner = getattr(self, '_owner', None)
+        if owner is not None:
+            owner._changed()
     
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
@@ -83,7 +195,33 @@ class MeetingSection:
         """Calculate total duration of all parts in this section"""
         return sum(part.duration_minutes for part in self.parts)
 
-@dataclass
+class _PartsView:
+    """Flattened, read-only view of a meeting's parts"""
+    __slots__ = ('generation', 'parts', 'section_of', 'part_of', 'section_offsets',
+                 'durations', 'parts_hash')
+
+    def __init__(self, sections: List[MeetingSection], generation: int):
+        self.generation = generation
+        parts = []
+        section_of = array('i')
+        part_of = array('i')
+        section_offsets = array('i')
+        for section_index, section in enumerate(sections):
+            section_offsets.append(len(parts))
+            parts.extend(section.parts)
+            count = len(section.parts)
+            section_of.extend([section_index] * count)
+            part_of.extend(range(count))
+
+        self.parts: Tuple[MeetingPart, ...] = tuple(parts)
+        self.section_of = section_of
+        self.part_of = part_of
+        self.section_offsets = section_offsets
+        self.durations = array('i', [part.duration_minutes for part in parts])
+        self.parts_hash: Optional[str] = None
+
+
+@dataclass(slots=True)
 class Meeting:
     """Represents a complete meeting with multiple sections"""
     meeting_type: MeetingType
@@ -94,6 +232,24 @@ class Meeting:
     language: str = "en"
     target_duration_minutes: Optional[int] = None  # Custom target for specific meeting (e.g., custom meetings)
     source: MeetingSource = MeetingSource.SCRAPED  # How the meeting was created
+    _parts_view: Optional[_PartsView] = field(default=None, init=False, repr=False, compare=False)
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == 'sections':
+            value = _tracked(value, self)
+        object.__setattr__(self, name, value)
+        if name not in ('_parts_view', '_generation'):
+            self._changed()
+
+    def _changed(self):
+        """Bump this meeting's change counter (not set yet during construction)"""
+        object.__setattr__(self, '_generation', getattr(self, '_generation', 0) + 1)
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever this meeting, one of its sections or one of its parts changes"""
+        return self._generation
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
@@ -129,14 +285,60 @@ class Meeting:
             source=source
         )
     
+    def _view(self) -> _PartsView:
+        """Get the cached flattened view, rebuilding it if anything changed"""
+        view = self._parts_view
+        if view is None or view.generation != self._generation:
+            view = _PartsView(self.sections, self._generation)
+            self._parts_view = view
+        return view
+
     @property
     def total_duration_minutes(self) -> int:
         """Calculate total duration of the entire meeting"""
-        return sum(section.total_duration_minutes for section in self.sections)
+        return sum(self._view().durations)
+    
+    @property
+    def part_count(self) -> int:
+        """Number of parts across all sections"""
+        return len(self._view().parts)
+    
+    @property
+    def durations(self) -> array:
+        """Part durations in minutes by global part index (shared; do not modify)"""
+        return self._view().durations
+    
+    @property
+    def section_indices(self) -> array:
+        """Section index of each part by global part index (shared; do not modify)"""
+        return self._view().section_of
     
     def get_all_parts(self) -> List[MeetingPart]:
         """Get a flattened list of all parts across all sections"""
-        all_parts = []
-        for section in self.sections:
-            all_parts.extend(section.parts)
-        return all_parts
\ No newline at end of file
+        return list(self._view().parts)
+    
+    def get_part(self, global_part_index: int) -> Optional[MeetingPart]:
+        """Get a part by its index across all sections"""
+        parts = self._view().parts
+        if 0 <= global_part_index < len(parts):
+            return parts[global_part_index]
+        return None
+    
+    def get_part_indices(self, global_part_index: int) -> Tuple[int, int]:
+        """Convert a global part index to (section index, part index), or (-1, -1)"""
+        view = self._view()
+        if 0 <= global_part_index < len(view.parts):
+            return view.section_of[global_part_index], view.part_of[global_part_index]
+        return -1, -1
+    
+    def get_global_part_index(self, section_index: int, part_index: int) -> int:
+        """Convert section and part indices to a global part index"""
+        return self._view().section_offsets[section_index] + part_index
+    
+    def parts_hash(self) -> str:
+        """Short hash of part titles and durations, used to detect meeting changes"""
+        view = self._view()
+        if view.parts_hash is None:
+            content = "|".join(f"{part.title}:{part.duration_minutes}" for part in view.parts)
+            view.parts_hash = hashlib.md5(content.encode()).hexdigest()[:8]
+        return view.parts_hash
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Metadata index for the meeting JSON files of the OnTime Meeting Timer application.
+
+The index is a small sidecar file mapping each meeting filename to its type,
+date, language, source, mtime, size and content hash. Startup can pick the
+right meeting file without opening the others, and a file is only re-read
+when its mtime or size changes (and only re-parsed when its hash changes).
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+from src.models.meeting import Meeting, MeetingType, MeetingSource
+from src.utils.persistence import get_persistence_service
+
+logger = logging.getLogger("OnTime.MeetingIndex")
+
+
+class MeetingIndex:
+    """Filename -> metadata index for a directory of meeting JSON files"""
+
+    INDEX_VERSION = 1
+
+    def __init__(self, meetings_dir: str, index_path: str):
+        self.meetings_dir = meetings_dir
+        self.index_path = index_path
+
+        # filename -> {type, date, language, source, mtime, size, hash}
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def _load(self):
+        """Load the index file, starting empty if it is missing or outdated"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.INDEX_VERSION:
+                self._entries = data.get('entries', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable meeting index: %s", e)
+
+    def _save(self):
+        """Queue the index for saving (called with the lock held)"""
+        get_persistence_service().save_json(
+            self.index_path,
+            {'version': self.INDEX_VERSION, 'entries': self._entries},
+            separators=(',', ':')
+        )
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the meetings directory
+
+        Returns:
+            True if any entry was added, changed or removed
+        """
+        # Queued meeting saves must be on disk before comparing mtimes
+        get_persistence_service().flush()
+
+        changed = False
+        seen = set()
+
+        with self._lock:
+            if os.path.isdir(self.meetings_dir):
+                with os.scandir(self.meetings_dir) as it:
+                    for dir_entry in it:
+                        if not dir_entry.name.endswith('.json') or not dir_entry.is_file():
+                            continue
+                        seen.add(dir_entry.name)
+
+                        try:
+                            stat = dir_entry.stat()
+                        except OSError:
+                            continue
+                        cached = self._entries.get(dir_entry.name)
+                        if (cached and cached.get('mtime') == stat.st_mtime
+                                and cached.get('size') == stat.st_size):
+                            continue
+
+                        self._entries[dir_entry.name] = self._read_entry(dir_entry.path, stat, cached)
+                        changed = True
+
+            for filename in list(self._entries):
+                if filename not in seen:
+                    del self._entries[filename]
+                    changed = True
+
+            if changed:
+                self._save()
+
+        return changed
+
+    def _read_entry(self, file_path: str, stat: os.stat_result, cached: Optional[dict]) -> dict:
+        """Build the entry for a new or changed file, parsing it only if its content changed"""
+        entry = {'type': None, 'date': '', 'language': '', 'source': '',
+                 'mtime': stat.st_mtime, 'size': stat.st_size, 'hash': ''}
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning("Could not read meeting file %s: %s", file_path, e)
+            return entry
+
+        entry['hash'] = hashlib.sha1(content).hexdigest()
+        if cached and cached.get('hash') == entry['hash']:
+            # Touched but unchanged: keep the metadata
+            return dict(cached, mtime=stat.st_mtime, size=stat.st_size)
+
+        try:
+            data = json.loads(content)
+            entry.update(
+                type=data['meeting_type'],
+                date=data['date'][:10],
+                language=data.get('language', 'en'),
+                source=data.get('source', MeetingSource.SCRAPED.value)
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            # Keep the entry so the file is not re-parsed until it changes
+            logger.warning("Could not index meeting file %s: %s", file_path, e)
+        return entry
+
+    def update(self, filename: str, meeting: Meeting, content: str):
+        """Record a meeting that was just saved, without reading it back
+
+        Args:
+            filename: Name of the meeting file in the meetings directory
+            meeting: The saved meeting
+            content: The exact text written to the file
+        """
+        encoded = content.encode('utf-8')
+        with self._lock:
+            self._entries[filename] = {
+                'type': meeting.meeting_type.value,
+                'date': meeting.date.strftime("%Y-%m-%d"),
+                'language': meeting.language,
+                'source': meeting.source.value,
+                # The write may still be queued; the next refresh adopts the real mtime
+                'mtime': None,
+                'size': len(encoded),
+                'hash': hashlib.sha1(encoded).hexdigest()
+            }
+            self._save()
+
+    def remove(self, filename: str):
+        """Drop a file from the index (e.g. after it was deleted)"""
+        with self._lock:
+            if self._entries.pop(filename, None) is not None:
+                self._save()
+
+    def entries(self) -> Dict[str, dict]:
+        """Get a snapshot of all entries"""
+        with self._lock:
+            return {filename: dict(entry) for filename, entry in self._entries.items()}
+
+    def candidates(self, meeting_type: MeetingType) -> List[str]:
+        """Filenames of a meeting type in load order: scraped first, then manual, newest first"""
+        with self._lock:
+            matching = [(entry['source'], entry['date'], filename)
+                        for filename, entry in self._entries.items()
+                        if entry.get('type') == meeting_type.value]
+
+        scraped = sorted((m for m in matching if m[0] == MeetingSource.SCRAPED.value), reverse=True)
+        manual = sorted((m for m in matching if m[0] == MeetingSource.MANUAL.value), reverse=True)
+        return [filename for _, _, filename in scraped + manual]
@@ -0,0 +1,183 @@
+"""
+Versioned fast serializer for meetings in the OnTime Meeting Timer application.
+
+Produces the same layout as Meeting.to_dict() plus a "schema_version" key,
+and reads both. Decoding fills the slotted model classes from precompiled
+field tables instead of going through the dataclass constructors, parses
+repeated date/time strings once, and uses orjson for text encoding when it
+is installed (falling back to the stdlib json module).
+"""
+import json
+import logging
+from datetime import datetime, time
+from functools import lru_cache
+from typing import Callable, Dict, IO, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.models.meeting import (
+    Meeting, MeetingSection, MeetingPart, MeetingType, MeetingSource, _tracked
+)
+
+logger = logging.getLogger("OnTime.MeetingSerializer")
+
+# Bump when the serialized layout changes and add an upgrader for the old version.
+# Files without a schema_version use the version 1 layout.
+SCHEMA_VERSION = 1
+
+# version -> function upgrading a dict of that version to the next one
+_UPGRADERS: Dict[int, Callable[[dict], dict]] = {}
+
+_REQUIRED = object()
+
+# (slot setter, key, default) for each serialized field, in constructor order
+_PART_FIELDS = tuple(
+    (getattr(MeetingPart, name).__set__, name, default)
+    for name, default in (
+        ('title', _REQUIRED),
+        ('duration_minutes', _REQUIRED),
+        ('presenter', ''),
+        ('notes', ''),
+        ('is_completed', False),
+        ('original_duration_minutes', None),
+    )
+)
+_SET_SECTION_TITLE = MeetingSection.title.__set__
+_SET_SECTION_PARTS = MeetingSection.parts.__set__
+_MEETING_SETTERS = {name: getattr(Meeting, name).__set__ for name in (
+    'meeting_type', 'title', 'date', 'start_time', 'sections', 'language',
+    'target_duration_minutes', 'source', '_parts_view', '_generation'
+)}
+
+_MEETING_TYPES = {member.value: member for member in MeetingType}
+_MEETING_SOURCES = {member.value: member for member in MeetingSource}
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_time(value: str) -> time:
+    return time.fromisoformat(value)
+
+
+def _part_to_dict(part: MeetingPart) -> dict:
+    d = {
+        'title': part.title,
+        'duration_minutes': part.duration_minutes,
+        'presenter': part.presenter,
+        'notes': part.notes,
+        'is_completed': part.is_completed
+    }
+    if part.original_duration_minutes is not None:
+        d['original_duration_minutes'] = part.original_duration_minutes
+    return d
+
+
+def meeting_to_dict(meeting: Meeting) -> dict:
+    """Convert a meeting to a dictionary in the current schema"""
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'meeting_type': meeting.meeting_type.value,
+        'title': meeting.title,
+        'date': meeting.date.isoformat(),
+        'start_time': meeting.start_time.isoformat(),
+        'sections': [
+            {'title': section.title, 'parts': [_part_to_dict(part) for part in section.parts]}
+            for section in meeting.sections
+        ],
+        'language': meeting.language,
+        'target_duration_minutes': meeting.target_duration_minutes,
+        'source': meeting.source.value
+    }
+
+
+def _part_from_dict(data: dict) -> MeetingPart:
+    part = object.__new__(MeetingPart)
+    for setter, key, default in _PART_FIELDS:
+        setter(part, data[key] if default is _REQUIRED else data.get(key, default))
+    return part
+
+
+def _section_from_dict(data: dict) -> MeetingSection:
+    section = object.__new__(MeetingSection)
+    _SET_SECTION_TITLE(section, data['title'])
+    _SET_SECTION_PARTS(section, _tracked([_part_from_dict(part) for part in data['parts']], section))
+    return section
+
+
+def meeting_from_dict(data: dict) -> Meeting:
+    """Create a meeting from a dictionary of any supported schema version
+
+    Raises:
+        ValueError: If the data is from a newer, unsupported schema version
+        KeyError: If a required field is missing
+    """
+    version = data.get('schema_version', 1)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Unsupported meeting schema version {version}")
+    while version < SCHEMA_VERSION:
+        data = _UPGRADERS[version](data)
+        version += 1
+
+    meeting = object.__new__(Meeting)
+    setters = _MEETING_SETTERS
+    setters['meeting_type'](meeting, _MEETING_TYPES[data['meeting_type']])
+    setters['title'](meeting, data['title'])
+    setters['date'](meeting, _parse_datetime(data['date']))
+    setters['start_time'](meeting, _parse_time(data['start_time']))
+    setters['sections'](meeting, _tracked([_section_from_dict(s) for s in data['sections']], meeting))
+    setters['language'](meeting, data.get('language', 'en'))
+    setters['target_duration_minutes'](meeting, data.get('target_duration_minutes'))
+    # Older files without a (valid) source are treated as scraped
+    setters['source'](meeting, _MEETING_SOURCES.get(data.get('source'), MeetingSource.SCRAPED))
+    setters['_parts_view'](meeting, None)
+    setters['_generation'](meeting, 0)
+    return meeting
+
+
+def dumps(meeting: Meeting, indent: bool = False) -> str:
+    """Serialize a meeting to JSON text (compact unless indent is set)"""
+    data = meeting_to_dict(meeting)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def loads(text: Union[str, bytes]) -> Meeting:
+    """Deserialize a meeting from JSON text"""
+    data = orjson.loads(text) if orjson is not None else json.loads(text)
+    return meeting_from_dict(data)
+
+
+def write_meetings(meetings: Iterable[Meeting], fp: IO[str]) -> int:
+    """Write meetings as JSON Lines (one compact meeting per line)
+
+    Returns:
+        Number of meetings written
+    """
+    count = 0
+    for meeting in meetings:
+        fp.write(dumps(meeting))
+        fp.write('\n')
+        count += 1
+    return count
+
+
+def iter_meetings(fp: IO[str]) -> Iterator[Meeting]:
+    """Read meetings one at a time from a JSON Lines file, skipping bad lines"""
+    for line_number, line in enumerate(fp, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield loads(line)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Skipping meeting on line %d: %s", line_number, e)
@@ -0,0 +1,283 @@
+"""
+SQLite-backed meeting history for the OnTime Meeting Timer application.
+
+All saved meetings live in one database file instead of one pretty-printed
+JSON file per meeting and language. The lookup columns are indexed, so
+finding the most recent meeting of a type is a single query no matter how
+much history is kept. Meeting contents are stored as compact JSON text
+written by meeting_serializer.
+"""
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from src.models.meeting import Meeting, MeetingType, MeetingSource
+from src.models import meeting_serializer
+
+logger = logging.getLogger("OnTime.MeetingStore")
+
+
+class MeetingStore:
+    """Stores meetings in a single SQLite database"""
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create tables and indexes if they do not exist yet"""
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS meetings (
+                    meeting_type TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (meeting_type, date, language)
+                )
+            """)
+            # Serves "most recent meeting of a type from a given source"
+            self._conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_meetings_type_source_date
+                ON meetings (meeting_type, source, date, language)
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+
+    @staticmethod
+    def _key(meeting: Meeting) -> Tuple[str, str, str]:
+        """Primary key for a meeting (same identity as the JSON filename)"""
+        return (meeting.meeting_type.value, meeting.date.strftime("%Y-%m-%d"), meeting.language)
+
+    def save_meeting(self, meeting: Meeting):
+        """Insert or replace a meeting"""
+        self._save_many([meeting])
+
+    def _save_many(self, meetings: List[Meeting], updated_at: Optional[List[float]] = None):
+        """Insert or replace several meetings in one transaction"""
+        now = time.time()
+        rows = []
+        for i, meeting in enumerate(meetings):
+            rows.append(self._key(meeting) + (
+                meeting.source.value,
+                meeting.title,
+                updated_at[i] if updated_at else now,
+                meeting_serializer.dumps(meeting),
+            ))
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO meetings "
+                "(meeting_type, date, language, source, title, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def load_latest(self, meeting_type: MeetingType,
+                    source: Optional[MeetingSource] = None) -> Optional[Meeting]:
+        """Load the most recent meeting of a type
+
+        Args:
+            meeting_type: Type of meeting to load
+            source: Only consider meetings from this source (default: any)
+        """
+        if source is None:
+            row = self._conn.execute(
+                "SELECT data FROM meetings WHERE meeting_type = ? "
+                "ORDER BY date DESC, language DESC LIMIT 1",
+                (meeting_type.value,)
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                "SELECT data FROM meetings WHERE meeting_type = ? AND source = ? "
+                "ORDER BY date DESC, language DESC LIMIT 1",
+                (meeting_type.value, source.value)
+            ).fetchone()
+
+        return self._row_to_meeting(row)
+
+    def load_best(self, meeting_type: MeetingType) -> Optional[Meeting]:
+        """Load the most recent scraped meeting of a type, falling back to the most recent manual one"""
+        return (self.load_latest(meeting_type, MeetingSource.SCRAPED)
+                or self.load_latest(meeting_type, MeetingSource.MANUAL))
+
+    def get_meeting(self, meeting_type: MeetingType, date: str, language: str) -> Optional[Meeting]:
+        """Load a specific meeting by type, ISO date (YYYY-MM-DD) and language"""
+        row = self._conn.execute(
+            "SELECT data FROM meetings WHERE meeting_type = ? AND date = ? AND language = ?",
+            (meeting_type.value, date, language)
+        ).fetchone()
+        return self._row_to_meeting(row)
+
+    @staticmethod
+    def file_name(meeting_type: str, date: str, language: str) -> str:
+        """Legacy JSON file name of a stored meeting, {type}_{date}_{language}.json"""
+        return f"{meeting_type}_{date}_{language}.json"
+
+    def prune(self, cutoff: float, keep: Iterable[str] = ()) -> Tuple[int, int]:
+        """Delete meetings last saved before cutoff, as data cleanup does with meeting files
+
+        Args:
+            cutoff: time.time() timestamp; meetings saved before it are deleted
+            keep: Meetings never deleted, by file name (see file_name)
+
+        Returns:
+            (meetings deleted, bytes of meeting data freed)
+        """
+        keep = set(keep)
+        rows = self._conn.execute(
+            "SELECT meeting_type, date, language, length(CAST(data AS BLOB)) FROM meetings "
+            "WHERE updated_at < ?",
+            (cutoff,)
+        ).fetchall()
+        stale = [row for row in rows if self.file_name(*row[:3]) not in keep]
+        if stale:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM meetings WHERE meeting_type = ? AND date = ? AND language = ?",
+                    [row[:3] for row in stale]
+                )
+        return len(stale), sum(row[3] for row in stale)
+
+    def count(self) -> int:
+        """Number of stored meetings"""
+        return self._conn.execute("SELECT COUNT(*) FROM meetings").fetchone()[0]
+
+    def _row_to_meeting(self, row) -> Optional[Meeting]:
+        """Deserialize a data row, logging (not raising) on bad data"""
+        if row is None:
+            return None
+        try:
+            return meeting_serializer.loads(row[0])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Error decoding stored meeting: %s", e)
+            return None
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def json_migrated(self) -> bool:
+        """Whether the one-time import of the JSON meeting files has run"""
+        return self._get_meta("json_migrated") is not None
+
+    def import_json_dir(self, meetings_dir: str) -> int:
+        """Import meeting JSON files (one-time migration from file storage)
+
+        Files that fail to parse are skipped. A meeting already in the
+        database is only replaced by a file that is newer than it.
+
+        Returns:
+            Number of meetings imported
+        """
+        meetings = []
+        mtimes = []
+        if os.path.isdir(meetings_dir):
+            with os.scandir(meetings_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json') or not entry.is_file():
+                        continue
+                    try:
+                        with open(entry.path, 'r', encoding='utf-8') as f:
+                            meeting = meeting_serializer.meeting_from_dict(json.load(f))
+                    except (OSError, ValueError, KeyError, TypeError) as e:
+                        logger.warning("Skipping meeting file %s: %s", entry.name, e)
+                        continue
+
+                    row = self._conn.execute(
+                        "SELECT updated_at FROM meetings "
+                        "WHERE meeting_type = ? AND date = ? AND language = ?",
+                        self._key(meeting)
+                    ).fetchone()
+                    mtime = entry.stat().st_mtime
+                    if row is None or row[0] < mtime:
+                        meetings.append(meeting)
+                        mtimes.append(mtime)
+
+        if meetings:
+            self._save_many(meetings, mtimes)
+        self._set_meta("json_migrated", str(time.time()))
+
+        logger.info("Imported %d meeting files into %s", len(meetings), self.db_path)
+        return len(meetings)
+
+    def export_json(self, output_dir: str) -> int:
+        """Export every stored meeting as a JSON file in the legacy file format
+
+        Files are named {type}_{date}_{language}.json so they can be loaded
+        or imported by older versions of the application.
+
+        Returns:
+            Number of files written
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        written = 0
+        rows = self._conn.execute("SELECT meeting_type, date, language, data FROM meetings")
+        for meeting_type, date, language, data in rows:
+            file_path = os.path.join(output_dir, self.file_name(meeting_type, date, language))
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(json.loads(data), f, indent=2)
+            written += 1
+
+        return written
+
+    def export_jsonl(self, file_path: str) -> int:
+        """Export every stored meeting to one JSON Lines file, streaming row by row
+
+        Returns:
+            Number of meetings written
+        """
+        rows = self._conn.execute("SELECT data FROM meetings ORDER BY date, meeting_type, language")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            count = 0
+            for (data,) in rows:
+                f.write(data)
+                f.write('\n')
+                count += 1
+        return count
+
+    def import_jsonl(self, file_path: str, batch_size: int = 500) -> int:
+        """Import meetings from a JSON Lines export without loading the whole file
+
+        Returns:
+            Number of meetings imported
+        """
+        count = 0
+        batch = []
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for meeting in meeting_serializer.iter_meetings(f):
+                batch.append(meeting)
+                if len(batch) >= batch_size:
+                    self._save_many(batch)
+                    count += len(batch)
+                    batch = []
+        if batch:
+            self._save_many(batch)
+            count += len(batch)
+        return count
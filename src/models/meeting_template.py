@@ -5,14 +5,16 @@ This module provides classes for managing meeting templates,
 which can be used to quickly create meetings with standard structures.
 """
 import os
+import copy
 import json
 from enum import Enum
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime, time
 
 from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
 from src.config import APP_DIR, USER_DATA_DIR
+from src.utils.persistence import get_persistence_service
 
 
 class TemplateType(Enum):
@@ -22,9 +24,49 @@ class TemplateType(Enum):
     CUSTOM = "custom"
 
 
+class _PartPrototype(NamedTuple):
+    """Immutable part of a parsed template, in MeetingPart constructor order"""
+    title: str
+    duration_minutes: int
+    presenter: str
+    notes: str
+
+
+class _CachedTemplate(NamedTuple):
+    """A parsed template file with the prototypes meetings are cloned from"""
+    data: Optional[Dict]
+    sections: Tuple[Tuple[str, Tuple[_PartPrototype, ...]], ...]
+    title: Optional[str]
+    language: str
+    mtime_ns: Optional[int] = None
+    size: Optional[int] = None
+    
+    @classmethod
+    def from_data(cls, data: Dict, mtime_ns: Optional[int] = None,
+                  size: Optional[int] = None) -> "_CachedTemplate":
+        """Build the prototypes for template data"""
+        sections = tuple(
+            (section.get('title', ''), tuple(
+                _PartPrototype(
+                    part.get('title', ''),
+                    part.get('duration_minutes', 0),
+                    part.get('presenter', ''),
+                    part.get('notes', '')
+                )
+                for part in section.get('parts', [])
+            ))
+            for section in data.get('sections', [])
+        )
+        return cls(data, sections, data.get('title'), data.get('language', 'en'), mtime_ns, size)
+
+
 class MeetingTemplate:
     """Class for managing meeting templates"""
     
+    # Parsed templates shared by all instances, keyed by file path
+    # (or by TemplateType for the built-in minimal templates)
+    _template_cache: Dict[Union[Path, TemplateType], _CachedTemplate] = {}
+    
     # Directory for storing templates
     TEMPLATES_DIR = USER_DATA_DIR / "templates"
     
@@ -53,28 +95,59 @@ class MeetingTemplate:
         Returns:
             Dictionary containing the template structure
         """
-        # Try to load user-customized template first
-        file_path = self.TEMPLATES_DIR / self.template_files[template_type]
+        # Copy so callers can edit the result without touching the cache
+        return copy.deepcopy(self._get_cached_template(template_type).data)
+    
+    def _get_cached_template(self, template_type: TemplateType) -> "_CachedTemplate":
+        """Get the parsed template for a type, reading a file only if it changed"""
+        filename = self.template_files[template_type]
         
-        if file_path.exists():
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading user template: {e}")
+        # Try to load user-customized template first, then the default template
+        for path, label in ((self.TEMPLATES_DIR / filename, "user"),
+                            (self.DEFAULT_TEMPLATES_DIR / filename, "default")):
+            cached = self._load_cached(path, label)
+            if cached is not None:
+                return cached
         
-        # Fall back to default template
-        default_path = self.DEFAULT_TEMPLATES_DIR / self.template_files[template_type]
+        # If no template found, use a minimal structure
+        cached = self._template_cache.get(template_type)
+        if cached is None:
+            cached = _CachedTemplate.from_data(self._create_minimal_template(template_type))
+            self._template_cache[template_type] = cached
+        return cached
+    
+    def _load_cached(self, path: Path, label: str) -> Optional["_CachedTemplate"]:
+        """Get the cached template for a file, re-parsing it when its mtime or size changed
         
-        if default_path.exists():
+        Returns:
+            The template, or None if the file is missing or unreadable
+        """
+        service = get_persistence_service()
+        if service.has_pending(path):
+            # A queued save already put its data in the cache
+            cached = self._template_cache.get(path)
+            if cached is not None and cached.data is not None:
+                return cached
+            service.flush(path)
+        
+        try:
+            stat = path.stat()
+        except OSError:
+            self._template_cache.pop(path, None)
+            return None
+        
+        cached = self._template_cache.get(path)
+        if cached is None or cached.mtime_ns != stat.st_mtime_ns or cached.size != stat.st_size:
             try:
-                with open(default_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading default template: {e}")
+                with open(path, 'r', encoding='utf-8') as f:
+                    cached = _CachedTemplate.from_data(json.load(f), stat.st_mtime_ns, stat.st_size)
+            except (json.JSONDecodeError, IOError, AttributeError, TypeError) as e:
+                print(f"Error loading {label} template: {e}")
+                # Remember the bad file so it is not re-read until it changes
+                cached = _CachedTemplate(None, (), None, "en", stat.st_mtime_ns, stat.st_size)
+            self._template_cache[path] = cached
         
-        # If no template found, return a minimal structure
-        return self._create_minimal_template(template_type)
+        return cached if cached.data is not None else None
     
     def save_template(self, template_type: TemplateType, template_data: Dict) -> bool:
         """
@@ -90,12 +163,19 @@ class MeetingTemplate:
         file_path = self.TEMPLATES_DIR / self.template_files[template_type]
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(template_data, f, indent=2)
-            return True
-        except IOError as e:
+            # Queued and written in the background
+            get_persistence_service().save_json(file_path, template_data, indent=2)
+        except (TypeError, ValueError) as e:
             print(f"Error saving template: {e}")
             return False
+        
+        try:
+            # Serve the new template from memory until the write lands on disk
+            self._template_cache[file_path] = _CachedTemplate.from_data(copy.deepcopy(template_data))
+        except (AttributeError, TypeError) as e:
+            print(f"Error caching template: {e}")
+            self._template_cache.pop(file_path, None)
+        return True
     
     def create_meeting_from_template(self, 
                                     template_type: TemplateType, 
@@ -112,7 +192,7 @@ class MeetingTemplate:
         Returns:
             A new Meeting object
         """
-        template = self.get_template(template_type)
+        template = self._get_cached_template(template_type)
         
         # Convert template type to meeting type
         if template_type == TemplateType.MIDWEEK:
@@ -122,34 +202,21 @@ class MeetingTemplate:
         else:
             meeting_type = MeetingType.CUSTOM
         
-        # Create sections with parts
-        sections = []
-        for section_template in template.get('sections', []):
-            parts = []
-            
-            for part_template in section_template.get('parts', []):
-                part = MeetingPart(
-                    title=part_template.get('title', ''),
-                    duration_minutes=part_template.get('duration_minutes', 0),
-                    presenter=part_template.get('presenter', ''),
-                    notes=part_template.get('notes', '')
-                )
-                parts.append(part)
-            
-            section = MeetingSection(
-                title=section_template.get('title', ''),
-                parts=parts
-            )
-            sections.append(section)
+        # Clone the prebuilt section and part prototypes
+        sections = [
+            MeetingSection(title=section_title, parts=[MeetingPart(*part) for part in parts])
+            for section_title, parts in template.sections
+        ]
         
         # Create meeting with the template
         meeting = Meeting(
             meeting_type=meeting_type,
-            title=template.get('title', f"{meeting_type.value.capitalize()} Meeting"),
+            title=(template.title if template.title is not None
+                   else f"{meeting_type.value.capitalize()} Meeting"),
             date=meeting_date,
             start_time=meeting_time,
             sections=sections,
-            language=template.get('language', 'en')
+            language=template.language
         )
         
         return meeting
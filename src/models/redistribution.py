@@ -0,0 +1,199 @@
+"""
+Duration redistribution for "end meeting at" targets in the OnTime Meeting Timer application.
+
+Whole minutes are shared out with the largest remainder method: every part
+gets its proportional share rounded down, and the minutes left over go to
+the parts with the largest fractional remainders. No single part absorbs
+the rounding error. Per-part minimum and maximum durations are met by fixing
+parts that would fall outside their bounds and re-sharing the rest. Locked
+parts keep their current duration.
+
+Planning has no side effects, so it doubles as a dry-run preview.
+"""
+import math
+from typing import Callable, Collection, List, Mapping, Optional, Sequence
+
+from src.models.meeting import MeetingPart
+
+TRANSITION_SECONDS = 60
+
+
+def apportion(weights: Sequence[float], total: int,
+              minimums: Sequence[int], maximums: Sequence[Optional[int]]) -> List[int]:
+    """Split total whole units in proportion to weights with the largest remainder method
+
+    Args:
+        weights: Non-negative weight per item
+        total: Number of units to hand out
+        minimums: Lowest allowed value per item
+        maximums: Highest allowed value per item (None for no limit)
+
+    Returns:
+        Units per item, summing to total
+
+    Raises:
+        ValueError: If the bounds make the total impossible to reach
+    """
+    count = len(weights)
+    if count == 0:
+        if total:
+            raise ValueError("Nothing to apportion to")
+        return []
+    if sum(minimums) > total:
+        raise ValueError("Total is below the sum of the minimums")
+    if all(m is not None for m in maximums) and sum(maximums) < total:
+        raise ValueError("Total is above the sum of the maximums")
+
+    result = [0] * count
+    free = list(range(count))
+    remaining = total
+    shares = {}
+
+    # Fix items whose proportional share breaks a bound, then re-share the rest
+    while free:
+        weight_sum = sum(weights[i] for i in free)
+        if weight_sum > 0:
+            shares = {i: weights[i] * remaining / weight_sum for i in free}
+        else:
+            shares = {i: remaining / len(free) for i in free}
+
+        low = [i for i in free if shares[i] < minimums[i]]
+        high = [i for i in free if maximums[i] is not None and shares[i] > maximums[i]]
+        if not low and not high:
+            break
+
+        deficit = sum(minimums[i] - shares[i] for i in low)
+        excess = sum(shares[i] - maximums[i] for i in high)
+        fixed, bounds = (low, minimums) if deficit >= excess else (high, maximums)
+        for i in fixed:
+            result[i] = bounds[i]
+            remaining -= bounds[i]
+        fixed = set(fixed)
+        free = [i for i in free if i not in fixed]
+
+    if not free:
+        return result
+
+    for i in free:
+        result[i] = math.floor(shares[i])
+    leftover = remaining - sum(result[i] for i in free)
+
+    # Largest remainders first; ties go to the larger weight, then the earlier item
+    order = sorted(free, key=lambda i: (result[i] - shares[i], -weights[i], i))
+    for i in order:
+        if leftover <= 0:
+            break
+        if maximums[i] is None or result[i] < maximums[i]:
+            result[i] += 1
+            leftover -= 1
+
+    return result
+
+
+def plan_redistribution(parts: Sequence[MeetingPart],
+                        transitions_between: Callable[[int, int], int],
+                        current_index: int,
+                        current_elapsed: int,
+                        current_remaining: int,
+                        from_index: int,
+                        seconds_available: float,
+                        locked: Collection[int] = (),
+                        min_minutes: Optional[Mapping[int, int]] = None,
+                        max_minutes: Optional[Mapping[int, int]] = None) -> dict:
+    """Plan new durations so the parts from from_index on fit the available time
+
+    Args:
+        parts: All meeting parts by global index
+        transitions_between: (first, last) -> chairman transitions after parts first..last-1
+        current_index: Global index of the running part
+        current_elapsed: Seconds elapsed in the running part
+        current_remaining: Seconds remaining in the running part
+        from_index: First part to adjust (the running part or a later one)
+        seconds_available: Seconds from now until the target end
+        locked: Global indices of parts that keep their duration
+        min_minutes: Lowest duration per global index (default 1 minute)
+        max_minutes: Highest duration per global index (default no limit)
+
+    Returns:
+        Dict with 'success', 'error' (if failed), 'adjusted_parts' list of
+        (global_index, old_minutes, new_minutes) tuples and 'planned_seconds',
+        the seconds from now until the end of the meeting under the plan
+    """
+    locked = set(locked)
+    min_minutes = min_minutes or {}
+    max_minutes = max_minutes or {}
+    part_count = len(parts)
+
+    # Time before from_index that is not adjusted
+    fixed_seconds = 0.0
+    if from_index > current_index:
+        fixed_seconds += max(0, current_remaining)
+        fixed_seconds += sum(parts[i].duration_seconds for i in range(current_index + 1, from_index))
+        fixed_seconds += transitions_between(current_index, from_index) * TRANSITION_SECONDS
+
+    # Transitions within the adjusted range
+    fixed_seconds += transitions_between(from_index, part_count) * TRANSITION_SECONDS
+
+    adjustable = []
+    for i in range(from_index, part_count):
+        if i in locked:
+            fixed_seconds += max(0, current_remaining) if i == current_index else parts[i].duration_seconds
+        else:
+            adjustable.append(i)
+    if not adjustable:
+        return {'success': False, 'error': 'No parts to adjust'}
+
+    available = seconds_available - fixed_seconds
+
+    # For the running part, only its remaining time is adjustable
+    elapsed = current_elapsed if adjustable[0] == current_index else 0
+
+    weights = []
+    minimums = []
+    maximums = []
+    for i in adjustable:
+        part = parts[i]
+        original = (part.original_duration_minutes or part.duration_minutes) * 60
+        minimum = max(1, min_minutes.get(i, 1))
+        if i == current_index:
+            original = max(0, original - elapsed)
+            # Enough to cover what has already elapsed plus part of a minute
+            minimum = max(minimum, elapsed // 60 + 1)
+        weights.append(original)
+        minimums.append(minimum)
+        maximum = max_minutes.get(i)
+        maximums.append(None if maximum is None else max(maximum, minimum))
+
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        return {'success': False, 'error': 'No adjustable time in selected parts'}
+
+    # Proportional share of the available time in minutes, with elapsed time added back
+    quotas = [w * max(0.0, available) / weight_sum for w in weights]
+    if elapsed:
+        quotas[0] += elapsed
+    quotas = [q / 60 for q in quotas]
+    total = round((available + elapsed) / 60)
+
+    if total < sum(minimums):
+        mins_needed = math.ceil((sum(minimums) * 60 - elapsed) / 60)
+        mins_available = int(available / 60)
+        return {
+            'success': False,
+            'error': f'Not enough time: need at least {mins_needed} min, '
+                     f'but only {mins_available} min available'
+        }
+    if all(m is not None for m in maximums) and total > sum(maximums):
+        return {
+            'success': False,
+            'error': f'Too much time: the parts can take at most {sum(maximums)} min'
+        }
+
+    new_minutes = apportion(quotas, total, minimums, maximums)
+    adjusted_parts = [(i, parts[i].duration_minutes, minutes) for i, minutes in zip(adjustable, new_minutes)]
+
+    return {
+        'success': True,
+        'adjusted_parts': adjusted_parts,
+        'planned_seconds': fixed_seconds + sum(new_minutes) * 60 - elapsed
+    }
@@ -0,0 +1,140 @@
+"""
+Planned schedule of a meeting for "what-if" queries in the OnTime Meeting Timer application.
+
+The schedule lays the parts and the chairman transitions between them on a
+timeline measured in seconds from the meeting start. Prefix sums over that
+timeline are built once per change to the meeting, so questions such as
+"when does the meeting end if part k overruns by x seconds", "how late can
+part k start" or "how much slack does each section have" cost O(1) each.
+"""
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from src.models.meeting import MeetingPart, MeetingType
+from src.models.transition_rules import TransitionPlan
+
+TRANSITION_SECONDS = 60
+
+# Slack is reported in whole minutes; near a minute boundary the previous
+# value is kept until the drift is this many seconds past it
+SLACK_HYSTERESIS_SECONDS = 10
+
+
+def _whole_minutes(seconds: float) -> int:
+    """Seconds rounded toward zero to whole minutes, as the slack is displayed"""
+    return int(seconds / 60) * 60
+
+
+class MeetingSchedule:
+    """Timeline of planned part and transition times with prefix sums
+
+    All offsets are seconds from the planned start of the first part.
+    """
+
+    def __init__(self, meeting_type: MeetingType, parts: Sequence[MeetingPart],
+                 section_of: Sequence[int], section_count: int):
+        """
+        Args:
+            meeting_type: Type of meeting (selects the transition rules)
+            parts: All parts by global index
+            section_of: Section index of each part
+            section_count: Number of sections, including empty ones
+        """
+        part_count = len(parts)
+        self.part_count = part_count
+        self.transitions = TransitionPlan(meeting_type, parts)
+
+        # _starts[i] = planned start of part i; _starts[n] = planned end of the meeting
+        # _durations_before[i] = sum of part durations before part i (no transitions)
+        self._durations = array('i', [part.duration_seconds for part in parts])
+        self._transitions = array('i', [
+            TRANSITION_SECONDS if self.transitions.has_transition_after(i) else 0
+            for i in range(part_count)
+        ])
+        self._starts = array('i', [0] * (part_count + 1))
+        self._durations_before = array('i', [0] * (part_count + 1))
+        for i in range(part_count):
+            self._durations_before[i + 1] = self._durations_before[i] + self._durations[i]
+            self._starts[i + 1] = self._starts[i] + self._durations[i] + self._transitions[i]
+
+        # Last part of each section (-1 for empty sections)
+        self._section_last = array('i', [-1] * section_count)
+        for i, section_index in enumerate(section_of):
+            self._section_last[section_index] = i
+
+    @property
+    def total_seconds(self) -> int:
+        """Planned length of the meeting, transitions included"""
+        return self._starts[self.part_count]
+
+    def start_offset(self, part_index: int) -> int:
+        """Planned start of a part"""
+        return self._starts[part_index]
+
+    def end_offset(self, part_index: int) -> int:
+        """Planned end of a part (before the transition that may follow it)"""
+        return self._starts[part_index] + self._durations[part_index]
+
+    def transition_after(self, part_index: int) -> int:
+        """Seconds of chairman transition planned after a part"""
+        return self._transitions[part_index]
+
+    def durations_between(self, first: int, last: int) -> int:
+        """Sum of the durations of parts first..last-1, without transitions"""
+        if last <= first:
+            return 0
+        return self._durations_before[last] - self._durations_before[first]
+
+    def section_end_offset(self, section_index: int) -> Optional[int]:
+        """Planned end of a section's last part (None for an empty section)"""
+        last = self._section_last[section_index]
+        return self.end_offset(last) if last >= 0 else None
+
+    def remaining_seconds(self, current_index: int, current_remaining: int) -> int:
+        """Seconds from now until the planned end, given the running part's remaining time"""
+        return max(0, current_remaining) + self.total_seconds - self.end_offset(current_index)
+
+    def predicted_end(self, current_index: int, current_remaining: int,
+                      overrun_part: Optional[int] = None, overrun_seconds: int = 0) -> int:
+        """Seconds from now until the meeting ends if overrun_part runs overrun_seconds long
+
+        Overruns of parts that are already finished have no effect.
+        """
+        remaining = self.remaining_seconds(current_index, current_remaining)
+        if overrun_part is not None and overrun_part >= current_index:
+            remaining += overrun_seconds
+        return remaining
+
+    def predicted_ends(self, current_index: int, current_remaining: int,
+                       overruns: Iterable[Tuple[int, int]]) -> List[int]:
+        """predicted_end for each (part index, overrun seconds) query"""
+        return [self.predicted_end(current_index, current_remaining, part, seconds)
+                for part, seconds in overruns]
+
+    def latest_start(self, part_index: int, deadline_offset: int) -> int:
+        """Latest start of a part that still lets the rest of the plan end by deadline_offset"""
+        return deadline_offset - (self.total_seconds - self._starts[part_index])
+
+    def section_slack(self, current_index: int, now_offset: float, current_remaining: float,
+                      previous: Optional[int] = None) -> List[Optional[int]]:
+        """Seconds each section is ahead of plan (negative when behind), in whole minutes
+
+        Sections that have already ended, or that have no parts, are None.
+
+        Args:
+            current_index: Global index of the running part
+            now_offset: Seconds since the actual meeting start
+            current_remaining: Seconds remaining in the running part, measured
+                at the same moment as now_offset (from the timer's deadline)
+            previous: Slack reported last time; it is kept while the drift
+                stays within SLACK_HYSTERESIS_SECONDS of its minute
+        """
+        # Every later part is planned relative to the running part, so the
+        # predicted drift is the same for every section that has not ended
+        drift = self.end_offset(current_index) - (now_offset + max(0, current_remaining))
+        slack = _whole_minutes(drift)
+        if previous is not None and slack != previous and previous in (
+                _whole_minutes(drift - SLACK_HYSTERESIS_SECONDS),
+                _whole_minutes(drift + SLACK_HYSTERESIS_SECONDS)):
+            slack = previous
+        return [slack if last >= current_index else None for last in self._section_last]
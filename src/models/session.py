@@ -1,9 +1,9 @@
 """
 Session persistence model for crash recovery in OnTime Meeting Timer.
 """
-import hashlib
 import json
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +11,9 @@ from typing import Optional, TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from src.models.meeting_serializer import meeting_to_dict
+from src.utils.persistence import get_persistence_service
+
 logger = logging.getLogger("OnTime.SessionManager")
 
 if TYPE_CHECKING:
@@ -20,7 +23,7 @@ if TYPE_CHECKING:
 @dataclass
 class SessionState:
     """Represents a recoverable meeting session state"""
-    version: str = "1.0"
+    version: str = "2.0"
     clean_exit: bool = False
     meeting_file: str = ""
     meeting_hash: str = ""
@@ -79,12 +82,28 @@ class SessionState:
 
 
 class SessionManager(QObject):
-    """Manages session persistence for crash recovery"""
+    """Manages session persistence for crash recovery
+
+    The session is stored as a snapshot (``session.json``) plus an
+    append-only journal (``session.journal``). Timer events (start, pause,
+    resume, part change, adjustments) append one compact line each; elapsed
+    time is never written because recovery derives it from the timestamp
+    of the last event. The journal is folded into a new snapshot every
+    ``COMPACT_AFTER_ENTRIES`` lines, and snapshots are replaced atomically.
+    """
 
     SESSION_FILE = "session.json"
-    AUTOSAVE_INTERVAL_MS = 5000  # 5 seconds
+    JOURNAL_FILE = "session.journal"
+    COMPACT_AFTER_ENTRIES = 50
     STALE_SESSION_HOURS = 24
 
+    # Fields that change during a meeting and are written to the journal
+    JOURNAL_FIELDS = (
+        'current_part_index', 'timer_state', 'total_seconds', 'elapsed_seconds',
+        'remaining_seconds', 'in_transition', 'next_part_after_transition',
+        'total_overtime_seconds', 'last_save_time', 'network_broadcast_active'
+    )
+
     # Signals
     session_saved = pyqtSignal()
 
@@ -92,18 +111,33 @@ class SessionManager(QObject):
         super().__init__(parent)
         self.data_dir = Path(data_dir)
         self.session_file = self.data_dir / self.SESSION_FILE
+        self.journal_file = self.data_dir / self.JOURNAL_FILE
 
-        self._autosave_timer = QTimer(self)
-        self._autosave_timer.timeout.connect(self._autosave)
+        # Events raised in the same event-loop iteration are written as one entry
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_events)
 
         self._current_session: Optional[SessionState] = None
         self._timer_controller = None
         self._meeting_file: str = ""
+        self._pending_events: list = []
+        self._last_journal_state: Optional[dict] = None
+        self._journal_entries = 0
+        self._last_deadline: Optional[float] = None
 
     def set_timer_controller(self, timer_controller):
-        """Set reference to timer controller for state updates"""
+        """Set reference to timer controller and record its events"""
         self._timer_controller = timer_controller
 
+        timer_controller.timer.state_changed.connect(self._on_timer_state_changed)
+        timer_controller.timer.time_updated.connect(self._on_time_updated)
+        timer_controller.part_changed.connect(lambda part, index: self.record_event("part_change"))
+        timer_controller.transition_started.connect(lambda text: self.record_event("transition"))
+        timer_controller.durations_redistributed.connect(lambda parts: self.record_event("redistribute"))
+        timer_controller.durations_reset.connect(lambda: self.record_event("reset_durations"))
+
     def start_session(self, meeting: 'Meeting', meeting_file: str):
         """Start tracking a new meeting session"""
         self._meeting_file = meeting_file
@@ -113,12 +147,34 @@ class SessionManager(QObject):
             meeting_hash=self._compute_meeting_hash(meeting),
             meeting_start_time=datetime.now().isoformat()
         )
+        self._pending_events = []
+        self.update_session_from_controller()
 
         # Save the meeting file to ensure it exists for recovery
         self._save_meeting_for_recovery(meeting, meeting_file)
 
         self._save_session()
-        self._autosave_timer.start(self.AUTOSAVE_INTERVAL_MS)
+
+    def record_event(self, event: str):
+        """Queue a session event; the journal is written once control returns to the event loop"""
+        if not self._current_session:
+            return
+
+        self._pending_events.append(event)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _on_timer_state_changed(self, state):
+        """Record timer state changes (running, paused, overtime, ...)"""
+        self._last_deadline = self._timer_controller.timer.deadline
+        self.record_event(state.name.lower())
+
+    def _on_time_updated(self, seconds: int):
+        """Record adjustments, detected as a change of the timer deadline"""
+        deadline = self._timer_controller.timer.deadline
+        if deadline != self._last_deadline:
+            self._last_deadline = deadline
+            self.record_event("adjust")
 
     def _save_meeting_for_recovery(self, meeting: 'Meeting', meeting_file: str):
         """Save the meeting to MEETINGS_DIR for crash recovery"""
@@ -126,10 +182,8 @@ class SessionManager(QObject):
 
         meeting_path = MEETINGS_DIR / meeting_file
         try:
-            MEETINGS_DIR.mkdir(parents=True, exist_ok=True)
-            with open(meeting_path, 'w', encoding='utf-8') as f:
-                json.dump(meeting.to_dict(), f, indent=2)
-        except IOError as e:
+            get_persistence_service().save_json(meeting_path, meeting_to_dict(meeting), indent=2)
+        except (TypeError, ValueError) as e:
             logger.error("Error saving meeting for recovery: %s", e)
 
     def update_session_from_controller(self):
@@ -156,16 +210,20 @@ class SessionManager(QObject):
         if self._current_session:
             self._current_session.network_broadcast_active = is_active
             logger.debug("Session network_broadcast_active now: %s", self._current_session.network_broadcast_active)
+            self.record_event("broadcast")
         else:
             logger.debug("No current session to update network broadcast state")
 
     def end_session(self, clean: bool = True):
         """End the current session"""
-        self._autosave_timer.stop()
-
         if clean:
-            # Clean exit - delete the session file
+            # Clean exit - delete the session files
+            self._flush_timer.stop()
+            self._pending_events = []
             self._delete_session_file()
+        else:
+            # Keep the session recoverable with its latest state
+            self._flush_events()
 
         self._current_session = None
 
@@ -178,6 +236,9 @@ class SessionManager(QObject):
             with open(self.session_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
+            # Replay journal entries written after the snapshot
+            data.update(self._replay_journal())
+
             session = SessionState.from_dict(data)
 
             # If clean_exit is True, previous session ended normally
@@ -191,6 +252,23 @@ class SessionManager(QObject):
             logger.error("Error reading session file: %s", e)
             return None
 
+    def recovery_meeting_file(self) -> Optional[str]:
+        """Meeting file the current or a recoverable session needs, if any
+
+        Unlike check_for_recovery(), the session files are left as they are.
+        """
+        if self._current_session:
+            return self._meeting_file or None
+
+        try:
+            with open(self.session_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('clean_exit'):
+            return None
+        return data.get('meeting_file') or None
+
     def is_session_stale(self, session: SessionState) -> bool:
         """Check if a session is older than STALE_SESSION_HOURS"""
         if not session.last_save_time:
@@ -263,7 +341,8 @@ class SessionManager(QObject):
 
     def clear_session(self):
         """Clear the session file without marking clean exit"""
-        self._autosave_timer.stop()
+        self._flush_timer.stop()
+        self._pending_events = []
         self._delete_session_file()
         self._current_session = None
 
@@ -271,38 +350,97 @@ class SessionManager(QObject):
         """Check if there's an active session being tracked"""
         return self._current_session is not None
 
-    def _autosave(self):
-        """Periodic autosave callback"""
-        if self._current_session:
-            self.update_session_from_controller()
+    def _flush_events(self):
+        """Append pending events to the journal if the session state changed"""
+        if not self._current_session or not self._pending_events:
+            return
+
+        events = self._pending_events
+        self._pending_events = []
+
+        self.update_session_from_controller()
+        state = self._current_session.to_dict()
+        journal_state = {key: state[key] for key in self.JOURNAL_FIELDS if key != 'last_save_time'}
+        if journal_state == self._last_journal_state:
+            return
+
+        entry = {'events': events}
+        entry.update({key: state[key] for key in self.JOURNAL_FIELDS})
+
+        try:
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, separators=(',', ':')) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error("Error writing session journal: %s", e)
+            return
+
+        self._last_journal_state = journal_state
+        self._journal_entries += 1
+
+        if self._journal_entries >= self.COMPACT_AFTER_ENTRIES:
+            # Fold the journal into a fresh snapshot
             self._save_session()
+        else:
+            self.session_saved.emit()
+
+    def _replay_journal(self) -> dict:
+        """Return the session fields reconstructed from the journal"""
+        replayed = {}
+        if not self.journal_file.exists():
+            return replayed
+
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-append leaves a partial last line
+                        logger.warning("Ignoring truncated session journal entry")
+                        break
+                    replayed.update({key: entry[key] for key in self.JOURNAL_FIELDS if key in entry})
+        except IOError as e:
+            logger.error("Error reading session journal: %s", e)
+
+        return replayed
 
     def _save_session(self):
-        """Save current session to file"""
+        """Write a session snapshot atomically and reset the journal"""
         if not self._current_session:
             return
 
+        state = self._current_session.to_dict()
+        temp_file = self.session_file.with_name(self.session_file.name + ".tmp")
         try:
             self.data_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                json.dump(self._current_session.to_dict(), f, indent=2)
-            self.session_saved.emit()
-        except IOError as e:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.session_file)
+
+            # Entries are now part of the snapshot; replaying them again would be harmless
+            with open(self.journal_file, 'w', encoding='utf-8'):
+                pass
+        except OSError as e:
             logger.error("Error saving session: %s", e)
+            return
+
+        self._last_journal_state = {key: state[key] for key in self.JOURNAL_FIELDS if key != 'last_save_time'}
+        self._journal_entries = 0
+        self.session_saved.emit()
 
     def _delete_session_file(self):
-        """Delete the session file"""
-        try:
-            if self.session_file.exists():
-                self.session_file.unlink()
-        except IOError as e:
-            logger.error("Error deleting session file: %s", e)
+        """Delete the session snapshot and journal"""
+        for path in (self.session_file, self.journal_file):
+            try:
+                if path.exists():
+                    path.unlink()
+            except IOError as e:
+                logger.error("Error deleting session file %s: %s", path.name, e)
 
     def _compute_meeting_hash(self, meeting: 'Meeting') -> str:
-        """Compute a hash of meeting parts for change detection"""
-        parts_data = []
-        for part in meeting.get_all_parts():
-            parts_data.append(f"{part.title}:{part.duration_minutes}")
-
-        content = "|".join(parts_data)
-        return hashlib.md5(content.encode()).hexdigest()[:8]
+        """Compute a hash of meeting parts for change detection (cached by the meeting)"""
+        return meeting.parts_hash()
@@ -8,6 +8,7 @@ from datetime import time
 from enum import Enum
 from typing import Dict, Optional, List
 from .timer import TimerDisplayMode
+from src.utils.persistence import get_persistence_service
 
 
 class DayOfWeek(Enum):
@@ -105,18 +106,21 @@ class DataCleanupSettings:
     """Settings for automatic data cleanup / garbage collection"""
     enabled: bool = True
     retention_days: int = 90  # Default 90 days
+    cache_budget_mb: int = 200  # Size limit of the EPUB and web scraper caches
 
     def to_dict(self) -> dict:
         return {
             'enabled': self.enabled,
-            'retention_days': self.retention_days
+            'retention_days': self.retention_days,
+            'cache_budget_mb': self.cache_budget_mb
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'DataCleanupSettings':
         return cls(
             enabled=data.get('enabled', True),
-            retention_days=data.get('retention_days', 90)
+            retention_days=data.get('retention_days', 90),
+            cache_budget_mb=data.get('cache_budget_mb', 200)
         )
 
 
@@ -200,6 +204,7 @@ class MeetingSourceSettings:
     auto_update_meetings: bool = True
     save_scraped_as_template: bool = False  # Option to save scraped meetings as templates
     weekend_songs_manual: bool = True  # Always manually enter weekend songs
+    use_meeting_database: bool = True  # Store meeting history in SQLite instead of JSON files
     
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
@@ -207,7 +212,8 @@ class MeetingSourceSettings:
             'mode': self.mode.value,
             'auto_update_meetings': self.auto_update_meetings,
             'save_scraped_as_template': self.save_scraped_as_template,
-            'weekend_songs_manual': self.weekend_songs_manual
+            'weekend_songs_manual': self.weekend_songs_manual,
+            'use_meeting_database': self.use_meeting_database
         }
     
     @classmethod
@@ -217,7 +223,8 @@ class MeetingSourceSettings:
             mode=MeetingSourceMode(data.get('mode', MeetingSourceMode.WEB_SCRAPING.value)),
             auto_update_meetings=data.get('auto_update_meetings', True),
             save_scraped_as_template=data.get('save_scraped_as_template', False),
-            weekend_songs_manual=data.get('weekend_songs_manual', True)
+            weekend_songs_manual=data.get('weekend_songs_manual', True),
+            use_meeting_database=data.get('use_meeting_database', True)
         )
 
 
@@ -292,6 +299,9 @@ class SettingsManager:
 
     def _load_settings(self) -> AppSettings:
         """Load settings from file or create default settings"""
+        # Make sure a queued save of this file is on disk before reading it
+        get_persistence_service().flush(self.settings_file)
+
         if os.path.exists(self.settings_file):
             try:
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
@@ -301,8 +311,7 @@ class SettingsManager:
                 settings = AppSettings.from_dict(migrated)
                 # Auto-save if migration changed the version (upgrades old files in place)
                 if migrated.get('_settings_version') != settings_dict.get('_settings_version'):
-                    with open(self.settings_file, 'w', encoding='utf-8') as fw:
-                        json.dump(settings.to_dict(), fw, indent=2)
+                    get_persistence_service().save_json(self.settings_file, settings.to_dict(), indent=2)
                 return settings
             except (json.JSONDecodeError, KeyError, ValueError) as e:
                 print(f"Error loading settings: {e}")
@@ -334,9 +343,12 @@ class SettingsManager:
         return data
 
     def save_settings(self):
-        """Save current settings to file"""
-        with open(self.settings_file, 'w', encoding='utf-8') as f:
-            json.dump(self.settings.to_dict(), f, indent=2)
+        """Queue current settings for saving (rapid saves collapse into one write)"""
+        get_persistence_service().save_json(self.settings_file, self.settings.to_dict(), indent=2)
+
+    def flush(self):
+        """Write any queued settings save to disk now"""
+        get_persistence_service().flush(self.settings_file)
 
     def reset_settings(self):
         """Reset settings to defaults"""
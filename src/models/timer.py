@@ -83,7 +83,18 @@ class Timer(QObject):
         if self._total_seconds == 0:
             return 0
         return (self.elapsed_seconds / self._total_seconds) * 100
-    
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Get the time.time() timestamp at which the remaining time reaches zero.
+
+        Stays constant while the timer runs, so it only changes on start,
+        pause/resume, adjustments and part changes. None when not counting.
+        """
+        if self._start_time is None or self._state in (TimerState.STOPPED, TimerState.PAUSED):
+            return None
+        return self._start_time + self._total_seconds - self._elapsed_time
+
     def _update_current_time(self):
         """Update and emit the current time"""
         current_time = datetime.now().strftime("%H:%M:%S")
@@ -0,0 +1,107 @@
+"""
+Chairman transition rules for the OnTime Meeting Timer application.
+
+A rule decides, for one meeting type, whether a chairman transition follows
+a given part. TransitionPlan evaluates the rule once for every part of a
+meeting. It stores the answers as a per-part bitmap with a suffix count
+array, so "is there a transition after part i", "how many transitions are
+left" and "how many transitions between parts a and b" are all O(1).
+
+Rules for other meeting types can be added with register_transition_rule.
+"""
+from array import array
+from typing import Callable, Dict, Optional, Sequence
+
+from src.models.meeting import MeetingPart, MeetingType
+
+# (parts, index) -> whether a transition follows parts[index]; never called for the last part
+TransitionRule = Callable[[Sequence[MeetingPart], int], bool]
+
+_RULES: Dict[MeetingType, TransitionRule] = {}
+
+
+def register_transition_rule(meeting_type: MeetingType, rule: Optional[TransitionRule] = None):
+    """Register the transition rule for a meeting type (usable as a decorator)"""
+    def register(rule: TransitionRule) -> TransitionRule:
+        _RULES[meeting_type] = rule
+        return rule
+    if rule is not None:
+        return register(rule)
+    return register
+
+
+def _every_part(parts: Sequence[MeetingPart], index: int) -> bool:
+    """Default rule: a transition after every part"""
+    return True
+
+
+@register_transition_rule(MeetingType.MIDWEEK)
+def _midweek_rule(parts: Sequence[MeetingPart], index: int) -> bool:
+    total_parts = len(parts)
+
+    # NO transition after Opening Song/Prayer (first part)
+    if index == 0:
+        return False
+
+    # NO transition after Congregation Bible Study (3rd-to-last, typically 30 min)
+    if index == total_parts - 3 and parts[index].duration_minutes >= 25:
+        return False
+
+    # NO transition after Concluding Comments / Review and Preview (2nd-to-last)
+    if index == total_parts - 2:
+        return False
+
+    # All other parts get transitions
+    return True
+
+
+@register_transition_rule(MeetingType.WEEKEND)
+def _weekend_rule(parts: Sequence[MeetingPart], index: int) -> bool:
+    # Transition only before the parts at index 1 and 2
+    return index + 1 in (1, 2)
+
+
+def get_transition_rule(meeting_type: MeetingType) -> TransitionRule:
+    """Get the rule for a meeting type (a transition after every part if none is registered)"""
+    return _RULES.get(meeting_type, _every_part)
+
+
+class TransitionPlan:
+    """Which parts of a meeting are followed by a chairman transition"""
+    __slots__ = ('_flags', '_suffix')
+
+    def __init__(self, meeting_type: MeetingType, parts: Sequence[MeetingPart]):
+        rule = get_transition_rule(meeting_type)
+        part_count = len(parts)
+
+        # No transition after the last part
+        self._flags = bytearray(part_count)
+        for i in range(part_count - 1):
+            self._flags[i] = bool(rule(parts, i))
+
+        # _suffix[i] = transitions after parts i..n-1
+        self._suffix = array('i', [0] * (part_count + 1))
+        for i in range(part_count - 1, -1, -1):
+            self._suffix[i] = self._suffix[i + 1] + self._flags[i]
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def has_transition_after(self, part_index: int) -> bool:
+        """Whether a transition follows the part"""
+        return 0 <= part_index < len(self._flags) and bool(self._flags[part_index])
+
+    @property
+    def total(self) -> int:
+        """Number of transitions in the meeting"""
+        return self._suffix[0]
+
+    def remaining_from(self, part_index: int) -> int:
+        """Number of transitions after parts part_index..last"""
+        return self._suffix[min(max(part_index, 0), len(self._flags))]
+
+    def between(self, first: int, last: int) -> int:
+        """Number of transitions after parts first..last-1"""
+        if last <= first:
+            return 0
+        return self.remaining_from(first) - self.remaining_from(last)
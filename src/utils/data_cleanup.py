@@ -3,28 +3,46 @@ Data cleanup utility for removing stale meeting files and cache data.
 Runs on startup to prevent indefinite file accumulation.
 """
 import logging
+import os
+import sqlite3
 import time as time_module
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from src.models.meeting_store import MeetingStore
+
 logger = logging.getLogger("OnTime.DataCleanup")
 
+# Default size budget of the EPUB and web scraper caches
+DEFAULT_CACHE_BUDGET_BYTES = 200 * 1024 * 1024
+
+# Cache files the cleanup manages: EPUBs (and partial downloads), scraped
+# pages, meeting links and meetings caches, EPUB outlines, interrupted writes
+EPUB_SUFFIXES = ('.epub', '.epub.part')
+CACHE_SUFFIXES = EPUB_SUFFIXES + ('.html', '.json', '.tmp', '.part')
+
+# Meetings extracted from an EPUB, stored next to it (EPUBMeetingScraper.OUTLINE_SUFFIX)
+OUTLINE_SUFFIX = '.outline.json'
+
 
 @dataclass
 class CleanupResult:
     """Result of a cleanup operation"""
     meetings_removed: int = 0
+    stored_meetings_removed: int = 0  # Rows deleted from the meeting database
     epub_files_removed: int = 0
     cache_files_removed: int = 0
     total_bytes_freed: int = 0
     errors: List[str] = field(default_factory=list)
+    interrupted: bool = False  # Stopped before the end, the next run goes on
 
     @property
     def total_removed(self) -> int:
-        return self.meetings_removed + self.epub_files_removed + self.cache_files_removed
+        return (self.meetings_removed + self.stored_meetings_removed
+                + self.epub_files_removed + self.cache_files_removed)
 
     @property
     def has_removals(self) -> bool:
@@ -35,6 +53,8 @@ class CleanupResult:
         parts = []
         if self.meetings_removed:
             parts.append(f"{self.meetings_removed} meeting file(s)")
+        if self.stored_meetings_removed:
+            parts.append(f"{self.stored_meetings_removed} saved meeting(s)")
         if self.epub_files_removed:
             parts.append(f"{self.epub_files_removed} EPUB cache file(s)")
         if self.cache_files_removed:
@@ -44,8 +64,30 @@ class CleanupResult:
         return f"Removed {', '.join(parts)} ({size_str} freed)"
 
 
+@dataclass
+class _CacheFile:
+    """A cache file found by the cache scan"""
+    name: str
+    path: str
+    size: int
+    mtime: float
+    last_used: float
+    is_epub: bool
+
+
 class CleanupWorker(QThread):
-    """Worker thread that performs file cleanup off the main thread."""
+    """Worker thread that performs file cleanup off the main thread.
+
+    Meeting files, meetings in the meeting database and cache files are
+    removed once they are older than the retention period. The cache is then kept under a size budget by evicting
+    the least recently used EPUB and web scraper files first, so it stays
+    bounded however many languages are used. Files in use are never removed.
+
+    Each directory is read once with os.scandir, and each file's stat is
+    taken from its directory entry. A run can be stopped with
+    requestInterruption() between two files; what is left is removed by the
+    next run.
+    """
 
     finished = pyqtSignal(object)  # emits CleanupResult
 
@@ -55,27 +97,38 @@ class CleanupWorker(QThread):
         cache_dir: Path,
         retention_days: int,
         active_meeting_files: Set[str],
-        parent=None
+        parent=None,
+        meeting_index=None,
+        cache_budget_bytes: Optional[int] = DEFAULT_CACHE_BUDGET_BYTES,
+        protected_cache_files: Optional[Set[str]] = None,
+        meeting_db_path: Optional[str] = None
     ):
         super().__init__(parent)
         self.meetings_dir = meetings_dir
         self.cache_dir = cache_dir
         self.retention_days = retention_days
         self.active_meeting_files = active_meeting_files
+        self.meeting_index = meeting_index  # Optional MeetingIndex for the meetings dir
+        self.cache_budget_bytes = cache_budget_bytes  # None: no size limit
+        self.protected_cache_files = protected_cache_files or set()
+        self.meeting_db_path = meeting_db_path  # Optional MeetingStore database
 
     def run(self):
         result = CleanupResult()
         cutoff = time_module.time() - (self.retention_days * 86400)
 
-        # 1. Clean meeting JSON files
+        # 1. Clean meeting JSON files and the meeting database
         self._clean_meetings(cutoff, result)
+        if not self.isInterruptionRequested():
+            self._clean_meeting_store(cutoff, result)
 
-        # 2. Clean EPUB cache files
-        self._clean_epub_cache(cutoff, result)
-
-        # 3. Clean web scraper cache files (HTML + JSON)
-        self._clean_scraper_cache(cutoff, result)
+        # 2. Clean EPUB and web scraper cache files (one pass over the cache dir)
+        if not self.isInterruptionRequested():
+            self._clean_cache(cutoff, result)
 
+        result.interrupted = self.isInterruptionRequested()
+        if result.interrupted:
+            logger.info("Cleanup interrupted, the rest is left for the next run")
         if result.has_removals:
             logger.info("Cleanup complete: %s", result.summary())
         else:
@@ -88,65 +141,185 @@ class CleanupWorker(QThread):
         if not self.meetings_dir.exists():
             return
 
-        for f in self.meetings_dir.iterdir():
-            if not f.is_file() or f.suffix != '.json':
+        if self.meeting_index is not None:
+            self._clean_indexed_meetings(cutoff, result)
+            return
+
+        try:
+            entries = list(os.scandir(self.meetings_dir))
+        except OSError as e:
+            result.errors.append(f"Meetings folder: {e}")
+            logger.warning("Failed to read %s: %s", self.meetings_dir, e)
+            return
+
+        for entry in entries:
+            if self.isInterruptionRequested():
+                return
+            if not entry.name.endswith('.json'):
                 continue
             # Never delete settings.json
-            if f.name == 'settings.json':
+            if entry.name == 'settings.json':
                 continue
             # Skip currently loaded meeting files
-            if f.name in self.active_meeting_files:
+            if entry.name in self.active_meeting_files:
                 continue
             try:
-                if f.stat().st_mtime < cutoff:
-                    size = f.stat().st_size
-                    f.unlink()
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                if stat.st_mtime < cutoff:
+                    os.unlink(entry.path)
                     result.meetings_removed += 1
-                    result.total_bytes_freed += size
-                    logger.debug("Removed stale meeting: %s", f.name)
+                    result.total_bytes_freed += stat.st_size
+                    logger.debug("Removed stale meeting: %s", entry.name)
+            except FileNotFoundError:
+                pass
             except OSError as e:
-                result.errors.append(f"Meeting {f.name}: {e}")
-                logger.warning("Failed to remove %s: %s", f, e)
+                result.errors.append(f"Meeting {entry.name}: {e}")
+                logger.warning("Failed to remove %s: %s", entry.path, e)
 
-    def _clean_epub_cache(self, cutoff: float, result: CleanupResult):
-        """Remove EPUB files older than cutoff."""
-        if not self.cache_dir.exists():
-            return
+    def _clean_indexed_meetings(self, cutoff: float, result: CleanupResult):
+        """Remove stale meeting files using the mtimes and sizes recorded in the meeting index."""
+        self.meeting_index.refresh()
 
-        for f in self.cache_dir.iterdir():
-            if not f.is_file() or f.suffix != '.epub':
+        for name, entry in self.meeting_index.entries().items():
+            if self.isInterruptionRequested():
+                return
+            if name == 'settings.json' or name in self.active_meeting_files:
+                continue
+            if entry['mtime'] is None or entry['mtime'] >= cutoff:
                 continue
             try:
-                if f.stat().st_mtime < cutoff:
-                    size = f.stat().st_size
-                    f.unlink()
-                    result.epub_files_removed += 1
-                    result.total_bytes_freed += size
-                    logger.debug("Removed stale EPUB: %s", f.name)
+                (self.meetings_dir / name).unlink()
+                result.meetings_removed += 1
+                result.total_bytes_freed += entry['size']
+                logger.debug("Removed stale meeting: %s", name)
+            except FileNotFoundError:
+                pass
             except OSError as e:
-                result.errors.append(f"EPUB {f.name}: {e}")
-                logger.warning("Failed to remove %s: %s", f, e)
+                result.errors.append(f"Meeting {name}: {e}")
+                logger.warning("Failed to remove %s: %s", name, e)
+                continue
+            self.meeting_index.remove(name)
+
+    def _clean_meeting_store(self, cutoff: float, result: CleanupResult):
+        """Delete meetings saved before cutoff from the meeting database, excluding active meetings."""
+        if self.meeting_db_path is None or not os.path.exists(self.meeting_db_path):
+            return
 
-    def _clean_scraper_cache(self, cutoff: float, result: CleanupResult):
-        """Remove web scraper cache files (HTML, JSON) older than cutoff."""
-        if not self.cache_dir.exists():
+        # A connection of this thread's own (sqlite3 connections stay on the thread that opened them)
+        try:
+            store = MeetingStore(self.meeting_db_path)
+            try:
+                removed, freed = store.prune(cutoff, self.active_meeting_files)
+            finally:
+                store.close()
+        except sqlite3.Error as e:
+            result.errors.append(f"Meeting database: {e}")
+            logger.warning("Failed to prune %s: %s", self.meeting_db_path, e)
             return
 
-        scraper_extensions = {'.html', '.json'}
+        result.stored_meetings_removed += removed
+        result.total_bytes_freed += freed
+        if removed:
+            logger.debug("Removed %d stale meeting(s) from the meeting database", removed)
 
-        for f in self.cache_dir.iterdir():
-            if not f.is_file() or f.suffix not in scraper_extensions:
+    def _clean_cache(self, cutoff: float, result: CleanupResult):
+        """Remove cache files older than cutoff, then the least recently used ones over the budget."""
+        files = self._scan_cache(result)
+        if not files:
+            return
+
+        by_name = {f.name: f for f in files}
+        total = sum(f.size for f in files)
+        kept = []
+        for f in files:
+            if self.isInterruptionRequested():
+                return
+            if f.name in self.protected_cache_files or f.name not in by_name:
                 continue
+            if f.mtime < cutoff:
+                total -= self._remove_cache_file(f, by_name, result)
+            else:
+                kept.append(f)
+
+        if self.cache_budget_bytes is None or total <= self.cache_budget_bytes:
+            return
+
+        for f in sorted(kept, key=lambda f: f.last_used):
+            if total <= self.cache_budget_bytes or self.isInterruptionRequested():
+                return
+            if f.name not in by_name or _epub_of_outline(f.name) in by_name:
+                continue  # Removed already, or goes with its EPUB
+            total -= self._remove_cache_file(f, by_name, result)
+
+    def _scan_cache(self, result: CleanupResult) -> List[_CacheFile]:
+        """Cache files the cleanup manages, with their stat, in one pass over the cache dir."""
+        files = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(CACHE_SUFFIXES):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # Removed meanwhile
+                    files.append(_CacheFile(
+                        name=entry.name,
+                        path=entry.path,
+                        size=stat.st_size,
+                        mtime=stat.st_mtime,
+                        # atime alone is unreliable (noatime and relatime mounts)
+                        last_used=max(stat.st_atime, stat.st_mtime),
+                        is_epub=entry.name.endswith(EPUB_SUFFIXES)
+                    ))
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            result.errors.append(f"Cache folder: {e}")
+            logger.warning("Failed to read %s: %s", self.cache_dir, e)
+        return files
+
+    def _remove_cache_file(self, f: _CacheFile, by_name: Dict[str, _CacheFile], result: CleanupResult) -> int:
+        """Remove a cache file, and the outline extracted from it for an EPUB; returns the bytes freed."""
+        group = [f]
+        if f.name.endswith('.epub'):
+            outline = by_name.get(f.name[:-len('.epub')] + OUTLINE_SUFFIX)
+            if outline is not None and outline.name not in self.protected_cache_files:
+                group.append(outline)
+
+        freed = 0
+        for member in group:
+            by_name.pop(member.name, None)
             try:
-                if f.stat().st_mtime < cutoff:
-                    size = f.stat().st_size
-                    f.unlink()
-                    result.cache_files_removed += 1
-                    result.total_bytes_freed += size
-                    logger.debug("Removed stale cache: %s", f.name)
+                os.unlink(member.path)
+            except FileNotFoundError:
+                freed += member.size
+                continue
             except OSError as e:
-                result.errors.append(f"Cache {f.name}: {e}")
-                logger.warning("Failed to remove %s: %s", f, e)
+                kind = "EPUB" if member.is_epub else "Cache"
+                result.errors.append(f"{kind} {member.name}: {e}")
+                logger.warning("Failed to remove %s: %s", member.path, e)
+                continue
+            freed += member.size
+            result.total_bytes_freed += member.size
+            if member.is_epub:
+                result.epub_files_removed += 1
+                logger.debug("Removed EPUB: %s", member.name)
+            else:
+                result.cache_files_removed += 1
+                logger.debug("Removed cache: %s", member.name)
+        return freed
+
+
+def _epub_of_outline(name: str) -> Optional[str]:
+    """Name of the EPUB an outline was extracted from"""
+    if name.endswith(OUTLINE_SUFFIX):
+        return name[:-len(OUTLINE_SUFFIX)] + '.epub'
+    return None
 
 
 def _format_bytes(num_bytes: int) -> str:
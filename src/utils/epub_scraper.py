@@ -2,20 +2,29 @@
 Complete EPUB-based Meeting Scraper using JW API endpoint
 Language-agnostic implementation using HTML structure and date arithmetic
 """
+import argparse
 import calendar
 import locale
 import logging
 import dateparser
+import hashlib
 import json
+import os
 import re
 import requests
+import sys
+import threading
 import zipfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from xml.etree import ElementTree as ET
 from dateutil.parser import parse as parse_date
+from bs4 import BeautifulSoup
 
 logger = logging.getLogger("OnTime.EPUBScraper")
 
@@ -26,7 +35,60 @@ except ImportError:
     def user_cache_dir(appname, appauthor=None):
         return str(Path.home() / ".meeting_timer_cache")
 
+from src import __version__ as APP_VERSION
 from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.utils.http_client import DownloadCancelled, IntegrityError, get_http_client
+from src.utils.scraper_patterns import (
+    get_patterns, PAREN_MINUTES, PART_NUMBER_PREFIX, SONG_AND_PRAYER, SONG_WORD,
+    TREASURES_HEADER, MINISTRY_HEADER, LIVING_HEADER
+)
+
+# Look-ahead defaults: weeks to prepare (a workbook covers two months, so nine
+# weeks always reach the next one) and issues kept per publication
+LOOKAHEAD_WEEKS = 9
+ISSUE_WINDOW = 6
+
+_cache_locks: Dict[str, threading.Lock] = {}
+_cache_locks_guard = threading.Lock()
+
+
+def _cache_lock(language: str) -> threading.Lock:
+    """Serializes updates of a language's meetings cache (GUI thread vs look-ahead worker)"""
+    with _cache_locks_guard:
+        return _cache_locks.setdefault(language, threading.Lock())
+
+
+_issue_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+
+
+def _issue_lock(language: str, publication: str, issue: str) -> threading.Lock:
+    """Keeps two threads from downloading or extracting the same issue at once"""
+    with _cache_locks_guard:
+        return _issue_locks.setdefault((language, publication, issue), threading.Lock())
+
+
+@dataclass
+class LookAheadResult:
+    """What a look-ahead pass did for one language"""
+    language: str
+    prepared: List[str] = field(default_factory=list)     # issues downloaded and parsed now
+    ready: List[str] = field(default_factory=list)        # issues that were already ready
+    unavailable: List[str] = field(default_factory=list)  # issues not published yet
+    evicted: List[str] = field(default_factory=list)      # issues dropped from the window
+    interrupted: bool = False                              # stopped before all issues were tried
+
+
+class EpubContent(dict):
+    """HTML members of an EPUB by name, remembering which file they came from
+
+    source, (path, mtime_ns), identifies the EPUB for the parse cache of a
+    cache update run (see EPUBMeetingScraper._soup).
+    """
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self.source = (str(path), path.stat().st_mtime_ns)
+
 
 class EPUBMeetingScraper:
     """Language-agnostic EPUB-based scraper using JW API endpoint"""
@@ -56,6 +118,11 @@ class EPUBMeetingScraper:
     # Cache TTL settings
     EPUB_TTL = 60 * 60 * 24 * 30  # 30 days for EPUB files
     JSON_TTL = 60 * 60 * 24 * 7   # 7 days for parsed JSON
+
+    # Meetings cache sections per publication, and the key of the readiness metadata
+    PUBLICATION_SECTIONS = {'mwb': 'midweek', 'w': 'weekend'}
+    READINESS_KEY = 'readiness'
+    OUTLINE_SUFFIX = '.outline.json'
     
     def __init__(self, language: str = "en"):
         if language not in self.LANG_CODES:
@@ -65,11 +132,15 @@ class EPUBMeetingScraper:
         self.language = language
         self.lang_code = self.LANG_CODES[language]
         self.iso_code = self.ISO_CODES[language]
+        self.patterns = get_patterns(language)
         
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.http = get_http_client()
         
         self.cache_path = self.CACHE_DIR / f"{self.language}_meetings_cache.json"
+
+        # Parsed EPUB members of the current cache update run, by (path, mtime_ns, member)
+        self._parsed_members: Optional[Dict[Tuple[str, int, str], BeautifulSoup]] = None
         
         # Setup translations for display only
         self._setup_translations()
@@ -140,9 +211,9 @@ class EPUBMeetingScraper:
         }
         self.trans = self.translations.get(self.language, self.translations["en"])
     
-    def _get_current_issue_dates(self) -> Tuple[str, str]:
+    def _get_current_issue_dates(self, today: Optional[datetime] = None) -> Tuple[str, str]:
         """Get correct MWB and WT issues based on this week's meetings (using Monday of current week)"""
-        today = datetime.now()
+        today = today or datetime.now()
         # 1. Find this week's Monday
         monday = today - timedelta(days=today.weekday())
 
@@ -168,9 +239,9 @@ class EPUBMeetingScraper:
 
         return mwb_issue, w_issue
 
-    def _get_relevant_watchtower_issues(self) -> List[str]:
+    def _get_relevant_watchtower_issues(self, today: Optional[datetime] = None) -> List[str]:
         """Get Watchtower issue based on 5-week study periods, 2-month lead time"""
-        today = datetime.now()
+        today = today or datetime.now()
         
         # Each WT covers ~5 weeks, published exactly 2 months before study period
         # So we need to go back 2 months from current date
@@ -210,14 +281,49 @@ class EPUBMeetingScraper:
         
         logger.debug(f"For {today.strftime('%B %d')}, trying Watchtower issues: {candidates}")
         return candidates
-    
-    def _download_epub(self, publication: str, issue: str) -> Optional[Path]:
-        """Download EPUB file from JW API"""
-        cache_file = self.CACHE_DIR / f"{publication}_{issue}_{self.language}.epub"
 
-        # Check cache first
+    def get_upcoming_issues(self, weeks: int) -> List[Tuple[str, str]]:
+        """(publication, issue) pairs needed for this week's and the next weeks' meetings"""
+        today = datetime.now()
+        monday = today - timedelta(days=today.weekday())
+        issues = []
+        for week in range(max(weeks, 1)):
+            day = monday + timedelta(weeks=week)
+            issues.append(('mwb', self._get_current_issue_dates(day)[0]))
+            issues.extend(('w', issue) for issue in self._get_relevant_watchtower_issues(day))
+        return list(dict.fromkeys(issues))
+
+    def files_in_use(self, weeks: int = LOOKAHEAD_WEEKS) -> Set[str]:
+        """Names of the cache files of this language that data cleanup must keep
+
+        The meetings cache and, for the upcoming issues, their EPUB (or its
+        partial download) and outline.
+        """
+        names = {self.cache_path.name}
+        for publication, issue in self.get_upcoming_issues(weeks):
+            epub = self._epub_cache_file(publication, issue).name
+            names.update((epub, epub + '.part', self._outline_file(publication, issue).name))
+        return names
+
+    def _epub_cache_file(self, publication: str, issue: str) -> Path:
+        return self.CACHE_DIR / f"{publication}_{issue}_{self.language}.epub"
+
+    def _outline_file(self, publication: str, issue: str) -> Path:
+        """Meetings extracted from an issue's EPUB, stored next to it"""
+        return self.CACHE_DIR / f"{publication}_{issue}_{self.language}{self.OUTLINE_SUFFIX}"
+
+    def _download_epub(self, publication: str, issue: str,
+                       should_stop: Optional[Callable[[], bool]] = None) -> Optional[Path]:
+        """Download EPUB file from JW API (should_stop can cancel the file download)"""
+        cache_file = self._epub_cache_file(publication, issue)
+
+        # Check cache first (a cached file that isn't a zip, e.g. written by an older
+        # version that didn't verify downloads, is discarded)
         if cache_file.exists() and (time.time() - cache_file.stat().st_mtime) < self.EPUB_TTL:
-            return cache_file
+            if zipfile.is_zipfile(cache_file):
+                return cache_file
+            logger.warning(f"Discarding corrupt cached EPUB {cache_file.name}")
+            cache_file.unlink(missing_ok=True)
 
         # Build API URL
         params = {
@@ -234,9 +340,9 @@ class EPUBMeetingScraper:
         try:
             logger.info(f"Downloading {publication} {issue}...")
             # Print the final constructed API URL for debugging
-            full_url = self.session.prepare_request(requests.Request('GET', self.API_BASE_URL, params=params)).url
+            full_url = requests.Request('GET', self.API_BASE_URL, params=params).prepare().url
             logger.debug(f"API request URL: {full_url}")
-            response = self.session.get(self.API_BASE_URL, params=params, timeout=30)
+            response = self.http.get(self.API_BASE_URL, params=params, timeout=30)
 
             if response.status_code != 200:
                 logger.error(f"API request failed: {response.status_code}")
@@ -247,8 +353,13 @@ class EPUBMeetingScraper:
             # extracting EPUB URL from API JSON response
             files = api_data.get("files", {}).get(self.lang_code, {}).get("EPUB", [])
             epub_url = None
+            epub_size = None
+            epub_checksum = None
             if files and isinstance(files[0], dict):
-                epub_url = files[0].get("file", {}).get("url")
+                epub_file = files[0].get("file", {})
+                epub_url = epub_file.get("url")
+                epub_size = files[0].get("filesize")
+                epub_checksum = epub_file.get("checksum")
 
             if not epub_url:
                 logger.error(f"No EPUB URL found in API response")
@@ -256,20 +367,46 @@ class EPUBMeetingScraper:
             # Print the EPUB download URL for debugging
             logger.debug(f"EPUB download URL: {epub_url}")
 
-            # Download the EPUB file
-            epub_response = self.session.get(epub_url, timeout=60)
-            if epub_response.status_code == 200:
-                cache_file.write_bytes(epub_response.content)
-                logger.info(f"Downloaded {cache_file.name}")
-                return cache_file
-            else:
-                logger.error(f"EPUB download failed: {epub_response.status_code}")
+            # Stream the EPUB file to the cache. The file is checked against the size
+            # and MD5 checksum reported by the API and must be a readable zip before it
+            # is renamed into the cache; an interrupted download is resumed next time.
+            try:
+                self.http.download_to(
+                    epub_url, cache_file, timeout=60, resume=True,
+                    expected_size=epub_size if isinstance(epub_size, int) else None,
+                    checksum=epub_checksum or None, validate=self._verify_epub,
+                    should_stop=should_stop
+                )
+            except requests.HTTPError as e:
+                logger.error(f"EPUB download failed: {e.response.status_code}")
+                return None
+            except IntegrityError as e:
+                logger.error(f"EPUB download rejected: {e}")
+                return None
+            except DownloadCancelled:
+                logger.info(f"Download of {cache_file.name} cancelled")
                 return None
+            logger.info(f"Downloaded {cache_file.name}")
+            return cache_file
 
         except Exception as e:
             logger.error(f"Error downloading {publication} {issue}: {e}")
             return None
     
+    @staticmethod
+    def _verify_epub(epub_path: Path):
+        """Reject a downloaded file that isn't a complete, readable EPUB zip"""
+        try:
+            with zipfile.ZipFile(epub_path) as epub_zip:
+                bad_member = epub_zip.testzip()
+                names = set(epub_zip.namelist())
+        except zipfile.BadZipFile as e:
+            raise IntegrityError(f"{epub_path.name} is not a valid zip: {e}")
+        if bad_member is not None:
+            raise IntegrityError(f"{epub_path.name}: corrupt member {bad_member}")
+        if "META-INF/container.xml" not in names:
+            raise IntegrityError(f"{epub_path.name}: no META-INF/container.xml")
+
     def _parse_epub_content(self, epub_path: Path) -> Dict:
         """Parse EPUB file and extract HTML content"""
         try:
@@ -277,7 +414,7 @@ class EPUBMeetingScraper:
                 # Find all HTML/XHTML files
                 html_files = [f for f in epub_zip.namelist() if f.endswith(('.html', '.xhtml'))]
                 logger.debug(f"EPUB contains {len(html_files)} HTML files: {html_files[:5]}")
-                content = {}
+                content = EpubContent(epub_path)
                 for html_file in html_files:
                     try:
                         html_content = epub_zip.read(html_file).decode('utf-8')
@@ -292,6 +429,36 @@ class EPUBMeetingScraper:
             logger.error(f"Error parsing EPUB {epub_path}: {e}")
             return {}
     
+    @contextmanager
+    def _parse_run(self):
+        """Share parsed EPUB members for the duration of one issue's extraction
+
+        A member is parsed at most once per run, however many TOC entries or
+        candidate probes need it; the trees are dropped when the run ends, so
+        at most one issue's trees are held at a time. Runs may nest (the
+        outermost one owns the cache).
+        """
+        if self._parsed_members is not None:
+            yield
+            return
+        self._parsed_members = {}
+        try:
+            yield
+        finally:
+            logger.debug(f"Parse run done, {len(self._parsed_members)} EPUB members parsed")
+            self._parsed_members = None
+
+    def _soup(self, epub_content: Dict, member: str) -> BeautifulSoup:
+        """Parsed tree of an EPUB member, reused within a run (trees must not be modified)"""
+        source = getattr(epub_content, 'source', None)
+        if source is None or self._parsed_members is None:
+            return BeautifulSoup(epub_content[member], 'html.parser')
+        key = (*source, member)
+        soup = self._parsed_members.get(key)
+        if soup is None:
+            soup = self._parsed_members[key] = BeautifulSoup(epub_content[member], 'html.parser')
+        return soup
+
     def _parse_meeting_date_from_workbook(self, date_text: str) -> Optional[str]:
         """Language-agnostic date parsing using locale and dateparser"""
         try:
@@ -535,9 +702,9 @@ class EPUBMeetingScraper:
                 return 'christian_living'
         
         # Fallback: look for section headers in the container
-        treasures_header = container.find(string=re.compile(r'TREASURES|TESORI|JOYAUX|TESOROS|SCHÄTZE'))
-        ministry_header = container.find(string=re.compile(r'APPLY|EFFICACI|APPLIQUE|SEAMOS|VERBESSERN'))
-        christian_header = container.find(string=re.compile(r'LIVING|VITA|VIE|NUESTRA|UNSER'))
+        treasures_header = container.find(string=TREASURES_HEADER)
+        ministry_header = container.find(string=MINISTRY_HEADER)
+        christian_header = container.find(string=LIVING_HEADER)
         
         # Determine position relative to section headers
         if treasures_header and ministry_header:
@@ -560,9 +727,9 @@ class EPUBMeetingScraper:
         text_lower = text.lower()
         
         # Songs and prayers
-        if re.search(r'song.*prayer|prayer.*song', text_lower):
+        if SONG_AND_PRAYER.search(text_lower):
             return 'song_prayer'
-        elif re.search(r'song|cantico|cantique|canción|lied', text_lower):
+        elif SONG_WORD.search(text_lower):
             return 'song'
         elif 'prayer' in text_lower or 'preghiera' in text_lower or 'prière' in text_lower:
             return 'prayer'
@@ -600,35 +767,15 @@ class EPUBMeetingScraper:
             return 'local_needs'
         
         # Numbered parts (generic parts)
-        elif re.search(r'^\d+\.', text.strip()):
+        elif PART_NUMBER_PREFIX.search(text.strip()):
             return 'part'
         
         return 'part'  # Default fallback
     
     def _extract_songs(self, container) -> List[int]:
         """Extract song numbers universally using regex"""
-        songs = []
-        
-        # Look for song patterns in any language
-        song_patterns = [
-            r'(?:Song|Cantico|Cantique|Canción|Lied)\s+(\d{1,3})',
-            r'(\d{1,3})\s*(?:Song|Cantico|Cantique|Canción|Lied)',
-            r'<.*?>(\d{1,3})<.*?>'  # Numbers in HTML tags
-        ]
-        
         text_content = container.get_text() if hasattr(container, 'get_text') else str(container)
-        
-        for pattern in song_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                try:
-                    song_num = int(match)
-                    if 1 <= song_num <= 200:  # Valid song range
-                        songs.append(song_num)
-                except ValueError:
-                    continue
-        
-        return list(dict.fromkeys(songs))  # Remove duplicates while preserving order
+        return self.patterns.find_all_songs(text_content)
     
     def _extract_midweek_meetings(self, epub_content: Dict) -> Dict[str, List[Dict]]:
         """
@@ -638,7 +785,6 @@ class EPUBMeetingScraper:
         """
         meetings = {}
         import re
-        from bs4 import BeautifulSoup
         # Only scan TOC files for date links
         toc_links = []
         toc_date_fallback = {}  # file_path -> parsed_date from TOC
@@ -646,7 +792,7 @@ class EPUBMeetingScraper:
             if 'toc' not in file_name.lower():
                 continue
             logger.debug(f"Scanning TOC file: {file_name}")
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self._soup(epub_content, file_name)
             links = soup.find_all('a')
             for link in links:
                 date_text = link.get_text(strip=True)
@@ -686,8 +832,7 @@ class EPUBMeetingScraper:
             if not file_path:
                 continue
             try:
-                body_html = epub_content[file_path]
-                soup_part = BeautifulSoup(body_html, 'html.parser')
+                soup_part = self._soup(epub_content, file_path)
 
                 # Extract all <h1> and <h2> headings
                 headings = []
@@ -773,9 +918,8 @@ class EPUBMeetingScraper:
         
         # Method 1: Check if duration is directly in the header text
         header_text = header.get_text()
-        duration_match = re.search(r'\((\d+)\s*min', header_text, re.IGNORECASE)
-        if duration_match:
-            duration = int(duration_match.group(1))
+        duration = self.patterns.find_paren_minutes(header_text)
+        if duration:
             logger.debug(f"Found duration in header: {duration} min for '{header_text[:50]}...'")
             return duration
         
@@ -784,9 +928,8 @@ class EPUBMeetingScraper:
         for sibling in header.find_next_siblings():
             if sibling.name in ['div', 'p', 'span']:
                 sibling_text = sibling.get_text()
-                duration_match = re.search(r'\((\d+)\s*min', sibling_text, re.IGNORECASE)
-                if duration_match:
-                    duration = int(duration_match.group(1))
+                duration = self.patterns.find_paren_minutes(sibling_text)
+                if duration:
                     logger.debug(f"Found duration in sibling: {duration} min for '{header_text[:50]}...'")
                     return duration
             
@@ -795,12 +938,11 @@ class EPUBMeetingScraper:
                 break
             
             # Also check nested elements within siblings
-            duration_elements = sibling.find_all(string=re.compile(r'\(\d+\s*min', re.IGNORECASE))
+            duration_elements = sibling.find_all(string=PAREN_MINUTES)
             if duration_elements:
                 for elem_text in duration_elements:
-                    duration_match = re.search(r'\((\d+)\s*min', elem_text, re.IGNORECASE)
-                    if duration_match:
-                        duration = int(duration_match.group(1))
+                    duration = self.patterns.find_paren_minutes(elem_text)
+                    if duration:
                         logger.debug(f"Found duration in nested element: {duration} min for '{header_text[:50]}...'")
                         return duration
         
@@ -808,9 +950,8 @@ class EPUBMeetingScraper:
         parent = header.parent
         if parent:
             parent_text = parent.get_text()
-            duration_match = re.search(r'\((\d+)\s*min', parent_text, re.IGNORECASE)
-            if duration_match:
-                duration = int(duration_match.group(1))
+            duration = self.patterns.find_paren_minutes(parent_text)
+            if duration:
                 logger.debug(f"Found duration in parent: {duration} min for '{header_text[:50]}...'")
                 return duration
         
@@ -824,7 +965,7 @@ class EPUBMeetingScraper:
         text_lower = text.lower()
         
         # Songs and prayers
-        if re.search(r'song.*prayer|prayer.*song', text_lower):
+        if SONG_AND_PRAYER.search(text_lower):
             return 3
         elif 'song' in text_lower:
             return 3
@@ -893,7 +1034,6 @@ class EPUBMeetingScraper:
         Extract weekend meeting parts from Watchtower EPUB using the detailed group TOC page.
         """
         meetings = {}
-        from bs4 import BeautifulSoup
         
         # Step 1: Find the TOC XHTML file and parse it.
         toc_file = None
@@ -905,8 +1045,7 @@ class EPUBMeetingScraper:
             logger.warning(f"No TOC file found in Watchtower EPUB.")
             return meetings
         
-        toc_html = epub_content[toc_file]
-        soup = BeautifulSoup(toc_html, 'html.parser')
+        soup = self._soup(epub_content, toc_file)
         logger.debug(f"Scanning TOC file: {toc_file}")
         
         # --- Begin: Find the 'chapter2' li to locate the detailed groupTOC
@@ -923,8 +1062,7 @@ class EPUBMeetingScraper:
                         break
                 if group_toc_file:
                     logger.debug(f"Found group TOC file: {group_toc_file}")
-                    toc_html = epub_content[group_toc_file]
-                    soup = BeautifulSoup(toc_html, 'html.parser')
+                    soup = self._soup(epub_content, group_toc_file)
         # --- End: groupTOC logic
         
         date_to_file = {}
@@ -972,9 +1110,8 @@ class EPUBMeetingScraper:
         for meeting_date in sorted(date_to_file):
             content_file, link_text = date_to_file[meeting_date]
             logger.debug(f"Processing Watchtower content from: {content_file} for date: {meeting_date}")
-            html_content = epub_content[content_file]
             try:
-                article_soup = BeautifulSoup(html_content, 'html.parser')
+                article_soup = self._soup(epub_content, content_file)
                 # Find article title
                 title_elem = article_soup.find("h1")
                 if not title_elem:
@@ -1193,23 +1330,7 @@ class EPUBMeetingScraper:
     
     def _extract_song_number(self, text: str) -> Optional[int]:
         """Extract song number from text with improved precision"""
-        # Multi-language song word patterns
-        song_patterns = [
-            r'(?:Song|SONG|Cantico|CANTICO|Cantique|CANTIQUE|Canción|CANCIÓN|Lied|LIED)\s+(\d{1,3})',
-            r'(\d{1,3})\s*(?:Song|SONG|Cantico|CANTICO|Cantique|CANTIQUE|Canción|CANCIÓN|Lied|LIED)',
-        ]
-        
-        for pattern in song_patterns:
-            song_match = re.search(pattern, text, re.IGNORECASE)
-            if song_match:
-                try:
-                    song_num = int(song_match.group(1))
-                    if 1 <= song_num <= 200:  # Valid song range
-                        return song_num
-                except ValueError:
-                    continue
-        
-        return None
+        return self.patterns.find_song(text)
     
     def _save_cached_meetings(self, meetings_data: Dict):
         """Save meeting data with two-stage process: raw → processed"""
@@ -1241,77 +1362,283 @@ class EPUBMeetingScraper:
             logger.error(f"Error in two-stage save process: {e}")
 
     
+    def _is_issue_ready(self, meetings_data: Dict, publication: str, issue: str) -> bool:
+        """Whether an issue was parsed into the cache by this version of the parser"""
+        entry = meetings_data.get(self.READINESS_KEY, {}).get(f"{publication} {issue}")
+        return (bool(entry) and entry.get('version') == APP_VERSION
+                and issue in meetings_data.get(self.PUBLICATION_SECTIONS[publication], {}))
+
+    def _prepare_issue(self, meetings_data: Dict, publication: str, issue: str) -> Optional[Dict]:
+        """Download and parse an issue into meetings_data and mark it ready
+
+        Returns the issue's meetings, or None if the EPUB isn't available
+        """
+        outline = self._issue_outline(publication, issue)
+        if outline is None:
+            return None
+        self._add_outline(meetings_data, publication, issue, outline)
+        return outline['meetings']
+
+    def _issue_outline(self, publication: str, issue: str,
+                       should_stop: Optional[Callable[[], bool]] = None) -> Optional[Dict]:
+        """Download an issue and extract its meetings, or load the outline stored for it
+
+        Returns None if the EPUB isn't available (or should_stop cancelled its
+        download). Only the issue is locked, not the meetings cache, so the
+        look-ahead can run this without holding up a meetings update for
+        longer than one issue.
+        """
+        with _issue_lock(self.language, publication, issue):
+            epub = self._download_epub(publication, issue, should_stop)
+            if not epub:
+                return None
+            outline = self._load_outline(publication, issue)
+            if outline is None:
+                logger.info(f"Parsing {publication} {issue} from {epub.name}...")
+                content = self._parse_epub_content(epub)
+                with self._parse_run():
+                    if publication == 'mwb':
+                        meetings = self._extract_midweek_meetings(content) or {}
+                    else:
+                        meetings = self._extract_weekend_meetings(content) or {}
+                outline = self._save_outline(publication, issue, meetings)
+            else:
+                logger.debug(f"Using the stored outline of {publication} {issue}")
+            return outline
+
+    def _add_outline(self, meetings_data: Dict, publication: str, issue: str, outline: Dict):
+        """Put an issue's meetings into meetings_data and mark the issue ready"""
+        meetings = outline['meetings']
+        meetings_data.setdefault(self.PUBLICATION_SECTIONS[publication], {})[issue] = meetings
+        meetings_data.setdefault(self.READINESS_KEY, {})[f"{publication} {issue}"] = {
+            'ready_at': datetime.now().isoformat(timespec='seconds'),
+            'meetings': len(meetings),
+            'epub': self._epub_cache_file(publication, issue).name,
+            'sha256': outline['sha256'],
+            'version': APP_VERSION,
+        }
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _save_outline(self, publication: str, issue: str, meetings: Dict) -> Dict:
+        """Store the meetings extracted from an issue's EPUB, keyed by the EPUB's sha256"""
+        epub = self._epub_cache_file(publication, issue)
+        stat = epub.stat()
+        outline = {
+            'sha256': self._file_sha256(epub),
+            'extractor': APP_VERSION,
+            # Unchanged size and mtime let later runs skip hashing the EPUB
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'meetings': meetings,
+        }
+        self._write_outline(publication, issue, outline)
+        return outline
+
+    def _write_outline(self, publication: str, issue: str, outline: Dict):
+        outline_file = self._outline_file(publication, issue)
+        try:
+            temp_file = outline_file.with_name(outline_file.name + '.tmp')
+            temp_file.write_text(json.dumps(outline, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp_file, outline_file)
+        except OSError as e:
+            logger.error(f"Error saving outline {outline_file.name}: {e}")
+
+    def _load_outline(self, publication: str, issue: str) -> Optional[Dict]:
+        """The stored outline of an issue, if it was extracted from the EPUB's current
+        bytes by this version of the parser"""
+        outline_file = self._outline_file(publication, issue)
+        epub = self._epub_cache_file(publication, issue)
+        try:
+            outline = json.loads(outline_file.read_text(encoding='utf-8'))
+            stat = epub.stat()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(outline, dict) or outline.get('extractor') != APP_VERSION \
+                or not isinstance(outline.get('meetings'), dict):
+            return None
+        if (outline.get('size'), outline.get('mtime_ns')) != (stat.st_size, stat.st_mtime_ns):
+            # Rewritten (e.g. downloaded again): still valid if the bytes are the same
+            if self._file_sha256(epub) != outline.get('sha256'):
+                return None
+            outline['size'], outline['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+            self._write_outline(publication, issue, outline)
+        return outline
+
+    def _meetings_from_outlines(self) -> Dict:
+        """Meetings cache data assembled from the valid outlines in the cache directory"""
+        meetings_data = {section: {} for section in self.PUBLICATION_SECTIONS.values()}
+        for publication in self.PUBLICATION_SECTIONS:
+            pattern = f"{publication}_*_{self.language}{self.OUTLINE_SUFFIX}"
+            for outline_file in sorted(self.CACHE_DIR.glob(pattern)):
+                issue = outline_file.name.split('_')[1]
+                outline = self._load_outline(publication, issue)
+                if outline is not None:
+                    self._add_outline(meetings_data, publication, issue, outline)
+        if meetings_data.get(self.READINESS_KEY):
+            logger.info(f"Meetings cache assembled from {len(meetings_data[self.READINESS_KEY])} stored outlines")
+        return meetings_data
+
     def update_meetings_cache(self) -> bool:
-        """Update the meetings cache with latest EPUB content"""
+        """Update the meetings cache with latest EPUB content
+
+        Issues already marked ready in the cache (see prefetch_upcoming) are
+        neither downloaded nor parsed again, so this is a pure cache hit once
+        the current issues have been prefetched.
+        """
+        with _cache_lock(self.language):
+            return self._update_meetings_cache()
+
+    def _update_meetings_cache(self) -> bool:
         logger.info(f"Updating meetings cache...")
         today = datetime.now()
         
         # Get current issue dates
         mwb_issue, _ = self._get_current_issue_dates()
 
-        # Download EPUBs, print the constructed download URL for debugging
-        logger.debug(f"Attempting to download MWB EPUB for issue {mwb_issue}...")
-        mwb_epub = self._download_epub('mwb', mwb_issue)
-
         meetings_data = self._load_cached_meetings()
+        changed = False
+        if not meetings_data:
+            # Missing or expired: start from the issues already extracted
+            meetings_data = self._meetings_from_outlines()
+            changed = bool(meetings_data.get(self.READINESS_KEY))
 
         # Parse midweek meetings
         if 'midweek' not in meetings_data:
             meetings_data['midweek'] = {}
-        if mwb_epub:
-            logger.info(f"Parsing midweek meetings from {mwb_epub.name}...")
-            mwb_content = self._parse_epub_content(mwb_epub)
-            midweek_meetings = self._extract_midweek_meetings(mwb_content)
-            meetings_data['midweek'][mwb_issue] = midweek_meetings or {}
+        mwb_ready = self._is_issue_ready(meetings_data, 'mwb', mwb_issue)
+        if mwb_ready:
+            logger.debug(f"Midweek issue {mwb_issue} is ready in the cache")
         else:
-            meetings_data['midweek'][mwb_issue] = {}
+            logger.debug(f"Attempting to download MWB EPUB for issue {mwb_issue}...")
+            mwb_ready = self._prepare_issue(meetings_data, 'mwb', mwb_issue) is not None
+            if not mwb_ready:
+                meetings_data['midweek'][mwb_issue] = {}
+            changed = True
 
         # We'll try multiple Watchtower issues and keep the first one that yields meetings
-        w_issues = self._get_relevant_watchtower_issues()
-        w_epub = None
+        if 'weekend' not in meetings_data:
+            meetings_data['weekend'] = {}
         w_issue_selected = None
-        for w_candidate in w_issues:
-            logger.debug(f"Attempting to download Watchtower EPUB for issue {w_candidate}...")
-            temp_epub = self._download_epub('w', w_candidate)
-            if temp_epub:
-                # Parse the content to check if it has studies for our target date
-                w_content = self._parse_epub_content(temp_epub)
-                weekend_meetings = self._extract_weekend_meetings(w_content)
-                
-                # Check if this Watchtower contains studies for our target date
-                # _extract_heading_date returns the START of the study week
-                # (e.g., "2026-02-23" for heading "February 23 - March 1, 2026")
-                contains_current_studies = False
-                for meeting_date_str in weekend_meetings.keys():
-                    week_start = datetime.strptime(meeting_date_str, '%Y-%m-%d')
-                    week_end = week_start + timedelta(days=6)
-                    if week_start <= today <= week_end:
-                        contains_current_studies = True
-                        break
-                
-                if contains_current_studies:
-                    logger.info(f"Found relevant studies in {w_candidate}")
-                    w_epub = temp_epub
-                    w_issue_selected = w_candidate
+        for w_candidate in self._get_relevant_watchtower_issues():
+            if self._is_issue_ready(meetings_data, 'w', w_candidate):
+                weekend_meetings = meetings_data['weekend'][w_candidate]
+            else:
+                logger.debug(f"Attempting to download Watchtower EPUB for issue {w_candidate}...")
+                weekend_meetings = self._prepare_issue(meetings_data, 'w', w_candidate)
+                if weekend_meetings is None:
+                    continue
+                changed = True
+
+            # Check if this Watchtower contains studies for our target date
+            # _extract_heading_date returns the START of the study week
+            # (e.g., "2026-02-23" for heading "February 23 - March 1, 2026")
+            contains_current_studies = False
+            for meeting_date_str in weekend_meetings.keys():
+                week_start = datetime.strptime(meeting_date_str, '%Y-%m-%d')
+                week_end = week_start + timedelta(days=6)
+                if week_start <= today <= week_end:
+                    contains_current_studies = True
                     break
-                else:
-                    logger.debug(f"No relevant studies in {w_candidate}, trying next...")
 
-        if 'weekend' not in meetings_data:
-            meetings_data['weekend'] = {}
-        if w_epub:
-            logger.info(f"Parsing weekend meetings from {w_epub.name}...")
-            w_content = self._parse_epub_content(w_epub)
-            weekend_meetings = self._extract_weekend_meetings(w_content)
-            meetings_data['weekend'][w_issue_selected] = weekend_meetings or {}
-        elif w_issue_selected:
-            meetings_data['weekend'][w_issue_selected] = {}
+            if contains_current_studies:
+                logger.info(f"Found relevant studies in {w_candidate}")
+                w_issue_selected = w_candidate
+                break
+            else:
+                logger.debug(f"No relevant studies in {w_candidate}, trying next...")
 
         # Save updated cache
-        self._save_cached_meetings(meetings_data)
-        logger.info(f"Cache file written: {self.CACHE_DIR / f'{self.language}_meetings_cache.json'}")
+        if changed:
+            self._save_cached_meetings(meetings_data)
+            logger.info(f"Cache file written: {self.CACHE_DIR / f'{self.language}_meetings_cache.json'}")
+        else:
+            logger.info("Meetings cache is up to date")
 
-        return bool(mwb_epub or w_epub)
+        return bool(mwb_ready or w_issue_selected)
+
+    def prefetch_upcoming(self, weeks: int = LOOKAHEAD_WEEKS, window: int = ISSUE_WINDOW,
+                          should_stop: Optional[Callable[[], bool]] = None) -> "LookAheadResult":
+        """Download and parse the issues of the coming weeks ahead of time
+
+        Issues that are not published yet are skipped (and tried again on the
+        next call). Afterwards only the newest `window` issues of each
+        publication are kept, plus any issue still needed for the coming
+        weeks; older ones are dropped from the meetings cache and their EPUBs
+        deleted.
+
+        The meetings cache is only locked to read it and to merge and save
+        the prepared issues; downloads and parsing happen in between. Once
+        should_stop returns True, the download in progress is cancelled and
+        the pass stops, keeping the issues it has prepared.
+        """
+        result = LookAheadResult(self.language)
+        upcoming = self.get_upcoming_issues(weeks)
+        with _cache_lock(self.language):
+            meetings_data = self._load_cached_meetings() or self._meetings_from_outlines()
+            missing = [(publication, issue) for publication, issue in upcoming
+                       if not self._is_issue_ready(meetings_data, publication, issue)]
+
+        outlines = {}
+        for publication, issue in missing:
+            if should_stop is not None and should_stop():
+                result.interrupted = True
+                break
+            outline = self._issue_outline(publication, issue, should_stop)
+            if outline is None and should_stop is not None and should_stop():
+                # Cancelled, not unavailable
+                result.interrupted = True
+                break
+            outlines[(publication, issue)] = outline
+
+        for publication, issue in upcoming:
+            name = f"{publication} {issue}"
+            if (publication, issue) not in missing:
+                result.ready.append(name)
+            elif outlines.get((publication, issue)) is not None:
+                result.prepared.append(name)
+            elif (publication, issue) in outlines:
+                result.unavailable.append(name)
+
+        with _cache_lock(self.language):
+            # Read again: a meetings update may have saved it in the meantime
+            meetings_data = self._load_cached_meetings()
+            assembled = not meetings_data
+            if assembled:
+                meetings_data = self._meetings_from_outlines()
+            for (publication, issue), outline in outlines.items():
+                if outline is not None:
+                    self._add_outline(meetings_data, publication, issue, outline)
+
+            result.evicted = self._evict_issues(meetings_data, window, set(upcoming))
+            if result.prepared or result.evicted or assembled:
+                self._save_cached_meetings(meetings_data)
+        logger.info(f"Look-ahead {self.language}: {len(result.prepared)} prepared, {len(result.ready)} ready, "
+                    f"{len(result.unavailable)} not published, {len(result.evicted)} evicted"
+                    f"{' (interrupted)' if result.interrupted else ''}")
+        return result
+
+    def _evict_issues(self, meetings_data: Dict, window: int, keep: set) -> List[str]:
+        """Drop all but the newest `window` issues of each publication (issues in keep stay)"""
+        readiness = meetings_data.get(self.READINESS_KEY, {})
+        evicted = []
+        for publication, section in self.PUBLICATION_SECTIONS.items():
+            issues = sorted(meetings_data.get(section, {}), reverse=True)
+            for issue in issues[window:]:
+                if (publication, issue) in keep:
+                    continue
+                del meetings_data[section][issue]
+                readiness.pop(f"{publication} {issue}", None)
+                self._epub_cache_file(publication, issue).unlink(missing_ok=True)
+                self._outline_file(publication, issue).unlink(missing_ok=True)
+                evicted.append(f"{publication} {issue}")
+        return evicted
     
     def get_meeting_by_date_range(self, date_str: str, meeting_type: MeetingType) -> Optional[Meeting]:
         """Get meeting by checking if a date falls within any meeting week range"""
@@ -1499,4 +1826,130 @@ class EPUBMeetingScraper:
             except Exception:
                 pass
         # No match
-        return None
\ No newline at end of file
+        return None
+
+# ----------------------------------------------------------------------
+# Multi-language prefetch
+
+@dataclass
+class PrefetchReport:
+    """What prefetching one language did, and how long it took"""
+    language: str
+    cached: List[str] = field(default_factory=list)       # issues already in the cache
+    downloaded: List[str] = field(default_factory=list)   # issues fetched now
+    unavailable: List[str] = field(default_factory=list)  # issues not (yet) published or failed
+    fetch_seconds: float = 0.0  # download time, summed over the language's issues
+    ready_seconds: float = 0.0  # wall clock until all the language's issues were settled
+    cache_seconds: float = 0.0  # rebuilding the meetings cache from the EPUBs
+    meetings_cached: bool = False
+
+
+def prefetch_languages(languages: List[str], weeks: int = 8, max_workers: int = 8,
+                       build_cache: bool = True) -> Dict[str, PrefetchReport]:
+    """Fill the EPUB caches of several languages for the coming weeks
+
+    The EPUBs of all languages are fetched concurrently through the shared HTTP
+    client, which caps the concurrent requests per host. Then the issues are
+    parsed into each language's meetings cache and marked ready, so switching
+    to any of them at the meeting is a cache hit that works offline.
+
+    Args:
+        languages: Language codes (keys of EPUBMeetingScraper.LANG_CODES)
+        weeks: Number of weeks, starting with the current one
+        max_workers: Concurrent downloads
+        build_cache: Also rebuild each language's meetings cache
+
+    Returns:
+        Report per language
+    """
+    scrapers = {language: EPUBMeetingScraper(language) for language in languages}
+    reports = {language: PrefetchReport(language) for language in languages}
+    tasks = [(language, publication, issue)
+             for language, scraper in scrapers.items()
+             for publication, issue in scraper.get_upcoming_issues(weeks)]
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    def fetch(language: str, publication: str, issue: str):
+        scraper = scrapers[language]
+        cache_file = scraper._epub_cache_file(publication, issue)
+        task_start = time.perf_counter()
+        # Same lock as _issue_outline, so a prefetch pass running in the
+        # background never downloads the issue at the same time
+        with _issue_lock(language, publication, issue):
+            cached_mtime = cache_file.stat().st_mtime_ns if cache_file.exists() else None
+            epub = scraper._download_epub(publication, issue)
+        elapsed = time.perf_counter() - task_start
+        name = f"{publication} {issue}"
+        with lock:
+            report = reports[language]
+            if epub is None:
+                report.unavailable.append(name)
+            elif cached_mtime is not None and epub.stat().st_mtime_ns == cached_mtime:
+                report.cached.append(name)
+            else:
+                report.downloaded.append(name)
+            report.fetch_seconds += elapsed
+            report.ready_seconds = max(report.ready_seconds, time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for future in as_completed([pool.submit(fetch, *task) for task in tasks]):
+            future.result()
+
+    if build_cache:
+        for language, scraper in scrapers.items():
+            cache_start = time.perf_counter()
+            scraper.prefetch_upcoming(weeks)
+            reports[language].meetings_cached = scraper.update_meetings_cache()
+            reports[language].cache_seconds = time.perf_counter() - cache_start
+
+    for report in reports.values():
+        logger.info(f"Prefetched {report.language}: {len(report.downloaded)} downloaded, "
+                    f"{len(report.cached)} cached, {len(report.unavailable)} unavailable "
+                    f"in {report.ready_seconds:.1f}s")
+    return reports
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line: python -m src.utils.epub_scraper prefetch --langs en,it,fr --weeks 8"""
+    parser = argparse.ArgumentParser(prog="python -m src.utils.epub_scraper",
+                                     description="EPUB meeting scraper tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    prefetch = commands.add_parser("prefetch", help="Fill the caches for several languages")
+    prefetch.add_argument("--langs", default="en",
+                          help="Comma-separated language codes (default: en)")
+    prefetch.add_argument("--weeks", type=int, default=8,
+                          help="Weeks to cover, starting with the current one (default: 8)")
+    prefetch.add_argument("--workers", type=int, default=8, help="Concurrent downloads (default: 8)")
+    prefetch.add_argument("--no-meetings", action="store_true",
+                          help="Only download EPUBs, don't rebuild the meetings caches")
+    prefetch.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    languages = [language.strip() for language in args.langs.split(",") if language.strip()]
+    unknown = [language for language in languages if language not in EPUBMeetingScraper.LANG_CODES]
+    if unknown:
+        parser.error(f"unsupported languages: {', '.join(unknown)} "
+                     f"(supported: {', '.join(EPUBMeetingScraper.LANG_CODES)})")
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+    start = time.perf_counter()
+    reports = prefetch_languages(languages, weeks=args.weeks, max_workers=args.workers,
+                                 build_cache=not args.no_meetings)
+
+    print(f"{'lang':<6}{'new':>5}{'cached':>8}{'missing':>9}{'ready':>9}{'fetch':>9}{'parse':>9}")
+    for report in reports.values():
+        print(f"{report.language:<6}{len(report.downloaded):>5}{len(report.cached):>8}"
+              f"{len(report.unavailable):>9}{report.ready_seconds:>8.1f}s{report.fetch_seconds:>8.1f}s"
+              f"{report.cache_seconds:>8.1f}s")
+    print(f"Total {time.perf_counter() - start:.1f}s")
+    for host, stats in get_http_client().stats().items():
+        print(f"  {host}: {stats['requests']} requests, {stats['bytes'] / 1e6:.1f} MB, "
+              f"mean {stats['mean_ms']:.0f} ms, {stats['retries']} retries, {stats['errors']} errors")
+
+    return 0 if all(report.downloaded or report.cached for report in reports.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
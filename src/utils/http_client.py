@@ -0,0 +1,293 @@
+"""
+Shared HTTP client for OnTime Meeting Timer.
+
+Every piece of network code (the meeting scrapers, the update checker and the
+update download) goes through one process-wide HttpClient, so connections to
+wol.jw.org, the JW CDN and GitHub are pooled and kept alive across requests
+and across scraper instances.
+
+The client adds what the individual fetchers used to do by hand, or not at all:
+- a sized urllib3 connection pool per host, with keep-alive
+- retries with exponential backoff on connection errors, timeouts and
+  429/5xx answers (Retry-After is honoured)
+- a limit on concurrent requests per host
+- the application User-Agent and default timeouts
+- streaming of large responses to disk, with resume and integrity checks
+- per-host timing metrics (see HttpClient.stats)
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import USER_AGENT
+
+logger = logging.getLogger("OnTime.Http")
+
+# Answers worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Connect and read timeouts (seconds) for calls that don't give their own
+DEFAULT_TIMEOUT = (10, 30)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class IntegrityError(Exception):
+    """A downloaded file doesn't have the expected size, checksum or content"""
+
+
+class DownloadCancelled(Exception):
+    """A download was stopped by its should_stop callback"""
+
+
+@dataclass
+class HostStats:
+    """Request timings for one host"""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float, received: int, retries: int, failed: bool):
+        self.requests += 1
+        self.errors += int(failed)
+        self.retries += retries
+        self.bytes += received
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'bytes': self.bytes,
+            'mean_ms': round(self.total_ms / self.requests, 2) if self.requests else 0.0,
+            'max_ms': round(self.max_ms, 2),
+        }
+
+
+class HttpClient:
+    """Connection-pooled, retrying HTTP client (thread-safe)"""
+
+    def __init__(self, *, pool_connections: int = 8, per_host_limit: int = 4,
+                 retries: int = 3, backoff_factor: float = 0.5,
+                 timeout=DEFAULT_TIMEOUT, user_agent: str = USER_AGENT):
+        """
+        Args:
+            pool_connections: Number of hosts whose connection pools are kept
+            per_host_limit: Concurrent requests (and pooled connections) per host
+            retries: Retries per request on connection errors and RETRY_STATUSES
+            backoff_factor: Backoff between retries is backoff_factor * 2 ** (retry - 1) seconds
+            timeout: Default (connect, read) timeout in seconds
+            user_agent: User-Agent header sent with every request
+        """
+        self.timeout = timeout
+        self.per_host_limit = per_host_limit
+        self.retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # hand the last answer to the caller, as a plain session would
+        )
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=per_host_limit,
+                              max_retries=self.retry)
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = user_agent
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._stats: Dict[str, HostStats] = {}
+
+    # ------------------------------------------------------------------
+    # Requests
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET a URL and read the whole body (same arguments as requests.get)"""
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, waiting for a free slot on the host first"""
+        if kwargs.get('stream'):
+            raise ValueError("use download_to() to stream a response")
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlsplit(url).netloc
+        with self._host_slot(host):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+                return response
+            finally:
+                received = len(response.content) if response is not None else 0
+                self._record(host, start, received, response)
+
+    def download_to(self, url: str, destination: Union[str, Path], *,
+                    progress: Optional[ProgressCallback] = None,
+                    chunk_size: int = DOWNLOAD_CHUNK_SIZE, resume: bool = False,
+                    expected_size: Optional[int] = None, checksum: Optional[str] = None,
+                    checksum_algorithm: str = "md5",
+                    validate: Optional[Callable[[Path], None]] = None,
+                    should_stop: Optional[Callable[[], bool]] = None, **kwargs) -> Path:
+        """Stream a response body to a file
+
+        The body is written to "<destination>.part", checked, then renamed onto
+        the destination, so a failed or interrupted download never leaves a
+        truncated destination file.
+
+        Args:
+            url: URL to download
+            destination: File to write
+            progress: Called with (bytes received, total bytes or 0 if unknown)
+            chunk_size: Bytes read per chunk
+            resume: Continue an earlier interrupted download with a Range request.
+                The .part file is kept when the connection fails, so that a
+                later call can pick it up.
+            expected_size: Size in bytes the file must have
+            checksum: Hex digest the file must have
+            checksum_algorithm: hashlib name of the checksum algorithm
+            validate: Called with the .part file before it is accepted; raises
+                IntegrityError (or any exception) to reject it
+            should_stop: Checked before each chunk; returning True cancels the
+                download (the .part file is kept for a resumed attempt)
+            **kwargs: Passed to requests (params, headers, timeout...)
+
+        Returns:
+            The destination path
+
+        Raises:
+            IntegrityError: The file failed the size, checksum or validate check
+            DownloadCancelled: should_stop returned True
+            requests.HTTPError: The server answered with an error status
+            requests.RequestException: The download failed
+        """
+        destination = Path(destination)
+        partial = destination.with_name(destination.name + ".part")
+        kwargs.setdefault('timeout', self.timeout)
+        headers = dict(kwargs.pop('headers', None) or {})
+        host = urlsplit(url).netloc
+        offset = partial.stat().st_size if resume and partial.exists() else 0
+        received = 0
+        with self._host_slot(host):
+            start = time.perf_counter()
+            response = None
+            try:
+                if offset:
+                    headers['Range'] = f"bytes={offset}-"
+                response = self.session.get(url, stream=True, headers=headers, **kwargs)
+                if offset and response.status_code == 416:
+                    # The partial file doesn't fit the resource any more: start over
+                    response.close()
+                    offset = 0
+                    del headers['Range']
+                    response = self.session.get(url, stream=True, headers=headers, **kwargs)
+                with response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        offset = 0  # Range ignored, the whole body follows
+                    elif offset:
+                        logger.info("Resuming %s at byte %d", url, offset)
+                    length = int(response.headers.get('Content-Length', 0) or 0)
+                    total = offset + length if length else 0
+                    digest = hashlib.new(checksum_algorithm) if checksum else None
+                    if digest and offset:
+                        with open(partial, 'rb') as f:
+                            for block in iter(lambda: f.read(chunk_size), b""):
+                                digest.update(block)
+                    with open(partial, 'ab' if offset else 'wb') as f:
+                        for chunk in response.iter_content(chunk_size):
+                            if should_stop is not None and should_stop():
+                                raise DownloadCancelled(url)
+                            f.write(chunk)
+                            received += len(chunk)
+                            if digest:
+                                digest.update(chunk)
+                            if progress:
+                                progress(offset + received, total)
+
+                size = offset + received
+                if expected_size is not None and size != expected_size:
+                    raise IntegrityError(f"{url}: got {size} bytes, expected {expected_size}")
+                if digest and digest.hexdigest().lower() != checksum.lower():
+                    raise IntegrityError(f"{url}: {checksum_algorithm} checksum mismatch")
+                if validate:
+                    validate(partial)
+                os.replace(partial, destination)
+            except (requests.RequestException, DownloadCancelled) as e:
+                # Keep what was received for a resumed attempt, unless the server refused
+                if not resume or isinstance(e, requests.HTTPError):
+                    partial.unlink(missing_ok=True)
+                raise
+            except BaseException:
+                partial.unlink(missing_ok=True)
+                raise
+            finally:
+                self._record(host, start, received, response)
+        logger.debug("Downloaded %s (%d bytes) to %s", url, offset + received, destination)
+        return destination
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return slot
+
+    # ------------------------------------------------------------------
+    # Metrics
+
+    def _record(self, host: str, start: float, received: int, response: Optional[requests.Response]):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        failed = response is None or response.status_code >= 400
+        retries = 0
+        if response is not None:
+            history = getattr(getattr(response.raw, 'retries', None), 'history', None)
+            retries = len(history) if history else 0
+        with self._lock:
+            self._stats.setdefault(host, HostStats()).add(elapsed_ms, received, retries, failed)
+        logger.debug("%s: %s in %.1f ms (%d retries)", host,
+                     response.status_code if response is not None else "failed", elapsed_ms, retries)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Request count, errors, retries, bytes and timings per host"""
+        with self._lock:
+            return {host: stats.to_dict() for host, stats in self._stats.items()}
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """The process-wide HTTP client (created on first use)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,155 @@
+"""
+Background look-ahead for the EPUB meeting scraper.
+
+A new workbook or Watchtower issue used to be downloaded and parsed by the first
+launch that needed it, often right before a meeting. IssuePrefetchScheduler
+prepares the coming issues in advance, on a low-priority thread, whenever the
+application is idle (no meeting timer running), and keeps the cache to a
+rolling window of issues. At meeting time update_meetings then finds every
+issue marked ready in the cache metadata.
+"""
+import atexit
+import logging
+from typing import Callable, Optional, Set
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+
+from src.utils.epub_scraper import EPUBMeetingScraper, ISSUE_WINDOW, LOOKAHEAD_WEEKS
+
+logger = logging.getLogger("OnTime.IssuePrefetch")
+
+FIRST_RUN_DELAY_MS = 60 * 1000        # let startup settle first
+INTERVAL_MS = 6 * 60 * 60 * 1000      # new issues appear weeks ahead; a few checks a day are plenty
+BUSY_RETRY_MS = 10 * 60 * 1000        # meeting in progress: look again later
+STOP_TIMEOUT_MS = 5 * 1000            # longest stop() waits for the download to be cancelled
+
+# Workers still running after stop() timed out, kept alive until they finish
+_detached_workers: Set["IssuePrefetchWorker"] = set()
+
+
+class IssuePrefetchWorker(QThread):
+    """Worker thread that runs one look-ahead pass for a language."""
+
+    finished = pyqtSignal(object)  # emits LookAheadResult, or None on failure
+
+    def __init__(self, language: str, weeks: int = LOOKAHEAD_WEEKS, window: int = ISSUE_WINDOW, parent=None):
+        super().__init__(parent)
+        self.language = language
+        self.weeks = weeks
+        self.window = window
+
+    def run(self):
+        try:
+            result = EPUBMeetingScraper(self.language).prefetch_upcoming(
+                self.weeks, self.window, should_stop=self.isInterruptionRequested)
+        except Exception as e:
+            logger.error("Look-ahead for %s failed: %s", self.language, e)
+            result = None
+        self.finished.emit(result)
+
+
+class IssuePrefetchScheduler(QObject):
+    """Runs IssuePrefetchWorker periodically while the application is idle"""
+
+    prefetched = pyqtSignal(object)  # LookAheadResult
+
+    def __init__(self, language: Callable[[], str], is_busy: Callable[[], bool] = lambda: False,
+                 interval_ms: int = INTERVAL_MS, first_run_delay_ms: int = FIRST_RUN_DELAY_MS,
+                 busy_retry_ms: int = BUSY_RETRY_MS, weeks: int = LOOKAHEAD_WEEKS,
+                 window: int = ISSUE_WINDOW, parent=None):
+        """
+        Args:
+            language: Returns the language to prepare (read at each run, so language changes are followed)
+            is_busy: Returns True while a pass should not run (e.g. during a meeting)
+            interval_ms: Time between passes
+            first_run_delay_ms: Time from start() to the first pass
+            busy_retry_ms: Time to wait before trying again when busy
+            weeks: Weeks to prepare, starting with the current one
+            window: Issues kept per publication
+        """
+        super().__init__(parent)
+        self._language = language
+        self._is_busy = is_busy
+        self.first_run_delay_ms = first_run_delay_ms
+        self.busy_retry_ms = busy_retry_ms
+        self.weeks = weeks
+        self.window = window
+        self._worker: Optional[IssuePrefetchWorker] = None
+        self._stopped = True
+
+        self._interval_timer = QTimer(self)
+        self._interval_timer.setInterval(interval_ms)
+        self._interval_timer.timeout.connect(self.run_now)
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self.run_now)
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None
+
+    def start(self):
+        self._stopped = False
+        self._interval_timer.start()
+        self._retry_timer.start(self.first_run_delay_ms)
+
+    def stop(self, timeout_ms: int = STOP_TIMEOUT_MS):
+        """Stop scheduling and interrupt a running pass
+
+        The download in progress is cancelled at its next chunk; this waits
+        for the pass to end at most timeout_ms. A pass stuck in a network read
+        for longer is detached from the scheduler, so destroying the scheduler
+        doesn't destroy the running thread, and left to finish on its own.
+        """
+        self._stopped = True
+        self._interval_timer.stop()
+        self._retry_timer.stop()
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            if not self._worker.wait(timeout_ms):
+                logger.warning("Look-ahead still running after %d ms, letting it finish in the background",
+                               timeout_ms)
+                self._detach_worker()
+
+    def _detach_worker(self):
+        worker, self._worker = self._worker, None
+        worker.finished.disconnect(self._on_finished)
+        worker.setParent(None)
+        _detached_workers.add(worker)
+        worker.finished.connect(lambda _result: _release_worker(worker))
+
+    def run_now(self):
+        """Start a pass unless one is running; defer it while busy"""
+        if self._worker is not None:
+            return
+        if self._is_busy():
+            logger.debug("Busy, look-ahead deferred")
+            self._retry_timer.start(self.busy_retry_ms)
+            return
+
+        self._worker = IssuePrefetchWorker(self._language(), self.weeks, self.window, parent=self)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.start(QThread.Priority.LowestPriority)
+
+    def _on_finished(self, result):
+        if self.sender() is not self._worker:
+            return  # Detached by stop() after it had already emitted
+        worker, self._worker = self._worker, None
+        worker.wait()
+        worker.deleteLater()
+        if result is not None and not self._stopped:
+            self.prefetched.emit(result)
+
+
+def _release_worker(worker: IssuePrefetchWorker):
+    """Drop a detached worker once its pass is over"""
+    worker.wait()
+    _detached_workers.discard(worker)
+    worker.deleteLater()
+
+
+@atexit.register
+def _wait_for_detached_workers():
+    # A QThread destroyed while it runs aborts the process; let the network read time out instead
+    for worker in list(_detached_workers):
+        worker.wait()
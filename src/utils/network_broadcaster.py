@@ -35,6 +35,8 @@ class NetworkBroadcaster(QObject):
         
         # Connection tracking
         self.connected_clients: Set[WebSocketServerProtocol] = set()
+        # Clients that subscribed to the anchor protocol and render the clock locally
+        self.anchor_clients: Set[WebSocketServerProtocol] = set()
         self.host_ip = self._get_local_ip()
         self.port = 8765  # Default WebSocket port
         self.is_broadcasting = False
@@ -52,6 +54,11 @@ class NetworkBroadcaster(QObject):
             "countdownMessage": "",
             "meetingEnded": False
         }
+
+        # Last anchor sent to anchor-protocol clients (only re-sent when it changes)
+        self.current_anchor: Dict[str, Any] = {"type": "anchor", "state": "stopped"}
+        # Seconds ahead of plan per section (whole minutes, None once ended), for anchor clients
+        self.current_section_slack: Dict[str, Any] = {"type": "section_slack", "sections": []}
     
     def _get_local_ip(self) -> str:
         """Get the local IP address of this machine"""
@@ -90,11 +97,31 @@ class NetworkBroadcaster(QObject):
                     # Try to parse the message as JSON
                     data = json.loads(message)
                     
+                    message_type = data.get('type')
+
                     # Handle 'request_state' message type
-                    if data.get('type') == 'request_state':
-                        # Re-send the current state
-                        await websocket.send(json.dumps(self.current_state))
+                    if message_type == 'request_state':
+                        # Re-send the current state in the client's protocol
+                        if websocket in self.anchor_clients:
+                            await websocket.send(json.dumps(self.current_anchor))
+                            await websocket.send(json.dumps(self.current_section_slack))
+                        else:
+                            await websocket.send(json.dumps(self.current_state))
                         #print(f"Re-sent state to client {client_id} after request")
+
+                    # Clock offset measurement: echo the client's timestamp with ours
+                    elif message_type == 'time_sync':
+                        await websocket.send(json.dumps({
+                            "type": "time_sync",
+                            "clientTime": data.get('clientTime'),
+                            "serverTime": time.time() * 1000
+                        }))
+
+                    # Switch the client to anchor messages (one per state change)
+                    elif message_type == 'subscribe' and data.get('protocol') == 'anchor':
+                        self.anchor_clients.add(websocket)
+                        await websocket.send(json.dumps(self.current_anchor))
+                        await websocket.send(json.dumps(self.current_section_slack))
                 except Exception as e:
                     print(f"Error processing message from client {client_id}: {e}")
         except Exception as e:
@@ -105,6 +132,7 @@ class NetworkBroadcaster(QObject):
         finally:
             # Remove disconnected client
             self.connected_clients.remove(websocket)
+            self.anchor_clients.discard(websocket)
             self.client_disconnected.emit(client_id)
             #print(f"Client disconnected: {client_id}")
     
@@ -233,17 +261,25 @@ class NetworkBroadcaster(QObject):
         self.broadcast_stopped.emit()
         print("WebSocket broadcaster stopped")
     
-    async def _broadcast_to_clients(self, data: Dict[str, Any]):
-        """Broadcast data to all connected clients with improved error handling"""
-        if not self.connected_clients:
+    async def _broadcast_to_clients(self, data: Dict[str, Any], anchor: bool = False):
+        """Broadcast data to connected clients with improved error handling
+
+        Legacy messages go to clients that did not subscribe to the anchor
+        protocol; anchor messages go only to those that did.
+        """
+        if anchor:
+            recipients = set(self.anchor_clients)
+        else:
+            recipients = self.connected_clients - self.anchor_clients
+        if not recipients:
             return
         
         # Convert data to JSON
         json_data = json.dumps(data)
         
-        # Send to all connected clients
+        # Send to all recipients
         disconnected_clients = set()
-        for client in self.connected_clients:
+        for client in recipients:
             try:
                 await client.send(json_data)
             except websockets.exceptions.ConnectionClosed:
@@ -255,6 +291,7 @@ class NetworkBroadcaster(QObject):
         
         # Remove disconnected clients
         for client in disconnected_clients:
+            self.anchor_clients.discard(client)
             if client in self.connected_clients:
                 self.connected_clients.remove(client)
                 try:
@@ -280,8 +317,9 @@ class NetworkBroadcaster(QObject):
             "meetingEnded": meeting_ended
         }
         
-        # Broadcast to clients if server is running
-        if self.is_broadcasting and self.event_loop:
+        # Broadcast to legacy clients if server is running
+        if (self.is_broadcasting and self.event_loop and
+                len(self.connected_clients) > len(self.anchor_clients)):
             try:
                 asyncio.run_coroutine_threadsafe(
                     self._broadcast_to_clients(self.current_state), 
@@ -289,6 +327,47 @@ class NetworkBroadcaster(QObject):
                 )
             except Exception as e:
                 print(f"Error broadcasting timer data: {e}")
+
+    def update_anchor(self, anchor: Dict[str, Any]):
+        """Update the clock anchor and resync anchor clients if it changed
+
+        An anchor describes the timer by its deadline rather than by the
+        formatted time, so clients can render every tick locally and only
+        need a new message on pause, adjustment or part change.
+        """
+        anchor = {"type": "anchor", **anchor}
+        if anchor == self.current_anchor:
+            return
+        self.current_anchor = anchor
+
+        if self.is_broadcasting and self.event_loop and self.anchor_clients:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._broadcast_to_clients(self.current_anchor, anchor=True),
+                    self.event_loop
+                )
+            except Exception as e:
+                print(f"Error broadcasting timer anchor: {e}")
+
+    def update_section_slack(self, section_slack: List[Optional[int]]):
+        """Send the per-section slack to anchor clients if it changed
+
+        Kept out of the anchor so that a slack change does not resend the
+        anchor; the timer controller reports it in whole minutes.
+        """
+        message = {"type": "section_slack", "sections": list(section_slack)}
+        if message == self.current_section_slack:
+            return
+        self.current_section_slack = message
+
+        if self.is_broadcasting and self.event_loop and self.anchor_clients:
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._broadcast_to_clients(message, anchor=True),
+                    self.event_loop
+                )
+            except Exception as e:
+                print(f"Error broadcasting section slack: {e}")
     
     def get_connection_url(self) -> str:
         """Get the URL clients can use to connect"""
@@ -270,6 +270,8 @@ class NetworkDisplayManager(QObject):
         self.timer_controller.part_changed.connect(self._on_part_changed)
         self.timer_controller.predicted_end_time_updated.connect(self._on_predicted_end_time_updated)
         self.timer_controller.meeting_overtime.connect(self._on_meeting_overtime)
+        # Section slack has its own message, sent only when its whole minutes change
+        self.timer_controller.section_slack_updated.connect(self.broadcaster.update_section_slack)
         # Connect meeting_countdown_updated without debug print
         # (debug print removed for production)
     
@@ -458,6 +460,8 @@ class NetworkDisplayManager(QObject):
             overtime_seconds = 0
             countdown_message = ""
             meeting_ended = False
+            meeting_start = None
+            deadline = None
 
             # Check if we're in STOPPED state with no active part (pre-meeting, or pre-meeting countdown)
             if (self.timer_controller.timer.state == TimerState.STOPPED and
@@ -477,6 +481,7 @@ class NetworkDisplayManager(QObject):
                         seconds_remaining = int(time_diff.total_seconds())
 
                         if seconds_remaining > 0:
+                            meeting_start = target
                             hours, remainder = divmod(seconds_remaining, 3600)
                             minutes, seconds = divmod(remainder, 60)
 
@@ -520,6 +525,7 @@ class NetworkDisplayManager(QObject):
                 }
 
                 state_str = state_map.get(self.timer_controller.timer.state, "stopped")
+                deadline = self.timer_controller.timer.deadline
 
                 # If timer is running and less than 60 seconds, use warning color
                 if (self.timer_controller.timer.state == TimerState.RUNNING and
@@ -569,6 +575,21 @@ class NetworkDisplayManager(QObject):
                 countdown_message=countdown_message,
                 meeting_ended=meeting_ended
             )
+
+            # Update anchor clients; warning colour and overtime are derived client-side
+            in_overtime = self.timer_controller.timer.state == TimerState.OVERTIME
+            self.broadcaster.update_anchor({
+                "state": "running" if state_str == "warning" else state_str,
+                "deadline": round(deadline * 1000) if deadline is not None else None,
+                "remaining": (self.timer_controller.timer.remaining_seconds
+                              if deadline is None and state_str != "stopped" else None),
+                "part": part_title,
+                "nextPart": next_part_title,
+                "endTime": end_time_str,
+                "overtime": None if in_overtime else overtime_seconds,
+                "meetingStart": round(meeting_start.timestamp() * 1000) if meeting_start else None,
+                "meetingEnded": meeting_ended
+            })
             
         finally:
             self._updating_display = False
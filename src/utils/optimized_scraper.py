@@ -0,0 +1,195 @@
+"""
+Optimized variant of MeetingScraper for wol.jw.org meeting pages.
+
+OptimizedMeetingScraper gives the same meetings as MeetingScraper, with
+less work per update:
+
+- single-pass parsing: the text of every element of a page is extracted in
+  one bottom-up walk (page_texts) and the songs, numbered parts and
+  concluding comments are collected in one walk of the document, instead of
+  a find_all() and a get_text() per element for each of them
+- cached lookups: the element texts are shared with the part duration index,
+  and parsed meetings are kept in memory by page content, so an unchanged
+  page is not parsed again
+- parallel fetches: the midweek and weekend pages are fetched at the same
+  time, and the first one is parsed while the other is still downloading
+"""
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from src.models.meeting import Meeting, MeetingSection, MeetingType
+from src.utils.scraper import MeetingScraper, PartDurationIndex
+from src.utils.scraper_patterns import NUMBERED_PART
+
+logger = logging.getLogger("OnTime.OptimizedScraper")
+
+# Elements MeetingScraper._parse_midweek_meeting looks at for each kind of entry
+SONG_TAGS = frozenset(['h3', 'p', 'strong', 'a', 'span'])
+PART_TAGS = frozenset(['p', 'span', 'div'])
+CONCLUDING_TAGS = frozenset(['p', 'h3', 'strong', 'span'])
+
+PARSED_CACHE_SIZE = 16
+
+
+def _is_interesting(types, string: NavigableString) -> bool:
+    """Whether Tag.get_text() with these string types includes string"""
+    if types is None:
+        return True
+    if isinstance(types, type):
+        return type(string) is types
+    return type(string) in types
+
+
+def page_texts(soup: BeautifulSoup) -> Dict[int, str]:
+    """tag.get_text().strip() of every element of a page, by id(tag)
+
+    Builds each element's text from its children's, deepest elements first,
+    so the whole page is read once instead of once per element asked for.
+    get_text() only keeps the string types an element is interested in
+    (script and style contents are left out of their ancestors' text); a
+    child with other types than its parent is read again with the parent's.
+    """
+    raw: Dict[int, str] = {}
+    tags = [soup]
+    tags.extend(node for node in soup.descendants if isinstance(node, Tag))
+    # In reverse document order every element comes after all of its descendants
+    for tag in reversed(tags):
+        types = tag.interesting_string_types
+        if types is None:
+            types = tag.MAIN_CONTENT_STRING_TYPES
+        parts = []
+        for child in tag.contents:
+            if isinstance(child, Tag):
+                child_types = child.interesting_string_types
+                if child_types is None:
+                    child_types = child.MAIN_CONTENT_STRING_TYPES
+                if child_types == types:
+                    parts.append(raw[id(child)])
+                else:
+                    parts.extend(child._all_strings(types=types))
+            elif isinstance(child, NavigableString) and _is_interesting(types, child):
+                parts.append(child)
+        raw[id(tag)] = "".join(parts)
+    return {key: text.strip() for key, text in raw.items()}
+
+
+class OptimizedMeetingScraper(MeetingScraper):
+    """MeetingScraper with single-pass parsing, cached lookups and parallel fetches"""
+
+    # Parsed meetings by (page digest, meeting type, language), shared by all instances
+    _parsed: "OrderedDict[Tuple[str, MeetingType, str], Meeting]" = OrderedDict()
+    _parsed_lock = threading.Lock()
+
+    def update_meetings(self) -> Dict[MeetingType, Meeting]:
+        """Fetch and update all current meetings"""
+        try:
+            meeting_links = self.get_current_meeting_urls()
+        except Exception as e:
+            logger.error("Error updating meetings: %s", e)
+            return {}
+
+        meetings = {}
+        if not meeting_links:
+            return meetings
+        with ThreadPoolExecutor(max_workers=len(meeting_links)) as pool:
+            pages = {meeting_type: pool.submit(self._fetch_page, url)
+                     for meeting_type, url in meeting_links.items()}
+            # Parsing stays on this thread: the duration index is per scraper
+            for meeting_type, page in pages.items():
+                try:
+                    meetings[meeting_type] = self._meeting_from_html(page.result(), meeting_type)
+                except Exception as e:
+                    logger.error("Error fetching %s meeting: %s", meeting_type.value, e)
+        return meetings
+
+    @classmethod
+    def pre_scan_all_languages(cls, languages: List[str], max_workers: int = 4) -> Dict[str, Dict[MeetingType, str]]:
+        """Fetch the meeting links of several languages at once, filling the links cache
+
+        Languages whose meetings page cannot be fetched are left out.
+        """
+        def scan(language: str) -> Optional[Dict[MeetingType, str]]:
+            try:
+                return cls(language).get_current_meeting_urls()
+            except Exception as e:
+                logger.warning("Meeting links for %s unavailable: %s", language, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(languages)))) as pool:
+            results = dict(zip(languages, pool.map(scan, languages)))
+        return {language: links for language, links in results.items() if links is not None}
+
+    @classmethod
+    def clear_parsed_cache(cls):
+        with cls._parsed_lock:
+            cls._parsed.clear()
+
+    def _meeting_from_html(self, html: str, meeting_type: MeetingType) -> Meeting:
+        """Parse a meeting page, or copy the meeting parsed from the same page before"""
+        key = (hashlib.md5(html.encode()).hexdigest(), meeting_type, self.language)
+        with self._parsed_lock:
+            meeting = self._parsed.get(key)
+            if meeting is not None:
+                self._parsed.move_to_end(key)
+        if meeting is None:
+            meeting = super()._meeting_from_html(html, meeting_type)
+            with self._parsed_lock:
+                self._parsed[key] = meeting
+                while len(self._parsed) > PARSED_CACHE_SIZE:
+                    self._parsed.popitem(last=False)
+
+        # Callers own (and may edit) the meeting they get
+        meeting = copy.deepcopy(meeting)
+        meeting.start_time = datetime.now().time()
+        return meeting
+
+    def _parse_midweek_meeting(self, soup: BeautifulSoup) -> List[MeetingSection]:
+        """Parse midweek meeting structure to match the desired output format"""
+        texts = page_texts(soup)
+        self._duration_index = PartDurationIndex(soup, self._extract_duration, texts)
+
+        songs = []
+        headings = []
+        part_candidates = []
+        concluding_text = None
+        for el in soup.find_all(True):
+            name = el.name
+            el_text = texts[id(el)]
+            if name in SONG_TAGS and ("Song" in el_text or "SONG" in el_text) \
+                    and "Song and Prayer" not in el_text:
+                song_num = self._extract_song_number(el_text)
+                if song_num:
+                    songs.append((song_num, el_text))
+            if name == 'h3':
+                headings.append(el)
+            elif name in PART_TAGS:
+                part_candidates.append(el)
+            if concluding_text is None and name in CONCLUDING_TAGS and "Concluding Comments" in el_text:
+                concluding_text = el_text
+
+        # Numbered parts, preferring (as MeetingScraper does) strong text in
+        # h3 headings, then the headings, then any p/span/div
+        titles = [texts[id(strong)] for h3 in headings for strong in h3.find_all('strong')]
+        titles.extend(texts[id(h3)] for h3 in headings)
+        titles.extend(texts[id(el)] for el in part_candidates)
+
+        numbered_parts = []
+        processed_part_numbers = set()
+        for title in titles:
+            part_match = NUMBERED_PART.match(title)
+            if part_match:
+                part_num = int(part_match.group(1))
+                if part_num not in processed_part_numbers:
+                    processed_part_numbers.add(part_num)
+                    duration = self._find_duration_for_part(part_num, soup)
+                    numbered_parts.append((part_num, title, duration))
+
+        return self._build_midweek_sections(songs, numbered_parts, concluding_text)
@@ -0,0 +1,172 @@
+"""
+Localization of the placeholder part titles produced by the meeting scrapers.
+
+The scrapers emit language-neutral markers such as "OPENING_SONG_PRAYER|99",
+"MIDDLE_SONG 12" or "OPENING_COMMENTS". The per-language title templates for
+every marker are compiled once, and each (language, raw title) result is
+memoized, so localizing a meeting costs one cached lookup per part.
+"""
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Pattern, Tuple
+
+DEFAULT_LANGUAGE = "en"
+
+PART_TRANSLATIONS: Dict[str, Dict[str, str]] = {
+    "en": {
+        "song": "Song",
+        "and_prayer": "and Prayer",
+        "opening_comments": "Opening Comments",
+        "concluding_comments": "Concluding Comments",
+        "opening_song_prayer": "Opening Song and Prayer",
+        "closing_song_prayer": "Closing Song and Prayer",
+        "service_talk": "Service Talk",
+        "co_talk": "Circuit Overseer Talk"
+    },
+    "it": {
+        "song": "Cantico",
+        "and_prayer": "e preghiera",
+        "opening_comments": "Commenti introduttivi",
+        "concluding_comments": "Commenti conclusivi",
+        "opening_song_prayer": "Cantico iniziale e preghiera",
+        "closing_song_prayer": "Cantico finale e preghiera",
+        "service_talk": "Discorso di servizio",
+        "co_talk": "Discorso del sorvegliante di circoscrizione"
+    },
+    "fr": {
+        "song": "Cantique",
+        "and_prayer": "et prière",
+        "opening_comments": "Paroles d'introduction",
+        "concluding_comments": "Commentaires de conclusion",
+        "opening_song_prayer": "Cantique d'ouverture et prière",
+        "closing_song_prayer": "Cantique de clôture et prière",
+        "service_talk": "Discours de service",
+        "co_talk": "Discours du surveillant de circonscription"
+    },
+    "es": {
+        "song": "Canción",
+        "and_prayer": "y oración",
+        "opening_comments": "Palabras de introducción",
+        "concluding_comments": "Comentarios finales",
+        "opening_song_prayer": "Canción inicial y oración",
+        "closing_song_prayer": "Canción final y oración",
+        "service_talk": "Discurso de servicio",
+        "co_talk": "Discurso del superintendente de circuito"
+    },
+    "de": {
+        "song": "Lied",
+        "and_prayer": "und Gebet",
+        "opening_comments": "Einleitende Worte",
+        "concluding_comments": "Schlussworte",
+        "opening_song_prayer": "Eingangslied und Gebet",
+        "closing_song_prayer": "Schlusslied und Gebet",
+        "service_talk": "Dienstgespräch",
+        "co_talk": "Ansprache des Kreisaufsehers"
+    },
+    "pt": {
+        "song": "Cântico",
+        "and_prayer": "e oração",
+        "opening_comments": "Comentários introdutórios",
+        "concluding_comments": "Comentários finais",
+        "opening_song_prayer": "Cântico inicial e oração",
+        "closing_song_prayer": "Cântico final e oração",
+        "service_talk": "Discurso de serviço",
+        "co_talk": "Discurso do superintendente de circuito"
+    },
+    "ja": {
+        "song": "歌",
+        "and_prayer": "と祈り",
+        "opening_comments": "開会の言葉",
+        "concluding_comments": "結びの言葉",
+        "opening_song_prayer": "開会の歌と祈り",
+        "closing_song_prayer": "閉会の歌と祈り",
+        "service_talk": "奉仕の話",
+        "co_talk": "巡回監督の話"
+    },
+    "ko": {
+        "song": "노래",
+        "and_prayer": "및 기도",
+        "opening_comments": "개회사",
+        "concluding_comments": "폐회사",
+        "opening_song_prayer": "개회 노래 및 기도",
+        "closing_song_prayer": "폐회 노래 및 기도",
+        "service_talk": "봉사 연설",
+        "co_talk": "순회 감독자 연설"
+    },
+    "zh": {
+        "song": "歌曲",
+        "and_prayer": "和祈祷",
+        "opening_comments": "开场白",
+        "concluding_comments": "结束语",
+        "opening_song_prayer": "开场歌曲和祈祷",
+        "closing_song_prayer": "结束歌曲和祈祷",
+        "service_talk": "服务讲话",
+        "co_talk": "巡回监督讲话"
+    }
+    # Add more languages as needed
+}
+
+# Read-only views so callers cannot alter the shared tables
+_TRANSLATION_VIEWS = {language: MappingProxyType(table) for language, table in PART_TRANSLATIONS.items()}
+
+# Marker -> (pattern for a song number after the marker when there is no "|",
+#            title template with a number, title template without one)
+# A marker matches when the raw title starts with it; "MARKER|n" always carries a number.
+_SONG_MARKERS: Dict[str, Tuple[Optional[Pattern], str, str]] = {
+    "OPENING_SONG_PRAYER": (None, "{song} {number} {and_prayer}", "{opening_song_prayer}"),
+    "MIDDLE_SONG": (re.compile(r'\s+(\d+)'), "{song} {number}", "{song}"),
+    "CLOSING_SONG_PRAYER": (re.compile(r'\s*\[?(\d+)'), "{song} {number} {and_prayer}", "{closing_song_prayer}"),
+}
+
+# Markers that must be the whole title
+_EXACT_MARKERS: Dict[str, str] = {
+    "OPENING_COMMENTS": "{opening_comments}",
+    "CONCLUDING_COMMENTS": "{concluding_comments}",
+}
+
+_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in _SONG_MARKERS))
+
+
+def get_part_translations(language: str) -> Mapping[str, str]:
+    """Get the part title translations for a language (English if unsupported)"""
+    return _TRANSLATION_VIEWS.get(language, _TRANSLATION_VIEWS[DEFAULT_LANGUAGE])
+
+
+@lru_cache(maxsize=None)
+def _compiled_templates(language: str) -> Tuple[Dict[str, Tuple[Optional[Pattern], str, str]], Dict[str, str]]:
+    """Song marker and exact marker tables with this language's text filled in"""
+    translations = get_part_translations(language)
+    song_markers = {
+        marker: (pattern,
+                 with_number.format(number="{number}", **translations),
+                 without_number.format(**translations))
+        for marker, (pattern, with_number, without_number) in _SONG_MARKERS.items()
+    }
+    exact_markers = {marker: template.format(**translations) for marker, template in _EXACT_MARKERS.items()}
+    return song_markers, exact_markers
+
+
+@lru_cache(maxsize=4096)
+def localize_part_title(language: str, title: str) -> str:
+    """Localized title for a raw part title; titles without a marker are returned unchanged"""
+    song_markers, exact_markers = _compiled_templates(language)
+
+    exact = exact_markers.get(title)
+    if exact is not None:
+        return exact
+
+    match = _MARKER_RE.match(title)
+    if match is None:
+        return title
+
+    number_pattern, with_number, without_number = song_markers[match.group()]
+    if "|" in title:
+        # Format: "MARKER|99" (or "MARKER |99")
+        return with_number.format(number=title.split("|")[1])
+    if number_pattern is not None:
+        # Format: "MIDDLE_SONG 99" or "CLOSING_SONG_PRAYER [100"
+        number_match = number_pattern.match(title, match.end())
+        if number_match:
+            return with_number.format(number=number_match.group(1))
+    return without_number
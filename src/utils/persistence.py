@@ -0,0 +1,173 @@
+"""
+Write-behind persistence for JSON data files in the OnTime Meeting Timer application.
+
+Saves are serialized on the calling thread and written by a single background
+thread. Repeated saves to the same file within the debounce delay collapse
+into one write (last write wins), and every write goes to a temp file that is
+moved into place with os.replace, so readers never see a truncated file.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger("OnTime.Persistence")
+
+
+class FsyncPolicy(Enum):
+    """How hard to push writes to stable storage"""
+    NONE = "none"  # Leave flushing to the OS (fastest)
+    FILE = "file"  # fsync the temp file before replacing the target
+    FULL = "full"  # Also fsync the containing directory after the replace (POSIX)
+
+
+class PersistenceService:
+    """Background writer shared by settings, meetings, templates and session data"""
+
+    DEFAULT_DELAY_SECONDS = 0.5
+
+    def __init__(self, delay: float = DEFAULT_DELAY_SECONDS,
+                 fsync_policy: FsyncPolicy = FsyncPolicy.FILE):
+        self.delay = delay
+        self.fsync_policy = fsync_policy
+
+        # path -> (serialized text, monotonic time the write is due)
+        self._pending: Dict[Path, Tuple[str, float]] = {}
+        self._in_flight: Optional[Path] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def save_json(self, file_path: Union[str, Path], data: Any,
+                  delay: Optional[float] = None, **dump_kwargs):
+        """Queue a JSON write; a later save of the same file replaces this one
+
+        Args:
+            file_path: Target file
+            data: JSON-serializable data (serialized immediately, so callers may keep mutating it)
+            delay: Debounce delay in seconds (defaults to the service delay)
+            **dump_kwargs: Passed to json.dumps (e.g. indent=2, ensure_ascii=False)
+
+        Returns:
+            The serialized text that will be written
+        """
+        text = json.dumps(data, **dump_kwargs)
+        due = time.monotonic() + (self.delay if delay is None else delay)
+
+        with self._condition:
+            self._pending[Path(file_path)] = (text, due)
+            self._ensure_thread()
+            self._condition.notify_all()
+
+        return text
+
+    def has_pending(self, file_path: Union[str, Path]) -> bool:
+        """Check whether a write for the given file has not reached disk yet"""
+        path = Path(file_path)
+        with self._condition:
+            return path in self._pending or path == self._in_flight
+
+    def flush(self, file_path: Optional[Union[str, Path]] = None, timeout: float = 10.0) -> bool:
+        """Write pending data now and wait for it to reach disk
+
+        Args:
+            file_path: Only flush this file (default: all pending files)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if everything requested was written within the timeout
+        """
+        path = Path(file_path) if file_path is not None else None
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            # Make the requested writes due immediately
+            for pending_path, (text, _) in list(self._pending.items()):
+                if path is None or pending_path == path:
+                    self._pending[pending_path] = (text, 0.0)
+            self._condition.notify_all()
+
+            while True:
+                if path is None:
+                    done = not self._pending and self._in_flight is None
+                else:
+                    done = path not in self._pending and path != self._in_flight
+                if done:
+                    return True
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Timed out flushing pending writes")
+                    return False
+                self._condition.wait(remaining)
+
+    def _ensure_thread(self):
+        """Start the writer thread on first use (called with the lock held)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="OnTimePersistence", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        """Writer loop: write each file once its debounce delay has passed"""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._pending:
+                        self._condition.wait()
+                        continue
+
+                    path, (text, due) = min(self._pending.items(), key=lambda item: item[1][1])
+                    wait = due - time.monotonic()
+                    if wait <= 0:
+                        del self._pending[path]
+                        self._in_flight = path
+                        break
+                    self._condition.wait(wait)
+
+            try:
+                self._write_atomic(path, text)
+            except Exception as e:
+                logger.error("Error writing %s: %s", path, e)
+            finally:
+                with self._condition:
+                    self._in_flight = None
+                    self._condition.notify_all()
+
+    def _write_atomic(self, path: Path, text: str):
+        """Write text to a temp file next to path and move it into place"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            if self.fsync_policy != FsyncPolicy.NONE:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+        if self.fsync_policy == FsyncPolicy.FULL and hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(path.parent, os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+
+_service: Optional[PersistenceService] = None
+_service_lock = threading.Lock()
+
+
+def get_persistence_service() -> PersistenceService:
+    """Get the process-wide persistence service, flushed automatically at exit"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = PersistenceService()
+            atexit.register(_service.flush)
+        return _service
@@ -0,0 +1,337 @@
+"""
+Opt-in profiling of the timer hot path for the OnTime Meeting Timer application.
+
+Every 100 ms the tick chain runs Timer._update_timer, then
+TimerController._handle_time_update, then the views and the
+NetworkDisplayManager. When tracing is enabled, the handlers in HOT_PATH are
+replaced at class level by timed wrappers. That must happen before the
+controllers and windows are created, because signals keep the bound method
+they were connected to. The tracer then collects:
+
+- a timing histogram per handler
+- tick-to-paint latency (tick start to the first paint event after it)
+- late and dropped ticks of the 100 ms timer
+- event-loop lag, measured by a probe timer
+
+When tracing is disabled nothing is patched, so the hot path is unchanged.
+The collected data can be written as a JSON summary or as a Chrome trace
+(chrome://tracing or https://ui.perfetto.dev).
+"""
+import functools
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Tuple, Union
+
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject, Qt, QTimer
+
+logger = logging.getLogger("OnTime.Profiling")
+
+# (module, class, method) of the handlers on the tick chain
+HOT_PATH: Tuple[Tuple[str, str, str], ...] = (
+    ("src.models.timer", "Timer", "_update_timer"),
+    ("src.controllers.timer_controller", "TimerController", "_handle_time_update"),
+    ("src.controllers.timer_controller", "TimerController", "_update_predicted_end_time"),
+    ("src.views.timer_view", "TimerView", "_update_time"),
+    ("src.views.secondary_display", "SecondaryDisplay", "_update_time"),
+    ("src.views.secondary_display", "SecondaryDisplay", "_update_predicted_end_time"),
+    ("src.views.main_window", "MainWindow", "_update_predicted_end_time"),
+    ("src.views.meeting_view", "MeetingPartsModel", "set_section_slack"),
+    ("src.utils.network_display_manager", "NetworkDisplayManager", "_on_time_updated"),
+    ("src.utils.network_display_manager", "NetworkDisplayManager", "_on_predicted_end_time_updated"),
+)
+
+TICK_HANDLER = "Timer._update_timer"
+TICK_INTERVAL_MS = 100
+LAG_PROBE_INTERVAL_MS = 50
+MAX_TRACE_EVENTS = 200_000
+
+# Histogram buckets: upper bounds in microseconds, doubling from 16 us to ~1 s
+BUCKET_BOUNDS_US: Tuple[int, ...] = tuple(16 << i for i in range(17))
+
+
+class Histogram:
+    """Log-scale histogram of durations in microseconds"""
+    __slots__ = ('counts', 'count', 'total_us', 'max_us')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_US) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def add(self, duration_us: float):
+        self.count += 1
+        self.total_us += duration_us
+        if duration_us > self.max_us:
+            self.max_us = duration_us
+        # Bucket of the smallest power of two above the value
+        bucket = max(0, int(duration_us).bit_length() - 4)
+        self.counts[min(bucket, len(BUCKET_BOUNDS_US))] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKET_BOUNDS_US, self.counts):
+            seen += bucket_count
+            if seen >= wanted:
+                return float(min(bound, self.max_us))
+        return self.max_us
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'mean_us': round(self.total_us / self.count, 1) if self.count else 0.0,
+            'p50_us': self.percentile(0.5),
+            'p95_us': self.percentile(0.95),
+            'p99_us': self.percentile(0.99),
+            'max_us': round(self.max_us, 1),
+            'buckets_us': {str(bound): n for bound, n in zip(BUCKET_BOUNDS_US, self.counts) if n},
+            'overflow': self.counts[-1],
+        }
+
+
+class _PaintWatcher(QObject):
+    """Application event filter that closes the tick-to-paint interval"""
+
+    def __init__(self, tracer: "Tracer"):
+        super().__init__()
+        self._tracer = tracer
+
+    def eventFilter(self, obj, event):
+        if self._tracer._pending_tick is not None and event.type() == QEvent.Type.Paint:
+            self._tracer._record_paint()
+        return False
+
+
+class Tracer:
+    """Collects hot path timings while tracing is enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._lag_timer: Optional[QTimer] = None
+        self._paint_watcher: Optional[_PaintWatcher] = None
+        self.reset()
+
+    def reset(self):
+        """Drop everything collected so far"""
+        self.handlers: Dict[str, Histogram] = {}
+        self.tick_to_paint = Histogram()
+        self.loop_lag = Histogram()
+        self.ticks = 0
+        self.late_ticks = 0
+        self.dropped_ticks = 0
+        self._events: Deque[Dict] = deque(maxlen=MAX_TRACE_EVENTS)
+        self._last_tick: Dict[int, float] = {}
+        self._pending_tick: Optional[float] = None
+        self._last_probe: Optional[float] = None
+        self.started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # Enabling
+
+    def enable(self, targets=HOT_PATH):
+        """Wrap the hot path handlers and start the probes
+
+        Call before the timer, controllers and windows are created.
+        """
+        if self.enabled:
+            return
+        for module_name, class_name, method_name in targets:
+            try:
+                cls = getattr(importlib.import_module(module_name), class_name)
+            except (ImportError, AttributeError) as e:
+                logger.warning("Cannot trace %s.%s: %s", class_name, method_name, e)
+                continue
+            self.instrument(cls, method_name)
+        self.enabled = True
+        self._start_probes()
+        logger.info("Hot path tracing enabled (%d handlers)", len(self._originals))
+
+    def disable(self):
+        """Restore the original handlers and stop the probes
+
+        Signals connected while tracing was enabled keep the wrapped handlers.
+        """
+        for (cls, method_name), original in self._originals.items():
+            setattr(cls, method_name, original)
+        self._originals.clear()
+        self._stop_probes()
+        self.enabled = False
+
+    def instrument(self, cls: type, method_name: str):
+        """Replace cls.method_name with a timed wrapper"""
+        key = (cls, method_name)
+        if key in self._originals:
+            return
+        original = cls.__dict__[method_name]
+        name = f"{cls.__name__}.{method_name}"
+        wrapper = self._wrap_tick(original) if name == TICK_HANDLER else self._wrap(name, original)
+        self._originals[key] = original
+        setattr(cls, method_name, wrapper)
+
+    def _wrap(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter())
+        return traced
+
+    def _wrap_tick(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def traced(timer, *args, **kwargs):
+            start = time.perf_counter()
+            self._record_tick(timer, start)
+            try:
+                return func(timer, *args, **kwargs)
+            finally:
+                self.record(TICK_HANDLER, start, time.perf_counter())
+        return traced
+
+    def _start_probes(self):
+        app = QCoreApplication.instance()
+        if app is None:
+            # Probes need an application; tests may enable tracing without one
+            return
+        self._paint_watcher = _PaintWatcher(self)
+        app.installEventFilter(self._paint_watcher)
+        self._lag_timer = QTimer()
+        self._lag_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._lag_timer.setInterval(LAG_PROBE_INTERVAL_MS)
+        self._lag_timer.timeout.connect(self._probe_lag)
+        self._lag_timer.start()
+
+    def _stop_probes(self):
+        if self._lag_timer is not None:
+            self._lag_timer.stop()
+            self._lag_timer = None
+        if self._paint_watcher is not None:
+            app = QCoreApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self._paint_watcher)
+            self._paint_watcher = None
+
+    # ------------------------------------------------------------------
+    # Recording
+
+    def record(self, name: str, start: float, end: float):
+        """Record one handler call (perf_counter timestamps)"""
+        duration_us = (end - start) * 1e6
+        with self._lock:
+            histogram = self.handlers.get(name)
+            if histogram is None:
+                histogram = self.handlers[name] = Histogram()
+            histogram.add(duration_us)
+            self._events.append({
+                'name': name, 'cat': 'handler', 'ph': 'X',
+                'ts': round((start - self._origin) * 1e6, 1), 'dur': round(duration_us, 1),
+                'pid': self._pid, 'tid': threading.get_ident(),
+            })
+
+    def _record_tick(self, timer, now: float):
+        """Count late and dropped ticks from the gap since the previous tick"""
+        qtimer = getattr(timer, '_timer', None)
+        if qtimer is None or not qtimer.isActive():
+            # Direct calls such as Timer.set_duration are not ticks
+            return
+        interval = (qtimer.interval() or TICK_INTERVAL_MS) / 1000
+        previous = self._last_tick.get(id(timer))
+        self._last_tick[id(timer)] = now
+        self._pending_tick = now
+        self.ticks += 1
+        if previous is None:
+            return
+        gap = now - previous
+        if gap > interval * 1.5:
+            self.late_ticks += 1
+            self.dropped_ticks += int(gap / interval + 0.5) - 1
+            self._counter('late_ticks', now, self.late_ticks)
+
+    def _record_paint(self):
+        now = time.perf_counter()
+        start = self._pending_tick
+        self._pending_tick = None
+        self.tick_to_paint.add((now - start) * 1e6)
+        self._events.append({
+            'name': 'tick-to-paint', 'cat': 'paint', 'ph': 'X',
+            'ts': round((start - self._origin) * 1e6, 1), 'dur': round((now - start) * 1e6, 1),
+            'pid': self._pid, 'tid': threading.get_ident(),
+        })
+
+    def _probe_lag(self):
+        now = time.perf_counter()
+        if self._last_probe is not None:
+            lag_us = max(0.0, (now - self._last_probe) * 1e6 - LAG_PROBE_INTERVAL_MS * 1000)
+            self.loop_lag.add(lag_us)
+            self._counter('event_loop_lag_ms', now, round(lag_us / 1000, 2))
+        self._last_probe = now
+
+    def _counter(self, name: str, now: float, value):
+        self._events.append({
+            'name': name, 'ph': 'C', 'ts': round((now - self._origin) * 1e6, 1),
+            'pid': self._pid, 'args': {'value': value},
+        })
+
+    # ------------------------------------------------------------------
+    # Reporting
+
+    def summary(self) -> Dict:
+        """Aggregated statistics as a JSON-serializable dict"""
+        with self._lock:
+            handlers = {name: hist.to_dict() for name, hist in sorted(self.handlers.items())}
+        return {
+            'enabled': self.enabled,
+            'started_at': self.started_at,
+            'duration_s': round(time.time() - self.started_at, 3),
+            'ticks': self.ticks,
+            'late_ticks': self.late_ticks,
+            'dropped_ticks': self.dropped_ticks,
+            'handlers': handlers,
+            'tick_to_paint': self.tick_to_paint.to_dict(),
+            'event_loop_lag': self.loop_lag.to_dict(),
+        }
+
+    def chrome_trace(self) -> Dict:
+        """Recorded events in the Chrome trace event format"""
+        with self._lock:
+            events = list(self._events)
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'summary': self.summary()},
+        }
+
+    def dump(self, file_path: Union[str, Path], trace_format: str = "chrome") -> Path:
+        """Write the summary ("json") or the Chrome trace ("chrome") to a file"""
+        if trace_format not in ("json", "chrome"):
+            raise ValueError(f"Unknown trace format: {trace_format}")
+        file_path = Path(file_path)
+        data = self.chrome_trace() if trace_format == "chrome" else self.summary()
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        logger.info("Wrote %s trace to %s", trace_format, file_path)
+        return file_path
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
@@ -2,7 +2,6 @@
 Web scraper for fetching meeting data from wol.jw.org
 """
 import re
-import requests
 from bs4 import BeautifulSoup, Tag
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional, Set
@@ -22,6 +21,116 @@ except ImportError:
         return str(Path.home() / ".meeting_timer_cache")
 
 from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.utils.http_client import get_http_client
+from src.utils.scraper_patterns import get_patterns, NUMBERED_PART, DUPLICATE_DURATION
+
+class PartDurationIndex:
+    """Part number -> duration lookups for one meeting page
+
+    Walks the numbered h3/strong/p/span elements once and records the first
+    duration found near each part number. The lookup strategies are the same,
+    in the same order of preference:
+
+    1. a numbered h3: the next paragraph, then the heading itself
+    2. a numbered strong: its parent, then the parent's next sibling
+    3. any numbered p/span/strong/h3: the element, then the next element
+    4. any element mentioning "N.": the element, then the next element
+
+    Strategy 4 only runs for parts the others did not resolve. It skips every
+    subtree whose text does not mention the part, so each element's text is
+    extracted at most once per page instead of once per part.
+    """
+
+    def __init__(self, soup: BeautifulSoup, extract_duration, texts: Optional[Dict[int, str]] = None):
+        self.soup = soup
+        self._extract = extract_duration
+        # Stripped element texts by id(tag); may be shared with the caller
+        self._texts: Dict[int, str] = {} if texts is None else texts
+        self._durations: Dict[int, Optional[int]] = {}
+        self._unprunable: Optional[Set[int]] = None
+
+        by_heading: Dict[int, int] = {}
+        by_strong: Dict[int, int] = {}
+        by_prefix: Dict[int, int] = {}
+        for tag in soup.find_all(['h3', 'strong', 'p', 'span']):
+            text = self._text(tag)
+            match = NUMBERED_PART.match(text)
+            if not match:
+                continue
+            digits = match.group(1)
+            number = int(digits)
+
+            if tag.name == 'h3' and number not in by_heading:
+                duration = self._duration_near(text, tag.find_next('p'), first=False)
+                if duration:
+                    by_heading[number] = duration
+
+            if tag.name == 'strong' and number not in by_strong and tag.parent:
+                parent = tag.parent
+                duration = self._duration_near(self._text(parent), parent.find_next_sibling())
+                if duration:
+                    by_strong[number] = duration
+
+            # Strategy 3 matches the literal number, so "01." is not part 1
+            if digits == str(number) and number not in by_prefix:
+                duration = self._duration_near(text, tag.find_next())
+                if duration:
+                    by_prefix[number] = duration
+
+        for number in by_heading.keys() | by_strong.keys() | by_prefix.keys():
+            self._durations[number] = by_heading.get(number) or by_strong.get(number) or by_prefix.get(number)
+
+    def duration_for(self, part_num: int) -> Optional[int]:
+        """Duration in minutes of a numbered part, or None if none was found"""
+        if part_num not in self._durations:
+            self._durations[part_num] = self._find_mention(part_num)
+        return self._durations[part_num]
+
+    def _text(self, tag: Tag) -> str:
+        key = id(tag)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = tag.get_text().strip()
+        return text
+
+    def _duration_near(self, text: str, next_elem: Optional[Tag], first: bool = True) -> Optional[int]:
+        """Duration in text or in the next element (the next element first when first is False)"""
+        next_text = self._text(next_elem) if next_elem else None
+        candidates = (text, next_text) if first else (next_text, text)
+        for candidate in candidates:
+            if candidate:
+                duration = self._extract(candidate)
+                if duration:
+                    return duration
+        return None
+
+    def _find_mention(self, part_num: int) -> Optional[int]:
+        """Strategy 4: first element (document order) mentioning "N." with a duration nearby"""
+        needle = f"{part_num}."
+        if self._unprunable is None:
+            # get_text() leaves script/style strings out of the ancestors' text, so
+            # the ancestors of those elements cannot be skipped on their text alone
+            self._unprunable = set()
+            for special in self.soup.find_all(['script', 'style', 'template']):
+                self._unprunable.update(id(parent) for parent in special.parents)
+
+        stack = [iter([child for child in self.soup.children if isinstance(child, Tag)])]
+        while stack:
+            tag = next(stack[-1], None)
+            if tag is None:
+                stack.pop()
+                continue
+            text = self._text(tag)
+            if needle in text:
+                duration = self._duration_near(text, tag.find_next())
+                if duration:
+                    return duration
+            elif id(tag) not in self._unprunable:
+                # A descendant's text is part of this text, so none of them mention it either
+                continue
+            stack.append(iter([child for child in tag.children if isinstance(child, Tag)]))
+        return None
+
 
 class MeetingScraper:
     """Scraper for fetching meeting data from wol.jw.org"""
@@ -35,7 +144,9 @@ class MeetingScraper:
     
     def __init__(self, language: str = "en"):
         self.language = language
-        self.session = requests.Session()
+        self.patterns = get_patterns(language)
+        self.http = get_http_client()
+        self._duration_index: Optional[PartDurationIndex] = None
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         
         # Set language in URL
@@ -53,7 +164,7 @@ class MeetingScraper:
             # convert string keys back to MeetingType
             return {MeetingType(k): v for k, v in raw_links.items()}
 
-        response = self.session.get(self.meetings_url)
+        response = self.http.get(self.meetings_url)
         if response.status_code != 200:
             raise Exception(f"Failed to fetch meetings page: {response.status_code}")
         
@@ -154,16 +265,24 @@ class MeetingScraper:
     
     def scrape_meeting(self, url: str, meeting_type: MeetingType) -> Meeting:
         """Scrape meeting data from a specific URL"""
+        return self._meeting_from_html(self._fetch_page(url), meeting_type)
+
+    def _fetch_page(self, url: str) -> str:
+        """HTML of a meeting page, from the page cache or the web"""
         # page‑cache key: md5(url)
         key = hashlib.md5(url.encode()).hexdigest() + ".html"
         page_path = self.CACHE_DIR / key
         html = self._cache_load(page_path, self.PAGE_TTL)
         if html is None:
-            response = self.session.get(url)
+            response = self.http.get(url)
             if response.status_code != 200:
                 raise Exception(f"Failed to fetch meeting page: {response.status_code}")
             html = response.text
             self._cache_save(page_path, html)
+        return html
+
+    def _meeting_from_html(self, html: str, meeting_type: MeetingType) -> Meeting:
+        """Parse a meeting page"""
         soup = BeautifulSoup(html, "html.parser")
         
         # Extract date information
@@ -254,119 +373,23 @@ class MeetingScraper:
         
     def _find_duration_for_part(self, part_num: int, soup: BeautifulSoup) -> Optional[int]:
         """Find the duration for a part by searching for it based on HTML structure rather than content patterns"""
-        # Look specifically for the part with this number
-        for h3 in soup.find_all(['h3']):
-            h3_text = h3.get_text().strip()
-            part_match = re.match(r'(\d+)\.\s+(.*)', h3_text)
-            
-            if part_match and int(part_match.group(1)) == part_num:
-                # Found the heading for this part, now look for duration in the next paragraph
-                next_p = h3.find_next('p')
-                if next_p:
-                    p_text = next_p.get_text().strip()
-                    duration = self._extract_duration(p_text)
-                    if duration:
-                        return duration
-                
-                # Also look for duration in the h3 itself
-                duration = self._extract_duration(h3_text)
-                if duration:
-                    return duration
-        
-        # If we couldn't find the part in h3 elements, try looking for it in strong elements
-        for strong in soup.find_all('strong'):
-            strong_text = strong.get_text().strip()
-            part_match = re.match(r'(\d+)\.\s+(.*)', strong_text)
-            
-            if part_match and int(part_match.group(1)) == part_num:
-                # Found the part in a strong tag, check parent and surrounding elements
-                parent = strong.parent
-                
-                # Check parent element for duration
-                if parent:
-                    parent_text = parent.get_text().strip()
-                    duration = self._extract_duration(parent_text)
-                    if duration:
-                        return duration
-                    
-                    # Check next sibling of parent
-                    next_elem = parent.find_next_sibling()
-                    if next_elem:
-                        next_text = next_elem.get_text().strip()
-                        duration = self._extract_duration(next_text)
-                        if duration:
-                            return duration
-        
-        # If still not found, look for any element containing part number string (e.g., "1.")
-        part_pattern = re.compile(rf'^{part_num}\.\s')
-        
-        for elem in soup.find_all(['p', 'span', 'strong', 'h3']):
-            elem_text = elem.get_text().strip()
-            
-            if part_pattern.match(elem_text):
-                # Found the part, check this element and the next for duration
-                duration = self._extract_duration(elem_text)
-                if duration:
-                    return duration
-                
-                # Check next element
-                next_elem = elem.find_next()
-                if next_elem:
-                    next_text = next_elem.get_text().strip()
-                    duration = self._extract_duration(next_text)
-                    if duration:
-                        return duration
-        
-        # If part number is mentioned anywhere in any element
-        for elem in soup.find_all():
-            text = elem.get_text().strip()
-            if f"{part_num}." in text:
-                # Found a mention, check surrounding elements
-                duration = self._extract_duration(text)
-                if duration:
-                    return duration
-                
-                # Check next element
-                next_elem = elem.find_next()
-                if next_elem:
-                    next_text = next_elem.get_text().strip()
-                    duration = self._extract_duration(next_text)
-                    if duration:
-                        return duration
-        
-        # Return None if we couldn't find a duration
-        return None
+        # The index is built on the first lookup for a page and reused for the other parts
+        if self._duration_index is None or self._duration_index.soup is not soup:
+            self._duration_index = PartDurationIndex(soup, self._extract_duration)
+        return self._duration_index.duration_for(part_num)
     
     def _extract_duration(self, text: str) -> Optional[int]:
         """Extract duration in minutes from text"""
-        # Enhanced pattern to catch more duration formats
-        patterns = [
-            r'\((\d+)\s*min\.?\)',                # (10 min) or (10 min.)
-            r'(?<!\()(\d+)\s*min\.?(?!\))',       # 10 min or 10 min. not in parentheses
-            r'(\d+)(?:\s*|-)\s*minute',           # 10 minute or 10-minute
-            r'(\d+)\s*(?:min|m)(?:\.|,|\s|$)',    # 10 min. or 10m or 10 min
-            r'\((\d+)\)'                          # (10) - as a last resort, if clearly in context
-        ]
-        
-        for pattern in patterns:
-            duration_match = re.search(pattern, text, re.IGNORECASE)
-            if duration_match:
-                return int(duration_match.group(1))
-        
-        return None
+        return self.patterns.find_duration(text)
     
     def _extract_song_number(self, text: str) -> Optional[int]:
         """Extract song number from text"""
-        # Match patterns like "Song 76" or "SONG 76"
-        song_match = re.search(r'[Ss][Oo][Nn][Gg]\s+(\d+)', text)
-        if song_match:
-            return int(song_match.group(1))
-        return None
+        return self.patterns.find_web_song(text)
     
     def _remove_duplicate_duration(self, title: str) -> str:
         """Remove duplicate duration formats from part titles"""
         # Match (X min) (X min) pattern
-        duplicate_match = re.search(r'(\(\d+\s*min\.?\))\s+\(\d+\s*min\.?\)', title)
+        duplicate_match = DUPLICATE_DURATION.search(title)
         if duplicate_match:
             # Keep only the first duration
             return title.replace(duplicate_match.group(0), duplicate_match.group(1))
@@ -388,11 +411,6 @@ class MeetingScraper:
     
     def _parse_midweek_meeting(self, soup: BeautifulSoup) -> List[MeetingSection]:
         """Parse midweek meeting structure to match the desired output format"""
-        # Create default sections 
-        treasures_section = MeetingSection(title="TREASURES FROM GOD'S WORD", parts=[])
-        ministry_section = MeetingSection(title="APPLY YOURSELF TO THE FIELD MINISTRY", parts=[])
-        christians_section = MeetingSection(title="LIVING AS CHRISTIANS", parts=[])
-        
         # Find all songs in the document
         songs = []
         for el in soup.find_all(['h3', 'p', 'strong', 'a', 'span']):
@@ -405,22 +423,6 @@ class MeetingScraper:
         # Use a set to track part numbers we've already processed to avoid duplicates
         processed_part_numbers = set()
         
-        # First, look for section headers to confirm the structure
-        section_headers = {
-            "treasures": False,
-            "ministry": False,
-            "christians": False
-        }
-        
-        for h3 in soup.find_all(['h3']):
-            h3_text = h3.get_text().strip().upper()
-            if "TREASURES FROM GOD'S WORD" in h3_text:
-                section_headers["treasures"] = True
-            elif "APPLY YOURSELF TO THE FIELD MINISTRY" in h3_text:
-                section_headers["ministry"] = True
-            elif "LIVING AS CHRISTIANS" in h3_text:
-                section_headers["christians"] = True
-        
         # Find all numbered parts (1. Title) in any tag
         numbered_parts = []
         
@@ -429,7 +431,7 @@ class MeetingScraper:
             strong_tags = h3.find_all('strong')
             for strong in strong_tags:
                 strong_text = strong.get_text().strip()
-                part_match = re.match(r'(\d+)\.\s+(.*)', strong_text)
+                part_match = NUMBERED_PART.match(strong_text)
                 if part_match:
                     part_num = int(part_match.group(1))
                     if part_num not in processed_part_numbers:
@@ -441,7 +443,7 @@ class MeetingScraper:
         # Then look in h3 tags directly
         for h3 in soup.find_all('h3'):
             h3_text = h3.get_text().strip()
-            part_match = re.match(r'(\d+)\.\s+(.*)', h3_text)
+            part_match = NUMBERED_PART.match(h3_text)
             if part_match:
                 part_num = int(part_match.group(1))
                 if part_num not in processed_part_numbers:
@@ -453,7 +455,7 @@ class MeetingScraper:
         # Finally look in any element that might contain a part number
         for el in soup.find_all(['p', 'span', 'div']):
             el_text = el.get_text().strip()
-            part_match = re.match(r'(\d+)\.\s+(.*)', el_text)
+            part_match = NUMBERED_PART.match(el_text)
             if part_match:
                 part_num = int(part_match.group(1))
                 if part_num not in processed_part_numbers:
@@ -462,6 +464,24 @@ class MeetingScraper:
                     duration = self._find_duration_for_part(part_num, soup)
                     numbered_parts.append((part_num, part_title, duration))
         
+        # Look for concluding comments
+        concluding_text = None
+        for el in soup.find_all(['p', 'h3', 'strong', 'span']):
+            el_text = el.get_text().strip()
+            if "Concluding Comments" in el_text:
+                concluding_text = el_text
+                break
+        
+        return self._build_midweek_sections(songs, numbered_parts, concluding_text)
+    
+    def _build_midweek_sections(self, songs: List[Tuple[int, str]],
+                                numbered_parts: List[Tuple[int, str, Optional[int]]],
+                                concluding_text: Optional[str]) -> List[MeetingSection]:
+        """Arrange the songs and numbered parts found on a midweek page into sections"""
+        treasures_section = MeetingSection(title="TREASURES FROM GOD'S WORD", parts=[])
+        ministry_section = MeetingSection(title="APPLY YOURSELF TO THE FIELD MINISTRY", parts=[])
+        christians_section = MeetingSection(title="LIVING AS CHRISTIANS", parts=[])
+        
         # Add opening song to Treasures section
         if songs:
             opening_song_num = songs[0][0]
@@ -516,31 +536,24 @@ class MeetingScraper:
             # Fallback to the opening song if we don't have a specific closing song
             closing_song_num = songs[0][0]
         
-        # Look for concluding comments
-        concluding_found = False
         concluding_duration = 3  # Default
-        for el in soup.find_all(['p', 'h3', 'strong', 'span']):
-            el_text = el.get_text().strip()
-            if "Concluding Comments" in el_text:
-                concluding_found = True
-                # Extract duration if present
-                duration = self._extract_duration(el_text)
-                if duration:
-                    concluding_duration = duration
-                
-                # Extract song number if present
-                song_match = re.search(r'Song\s+(\d+)', el_text, re.IGNORECASE)
-                if song_match:
-                    closing_song_num = song_match.group(1)
-                
-                christians_section.parts.append(
-                    MeetingPart(title=f"Concluding Comments (3 min.) | Song {closing_song_num} and Prayer", 
-                            duration_minutes=concluding_duration + 5)  # Add 5 for song and prayer
-                )
-                break
-        
-        # If concluding comments not found, add a default entry
-        if not concluding_found:
+        if concluding_text is not None:
+            # Extract duration if present
+            duration = self._extract_duration(concluding_text)
+            if duration:
+                concluding_duration = duration
+            
+            # Extract song number if present
+            song_match = re.search(r'Song\s+(\d+)', concluding_text, re.IGNORECASE)
+            if song_match:
+                closing_song_num = song_match.group(1)
+            
+            christians_section.parts.append(
+                MeetingPart(title=f"Concluding Comments (3 min.) | Song {closing_song_num} and Prayer", 
+                        duration_minutes=concluding_duration + 5)  # Add 5 for song and prayer
+            )
+        else:
+            # If concluding comments not found, add a default entry
             christians_section.parts.append(
                 MeetingPart(title=f"Concluding Comments (3 min.) | Song {closing_song_num} and Prayer", 
                         duration_minutes=8)
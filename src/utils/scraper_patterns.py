@@ -0,0 +1,187 @@
+"""
+Compiled regular expressions shared by the meeting scrapers.
+
+MeetingScraper (wol.jw.org pages) and EPUBMeetingScraper (workbook and
+Watchtower EPUBs) look for the same tokens: part durations, song numbers and
+numbered part headings. Their grammars used to be written inline in the hot
+loops. Here they are compiled once per language and shared.
+
+Patterns that are tried one after another (the first one that matches wins)
+are grouped in a PatternGroup.
+
+Hits and misses of each lookup are counted per language (see get_pattern_stats).
+The counters are not locked, so counts from concurrent scrapers are approximate.
+"""
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+
+# Song words every scraper has always accepted, whatever the language
+BASE_SONG_WORDS = ("Song", "Cantico", "Cantique", "Canción", "Lied")
+
+# Extra song words per language
+SONG_WORDS: Dict[str, Tuple[str, ...]] = {
+    "pt": ("Cântico",),
+    "ja": ("歌",),
+    "ko": ("노래",),
+    "zh": ("唱诗", "诗歌"),
+}
+
+# Extra duration abbreviations and words per language ("min" and "minute" are always accepted)
+MINUTE_ABBREVIATIONS: Dict[str, Tuple[str, ...]] = {
+    "es": ("mins",),
+    "ja": ("分",),
+    "ko": ("분",),
+    "zh": ("分钟", "分"),
+}
+MINUTE_WORDS: Dict[str, Tuple[str, ...]] = {
+    "it": ("minuti", "minuto"),
+    "es": ("minutos", "minuto"),
+    "pt": ("minutos", "minuto"),
+}
+
+# Languages without spaces between words and numbers
+UNSPACED_LANGUAGES = frozenset({"ja", "ko", "zh"})
+
+SUPPORTED_LANGUAGES = ("en", "it", "fr", "es", "de", "pt", "ja", "ko", "zh")
+
+MAX_SONG_NUMBER = 200
+
+# Language-independent grammars
+NUMBERED_PART = re.compile(r'(\d+)\.\s+(.*)')
+PART_NUMBER_PREFIX = re.compile(r'^\d+\.')
+DUPLICATE_DURATION = re.compile(r'(\(\d+\s*min\.?\))\s+\(\d+\s*min\.?\)')
+PAREN_MINUTES = re.compile(r'\((\d+)\s*min', re.IGNORECASE)
+SONG_AND_PRAYER = re.compile(r'song.*prayer|prayer.*song')
+SONG_WORD = re.compile(r'song|cantico|cantique|canción|lied')
+WEB_SONG = re.compile(r'[Ss][Oo][Nn][Gg]\s+(\d+)')  # "Song 80" on the English meeting web pages
+TREASURES_HEADER = re.compile(r'TREASURES|TESORI|JOYAUX|TESOROS|SCHÄTZE')
+MINISTRY_HEADER = re.compile(r'APPLY|EFFICACI|APPLIQUE|SEAMOS|VERBESSERN')
+LIVING_HEADER = re.compile(r'LIVING|VITA|VIE|NUESTRA|UNSER')
+
+
+def _alternation(words: Sequence[str]) -> str:
+    return "|".join(re.escape(word) for word in words)
+
+
+class PatternGroup:
+    """Precompiled patterns tried in order, where the first one that matches wins
+
+    A single alternation of the patterns was measured slower than searching
+    them one by one: it loses the literal-prefix scans that re uses for the
+    individual patterns, on hits and misses alike.
+    """
+    __slots__ = ('name', 'patterns')
+
+    def __init__(self, name: str, sources: Sequence[str], flags: int = 0):
+        self.name = name
+        self.patterns: Tuple[Pattern, ...] = tuple(re.compile(source, flags) for source in sources)
+
+    def first(self, text: str, accept: Callable[[str], bool] = bool) -> Optional[str]:
+        """Capture of the first pattern whose leftmost match is accepted"""
+        for pattern in self.patterns:
+            match = pattern.search(text)
+            if match is not None and accept(match.group(1)):
+                return match.group(1)
+        return None
+
+
+def _is_song_number(captured: str) -> bool:
+    return 1 <= int(captured) <= MAX_SONG_NUMBER
+
+
+class LanguagePatterns:
+    """Compiled duration, song and part grammars for one language"""
+
+    def __init__(self, language: str):
+        self.language = language
+        abbreviations = MINUTE_ABBREVIATIONS.get(language, ()) + ("min",)
+        minute_words = ("minute",) + MINUTE_WORDS.get(language, ())
+        song_words = BASE_SONG_WORDS + SONG_WORDS.get(language, ())
+        gap = r"\s*" if language in UNSPACED_LANGUAGES else r"\s+"
+
+        # Part durations, in order of preference
+        self.duration_sources: Tuple[str, ...] = (
+            r'\((\d+)\s*(?:' + _alternation(abbreviations) + r')\.?\)',  # (10 min) or (10 min.)
+            r'(?<!\()(\d+)\s*(?:' + _alternation(abbreviations) + r')\.?(?!\))',  # 10 min not in parentheses
+            r'(\d+)(?:\s*|-)\s*(?:' + _alternation(minute_words) + r')',  # 10 minute or 10-minute
+            r'(\d+)\s*(?:' + _alternation(abbreviations + ("m",)) + r')(?:\.|,|\s|$)',  # 10 min. or 10m or 10 min
+            r'\((\d+)\)',  # (10) - as a last resort
+        )
+        self.durations = PatternGroup("duration", self.duration_sources, re.IGNORECASE)
+
+        # Song numbers: "Song 80" first, then "80 Song"
+        words = _alternation(song_words)
+        self.song_sources: Tuple[str, ...] = (
+            rf'(?:{words}){gap}(\d{{1,3}})',
+            rf'(\d{{1,3}})\s*(?:{words})',
+        )
+        self.songs = PatternGroup("song", self.song_sources, re.IGNORECASE)
+        # Song numbers of a whole article, in the order EPUBMeetingScraper has always listed them
+        self.song_lists: Tuple[Pattern, ...] = self.songs.patterns + (re.compile(r'<.*?>(\d{1,3})<.*?>'),)
+
+    def find_duration(self, text: str) -> Optional[int]:
+        """Duration in minutes from the first duration grammar that matches"""
+        captured = self.durations.first(text)
+        _count(self.language, "duration", captured is not None)
+        return int(captured) if captured is not None else None
+
+    def find_song(self, text: str) -> Optional[int]:
+        """Song number (1-MAX_SONG_NUMBER) from the first song grammar that matches"""
+        captured = self.songs.first(text, _is_song_number)
+        _count(self.language, "song", captured is not None)
+        return int(captured) if captured is not None else None
+
+    def find_all_songs(self, text: str) -> List[int]:
+        """Distinct song numbers of a text, in grammar order then text order"""
+        songs = []
+        for pattern in self.song_lists:
+            for match in pattern.findall(text):
+                number = int(match)
+                if 1 <= number <= MAX_SONG_NUMBER:
+                    songs.append(number)
+        _count(self.language, "song_list", bool(songs))
+        return list(dict.fromkeys(songs))
+
+    def find_web_song(self, text: str) -> Optional[int]:
+        """Song number written as "Song N" (any number, as MeetingScraper has always read it)"""
+        match = WEB_SONG.search(text)
+        _count(self.language, "web_song", match is not None)
+        return int(match.group(1)) if match else None
+
+    def find_paren_minutes(self, text: str) -> Optional[int]:
+        """Duration written as "(N min" """
+        match = PAREN_MINUTES.search(text)
+        _count(self.language, "paren_minutes", match is not None)
+        return int(match.group(1)) if match else None
+
+
+@lru_cache(maxsize=None)
+def get_patterns(language: str) -> LanguagePatterns:
+    """Compiled grammars for a language (built on first use, then shared)"""
+    return LanguagePatterns(language)
+
+
+# ----------------------------------------------------------------------
+# Statistics
+
+_stats: Counter = Counter()
+
+
+def _count(language: str, grammar: str, hit: bool):
+    _stats[(language, grammar, hit)] += 1
+
+
+def get_pattern_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Hits and misses per language and grammar, e.g. stats["en"]["duration"]["hits"]"""
+    items = list(_stats.items())
+    stats: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for (language, grammar, hit), count in items:
+        entry = stats.setdefault(language, {}).setdefault(grammar, {"hits": 0, "misses": 0})
+        entry["hits" if hit else "misses"] += count
+    return stats
+
+
+def reset_pattern_stats():
+    _stats.clear()
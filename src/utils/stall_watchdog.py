@@ -0,0 +1,253 @@
+"""
+GUI event-loop stall watchdog for the OnTime Meeting Timer application.
+
+A heartbeat timer on the GUI thread stamps the time every HEARTBEAT_MS. A
+daemon thread checks that stamp. When it is older than the threshold, the
+event loop is stalled: the reminders, session autosave, screen monitoring or
+a synchronous update is blocking the GUI thread. While the stall lasts, the
+thread samples the main thread's stack with sys._current_frames(). When the
+heartbeat resumes, the stall and its hottest frames are logged through the
+"OnTime" logger (and so into the rotating log file). They are also kept for
+the post-meeting report.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from PyQt6.QtCore import QObject, QTimer
+
+logger = logging.getLogger("OnTime.Watchdog")
+
+HEARTBEAT_MS = 50
+DEFAULT_THRESHOLD_MS = 250
+SAMPLE_INTERVAL_MS = 20
+MAX_STACK_DEPTH = 40
+MAX_STALLS = 200
+
+# (filename, line number, function name), innermost frame last
+Frame = Tuple[str, int, str]
+Stack = Tuple[Frame, ...]
+
+_APP_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+
+
+def format_frame(frame: Frame) -> str:
+    filename, lineno, name = frame
+    if filename.startswith(_APP_ROOT):
+        filename = filename[len(_APP_ROOT):].lstrip("/\\")
+    return f"{filename}:{lineno} in {name}"
+
+
+def _is_app_frame(frame: Frame) -> bool:
+    return frame[0].startswith(_APP_ROOT) and "site-packages" not in frame[0]
+
+
+def _hot_frame(stack: Stack) -> Frame:
+    """Innermost frame of the application's own code (the leaf if there is none)"""
+    for frame in reversed(stack):
+        if _is_app_frame(frame):
+            return frame
+    return stack[-1]
+
+
+@dataclass
+class Stall:
+    """One stall of the GUI event loop"""
+    started_at: datetime
+    duration_ms: float = 0.0
+    stacks: Counter = field(default_factory=Counter)
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def hot_frames(self, limit: Optional[int] = 5) -> List[Tuple[Frame, int]]:
+        frames = Counter()
+        for stack, count in self.stacks.items():
+            frames[_hot_frame(stack)] += count
+        return frames.most_common(limit)
+
+    def to_dict(self) -> Dict:
+        top_stack = self.stacks.most_common(1)
+        return {
+            'started_at': self.started_at.isoformat(timespec='milliseconds'),
+            'duration_ms': round(self.duration_ms, 1),
+            'samples': self.samples,
+            'hot_frames': [{'frame': format_frame(frame), 'samples': count}
+                           for frame, count in self.hot_frames()],
+            'top_stack': [format_frame(frame) for frame in top_stack[0][0]] if top_stack else [],
+        }
+
+
+class StallWatchdog(QObject):
+    """Detects GUI event-loop stalls and samples the main thread during them
+
+    Must be created on the GUI thread.
+    """
+
+    def __init__(self, threshold_ms: int = DEFAULT_THRESHOLD_MS,
+                 sample_interval_ms: int = SAMPLE_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.sample_interval = sample_interval_ms / 1000
+        self._main_thread_id = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.stalls: Deque[Stall] = deque(maxlen=MAX_STALLS)
+        self.stall_count = 0
+        self.total_stall_ms = 0.0
+        self.hot_frames: Counter = Counter()
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._beat)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._beat()
+        self._heartbeat.start()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._watch, name="OnTimeStallWatchdog", daemon=True)
+        self._thread.start()
+        logger.info("Stall watchdog started (threshold %d ms)", self.threshold * 1000)
+
+    def stop(self):
+        self._heartbeat.stop()
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self.stall_count:
+            logger.info("Stall watchdog stopped: %d stalls, %.0f ms stalled in total",
+                        self.stall_count, self.total_stall_ms)
+
+    def _beat(self):
+        # A float assignment is atomic under the GIL; the watchdog thread only reads it
+        self._last_beat = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Watchdog thread
+
+    def _watch(self):
+        stall: Optional[Stall] = None
+        stall_beat = 0.0
+        while not self._stop_event.wait(self.sample_interval):
+            last_beat = self._last_beat
+            behind = time.monotonic() - last_beat
+            if stall is None:
+                if behind > self.threshold:
+                    stall = Stall(started_at=datetime.now().astimezone() - timedelta(seconds=behind))
+                    stall_beat = last_beat
+                    self._sample(stall)
+            elif last_beat != stall_beat:
+                # The heartbeat ran again: the stall lasted about the gap between the beats
+                stall.duration_ms = (last_beat - stall_beat) * 1000
+                self._finish(stall)
+                stall = None
+            else:
+                self._sample(stall)
+
+    def _sample(self, stall: Stall):
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        stack: List[Frame] = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            stack.append((code.co_filename, frame.f_lineno, code.co_name))
+            frame = frame.f_back
+        stall.stacks[tuple(reversed(stack))] += 1
+
+    def _finish(self, stall: Stall):
+        with self._lock:
+            self.stalls.append(stall)
+            self.stall_count += 1
+            self.total_stall_ms += stall.duration_ms
+            for frame, count in stall.hot_frames(limit=None):
+                self.hot_frames[frame] += count
+
+        details = stall.to_dict()
+        lines = [f"    {item['samples']:>4}  {item['frame']}" for item in details['hot_frames']]
+        logger.warning(
+            "GUI event loop stalled for %.0f ms (%d samples); hot frames:\n%s\n  stack:\n%s",
+            stall.duration_ms, stall.samples, "\n".join(lines) or "    (none)",
+            "\n".join(f"    {frame}" for frame in details['top_stack']) or "    (none)"
+        )
+
+    # ------------------------------------------------------------------
+    # Reporting
+
+    def report(self) -> Dict:
+        """Stalls and hot frames collected so far, JSON-serializable"""
+        with self._lock:
+            stalls = [stall.to_dict() for stall in self.stalls]
+            hot_frames = self.hot_frames.most_common(20)
+            total_samples = sum(self.hot_frames.values())
+            stall_count, total_ms = self.stall_count, self.total_stall_ms
+        return {
+            'threshold_ms': round(self.threshold * 1000),
+            'stall_count': stall_count,
+            'total_stall_ms': round(total_ms, 1),
+            'longest_stall_ms': max((s['duration_ms'] for s in stalls), default=0.0),
+            'hot_frames': [{'frame': format_frame(frame), 'samples': count,
+                            'share': round(count / total_samples, 3)}
+                           for frame, count in hot_frames],
+            'stalls': stalls,
+        }
+
+    def format_report(self) -> str:
+        """Plain text version of report() for the report view"""
+        report = self.report()
+        lines = [
+            f"Stalls over {report['threshold_ms']} ms: {report['stall_count']}",
+            f"Total stalled: {report['total_stall_ms']:.0f} ms, "
+            f"longest: {report['longest_stall_ms']:.0f} ms",
+            "",
+            "Hot frames:",
+        ]
+        lines += [f"  {item['share']:6.1%}  {item['frame']}" for item in report['hot_frames']] or ["  (none)"]
+        lines += ["", "Recent stalls:"]
+        for stall in reversed(report['stalls']):
+            hottest = stall['hot_frames'][0]['frame'] if stall['hot_frames'] else "(no samples)"
+            lines.append(f"  {stall['started_at']}  {stall['duration_ms']:7.0f} ms  {hottest}")
+        if not report['stalls']:
+            lines.append("  (none)")
+        return "\n".join(lines)
+
+    def save_report(self, file_path: Union[str, Path]) -> Path:
+        file_path = Path(file_path)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        return file_path
+
+
+_watchdog: Optional[StallWatchdog] = None
+
+
+def start_stall_watchdog(threshold_ms: int = DEFAULT_THRESHOLD_MS) -> StallWatchdog:
+    """Create and start the process-wide watchdog (call on the GUI thread)"""
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = StallWatchdog(threshold_ms)
+    _watchdog.start()
+    return _watchdog
+
+
+def get_stall_watchdog() -> Optional[StallWatchdog]:
+    """Get the process-wide watchdog, or None if it was never started"""
+    return _watchdog
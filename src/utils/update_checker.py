@@ -4,25 +4,16 @@ Thread-safe implementation that checks for updates against a GitHub repository.
 """
 import os
 import sys
-import json
 import time
 import platform
 import tempfile
 import subprocess
 from pathlib import Path
-import urllib.request
-import urllib.error
-import ssl
-
-from src import __version__ as CURRENT_VERSION
 
+import requests
 
- # Use certifi bundle to ensure up-to-date CAs on macOS and packaged Python
-try:
-    import certifi
-    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
-except ImportError:
-    SSL_CONTEXT = ssl.create_default_context()
+from src import __version__ as CURRENT_VERSION
+from src.utils.http_client import get_http_client
 from typing import Dict, Optional, Tuple, Any
 from datetime import datetime
 from PyQt6.QtWidgets import (
@@ -56,30 +47,22 @@ class UpdateChecker(QObject):
         cache_buster = f"?t={int(time.time())}"
         url = UPDATE_CHECK_URL + cache_buster
         
-        for attempt in range(3):
-            try:
-                with urllib.request.urlopen(url, timeout=15, context=SSL_CONTEXT) as response:
-                    content = response.read().decode('utf-8')
-                    version_info = json.loads(content)
-
-                    if self._is_newer_version(version_info.get('version', '0.0.0')):
-                        self.update_available.emit(version_info)
-                    else:
-                        self.no_update_available.emit()
-                    return
-            except urllib.error.URLError as e:
-                if attempt == 2:
-                    if isinstance(e.reason, ssl.SSLError):
-                        self.error_occurred.emit("SSL handshake failed. Check your network or certificate settings.")
-                    else:
-                        self.error_occurred.emit(str(e))
-                else:
-                    time.sleep(2 ** attempt)
-            except Exception as e:
-                if attempt == 2:
-                    self.error_occurred.emit(str(e))
-                else:
-                    time.sleep(2 ** attempt)
+        # Connection errors and server errors are retried with backoff by the HTTP client
+        try:
+            response = get_http_client().get(url, timeout=15)
+            response.raise_for_status()
+            version_info = response.json()
+        except requests.exceptions.SSLError:
+            self.error_occurred.emit("SSL handshake failed. Check your network or certificate settings.")
+            return
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+            return
+
+        if self._is_newer_version(version_info.get('version', '0.0.0')):
+            self.update_available.emit(version_info)
+        else:
+            self.no_update_available.emit()
     
     def _is_newer_version(self, remote_version: str) -> bool:
         """Compare version strings to determine if remote is newer"""
@@ -361,31 +344,14 @@ class DownloadWorker(QObject):
     def start_download(self):
         """Start downloading the file"""
         try:
-            # Create a request with timeout and user-agent header
-            request = urllib.request.Request(self.url, headers={'User-Agent': 'Mozilla/5.0'})
-
-            # Open the URL
-            with urllib.request.urlopen(request, timeout=30, context=SSL_CONTEXT) as response:
-                # Get file size
-                file_size = int(response.info().get('Content-Length', 0))
-
-                # Download the file in chunks
-                downloaded_size = 0
-                chunk_size = 8192
-
-                with open(self.destination, 'wb') as f:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-
-                        f.write(chunk)
-                        downloaded_size += len(chunk)
-
-                        # Update progress
-                        if file_size > 0:
-                            progress = int((downloaded_size / file_size) * 100)
-                            self.progress_updated.emit(progress)
+            def report_progress(downloaded_size, file_size):
+                if file_size > 0:
+                    self.progress_updated.emit(int((downloaded_size / file_size) * 100))
+
+            # Stream the file to disk through the shared HTTP client (requests
+            # verifies TLS against its bundled certifi CA store)
+            get_http_client().download_to(self.url, self.destination, timeout=30,
+                                          progress=report_progress)
 
             # After download, verify SHA256 if expected
             if self.sha256_expected:
@@ -0,0 +1,168 @@
+"""
+Hidden diagnostics dialog showing the timer hot path profile and the
+event-loop stall report.
+"""
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QTabWidget,
+    QPlainTextEdit
+)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFontDatabase
+
+from src.utils.profiling import get_tracer
+from src.utils.stall_watchdog import get_stall_watchdog
+
+
+class DiagnosticsDialog(QDialog):
+    """Live view of the tracer statistics and stall report (opened with Ctrl+Shift+F12)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tracer = get_tracer()
+        self.watchdog = get_stall_watchdog()
+        self.setWindowTitle(self.tr("Diagnostics"))
+        self.resize(720, 420)
+
+        layout = QVBoxLayout(self)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self._create_timer_tab(), self.tr("Timer"))
+        self.tabs.addTab(self._create_stalls_tab(), self.tr("Stalls"))
+        layout.addWidget(self.tabs)
+
+        close_layout = QHBoxLayout()
+        close_layout.addStretch()
+        close_button = QPushButton(self.tr("Close"))
+        close_button.clicked.connect(self.accept)
+        close_layout.addWidget(close_button)
+        layout.addLayout(close_layout)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self._refresh)
+        self._refresh()
+        if self.tracer.enabled or self.watchdog is not None:
+            self._refresh_timer.start()
+
+    def _create_timer_tab(self) -> QWidget:
+        """Hot path profile collected by the tracer"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+
+        columns = [self.tr("Handler"), self.tr("Calls"), self.tr("Mean (ms)"), self.tr("p50 (ms)"),
+                   self.tr("p95 (ms)"), self.tr("p99 (ms)"), self.tr("Max (ms)")]
+        self.table = QTableWidget(0, len(columns))
+        self.table.setHorizontalHeaderLabels(columns)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        self.reset_button = QPushButton(self.tr("Reset"))
+        self.reset_button.clicked.connect(self._reset)
+        self.save_json_button = QPushButton(self.tr("Save JSON..."))
+        self.save_json_button.clicked.connect(lambda: self._save("json"))
+        self.save_trace_button = QPushButton(self.tr("Save Chrome Trace..."))
+        self.save_trace_button.clicked.connect(lambda: self._save("chrome"))
+        for button in (self.reset_button, self.save_json_button, self.save_trace_button):
+            button.setEnabled(self.tracer.enabled)
+            button_layout.addWidget(button)
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        return page
+
+    def _create_stalls_tab(self) -> QWidget:
+        """Stalls of the GUI event loop and the code that was running during them"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+
+        self.stall_report = QPlainTextEdit()
+        self.stall_report.setReadOnly(True)
+        self.stall_report.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.stall_report.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        layout.addWidget(self.stall_report)
+
+        button_layout = QHBoxLayout()
+        self.save_stalls_button = QPushButton(self.tr("Save Report..."))
+        self.save_stalls_button.clicked.connect(self._save_stall_report)
+        self.save_stalls_button.setEnabled(self.watchdog is not None)
+        button_layout.addWidget(self.save_stalls_button)
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        return page
+
+    def _refresh(self):
+        """Reload the statistics from the tracer and the watchdog"""
+        self._refresh_stalls()
+        if not self.tracer.enabled:
+            self.status_label.setText(self.tr(
+                "Tracing is disabled. Start OnTime with --trace to profile the timer."
+            ))
+            return
+
+        summary = self.tracer.summary()
+        paint = summary['tick_to_paint']
+        lag = summary['event_loop_lag']
+        self.status_label.setText(self.tr(
+            "Ticks: {ticks}   Late: {late}   Dropped: {dropped}\n"
+            "Tick to paint: p50 {paint50:.2f} ms, p95 {paint95:.2f} ms\n"
+            "Event loop lag: p50 {lag50:.2f} ms, p95 {lag95:.2f} ms, max {lagmax:.2f} ms"
+        ).format(
+            ticks=summary['ticks'], late=summary['late_ticks'], dropped=summary['dropped_ticks'],
+            paint50=paint['p50_us'] / 1000, paint95=paint['p95_us'] / 1000,
+            lag50=lag['p50_us'] / 1000, lag95=lag['p95_us'] / 1000, lagmax=lag['max_us'] / 1000,
+        ))
+
+        handlers = summary['handlers']
+        self.table.setRowCount(len(handlers))
+        for row, (name, stats) in enumerate(handlers.items()):
+            values = (
+                name, str(stats['count']),
+                *(f"{stats[key] / 1000:.3f}" for key in ('mean_us', 'p50_us', 'p95_us', 'p99_us', 'max_us'))
+            )
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def _refresh_stalls(self):
+        if self.watchdog is None:
+            text = self.tr("The stall watchdog is not running (started with --stall-threshold 0).")
+        else:
+            text = self.watchdog.format_report()
+        if text != self.stall_report.toPlainText():
+            self.stall_report.setPlainText(text)
+
+    def _reset(self):
+        self.tracer.reset()
+        self._refresh()
+
+    def _save(self, trace_format: str):
+        """Ask for a file and write the summary or the Chrome trace to it"""
+        default_name = "ontime-trace.json" if trace_format == "chrome" else "ontime-profile.json"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, self.tr("Save Diagnostics"), default_name, self.tr("JSON Files (*.json)")
+        )
+        if file_path:
+            self.tracer.dump(file_path, trace_format)
+
+    def _save_stall_report(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, self.tr("Save Stall Report"), "ontime-stalls.json", self.tr("JSON Files (*.json)")
+        )
+        if file_path:
+            self.watchdog.save_report(file_path)
+
+    def closeEvent(self, event):
+        self._refresh_timer.stop()
+        super().closeEvent(event)
+
+    def done(self, result):
+        self._refresh_timer.stop()
+        super().done(result)
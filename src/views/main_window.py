@@ -795,6 +795,12 @@ class MainWindow(QMainWindow):
         open_meeting_action.triggered.connect(self._open_meeting)
         file_menu.addAction(open_meeting_action)
         
+        # Export meeting history as JSON files
+        export_meetings_action = QAction(self.tr("Ex&port Meetings..."), self)
+        export_meetings_action.triggered.connect(self._export_meetings)
+        export_meetings_action.setEnabled(self.meeting_controller.meeting_store is not None)
+        file_menu.addAction(export_meetings_action)
+        
         # Edit current meeting
         edit_meeting_action = QAction(get_icon("edit"), self.tr("&Edit Current Meeting"), self)
         edit_meeting_action.setShortcut("Ctrl+E")
@@ -920,6 +926,12 @@ class MainWindow(QMainWindow):
         check_updates_action = QAction(self.tr("&Check for Updates"), self)
         check_updates_action.triggered.connect(lambda: self._check_for_updates(False))
         help_menu.addAction(check_updates_action)
+
+        # Hidden diagnostics dialog (not in any menu)
+        diagnostics_action = QAction(self.tr("Diagnostics"), self)
+        diagnostics_action.setShortcut("Ctrl+Shift+F12")
+        diagnostics_action.triggered.connect(self._show_diagnostics_dialog)
+        self.addAction(diagnostics_action)
     
     def _create_tool_bar(self):
         """Create the main toolbar"""
@@ -1984,6 +1996,23 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QTimer.singleShot(0, lambda: QMessageBox.critical(self, self.tr("Error"), self.tr(f"Failed to load meeting: {str(e)}")))
 
+    def _export_meetings(self):
+        """Export the meeting database as JSON files into a chosen folder"""
+        from PyQt6.QtWidgets import QFileDialog
+
+        output_dir = QFileDialog.getExistingDirectory(self, self.tr("Export Meetings"))
+        if not output_dir:
+            return
+
+        try:
+            count = self.meeting_controller.export_meetings_to_json(output_dir)
+            QMessageBox.information(
+                self, self.tr("Export Meetings"),
+                self.tr("Exported {0} meetings.").format(count)
+            )
+        except OSError as e:
+            QMessageBox.critical(self, self.tr("Error"), self.tr("Failed to export meetings: {0}").format(str(e)))
+
     def _update_meetings(self):
         """Update meetings from web with enhanced weekend meeting handling"""
         # Check meeting source mode
@@ -2430,6 +2459,11 @@ class MainWindow(QMainWindow):
             "© 2025 Open Source")
         )
     
+    def _show_diagnostics_dialog(self):
+        """Show the timer profiling statistics"""
+        from src.views.diagnostics_dialog import DiagnosticsDialog
+        DiagnosticsDialog(self).exec()
+
     def _show_error(self, message):
         """Show error message (thread-safe)"""
         QTimer.singleShot(0, lambda: QMessageBox.critical(self, self.tr("Error"), message))
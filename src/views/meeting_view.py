@@ -2,13 +2,16 @@
 Meeting view component for displaying and managing meeting parts.
 """
 from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Set, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QTreeWidget, QTreeWidgetItem, QHeaderView,
+    QScrollArea, QFrame, QTreeView, QHeaderView,
     QSizePolicy, QSpacerItem, QMenu, QDialog, QFormLayout, QLineEdit,
     QSpinBox, QDialogButtonBox, QMessageBox, QTimeEdit
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QSize, QTime
+from PyQt6.QtCore import (
+    Qt, pyqtSlot, QSize, QTime, QAbstractItemModel, QModelIndex, QCoreApplication
+)
 from PyQt6.QtGui import QAction, QColor, QBrush, QIcon, QFont
 
 from src.controllers.meeting_controller import MeetingController
@@ -70,12 +73,17 @@ class EndMeetingAtDialog(QDialog):
     def __init__(self, predicted_end_time: datetime,
                  remaining_parts_count: int,
                  remaining_duration_minutes: int,
-                 parent=None):
+                 parent=None,
+                 preview: Optional[Callable[[datetime], dict]] = None,
+                 part_titles: Optional[List[str]] = None):
         super().__init__(parent)
         self.setWindowTitle(self.tr("End Meeting At"))
         self.setMinimumWidth(320)
         self._remaining_parts_count = remaining_parts_count
         self._remaining_duration_minutes = remaining_duration_minutes
+        # Dry-run redistribution (target -> result dict) for the live preview
+        self._preview = preview
+        self._part_titles = part_titles or []
         self._setup_ui(predicted_end_time)
 
     def _setup_ui(self, predicted_end_time: datetime):
@@ -110,6 +118,12 @@ class EndMeetingAtDialog(QDialog):
         self.calc_label.setStyleSheet("font-size: 9pt;")
         layout.addRow(self.calc_label)
 
+        # Live preview of the new part durations
+        self.preview_label = QLabel()
+        self.preview_label.setStyleSheet("color: #666; font-size: 9pt;")
+        self.preview_label.setVisible(self._preview is not None)
+        layout.addRow(self.preview_label)
+
         self._update_calculation(self.time_edit.time())
 
         # Buttons
@@ -128,11 +142,20 @@ class EndMeetingAtDialog(QDialog):
         if target <= now:
             self.calc_label.setText(self.tr("Target time must be in the future"))
             self.calc_label.setStyleSheet("color: #f44336; font-size: 9pt;")
+            self.preview_label.clear()
             return
 
         diff_minutes = int((target - now).total_seconds() / 60)
 
-        if diff_minutes < self._remaining_parts_count:
+        if self._preview is not None:
+            result = self._preview(target)
+            if not result.get('success'):
+                self.calc_label.setText(result.get('error', self.tr("Unknown error")))
+                self.calc_label.setStyleSheet("color: #f44336; font-size: 9pt;")
+                self.preview_label.clear()
+                return
+            self._show_preview(result)
+        elif diff_minutes < self._remaining_parts_count:
             self.calc_label.setText(
                 self.tr("Not enough time")
                 + f" ({diff_minutes} min "
@@ -140,21 +163,36 @@ class EndMeetingAtDialog(QDialog):
                 + self.tr("parts") + ")"
             )
             self.calc_label.setStyleSheet("color: #f44336; font-size: 9pt;")
+            return
+
+        change = diff_minutes - self._remaining_duration_minutes
+        if change < 0:
+            self.calc_label.setText(
+                self.tr("Saving") + f" {abs(change)} min " + self.tr("from remaining parts")
+            )
+            self.calc_label.setStyleSheet("color: #4caf50; font-size: 9pt;")
+        elif change > 0:
+            self.calc_label.setText(
+                self.tr("Adding") + f" {change} min " + self.tr("to remaining parts")
+            )
+            self.calc_label.setStyleSheet("color: #ff9800; font-size: 9pt;")
         else:
-            change = diff_minutes - self._remaining_duration_minutes
-            if change < 0:
-                self.calc_label.setText(
-                    self.tr("Saving") + f" {abs(change)} min " + self.tr("from remaining parts")
-                )
-                self.calc_label.setStyleSheet("color: #4caf50; font-size: 9pt;")
-            elif change > 0:
-                self.calc_label.setText(
-                    self.tr("Adding") + f" {change} min " + self.tr("to remaining parts")
-                )
-                self.calc_label.setStyleSheet("color: #ff9800; font-size: 9pt;")
-            else:
-                self.calc_label.setText(self.tr("No change needed"))
-                self.calc_label.setStyleSheet("color: #666; font-size: 9pt;")
+            self.calc_label.setText(self.tr("No change needed"))
+            self.calc_label.setStyleSheet("color: #666; font-size: 9pt;")
+
+    def _show_preview(self, result: dict, max_lines: int = 6):
+        """Show the changed parts and the planned end time from a dry run"""
+        changed = [(idx, old, new) for idx, old, new in result['adjusted_parts'] if old != new]
+        lines = []
+        for idx, old, new in changed[:max_lines]:
+            title = self._part_titles[idx] if idx < len(self._part_titles) else ""
+            lines.append(f"{title}: {old} \u2192 {new} min")
+        if len(changed) > max_lines:
+            lines.append(self.tr("and %n more", "", len(changed) - max_lines))
+        end_time = result.get('end_time')
+        if end_time is not None:
+            lines.append(self.tr("Meeting ends at ") + end_time.strftime("%I:%M %p"))
+        self.preview_label.setText("\n".join(lines))
 
     def _validate_and_accept(self):
         target = self.get_target_datetime()
@@ -172,6 +210,317 @@ class EndMeetingAtDialog(QDialog):
         return now.replace(hour=qtime.hour(), minute=qtime.minute(), second=0, microsecond=0)
 
 
+
+def _tr(text: str) -> str:
+    """Translate using the MeetingView context so existing translations apply"""
+    return QCoreApplication.translate("MeetingView", text)
+
+
+# Brushes and fonts used by the parts model
+SECTION_BACKGROUND = QBrush(QColor(240, 240, 240))
+CURRENT_BACKGROUND = QBrush(QColor(255, 240, 200))  # Light yellow
+SONG_FOREGROUND = QBrush(QColor(74, 144, 226))  # Blue color for songs
+ADJUSTED_FOREGROUND = QBrush(QColor(255, 152, 0))  # Orange
+COMPLETED_FOREGROUND = QBrush(QColor(0, 128, 0))  # Green
+CURRENT_FOREGROUND = QBrush(QColor(0, 0, 255))  # Blue
+BEHIND_FOREGROUND = QBrush(QColor(244, 67, 54))  # Red
+
+
+class MeetingPartsModel(QAbstractItemModel):
+    """Two-level item model (sections -> parts) of a meeting, keyed by global part index.
+
+    Highlighting, completion and duration changes only emit dataChanged for
+    the affected rows instead of rebuilding the tree.
+    """
+
+    COLUMN_COUNT = 3
+    TITLE_COLUMN, DURATION_COLUMN, STATUS_COLUMN = range(COLUMN_COUNT)
+
+    # Item data roles (same layout the QTreeWidget items used)
+    ITEM_ROLE = Qt.ItemDataRole.UserRole  # ("section", section_index) or ("part", global_index)
+    SECTION_INDEX_ROLE = Qt.ItemDataRole.UserRole + 1
+    PART_INDEX_ROLE = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._meeting: Optional[Meeting] = None
+        self._part_locations: List[Tuple[int, int]] = []  # global index -> (section, part)
+        self._parts: List[MeetingPart] = []  # global index -> part, as last indexed
+        self._section_offsets: List[int] = []  # section index -> first global index
+        self._row_keys: List[tuple] = []  # global index -> displayed values, for diffing
+        self._current_index = -1
+        self._completed: Set[int] = set()
+        self._section_slack: List[Optional[int]] = []  # seconds ahead of plan per section
+
+    # --- Meeting updates ---
+
+    def set_meeting(self, meeting: Optional[Meeting]):
+        """Show a meeting; re-setting the same meeting only updates rows that changed"""
+        if meeting is not None and meeting is self._meeting and self._same_shape():
+            changed = [i for i, key in enumerate(self._row_keys) if key != self._row_key(i)]
+            self.parts_changed(changed)
+            return
+
+        self.beginResetModel()
+        same_meeting = meeting is self._meeting
+        old_parts = self._parts
+        old_section_count = len(self._section_offsets)
+        self._meeting = meeting
+        self._rebuild_index()
+        if same_meeting:
+            # Parts were added, removed or moved: follow them to their new global index
+            self._remap_indices(old_parts)
+            if len(self._section_offsets) != old_section_count:
+                self._section_slack = []
+        else:
+            self._current_index = -1
+            self._completed = set()
+            self._section_slack = []
+        self.endResetModel()
+
+    def _remap_indices(self, old_parts: List[MeetingPart]):
+        """Move the current and completed markers from the old global indices to the new ones"""
+        new_indices = {id(part): index for index, part in enumerate(self._parts)}
+
+        def remap(index: int) -> int:
+            if 0 <= index < len(old_parts):
+                return new_indices.get(id(old_parts[index]), -1)
+            return -1
+
+        self._current_index = remap(self._current_index)
+        self._completed = {new for new in map(remap, self._completed) if new >= 0}
+
+    def _same_shape(self) -> bool:
+        """Check whether the meeting still has the sections and part counts we indexed"""
+        sections = self._meeting.sections
+        if len(sections) != len(self._section_offsets):
+            return False
+        total = 0
+        for section_index, section in enumerate(sections):
+            if self._section_offsets[section_index] != total:
+                return False
+            total += len(section.parts)
+        return total == len(self._part_locations)
+
+    def _rebuild_index(self):
+        """Rebuild the global index <-> (section, part) maps"""
+        self._part_locations = []
+        self._parts = []
+        self._section_offsets = []
+        if self._meeting:
+            for section_index, section in enumerate(self._meeting.sections):
+                self._section_offsets.append(len(self._part_locations))
+                for part_index, part in enumerate(section.parts):
+                    self._part_locations.append((section_index, part_index))
+                    self._parts.append(part)
+        self._row_keys = [self._row_key(i) for i in range(len(self._part_locations))]
+
+    def _row_key(self, global_index: int) -> tuple:
+        """Values shown for a part, used to detect changed rows"""
+        part = self.part(global_index)
+        return (part.title, part.duration_minutes, part.original_duration_minutes, part.is_completed)
+
+    def parts_changed(self, global_indices: Iterable[int]):
+        """Repaint the given parts and the duration of their sections"""
+        sections = set()
+        for global_index in global_indices:
+            if not 0 <= global_index < len(self._part_locations):
+                continue
+            self._row_keys[global_index] = self._row_key(global_index)
+            self._emit_row_changed(self.part_index(global_index))
+            sections.add(self._part_locations[global_index][0])
+
+        for section_index in sections:
+            duration = self.index(section_index, self.DURATION_COLUMN)
+            self.dataChanged.emit(duration, duration)
+
+    def set_current_part(self, global_index: int):
+        """Move the current-part highlight"""
+        previous = self._current_index
+        self._current_index = global_index
+        for index in {previous, global_index}:
+            if 0 <= index < len(self._part_locations):
+                self._emit_row_changed(self.part_index(index))
+
+    def set_part_completed(self, global_index: int):
+        """Mark a part as completed"""
+        if 0 <= global_index < len(self._part_locations):
+            self._completed.add(global_index)
+            self._emit_row_changed(self.part_index(global_index))
+
+    def set_section_slack(self, section_slack: List[Optional[int]]):
+        """Show how far each section is ahead of (or behind) plan"""
+        previous = self._section_slack
+        self._section_slack = list(section_slack)
+        for section_index in range(len(self._section_offsets)):
+            old = previous[section_index] if section_index < len(previous) else None
+            new = self._section_slack[section_index] if section_index < len(self._section_slack) else None
+            if self._slack_text(old) != self._slack_text(new):
+                status = self.index(section_index, self.STATUS_COLUMN)
+                self.dataChanged.emit(status, status)
+
+    @staticmethod
+    def _slack_text(slack: Optional[int]) -> str:
+        """Whole minutes ahead (+) or behind (-) plan"""
+        if slack is None:
+            return ""
+        minutes = int(slack / 60)
+        if minutes == 0:
+            return _tr("On time")
+        return f"{minutes:+d} min"
+
+    def _section_slack_seconds(self, section_index: int) -> Optional[int]:
+        if section_index < len(self._section_slack):
+            return self._section_slack[section_index]
+        return None
+
+    def _emit_row_changed(self, index: QModelIndex):
+        """Emit dataChanged for all columns of one row"""
+        self.dataChanged.emit(index, index.siblingAtColumn(self.COLUMN_COUNT - 1))
+
+    # --- Lookups ---
+
+    def part(self, global_index: int) -> MeetingPart:
+        """Get a part by global index"""
+        section_index, part_index = self._part_locations[global_index]
+        return self._meeting.sections[section_index].parts[part_index]
+
+    def part_location(self, global_index: int) -> Tuple[int, int]:
+        """Convert a global part index to (section index, part index)"""
+        if 0 <= global_index < len(self._part_locations):
+            return self._part_locations[global_index]
+        return -1, -1
+
+    def global_part_index(self, section_index: int, part_index: int) -> int:
+        """Convert section and part indices to a global part index"""
+        return self._section_offsets[section_index] + part_index
+
+    def part_index(self, global_index: int, column: int = 0) -> QModelIndex:
+        """Model index of a part by global index"""
+        if not 0 <= global_index < len(self._part_locations):
+            return QModelIndex()
+        section_index, part_index = self._part_locations[global_index]
+        return self.createIndex(part_index, column, section_index + 1)
+
+    # --- QAbstractItemModel interface ---
+    # Section rows have internal id 0; part rows store their section index + 1.
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        if parent.internalId() == 0:
+            return self.createIndex(row, column, parent.row() + 1)
+        return QModelIndex()
+
+    def parent(self, child: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not child.isValid() or child.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(child.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not self._meeting or parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(self._meeting.sections)
+        if parent.internalId() == 0:
+            return len(self._meeting.sections[parent.row()].parts)
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self.COLUMN_COUNT
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return (_tr("Title"), _tr("Duration"), _tr("Status"))[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.internalId() == 0:
+            return self._section_data(index.row(), index.column(), role)
+        return self._part_data(index.internalId() - 1, index.row(), index.column(), role)
+
+    def _section_data(self, section_index: int, column: int, role: int):
+        section = self._meeting.sections[section_index]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.TITLE_COLUMN:
+                return section.title
+            if column == self.DURATION_COLUMN:
+                return f"{section.total_duration_minutes} min"
+            if column == self.STATUS_COLUMN:
+                return self._slack_text(self._section_slack_seconds(section_index))
+        elif role == Qt.ItemDataRole.ForegroundRole and column == self.STATUS_COLUMN:
+            slack = self._section_slack_seconds(section_index)
+            if slack is not None and int(slack / 60) != 0:
+                return COMPLETED_FOREGROUND if slack > 0 else BEHIND_FOREGROUND
+        elif role == Qt.ItemDataRole.FontRole and column == self.TITLE_COLUMN:
+            font = QFont()
+            font.setBold(True)
+            return font
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            return SECTION_BACKGROUND
+        elif role == self.ITEM_ROLE and column == self.TITLE_COLUMN:
+            return ("section", section_index)
+        return None
+
+    def _part_data(self, section_index: int, part_index: int, column: int, role: int):
+        part = self._meeting.sections[section_index].parts[part_index]
+        global_index = self._section_offsets[section_index] + part_index
+        adjusted = (part.original_duration_minutes is not None and
+                    part.original_duration_minutes != part.duration_minutes)
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.TITLE_COLUMN:
+                return part.title
+            if column == self.DURATION_COLUMN:
+                if adjusted:
+                    return f"{part.duration_minutes} min (was {part.original_duration_minutes})"
+                return f"{part.duration_minutes} min"
+            if column == self.STATUS_COLUMN:
+                if global_index == self._current_index:
+                    return _tr("Current")
+                if part.is_completed or global_index in self._completed:
+                    return _tr("Completed")
+                return _tr("Pending")
+
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            # Song parts are visually distinct
+            if column == self.TITLE_COLUMN and "song" in part.title.lower():
+                return SONG_FOREGROUND
+            if column == self.DURATION_COLUMN and adjusted:
+                return ADJUSTED_FOREGROUND
+            if column == self.STATUS_COLUMN:
+                if global_index == self._current_index:
+                    return CURRENT_FOREGROUND
+                if part.is_completed or global_index in self._completed:
+                    return COMPLETED_FOREGROUND
+
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if global_index == self._current_index:
+                return CURRENT_BACKGROUND
+
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == self.DURATION_COLUMN and adjusted:
+                diff = part.duration_minutes - part.original_duration_minutes
+                direction = _tr("added") if diff > 0 else _tr("removed")
+                return (_tr("Adjusted:") + f" {abs(diff)} min {direction} "
+                        + _tr("(original:") + f" {part.original_duration_minutes} min)")
+
+        elif column == self.TITLE_COLUMN:
+            if role == self.ITEM_ROLE:
+                return ("part", global_index)
+            if role == self.SECTION_INDEX_ROLE:
+                return section_index
+            if role == self.PART_INDEX_ROLE:
+                return part_index
+
+        return None
+
+
 class MeetingView(QWidget):
     """Widget for displaying and managing meeting parts"""
     
@@ -207,15 +556,21 @@ class MeetingView(QWidget):
         layout.addLayout(header_layout)
         
         # Parts tree
-        self.parts_tree = QTreeWidget()
-        self.parts_tree.setHeaderLabels([self.tr("Title"), self.tr("Duration"), self.tr("Status")])
+        self.parts_model = MeetingPartsModel(self)
+        self.parts_tree = QTreeView()
+        self.parts_tree.setModel(self.parts_model)
         self.parts_tree.setColumnWidth(0, 400)  # Set width for title column
         self.parts_tree.setColumnWidth(1, 100)  # Set width for duration column
         self.parts_tree.setAlternatingRowColors(True)
         self.parts_tree.setIndentation(20)
+        self.parts_tree.setUniformRowHeights(True)
+        self.parts_tree.setEditTriggers(QTreeView.EditTrigger.NoEditTriggers)
+        
+        # Sections are always shown expanded
+        self.parts_model.modelReset.connect(self.parts_tree.expandAll)
         
         # Connect double-click to jump to part
-        self.parts_tree.itemDoubleClicked.connect(self._part_double_clicked)
+        self.parts_tree.doubleClicked.connect(self._part_double_clicked)
         
         # Enable context menu
         self.parts_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -234,117 +589,44 @@ class MeetingView(QWidget):
         """Connect controller signals"""
         self.timer_controller.part_changed.connect(self._part_changed)
         self.timer_controller.part_completed.connect(self._part_completed)
+        self.timer_controller.durations_redistributed.connect(self._apply_duration_adjustment_visuals)
+        self.timer_controller.durations_reset.connect(self._refresh_parts)
+        self.timer_controller.section_slack_updated.connect(self.parts_model.set_section_slack)
+        self.meeting_controller.part_updated.connect(self._on_part_updated)
     
     def set_meeting(self, meeting: Meeting):
         """Set the current meeting to display"""
         self.meeting = meeting
-        # Clear the tree first
-        self.parts_tree.clear()
         self._update_display()
     
     def _update_display(self):
         """Update the display with current meeting data"""
         if not self.meeting:
             self.title_label.setText(self.tr("No Meeting Selected"))
-            self.parts_tree.clear()
+            self.parts_model.set_meeting(None)
             return
         
         # Update title
         date_str = self.meeting.date.strftime("%Y-%m-%d")
         self.title_label.setText(self.tr(f"{self.meeting.title} ({date_str})"))
         
-        # Clear existing items
-        self.parts_tree.clear()
-        
-        # Add sections and parts
-        for section_index, section in enumerate(self.meeting.sections):
-            # Create section item
-            section_item = QTreeWidgetItem(self.parts_tree)
-            section_item.setText(0, section.title)
-            section_item.setText(1, f"{section.total_duration_minutes} min")
-            section_item.setData(0, Qt.ItemDataRole.UserRole, ("section", section_index))
-            
-            # Set bold font for section
-            font = section_item.font(0)
-            font.setBold(True)
-            section_item.setFont(0, font)
-            
-            # Set background color
-            section_item.setBackground(0, QBrush(QColor(240, 240, 240)))
-            section_item.setBackground(1, QBrush(QColor(240, 240, 240)))
-            section_item.setBackground(2, QBrush(QColor(240, 240, 240)))
-            
-            # Add parts as children
-            for part_index, part in enumerate(section.parts):
-                part_item = QTreeWidgetItem(section_item)
-                # check if songs are part of the meeting
-                is_song_part = "song" in part.title.lower()
-                part_item.setText(0, part.title)
-                # Show adjusted duration with visual feedback
-                if (part.original_duration_minutes is not None and
-                        part.original_duration_minutes != part.duration_minutes):
-                    part_item.setText(1, f"{part.duration_minutes} min (was {part.original_duration_minutes})")
-                    part_item.setForeground(1, QBrush(QColor(255, 152, 0)))  # Orange
-                    diff = part.duration_minutes - part.original_duration_minutes
-                    direction = self.tr("added") if diff > 0 else self.tr("removed")
-                    part_item.setToolTip(1,
-                        self.tr("Adjusted:") + f" {abs(diff)} min {direction} "
-                        + self.tr("(original:") + f" {part.original_duration_minutes} min)")
-                else:
-                    part_item.setText(1, f"{part.duration_minutes} min")
-
-                # If it's a song part, make it visually distinct
-                if is_song_part:
-                    part_item.setForeground(0, QBrush(QColor(74, 144, 226)))  # Blue color for songs
-                
-                # Store additional data for context menu
-                global_part_index = self._get_global_part_index(section_index, part_index)
-                part_item.setData(0, Qt.ItemDataRole.UserRole, ("part", global_part_index))
-                part_item.setData(0, Qt.ItemDataRole.UserRole + 1, section_index)
-                part_item.setData(0, Qt.ItemDataRole.UserRole + 2, part_index)
-                
-                # Set status
-                if part.is_completed:
-                    part_item.setText(2, self.tr("Completed"))
-                    part_item.setForeground(2, QBrush(QColor(0, 128, 0)))  # Green
-                else:
-                    part_item.setText(2, self.tr("Pending"))
-
-        # Expand all sections
-        self.parts_tree.expandAll()
+        # Rebuilds the tree for a new meeting; otherwise only changed rows repaint
+        self.parts_model.set_meeting(self.meeting)
+    
+    def _refresh_parts(self):
+        """Repaint parts whose displayed values changed"""
+        if self.meeting:
+            self.parts_model.set_meeting(self.meeting)
     
     def highlight_part(self, global_part_index: int):
         """Highlight the current part in the tree"""
-        # Iterate through all top-level items (sections)
-        for section_index in range(self.parts_tree.topLevelItemCount()):
-            section_item = self.parts_tree.topLevelItem(section_index)
-            
-            # Iterate through child items (parts)
-            for part_index in range(section_item.childCount()):
-                part_item = section_item.child(part_index)
-                
-                # Get stored global part index
-                item_type, item_index = part_item.data(0, Qt.ItemDataRole.UserRole)
-                
-                if item_type == "part" and item_index == global_part_index:
-                    # Set background color for current part
-                    part_item.setBackground(0, QBrush(QColor(255, 240, 200)))  # Light yellow
-                    part_item.setBackground(1, QBrush(QColor(255, 240, 200)))
-                    part_item.setBackground(2, QBrush(QColor(255, 240, 200)))
-                    
-                    # Set as current item and make visible
-                    self.parts_tree.setCurrentItem(part_item)
-                    self.parts_tree.scrollToItem(part_item)
-                    
-                    # Update status text
-                    part_item.setText(2, self.tr("Current"))
-                    part_item.setForeground(2, QBrush(QColor(0, 0, 255)))  # Blue
-                else:
-                    # Reset background if not the current part
-                    if item_type == "part":
-                        part_item.setBackground(0, QBrush())
-                        part_item.setBackground(1, QBrush())
-                        part_item.setBackground(2, QBrush())
+        self.parts_model.set_current_part(global_part_index)
+        
+        index = self.parts_model.part_index(global_part_index)
+        if index.isValid():
+            # Set as current item and make visible
+            self.parts_tree.setCurrentIndex(index)
+            self.parts_tree.scrollTo(index)
     
     def _part_changed(self, part, global_part_index):
         """Handle part change from timer controller"""
@@ -354,24 +636,18 @@ class MeetingView(QWidget):
     
     def _part_completed(self, global_part_index):
         """Handle part completion"""
-        # Find the part item in the tree
-        for section_index in range(self.parts_tree.topLevelItemCount()):
-            section_item = self.parts_tree.topLevelItem(section_index)
-            
-            for part_index in range(section_item.childCount()):
-                part_item = section_item.child(part_index)
-                
-                item_type, item_index = part_item.data(0, Qt.ItemDataRole.UserRole)
-                
-                if item_type == "part" and item_index == global_part_index:
-                    # Update status
-                    part_item.setText(2, self.tr("Completed"))
-                    part_item.setForeground(2, QBrush(QColor(0, 128, 0)))  # Green
-                    break
+        self.parts_model.set_part_completed(global_part_index)
     
-    def _part_double_clicked(self, item, column):
+    def _on_part_updated(self, part, section_index, part_index):
+        """Repaint a part edited through the meeting controller"""
+        if self.meeting and 0 <= section_index < len(self.meeting.sections):
+            self.parts_model.parts_changed(
+                [self.parts_model.global_part_index(section_index, part_index)]
+            )
+    
+    def _part_double_clicked(self, index):
         """Handle double-click on a part"""
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = index.siblingAtColumn(0).data(MeetingPartsModel.ITEM_ROLE)
         
         if not item_data:
             return
@@ -384,10 +660,11 @@ class MeetingView(QWidget):
     
     def _show_context_menu(self, position):
         """Show context menu for parts"""
-        item = self.parts_tree.itemAt(position)
+        index = self.parts_tree.indexAt(position)
         
-        if item:
-            item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        if index.isValid():
+            index = index.siblingAtColumn(0)
+            item_data = index.data(MeetingPartsModel.ITEM_ROLE)
             
             if item_data:
                 item_type, item_index = item_data
@@ -395,6 +672,9 @@ class MeetingView(QWidget):
                 menu = QMenu()
                 
                 if item_type == "part":
+                    section_index = index.data(MeetingPartsModel.SECTION_INDEX_ROLE)
+                    part_index = index.data(MeetingPartsModel.PART_INDEX_ROLE)
+                    
                     # Part context menu
                     start_action = QAction(self.tr("Start This Part"), self)
                     start_action.triggered.connect(lambda: self.timer_controller.jump_to_part(item_index))
@@ -402,29 +682,27 @@ class MeetingView(QWidget):
                     
                     # Add edit action
                     edit_action = QAction(self.tr("Edit Part"), self)
-                    edit_action.triggered.connect(lambda: self._edit_part(item))
+                    edit_action.triggered.connect(lambda: self._edit_part(section_index, part_index))
                     menu.addAction(edit_action)
                     
                     # Add remove action
                     remove_action = QAction(self.tr("Remove Part"), self)
-                    remove_action.triggered.connect(lambda: self._remove_part(item))
+                    remove_action.triggered.connect(lambda: self._remove_part(section_index, part_index))
                     menu.addAction(remove_action)
                     
                     # Add move actions if appropriate
-                    section_index = item.data(0, Qt.ItemDataRole.UserRole + 1)
-                    part_index = item.data(0, Qt.ItemDataRole.UserRole + 2)
                     section = self.meeting.sections[section_index]
                     
                     # Move up action (if not the first part)
                     if part_index > 0:
                         move_up_action = QAction(self.tr("Move Up"), self)
-                        move_up_action.triggered.connect(lambda: self._move_part_up(item))
+                        move_up_action.triggered.connect(lambda: self._move_part_up(section_index, part_index))
                         menu.addAction(move_up_action)
                     
                     # Move down action (if not the last part)
                     if part_index < len(section.parts) - 1:
                         move_down_action = QAction(self.tr("Move Down"), self)
-                        move_down_action.triggered.connect(lambda: self._move_part_down(item))
+                        move_down_action.triggered.connect(lambda: self._move_part_down(section_index, part_index))
                         menu.addAction(move_down_action)
 
                     # "End Meeting At..." — always visible, greyed out when not applicable
@@ -457,15 +735,11 @@ class MeetingView(QWidget):
                 if menu.actions():
                     menu.exec(self.parts_tree.mapToGlobal(position))
     
-    def _edit_part(self, item):
+    def _edit_part(self, section_index, part_index):
         """Edit the selected part"""
         if not self.meeting:
             return
         
-        # Get section and part indices
-        section_index = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        part_index = item.data(0, Qt.ItemDataRole.UserRole + 2)
-        
         # Get the part to edit
         section = self.meeting.sections[section_index]
         part = section.parts[part_index]
@@ -479,22 +753,14 @@ class MeetingView(QWidget):
             # Update the part in the model
             section.parts[part_index] = updated_part
             
-            # Update the display
-            item.setText(0, updated_part.title)
-            item.setText(1, f"{updated_part.duration_minutes} min")
-            
-            # Update the part using the controller
+            # Update the part using the controller (repaints the row via part_updated)
             self.meeting_controller.update_part(self.meeting, section_index, part_index, updated_part)
     
-    def _remove_part(self, item):
+    def _remove_part(self, section_index, part_index):
         """Remove the selected part"""
         if not self.meeting:
             return
         
-        # Get section and part indices
-        section_index = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        part_index = item.data(0, Qt.ItemDataRole.UserRole + 2)
-        
         # Confirm removal
         from PyQt6.QtWidgets import QMessageBox
         confirm = QMessageBox.question(
@@ -511,15 +777,11 @@ class MeetingView(QWidget):
             # Update the display
             self._update_display()
     
-    def _move_part_up(self, item):
+    def _move_part_up(self, section_index, part_index):
         """Move the selected part up in its section"""
         if not self.meeting:
             return
         
-        # Get section and part indices
-        section_index = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        part_index = item.data(0, Qt.ItemDataRole.UserRole + 2)
-        
         # Check if we can move up
         if part_index <= 0:
             return
@@ -534,21 +796,18 @@ class MeetingView(QWidget):
         # Save the updated meeting
         self.meeting_controller.save_meeting(self.meeting)
         
-        # Update the display
-        self._update_display()
+        # Repaint the two swapped rows
+        global_index = self.parts_model.global_part_index(section_index, part_index)
+        self.parts_model.parts_changed([global_index - 1, global_index])
         
         # Re-select the moved part
         self._select_part(section_index, part_index-1)
     
-    def _move_part_down(self, item):
+    def _move_part_down(self, section_index, part_index):
         """Move the selected part down in its section"""
         if not self.meeting:
             return
         
-        # Get section and part indices
-        section_index = item.data(0, Qt.ItemDataRole.UserRole + 1)
-        part_index = item.data(0, Qt.ItemDataRole.UserRole + 2)
-        
         # Check if we can move down
         section = self.meeting.sections[section_index]
         if part_index >= len(section.parts) - 1:
@@ -561,35 +820,27 @@ class MeetingView(QWidget):
         # Save the updated meeting
         self.meeting_controller.save_meeting(self.meeting)
         
-        # Update the display
-        self._update_display()
+        # Repaint the two swapped rows
+        global_index = self.parts_model.global_part_index(section_index, part_index)
+        self.parts_model.parts_changed([global_index, global_index + 1])
         
         # Re-select the moved part
         self._select_part(section_index, part_index+1)
     
     def _select_part(self, section_index, part_index):
         """Select a part in the tree"""
-        # Get the section item
-        if section_index < self.parts_tree.topLevelItemCount():
-            section_item = self.parts_tree.topLevelItem(section_index)
+        if section_index < len(self.meeting.sections) and part_index < len(self.meeting.sections[section_index].parts):
+            index = self.parts_model.part_index(
+                self.parts_model.global_part_index(section_index, part_index)
+            )
             
-            # Get the part item
-            if part_index < section_item.childCount():
-                part_item = section_item.child(part_index)
-                
-                # Select the part
-                self.parts_tree.setCurrentItem(part_item)
-                self.parts_tree.scrollToItem(part_item)
+            # Select the part
+            self.parts_tree.setCurrentIndex(index)
+            self.parts_tree.scrollTo(index)
     
     def _get_global_part_index(self, section_index, part_index):
         """Convert section and part indices to global part index"""
-        global_index = 0
-
-        for i in range(section_index):
-            global_index += len(self.meeting.sections[i].parts)
-
-        global_index += part_index
-        return global_index
+        return self.parts_model.global_part_index(section_index, part_index)
 
     def _show_end_meeting_at_dialog(self, clicked_part_index: int):
         """Open the End Meeting At dialog and apply redistribution"""
@@ -611,7 +862,11 @@ class MeetingView(QWidget):
         if predicted is None:
             predicted = datetime.now()
 
-        dialog = EndMeetingAtDialog(predicted, remaining_count, remaining_minutes, self)
+        dialog = EndMeetingAtDialog(
+            predicted, remaining_count, remaining_minutes, self,
+            preview=lambda target: self.timer_controller.preview_redistribution(target, clicked_part_index),
+            part_titles=[p.title for p in parts]
+        )
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -626,55 +881,13 @@ class MeetingView(QWidget):
             )
             return
 
-        # Refresh tree display to show adjustments
-        self._update_display()
-
-        # Re-highlight current part
-        if self.timer_controller.current_part_index >= 0:
-            self.highlight_part(self.timer_controller.current_part_index)
-
     def _apply_duration_adjustment_visuals(self, adjusted_parts: list):
-        """Update tree items with visual feedback for adjusted durations.
+        """Repaint the rows whose durations were redistributed.
         adjusted_parts: [(global_idx, old_min, new_min), ...]
         """
-        adjusted_map = {idx: (old, new) for idx, old, new in adjusted_parts}
-
-        for section_index in range(self.parts_tree.topLevelItemCount()):
-            section_item = self.parts_tree.topLevelItem(section_index)
-            for part_index in range(section_item.childCount()):
-                part_item = section_item.child(part_index)
-                item_data = part_item.data(0, Qt.ItemDataRole.UserRole)
-                if not item_data:
-                    continue
-                _, global_idx = item_data
-                if global_idx in adjusted_map:
-                    old_min, new_min = adjusted_map[global_idx]
-                    part_item.setText(1, f"{new_min} min (was {old_min})")
-                    part_item.setForeground(1, QBrush(QColor(255, 152, 0)))
-                    diff = new_min - old_min
-                    direction = self.tr("added") if diff > 0 else self.tr("removed")
-                    part_item.setToolTip(1,
-                        self.tr("Adjusted:") + f" {abs(diff)} min {direction} "
-                        + self.tr("(original:") + f" {old_min} min)")
-
-        self._update_section_totals()
-
-    def _update_section_totals(self):
-        """Recalculate and update section duration text in the tree"""
-        if not self.meeting:
-            return
-
-        for section_index in range(self.parts_tree.topLevelItemCount()):
-            section_item = self.parts_tree.topLevelItem(section_index)
-            if section_index < len(self.meeting.sections):
-                section = self.meeting.sections[section_index]
-                total = section.total_duration_minutes
-                section_item.setText(1, f"{total} min")
+        self.parts_model.parts_changed(idx for idx, _, _ in adjusted_parts)
 
     def _reset_adjusted_durations(self):
         """Reset all adjusted durations back to their originals"""
-        count = self.timer_controller.reset_adjusted_durations()
-        if count > 0:
-            self._update_display()
-            if self.timer_controller.current_part_index >= 0:
-                self.highlight_part(self.timer_controller.current_part_index)
\ No newline at end of file
+        # The tree repaints the reset rows via durations_reset
+        self.timer_controller.reset_adjusted_durations()
@@ -537,6 +537,8 @@ class SettingsDialog(QDialog):
         self.cleanup_enabled_check.setChecked(settings.data_cleanup.enabled)
         self.retention_days_spin.setValue(settings.data_cleanup.retention_days)
         self.retention_days_spin.setEnabled(settings.data_cleanup.enabled)
+        self.cache_budget_spin.setValue(settings.data_cleanup.cache_budget_mb)
+        self.cache_budget_spin.setEnabled(settings.data_cleanup.enabled)
     
     def _apply_settings(self):
         """Apply settings changes"""
@@ -626,6 +628,7 @@ class SettingsDialog(QDialog):
         # Data cleanup settings
         self.settings_controller.set_data_cleanup_enabled(self.cleanup_enabled_check.isChecked())
         self.settings_controller.set_data_cleanup_retention_days(self.retention_days_spin.value())
+        self.settings_controller.set_data_cleanup_cache_budget(self.cache_budget_spin.value())
 
         # Save the updated settings so get_settings() returns latest values
         self.settings_controller.save_settings()
@@ -655,12 +658,22 @@ class SettingsDialog(QDialog):
         )
         cleanup_layout.addRow(self.tr("Retention period:"), self.retention_days_spin)
 
+        self.cache_budget_spin = QSpinBox()
+        self.cache_budget_spin.setRange(20, 10240)
+        self.cache_budget_spin.setSingleStep(50)
+        self.cache_budget_spin.setSuffix(self.tr(" MB"))
+        self.cache_budget_spin.setToolTip(
+            self.tr("Least recently used downloads are removed when the cache grows larger than this")
+        )
+        cleanup_layout.addRow(self.tr("Cache size limit:"), self.cache_budget_spin)
+
         # Toggle spin box enabled state based on checkbox
         self.cleanup_enabled_check.toggled.connect(self.retention_days_spin.setEnabled)
+        self.cleanup_enabled_check.toggled.connect(self.cache_budget_spin.setEnabled)
 
         # Informational label
         info_label = QLabel(self.tr(
-            "Cleanup removes old meeting JSON files, EPUB downloads, "
+            "Cleanup removes old saved meetings, EPUB downloads, "
             "and web scraper cache files. Currently loaded meetings "
             "are never removed."
         ))
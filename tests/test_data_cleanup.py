@@ -0,0 +1,203 @@
+"""
+Tests for the data cleanup of meeting files and the EPUB / web scraper caches.
+"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, time as dt_time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from src.models.meeting import Meeting, MeetingPart, MeetingSection, MeetingType
+from src.models.meeting_store import MeetingStore
+from src.models.session import SessionManager
+from src.utils import data_cleanup
+from src.utils.data_cleanup import CleanupWorker
+
+DAY = 86400
+
+
+class TestCleanupWorker(unittest.TestCase):
+    """Test cases for CleanupWorker"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.meetings_dir = Path(tmp.name) / "meetings"
+        self.cache_dir = Path(tmp.name) / "cache"
+        self.meetings_dir.mkdir()
+        self.cache_dir.mkdir()
+        self.now = time.time()
+
+    def _file(self, directory: Path, name: str, size: int = 10, age_days: float = 0,
+              used_days_ago: float = None) -> Path:
+        path = directory / name
+        path.write_bytes(b"x" * size)
+        modified = self.now - age_days * DAY
+        used = modified if used_days_ago is None else self.now - used_days_ago * DAY
+        os.utime(path, (used, modified))
+        return path
+
+    def _run(self, **kwargs):
+        options = dict(meetings_dir=self.meetings_dir, cache_dir=self.cache_dir, retention_days=90,
+                       active_meeting_files=set())
+        options.update(kwargs)
+        worker = CleanupWorker(**options)
+        results = []
+        worker.finished.connect(results.append, Qt.ConnectionType.DirectConnection)
+        # Interruptions are only seen by a running thread
+        worker.start()
+        self.assertTrue(worker.wait(10000))
+        return worker, results[0]
+
+    def _cache_names(self):
+        return sorted(path.name for path in self.cache_dir.iterdir())
+
+    def test_stale_files_are_removed(self):
+        self._file(self.meetings_dir, "midweek_2026-01-07_en.json", age_days=100)
+        self._file(self.meetings_dir, "midweek_2026-01-14_en.json", age_days=100)
+        self._file(self.meetings_dir, "settings.json", age_days=100)
+        self._file(self.meetings_dir, "weekend_2026-10-18_en.json")
+        self._file(self.cache_dir, "w_202601_en.epub", size=100, age_days=100)
+        self._file(self.cache_dir, "w_202601_en.outline.json", size=20, age_days=100)
+        self._file(self.cache_dir, "0123abcd.html", size=30, age_days=100)
+        self._file(self.cache_dir, "mwb_202609_en.epub.part", size=40, age_days=100)
+        self._file(self.cache_dir, "w_202608_en.epub", size=100)
+        self._file(self.cache_dir, "notes.txt", age_days=100)
+
+        _, result = self._run(active_meeting_files={"midweek_2026-01-14_en.json"})
+
+        self.assertEqual(sorted(path.name for path in self.meetings_dir.iterdir()),
+                         ["midweek_2026-01-14_en.json", "settings.json", "weekend_2026-10-18_en.json"])
+        self.assertEqual(self._cache_names(), ["notes.txt", "w_202608_en.epub"])
+        self.assertEqual((result.meetings_removed, result.epub_files_removed, result.cache_files_removed),
+                         (1, 2, 2))
+        self.assertEqual(result.total_bytes_freed, 10 + 100 + 20 + 30 + 40)
+        self.assertFalse(result.interrupted)
+        self.assertEqual(result.errors, [])
+
+    def test_cache_dir_is_scanned_once(self):
+        for index in range(5):
+            self._file(self.cache_dir, f"page{index}.html", age_days=index * 50)
+        with patch.object(data_cleanup.os, "scandir", wraps=os.scandir) as scandir:
+            self._run()
+        self.assertEqual([call.args[0] for call in scandir.call_args_list],
+                         [self.meetings_dir, self.cache_dir])
+        self.assertEqual(self._cache_names(), ["page0.html", "page1.html"])
+
+    def test_least_recently_used_files_are_evicted_over_budget(self):
+        self._file(self.cache_dir, "w_202606_en.epub", size=400, age_days=40, used_days_ago=30)
+        self._file(self.cache_dir, "w_202606_en.outline.json", size=50, age_days=40, used_days_ago=1)
+        self._file(self.cache_dir, "w_202606_fr.epub", size=400, age_days=20, used_days_ago=2)
+        self._file(self.cache_dir, "w_202606_fr.outline.json", size=50, age_days=20)
+        self._file(self.cache_dir, "mwb_202609_de.epub", size=400, age_days=10)
+        self._file(self.cache_dir, "fedcba98.html", size=100, age_days=5)
+
+        _, result = self._run(cache_budget_bytes=1000)
+
+        # Least recently used first: w_202606_en.epub (with its outline) is
+        # enough to go under the budget
+        self.assertEqual(self._cache_names(),
+                         ["fedcba98.html", "mwb_202609_de.epub", "w_202606_fr.epub", "w_202606_fr.outline.json"])
+        self.assertEqual((result.epub_files_removed, result.cache_files_removed), (1, 1))
+        self.assertEqual(result.total_bytes_freed, 450)
+
+        # An outline goes with its EPUB, however long ago it was read
+        _, result = self._run(cache_budget_bytes=500)
+        self.assertEqual(self._cache_names(), ["w_202606_fr.epub", "w_202606_fr.outline.json"])
+
+    def test_files_in_use_are_kept(self):
+        protected = {"mwb_202609_en.epub", "mwb_202609_en.outline.json", "en_meetings_cache.json"}
+        for name in protected:
+            self._file(self.cache_dir, name, size=300, age_days=200)
+        self._file(self.cache_dir, "mwb_202609_it.epub", size=300, used_days_ago=1)
+        self._file(self.meetings_dir, "midweek_2026-01-07_en.json", age_days=200)
+
+        self._run(cache_budget_bytes=500, protected_cache_files=protected,
+                  active_meeting_files={"midweek_2026-01-07_en.json"})
+
+        self.assertEqual(self._cache_names(), sorted(protected))
+        self.assertTrue((self.meetings_dir / "midweek_2026-01-07_en.json").exists())
+
+    def test_interrupted_run_is_continued_by_the_next(self):
+        for index in range(4):
+            self._file(self.cache_dir, f"page{index}.html", age_days=100)
+        remove = CleanupWorker._remove_cache_file
+
+        def remove_then_quit(worker, *args):
+            worker.requestInterruption()
+            return remove(worker, *args)
+
+        with patch.object(CleanupWorker, "_remove_cache_file", autospec=True, side_effect=remove_then_quit):
+            _, result = self._run()
+        self.assertTrue(result.interrupted)
+        self.assertEqual(result.cache_files_removed, 1)
+        self.assertEqual(len(self._cache_names()), 3)
+
+        _, result = self._run()
+        self.assertFalse(result.interrupted)
+        self.assertEqual(result.cache_files_removed, 3)
+        self.assertEqual(self._cache_names(), [])
+
+    def test_meeting_database_is_pruned(self):
+        """Old meetings in the database go like old files; active and recovery meetings stay"""
+        db_path = str(self.meetings_dir / "meetings.db")
+        store = MeetingStore(db_path)
+        meetings = [Meeting(MeetingType.MIDWEEK, "Meeting", datetime(2026, 1, day), dt_time(19, 0),
+                            [MeetingSection("Section", [MeetingPart("Part", 10)])])
+                    for day in (7, 14, 21)]
+        store._save_many(meetings[:2], [self.now - 200 * DAY] * 2)
+        store.save_meeting(meetings[2])
+        store.close()
+
+        _, result = self._run(active_meeting_files={"midweek_2026-01-14_en.json"}, meeting_db_path=db_path)
+
+        self.assertEqual((result.meetings_removed, result.stored_meetings_removed), (0, 1))
+        self.assertGreater(result.total_bytes_freed, 0)
+        self.assertTrue(result.summary().startswith("Removed 1 saved meeting(s) ("))
+        store = MeetingStore(db_path)
+        self.addCleanup(store.close)
+        self.assertEqual([store.get_meeting(MeetingType.MIDWEEK, date, "en") is not None
+                          for date in ("2026-01-07", "2026-01-14", "2026-01-21")], [False, True, True])
+
+    def test_missing_directories(self):
+        _, result = self._run(meetings_dir=self.meetings_dir / "missing", cache_dir=self.cache_dir / "missing")
+        self.assertFalse(result.has_removals)
+        self.assertEqual(result.errors, [])
+
+
+class TestRecoveryMeetingFile(unittest.TestCase):
+    """Test cases for SessionManager.recovery_meeting_file"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.manager = SessionManager(Path(tmp.name))
+
+    def test_recovery_meeting_file(self):
+        self.assertIsNone(self.manager.recovery_meeting_file())
+
+        self.manager.session_file.write_text('{"clean_exit": false, "meeting_file": "weekend_2026-10-18_en.json"}',
+                                             encoding="utf-8")
+        self.assertEqual(self.manager.recovery_meeting_file(), "weekend_2026-10-18_en.json")
+        self.assertTrue(self.manager.session_file.exists())
+
+        self.manager.session_file.write_text('{"clean_exit": true, "meeting_file": "weekend_2026-10-18_en.json"}',
+                                             encoding="utf-8")
+        self.assertIsNone(self.manager.recovery_meeting_file())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests for EPUBMeetingScraper._download_epub against a local stand-in for the JW API and CDN.
+"""
+import hashlib
+import io
+import json
+import random
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.epub_scraper import EPUBMeetingScraper
+from tests.test_http_client import StandInServer
+
+
+def make_epub() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as epub:
+        epub.writestr("mimetype", "application/epub+zip")
+        epub.writestr("META-INF/container.xml", "<container/>")
+        epub.writestr("OEBPS/week.xhtml", "<html><body>" + "Song 80 " * 2000 + "</body></html>")
+        # Several download chunks worth of incompressible data
+        epub.writestr("OEBPS/images/cover.jpg", random.Random(44).randbytes(300 * 1024))
+    return buffer.getvalue()
+
+
+class TestEpubDownload(unittest.TestCase):
+    """Test cases for the verified EPUB download"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        cache_patch = patch.object(EPUBMeetingScraper, "CACHE_DIR", self.cache_dir)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.epub = make_epub()
+
+    def _serve(self, epub_answers, size=None, checksum=None):
+        """Serve the API answer for mwb 202505 and the EPUB itself"""
+        server = StandInServer({"/epub": epub_answers}, ranges=True)
+        api_answer = {"files": {"E": {"EPUB": [{
+            "file": {"url": server.url + "/epub", "checksum": checksum or hashlib.md5(self.epub).hexdigest()},
+            "filesize": size if size is not None else len(self.epub),
+        }]}}}
+        server.routes["/api"] = [(200, json.dumps(api_answer).encode())]
+        server.__enter__()
+        self.addCleanup(server.__exit__)
+        api_patch = patch.object(EPUBMeetingScraper, "API_BASE_URL", server.url + "/api")
+        api_patch.start()
+        self.addCleanup(api_patch.stop)
+        return server
+
+    def test_download_is_verified_and_cached(self):
+        self._serve([(200, self.epub)])
+        path = EPUBMeetingScraper("en")._download_epub("mwb", "202505")
+        self.assertEqual(path, self.cache_dir / "mwb_202505_en.epub")
+        self.assertEqual(path.read_bytes(), self.epub)
+
+    def test_interrupted_download_is_resumed(self):
+        server = self._serve([(200, self.epub, len(self.epub) // 2), (200, self.epub)])
+        scraper = EPUBMeetingScraper("en")
+        self.assertIsNone(scraper._download_epub("mwb", "202505"))
+        self.assertFalse((self.cache_dir / "mwb_202505_en.epub").exists())
+
+        path = scraper._download_epub("mwb", "202505")
+        self.assertEqual(path.read_bytes(), self.epub)
+        self.assertEqual(len(server.range_requests), 1)
+
+    def test_rejects_bad_downloads(self):
+        """Truncated, corrupted or non-zip files never enter the cache"""
+        not_a_zip = b"<html>Service unavailable</html>"
+        cases = {
+            "size": ([(200, self.epub[:-10])], None, None),
+            "checksum": ([(200, self.epub)], None, "0" * 32),
+            "zip": ([(200, not_a_zip)], len(not_a_zip), hashlib.md5(not_a_zip).hexdigest()),
+        }
+        for name, (answers, size, checksum) in cases.items():
+            with self.subTest(name):
+                self._serve(answers, size=size, checksum=checksum)
+                self.assertIsNone(EPUBMeetingScraper("en")._download_epub("mwb", "202505"))
+                self.assertEqual(list(self.cache_dir.glob("*.epub*")), [])
+
+    def test_corrupt_cached_file_is_replaced(self):
+        self._serve([(200, self.epub)])
+        (self.cache_dir / "mwb_202505_en.epub").write_bytes(b"truncated")
+        path = EPUBMeetingScraper("en")._download_epub("mwb", "202505")
+        self.assertEqual(path.read_bytes(), self.epub)
+
+
+if __name__ == '__main__':
+    unittest.main()
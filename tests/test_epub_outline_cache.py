@@ -0,0 +1,133 @@
+"""
+Tests for the outlines (extracted meetings) EPUBMeetingScraper stores next to each EPUB.
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import __version__ as APP_VERSION
+from src.utils.epub_scraper import EPUBMeetingScraper
+from tests.test_scraper_perf import OfflineWeb
+
+
+class TestOutlineCache(unittest.TestCase):
+    """Test cases for the outline cache"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        cache_patch = patch.object(EPUBMeetingScraper, "CACHE_DIR", self.cache_dir)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.web = OfflineWeb()
+        self.web.__enter__()
+        self.addCleanup(self.web.__exit__)
+        self.scraper = EPUBMeetingScraper("en")
+        self.cache_file = self.cache_dir / "en_meetings_cache.json"
+
+    def _meetings_cache(self):
+        data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        for entry in data.pop("readiness").values():
+            entry.pop("ready_at")
+        return data
+
+    def _not_parsed(self):
+        return patch.object(EPUBMeetingScraper, "_parse_epub_content", side_effect=AssertionError("parsed"))
+
+    def test_outline_is_stored_next_to_epub(self):
+        self.assertTrue(self.scraper.update_meetings_cache())
+        readiness = json.loads(self.cache_file.read_text(encoding="utf-8"))["readiness"]
+        self.assertTrue(readiness)
+        for name, entry in readiness.items():
+            publication, issue = name.split()
+            epub = self.scraper._epub_cache_file(publication, issue)
+            outline = json.loads(self.scraper._outline_file(publication, issue).read_text(encoding="utf-8"))
+            self.assertEqual(outline["sha256"], hashlib.sha256(epub.read_bytes()).hexdigest())
+            self.assertEqual(outline["sha256"], entry["sha256"])
+            self.assertEqual(outline["extractor"], APP_VERSION)
+            self.assertEqual(len(outline["meetings"]), entry["meetings"])
+
+    def test_expired_meetings_cache_is_assembled_from_outlines(self):
+        """Every stored issue comes back, not only those of the current week, without parsing"""
+        self.scraper.prefetch_upcoming(weeks=9)
+        expected = self._meetings_cache()
+        self.assertGreater(len(expected["weekend"]), 1)
+        expired = self.cache_file.stat().st_mtime - EPUBMeetingScraper.JSON_TTL - 60
+        os.utime(self.cache_file, (expired, expired))
+
+        requests = self.web.requests()
+        with self._not_parsed():
+            self.assertTrue(EPUBMeetingScraper("en").update_meetings_cache())
+        self.assertEqual(self.web.requests(), requests)
+        self.assertEqual(self._meetings_cache(), expected)
+
+        self.cache_file.unlink()
+        with self._not_parsed():
+            self.assertEqual(EPUBMeetingScraper("en").prefetch_upcoming(weeks=9).prepared, [])
+        self.assertEqual(self._meetings_cache(), expected)
+
+    def test_same_bytes_are_not_parsed_again(self):
+        self.scraper.update_meetings_cache()
+        publication, issue = "w", self.scraper._get_relevant_watchtower_issues()[0]
+        epub = self.scraper._epub_cache_file(publication, issue)
+        # Downloaded again: same bytes, new file
+        epub.write_bytes(epub.read_bytes())
+        self.cache_file.unlink()
+        with self._not_parsed():
+            self.assertTrue(self.scraper.update_meetings_cache())
+        outline = json.loads(self.scraper._outline_file(publication, issue).read_text(encoding="utf-8"))
+        self.assertEqual(outline["mtime_ns"], epub.stat().st_mtime_ns)
+
+    def test_new_bytes_or_parser_version_are_parsed(self):
+        self.scraper.update_meetings_cache()
+        publication, issue = "w", self.scraper._get_relevant_watchtower_issues()[0]
+
+        def reissue():
+            with zipfile.ZipFile(self.scraper._epub_cache_file(publication, issue), 'a') as epub:
+                epub.comment = b"reissued"
+
+        cases = {
+            "bytes": reissue,
+            "version": lambda: self.scraper._write_outline(publication, issue, dict(
+                self.scraper._load_outline(publication, issue), extractor="0.0.1")),
+        }
+        for name, change in cases.items():
+            with self.subTest(name):
+                change()
+                self.cache_file.unlink()
+                with patch.object(EPUBMeetingScraper, "_parse_epub_content",
+                                  wraps=self.scraper._parse_epub_content) as parse:
+                    EPUBMeetingScraper("en").update_meetings_cache()
+                self.assertEqual(parse.call_count, 1)
+                self.assertIsNotNone(self.scraper._load_outline(publication, issue))
+
+    def test_evicted_issues_lose_their_outlines(self):
+        self.scraper.prefetch_upcoming(weeks=9)
+        outlines = sorted(self.cache_dir.glob("*.outline.json"))
+        self.scraper.prefetch_upcoming(weeks=1, window=1)
+        remaining = sorted(self.cache_dir.glob("*.outline.json"))
+        self.assertLess(len(remaining), len(outlines))
+        self.assertEqual([path.name.replace(".outline.json", ".epub") for path in remaining],
+                         sorted(path.name for path in self.cache_dir.glob("*.epub")))
+
+    def test_files_in_use_are_those_of_the_upcoming_issues(self):
+        self.scraper.prefetch_upcoming(weeks=2)
+        stored = {path.name for path in self.cache_dir.iterdir()}
+        in_use = self.scraper.files_in_use(weeks=2)
+        self.assertIn(self.cache_file.name, stored)
+        self.assertEqual(stored - in_use, set())
+        self.assertFalse(in_use & set(EPUBMeetingScraper("fr").files_in_use(weeks=2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the per-run parse cache of EPUB members in EPUBMeetingScraper.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from src.utils.epub_scraper import EPUBMeetingScraper
+from tests.test_scraper_perf import OfflineWeb, watchtower_epub, workbook_epub
+
+
+class TestParseRun(unittest.TestCase):
+    """Test cases for EPUBMeetingScraper._parse_run"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        cache_patch = patch.object(EPUBMeetingScraper, "CACHE_DIR", self.cache_dir)
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+        self.scraper = EPUBMeetingScraper("en")
+
+    def _content(self, publication, build):
+        path = self.scraper._epub_cache_file(publication, "202609")
+        path.write_bytes(build("202609"))
+        return path, self.scraper._parse_epub_content(path)
+
+    def _count_parses(self):
+        return patch("src.utils.epub_scraper.BeautifulSoup", wraps=BeautifulSoup)
+
+    def test_members_are_parsed_once_per_run(self):
+        """The workbook TOC links each week twice (date and Bible reading)"""
+        extractors = {'mwb': (workbook_epub, self.scraper._extract_midweek_meetings),
+                      'w': (watchtower_epub, self.scraper._extract_weekend_meetings)}
+        for publication, (build, extract) in extractors.items():
+            with self.subTest(publication):
+                _, content = self._content(publication, build)
+                expected = extract(dict(content))
+                with self._count_parses() as parse, self.scraper._parse_run():
+                    self.assertEqual(extract(content), expected)
+                    self.assertEqual(extract(content), expected)
+                self.assertEqual(parse.call_count, len(content))
+                self.assertTrue(expected)
+
+    def test_cache_is_dropped_after_run(self):
+        _, content = self._content('mwb', workbook_epub)
+        with self.scraper._parse_run():
+            with self.scraper._parse_run():
+                self.scraper._extract_midweek_meetings(content)
+            # An inner run leaves the outer run's trees alone
+            self.assertEqual(len(self.scraper._parsed_members), len(content))
+        self.assertIsNone(self.scraper._parsed_members)
+
+        with self._count_parses() as parse:
+            self.scraper._extract_midweek_meetings(content)
+        self.assertEqual(parse.call_count, len(content) * 2 - 1)
+
+    def test_rewritten_epub_is_parsed_again(self):
+        path, content = self._content('w', watchtower_epub)
+        with self.scraper._parse_run():
+            old = self.scraper._soup(content, "OEBPS/toc.xhtml")
+            path.write_bytes(watchtower_epub("202610"))
+            os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10 ** 9))
+            new_content = self.scraper._parse_epub_content(path)
+            self.assertIs(self.scraper._soup(content, "OEBPS/toc.xhtml"), old)
+            new = self.scraper._soup(new_content, "OEBPS/toc.xhtml")
+        self.assertIsNot(new, old)
+        self.assertNotEqual(new.get_text(), old.get_text())
+
+    def test_update_parses_nothing_twice(self):
+        with OfflineWeb(), self._count_parses() as parse:
+            self.assertTrue(self.scraper.update_meetings_cache())
+        documents = [call.args[0] for call in parse.call_args_list]
+        self.assertTrue(documents)
+        self.assertEqual(len(documents), len(set(documents)))
+
+
+    def test_each_issue_has_its_own_run(self):
+        """The trees of one issue are dropped before the next issue is extracted"""
+        held = []
+        extractors = {name: getattr(EPUBMeetingScraper, name)
+                      for name in ("_extract_midweek_meetings", "_extract_weekend_meetings")}
+
+        def record(name):
+            def extract(scraper, content):
+                held.append(dict(scraper._parsed_members))
+                return extractors[name](scraper, content)
+            return patch.object(EPUBMeetingScraper, name, autospec=True, side_effect=extract)
+
+        with OfflineWeb(), record("_extract_midweek_meetings"), record("_extract_weekend_meetings"):
+            self.assertTrue(self.scraper.update_meetings_cache())
+        self.assertGreaterEqual(len(held), 2)
+        self.assertEqual(held, [{}] * len(held))
+        self.assertIsNone(self.scraper._parsed_members)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the multi-language EPUB prefetch, against a local stand-in for the JW API and CDN.
+"""
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import epub_scraper
+from src.utils.epub_scraper import EPUBMeetingScraper, main, prefetch_languages
+from tests.test_epub_download import make_epub
+from tests.test_http_client import StandInServer
+
+LANGUAGES = ["en", "it", "fr"]
+
+
+class TestEpubPrefetch(unittest.TestCase):
+    """Test cases for prefetch_languages and the prefetch command"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        self._patch(EPUBMeetingScraper, "CACHE_DIR", self.cache_dir)
+
+        self.server = StandInServer({"/epub": [(200, make_epub())]})
+        api_answer = {"files": {
+            EPUBMeetingScraper.LANG_CODES[language]: {"EPUB": [{"file": {"url": self.server.url + "/epub"}}]}
+            for language in LANGUAGES
+        }}
+        self.server.routes["/api"] = [(200, json.dumps(api_answer).encode())]
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self._patch(EPUBMeetingScraper, "API_BASE_URL", self.server.url + "/api")
+
+    def _patch(self, target, name, value):
+        patcher = patch.object(target, name, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_prefetch_fills_every_language(self):
+        reports = prefetch_languages(LANGUAGES, weeks=8, build_cache=False)
+        self.assertEqual(list(reports), LANGUAGES)
+        for language, report in reports.items():
+            expected = EPUBMeetingScraper(language).get_upcoming_issues(8)
+            self.assertEqual(sorted(report.downloaded), sorted(f"{pub} {issue}" for pub, issue in expected))
+            self.assertEqual(report.unavailable, [])
+            for publication, issue in expected:
+                self.assertTrue((self.cache_dir / f"{publication}_{issue}_{language}.epub").exists())
+
+        # A second run is served from the cache
+        downloads = self.server.hits["/epub"]
+        reports = prefetch_languages(LANGUAGES, weeks=8, build_cache=False)
+        self.assertEqual(self.server.hits["/epub"], downloads)
+        self.assertTrue(all(report.cached and not report.downloaded for report in reports.values()))
+
+    def test_downloads_hold_the_issue_lock(self):
+        """A background look-ahead pass never downloads the same issue at the same time"""
+        held = []
+        download = EPUBMeetingScraper._download_epub
+
+        def check_lock(scraper, publication, issue):
+            held.append(epub_scraper._issue_lock(scraper.language, publication, issue).locked())
+            return download(scraper, publication, issue)
+
+        with patch.object(EPUBMeetingScraper, "_download_epub", autospec=True, side_effect=check_lock):
+            prefetch_languages(["en"], weeks=2, build_cache=False)
+        self.assertEqual(len(held), len(EPUBMeetingScraper("en").get_upcoming_issues(2)))
+        self.assertTrue(all(held))
+
+    def test_upcoming_issues(self):
+        scraper = EPUBMeetingScraper("en")
+        this_week = scraper.get_upcoming_issues(1)
+        self.assertEqual(this_week[0], ('mwb', scraper._get_current_issue_dates()[0]))
+        self.assertEqual(len(this_week), len(set(this_week)))
+        self.assertTrue(set(this_week) <= set(scraper.get_upcoming_issues(8)))
+
+    def test_unavailable_issues_are_reported(self):
+        self.server.routes["/api"] = [(404, b"")]
+        reports = prefetch_languages(["en"], weeks=1, build_cache=False)
+        self.assertEqual(reports["en"].downloaded, [])
+        self.assertEqual(len(reports["en"].unavailable), len(EPUBMeetingScraper("en").get_upcoming_issues(1)))
+
+    def test_command_line(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(["prefetch", "--langs", "en,it", "--weeks", "2", "--no-meetings"])
+        self.assertEqual(status, 0)
+        self.assertIn("it", output.getvalue())
+
+        with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit):
+            main(["prefetch", "--langs", "en,xx"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,233 @@
+"""
+Tests for the shared HTTP client, against a local stand-in server.
+"""
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import requests
+
+from src.config import USER_AGENT
+from src.utils.http_client import DownloadCancelled, HttpClient, IntegrityError
+
+
+class StandInServer:
+    """Local HTTP/1.1 server answering from a table of canned responses
+
+    routes maps a path to a list of (status, body) answers, served in order;
+    the last one is repeated. Bodies may be bytes or a callable returning bytes
+    (to simulate a slow server). An answer (status, body, cut) announces the
+    whole body but drops the connection after cut bytes. With ranges=True,
+    200 answers honour "Range: bytes=N-" requests. route(path, query), if
+    given, picks the routes key for a request (e.g. one per query parameter).
+    """
+
+    def __init__(self, routes, ranges=False, route=None):
+        self.routes = {path: list(answers) for path, answers in routes.items()}
+        self.ranges = ranges
+        self.route = route
+        self.range_requests = []
+        self.hits = {}
+        self.user_agents = []
+        self.client_ports = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path, _, query = self.path.partition('?')
+                if server.route:
+                    path = server.route(path, query)
+                with server._lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    server.hits[path] = server.hits.get(path, 0) + 1
+                    server.user_agents.append(self.headers.get('User-Agent'))
+                    server.client_ports.add(self.client_address[1])
+                    answers = server.routes.get(path, [(404, b"not found")])
+                    status, body, *cut = answers.pop(0) if len(answers) > 1 else answers[0]
+                    requested_range = self.headers.get('Range')
+                    if requested_range:
+                        server.range_requests.append(requested_range)
+                try:
+                    if callable(body):
+                        body = body()
+                    headers = {}
+                    if server.ranges and requested_range and status == 200:
+                        offset = int(requested_range.split('=')[1].rstrip('-'))
+                        if offset >= len(body):
+                            status, body = 416, b""
+                        else:
+                            headers['Content-Range'] = f"bytes {offset}-{len(body) - 1}/{len(body)}"
+                            status, body = 206, body[offset:]
+                    self.send_response(status)
+                    self.send_header('Content-Length', str(len(body)))
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    if cut:
+                        self.send_header('Connection', 'close')
+                        self.close_connection = True
+                    self.end_headers()
+                    self.wfile.write(body[:cut[0]] if cut else body)
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestHttpClient(unittest.TestCase):
+    """Test cases for HttpClient"""
+
+    def setUp(self):
+        self.client = HttpClient(backoff_factor=0)
+        self.addCleanup(self.client.close)
+
+    def test_get_reuses_connection(self):
+        """Sequential requests share one kept-alive connection and send the User-Agent"""
+        with StandInServer({"/page": [(200, b"hello")]}) as server:
+            for _ in range(5):
+                response = self.client.get(server.url + "/page")
+                self.assertEqual(response.text, "hello")
+        self.assertEqual(len(server.client_ports), 1)
+        self.assertEqual(set(server.user_agents), {USER_AGENT})
+
+    def test_retries_server_errors(self):
+        with StandInServer({"/flaky": [(503, b""), (502, b""), (200, b"ok")]}) as server:
+            response = self.client.get(server.url + "/flaky")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.hits["/flaky"], 3)
+        stats = self.client.stats()[server.url.split("//")[1]]
+        self.assertEqual((stats['requests'], stats['retries'], stats['errors']), (1, 2, 0))
+
+    def test_gives_up_with_last_answer(self):
+        """Once retries are exhausted the last error answer is returned, not raised"""
+        with StandInServer({"/down": [(500, b"")]}) as server:
+            response = self.client.get(server.url + "/down")
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(server.hits["/down"], 4)
+        self.assertEqual(self.client.stats()[server.url.split("//")[1]]['errors'], 1)
+
+    def test_download_to(self):
+        body = bytes(range(256)) * 1000
+        progress = []
+        with StandInServer({"/file.epub": [(200, body)], "/missing.epub": [(404, b"")]}) as server, \
+                tempfile.TemporaryDirectory() as tmp:
+            destination = Path(tmp) / "file.epub"
+            self.client.download_to(server.url + "/file.epub", destination, chunk_size=10000,
+                                    progress=lambda received, total: progress.append((received, total)))
+            self.assertEqual(destination.read_bytes(), body)
+            self.assertEqual(progress[-1], (len(body), len(body)))
+            self.assertGreater(len(progress), 1)
+
+            with self.assertRaises(requests.HTTPError):
+                self.client.download_to(server.url + "/missing.epub", Path(tmp) / "missing.epub")
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ["file.epub"])
+
+    def test_resume_interrupted_download(self):
+        """A dropped download keeps its .part file and the next call resumes it with Range"""
+        body = bytes(range(256)) * 400
+        checksum = hashlib.md5(body).hexdigest()
+        routes = {"/book.epub": [(200, body, 30000), (200, body)]}
+        with StandInServer(routes, ranges=True) as server, tempfile.TemporaryDirectory() as tmp:
+            destination = Path(tmp) / "book.epub"
+            partial = Path(tmp) / "book.epub.part"
+            with self.assertRaises(requests.RequestException):
+                self.client.download_to(server.url + "/book.epub", destination, resume=True,
+                                        chunk_size=1000, checksum=checksum)
+            self.assertFalse(destination.exists())
+            offset = partial.stat().st_size
+            self.assertGreater(offset, 0)
+
+            self.client.download_to(server.url + "/book.epub", destination, resume=True,
+                                    expected_size=len(body), checksum=checksum)
+            self.assertEqual(destination.read_bytes(), body)
+            self.assertFalse(partial.exists())
+        self.assertEqual(server.range_requests, [f"bytes={offset}-"])
+
+    def test_cancelled_download(self):
+        """should_stop cancels between chunks; the .part file is kept for a resumed attempt"""
+        body = bytes(range(256)) * 400
+        chunks = []
+        with StandInServer({"/book.epub": [(200, body)]}) as server, tempfile.TemporaryDirectory() as tmp:
+            destination = Path(tmp) / "book.epub"
+            with self.assertRaises(DownloadCancelled):
+                self.client.download_to(server.url + "/book.epub", destination, resume=True, chunk_size=1000,
+                                        progress=lambda received, total: chunks.append(received),
+                                        should_stop=lambda: len(chunks) >= 3)
+            self.assertFalse(destination.exists())
+            self.assertEqual((Path(tmp) / "book.epub.part").stat().st_size, 3000)
+
+    def test_stale_partial_restarts(self):
+        """A .part file longer than the resource is discarded and the download restarts"""
+        body = b"new edition"
+        with StandInServer({"/book.epub": [(200, body)]}, ranges=True) as server, \
+                tempfile.TemporaryDirectory() as tmp:
+            destination = Path(tmp) / "book.epub"
+            Path(tmp, "book.epub.part").write_bytes(b"x" * 100)
+            self.client.download_to(server.url + "/book.epub", destination, resume=True)
+            self.assertEqual(destination.read_bytes(), body)
+
+    def test_integrity_checks(self):
+        """Files with the wrong size, checksum or content never reach the destination"""
+        body = b"epub bytes"
+
+        def reject(path):
+            raise IntegrityError("not an epub")
+
+        with StandInServer({"/book.epub": [(200, body)]}) as server, tempfile.TemporaryDirectory() as tmp:
+            destination = Path(tmp) / "book.epub"
+            url = server.url + "/book.epub"
+            for checks in ({'expected_size': len(body) + 1}, {'checksum': "0" * 32}, {'validate': reject}):
+                with self.subTest(**{name: str(value) for name, value in checks.items()}):
+                    with self.assertRaises(IntegrityError):
+                        self.client.download_to(url, destination, resume=True, **checks)
+                    self.assertEqual(list(Path(tmp).iterdir()), [])
+
+            self.client.download_to(url, destination, expected_size=len(body),
+                                    checksum=hashlib.sha256(body).hexdigest(), checksum_algorithm="sha256")
+            self.assertEqual(destination.read_bytes(), body)
+
+    def test_per_host_limit(self):
+        def slow():
+            time.sleep(0.1)
+            return b"slow"
+
+        client = HttpClient(per_host_limit=2)
+        self.addCleanup(client.close)
+        with StandInServer({"/slow": [(200, slow)]}) as server:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                texts = list(pool.map(lambda _: client.get(server.url + "/slow").text, range(6)))
+        self.assertEqual(texts, ["slow"] * 6)
+        self.assertEqual(server.max_active, 2)
+        self.assertEqual(client.stats()[server.url.split("//")[1]]['requests'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+"""
+Tests for the look-ahead issue prefetch and its rolling cache window.
+"""
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.utils.epub_scraper import EPUBMeetingScraper, _cache_lock
+from src.utils import issue_prefetch
+from src.utils.issue_prefetch import IssuePrefetchScheduler
+from tests.test_epub_download import make_epub
+from tests.test_http_client import StandInServer
+
+
+class LookAheadTestCase(unittest.TestCase):
+    """Scrapers use a temporary cache and a local stand-in for the JW API and CDN"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        self.server = StandInServer({"/epub": [(200, make_epub())]})
+        api_answer = {"files": {"E": {"EPUB": [{"file": {"url": self.server.url + "/epub"}}]}}}
+        self.server.routes["/api"] = [(200, json.dumps(api_answer).encode())]
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        for name, value in (("CACHE_DIR", self.cache_dir), ("API_BASE_URL", self.server.url + "/api")):
+            patcher = patch.object(EPUBMeetingScraper, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.scraper = EPUBMeetingScraper("en")
+        self.cache_file = self.cache_dir / "en_meetings_cache.json"
+
+    def downloads(self):
+        return self.server.hits.get("/epub", 0)
+
+
+class TestLookAhead(LookAheadTestCase):
+    """Test cases for EPUBMeetingScraper.prefetch_upcoming"""
+
+    def test_prefetch_marks_issues_ready(self):
+        upcoming = [f"{pub} {issue}" for pub, issue in self.scraper.get_upcoming_issues(9)]
+        self.assertIn(('mwb', self.scraper._get_current_issue_dates()[0]), self.scraper.get_upcoming_issues(9))
+
+        result = self.scraper.prefetch_upcoming(weeks=9)
+        self.assertEqual(result.prepared, upcoming)
+        readiness = json.loads(self.cache_file.read_text(encoding="utf-8"))["readiness"]
+        self.assertEqual(sorted(readiness), sorted(upcoming))
+        self.assertTrue(all(entry["ready_at"] for entry in readiness.values()))
+
+        downloads = self.downloads()
+        result = self.scraper.prefetch_upcoming(weeks=9)
+        self.assertEqual((result.prepared, result.ready), ([], upcoming))
+        self.assertEqual(self.downloads(), downloads)
+
+    def test_update_is_a_pure_cache_hit_after_prefetch(self):
+        self.scraper.prefetch_upcoming(weeks=9)
+        downloads = self.downloads()
+        written = self.cache_file.stat().st_mtime_ns
+
+        with patch.object(EPUBMeetingScraper, "_parse_epub_content") as parse:
+            self.assertTrue(EPUBMeetingScraper("en").update_meetings_cache())
+        parse.assert_not_called()
+        self.assertEqual(self.downloads(), downloads)
+        self.assertEqual(self.cache_file.stat().st_mtime_ns, written)
+
+    def test_new_parser_version_reparses(self):
+        self.scraper.prefetch_upcoming(weeks=1)
+        data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        for entry in data["readiness"].values():
+            entry["version"] = "0.0.1"
+        self.cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        result = self.scraper.prefetch_upcoming(weeks=1)
+        self.assertEqual(result.ready, [])
+        self.assertEqual(len(result.prepared), len(self.scraper.get_upcoming_issues(1)))
+
+    def test_rolling_window_evicts_old_issues(self):
+        old_issues = ["202001", "202003", "202005"]
+        data = {"midweek": {issue: {} for issue in old_issues}, "weekend": {}, "readiness": {}}
+        for issue in old_issues:
+            data["readiness"][f"mwb {issue}"] = {"version": "old"}
+            self.scraper._epub_cache_file("mwb", issue).write_bytes(make_epub())
+        self.cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        result = self.scraper.prefetch_upcoming(weeks=1, window=1)
+        self.assertEqual(sorted(result.evicted), [f"mwb {issue}" for issue in old_issues])
+        data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        upcoming = self.scraper.get_upcoming_issues(1)
+        self.assertEqual(sorted(data["midweek"]), sorted(issue for pub, issue in upcoming if pub == "mwb"))
+        self.assertFalse(any(key.startswith("mwb 2020") for key in data["readiness"]))
+        self.assertEqual(list(self.cache_dir.glob("mwb_2020*.epub")), [])
+        # Issues still needed for the coming weeks are never evicted
+        for publication, issue in upcoming:
+            self.assertTrue(self.scraper._epub_cache_file(publication, issue).exists())
+
+    def test_downloads_do_not_hold_the_cache_lock(self):
+        """A meetings update only waits for the issue being downloaded, not for the whole pass"""
+        download = EPUBMeetingScraper._download_epub
+        locked = []
+
+        def checked_download(scraper, *args):
+            locked.append(_cache_lock("en").locked())
+            return download(scraper, *args)
+
+        with patch.object(EPUBMeetingScraper, "_download_epub", autospec=True, side_effect=checked_download):
+            self.scraper.prefetch_upcoming(weeks=9)
+        self.assertEqual(len(locked), len(self.scraper.get_upcoming_issues(9)))
+        self.assertFalse(any(locked))
+
+    def test_stops_between_issues(self):
+        upcoming = [f"{pub} {issue}" for pub, issue in self.scraper.get_upcoming_issues(9)]
+        outlines = lambda: len(list(self.cache_dir.glob("*.outline.json")))
+        result = self.scraper.prefetch_upcoming(weeks=9, should_stop=lambda: outlines() >= 2)
+        self.assertTrue(result.interrupted)
+        self.assertEqual(result.prepared, upcoming[:2])
+        readiness = json.loads(self.cache_file.read_text(encoding="utf-8"))["readiness"]
+        self.assertEqual(sorted(readiness), sorted(upcoming[:2]))
+
+        result = self.scraper.prefetch_upcoming(weeks=9)
+        self.assertFalse(result.interrupted)
+        self.assertEqual((result.ready, result.prepared), (upcoming[:2], upcoming[2:]))
+
+    def test_stop_cancels_the_download(self):
+        """An issue whose download was cancelled is left for the next pass, not reported unavailable"""
+        issues = self.scraper.get_upcoming_issues(9)
+        upcoming = [f"{pub} {issue}" for pub, issue in issues]
+        stop = threading.Event()
+        download_to = self.scraper.http.download_to
+
+        def stopping_download(*args, **kwargs):
+            if self.downloads() == 1:
+                stop.set()
+            return download_to(*args, **kwargs)
+
+        with patch.object(self.scraper.http, "download_to", side_effect=stopping_download):
+            result = self.scraper.prefetch_upcoming(weeks=9, should_stop=stop.is_set)
+        self.assertTrue(result.interrupted)
+        self.assertEqual((result.prepared, result.unavailable), (upcoming[:1], []))
+        self.assertEqual(self.downloads(), 2)
+        cancelled = self.scraper._epub_cache_file(*issues[1])
+        self.assertFalse(cancelled.exists())
+        self.assertTrue(cancelled.with_name(cancelled.name + ".part").exists())
+
+
+class TestIssuePrefetchScheduler(LookAheadTestCase):
+    """Test cases for IssuePrefetchScheduler"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a QApplication instance if one doesn't exist"""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _wait_for(self, condition, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        return condition()
+
+    def test_runs_when_idle(self):
+        busy = [True]
+        results = []
+        scheduler = IssuePrefetchScheduler(lambda: "en", is_busy=lambda: busy[0], first_run_delay_ms=0,
+                                           busy_retry_ms=50, weeks=1)
+        scheduler.prefetched.connect(results.append)
+        self.addCleanup(scheduler.stop)
+        scheduler.start()
+
+        self._wait_for(lambda: False, timeout=0.2)
+        self.assertEqual((results, self.downloads()), ([], 0))
+        self.assertFalse(scheduler.is_running)
+
+        busy[0] = False
+        self.assertTrue(self._wait_for(lambda: results))
+        self.assertEqual(results[0].language, "en")
+        self.assertEqual(len(results[0].prepared), len(self.scraper.get_upcoming_issues(1)))
+
+    def test_stop_interrupts_a_running_pass(self):
+        started = threading.Event()
+        release = threading.Event()
+        outline = EPUBMeetingScraper._issue_outline
+        prepared = []
+
+        def slow_outline(scraper, publication, issue, *args):
+            started.set()
+            release.wait(10)
+            prepared.append(issue)
+            return outline(scraper, publication, issue, *args)
+
+        scheduler = IssuePrefetchScheduler(lambda: "en", first_run_delay_ms=0, weeks=9)
+        with patch.object(EPUBMeetingScraper, "_issue_outline", autospec=True, side_effect=slow_outline):
+            scheduler.start()
+            self.assertTrue(self._wait_for(started.is_set))
+            worker = scheduler._worker
+
+            stop_start = time.monotonic()
+            scheduler.stop(timeout_ms=100)
+            self.assertLess(time.monotonic() - stop_start, 2)
+            # Still running: no longer owned by the scheduler, which may be destroyed
+            self.assertFalse(scheduler.is_running)
+            self.assertIsNone(worker.parent())
+            self.assertIn(worker, issue_prefetch._detached_workers)
+            release.set()
+            self.assertTrue(worker.wait(10000))
+        # The pass ended after the issue it was working on
+        self.assertEqual(len(prepared), 1)
+        self.assertTrue(self._wait_for(lambda: not issue_prefetch._detached_workers))
+
+
+if __name__ == '__main__':
+    unittest.main()
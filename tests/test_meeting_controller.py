@@ -198,5 +198,38 @@ class TestMeetingControllerCore(unittest.TestCase):
         return meeting
 
 
+class TestSaveMeeting(unittest.TestCase):
+    """Test cases for MeetingController.save_meeting"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = patch("os.path.expanduser", return_value=tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _controller(self, use_meeting_database):
+        from src.controllers.meeting_controller import MeetingController
+        controller = MeetingController()
+        controller.settings_manager.settings.meeting_source.use_meeting_database = use_meeting_database
+        if use_meeting_database:
+            controller.meeting_store = controller._open_meeting_store()
+            self.addCleanup(controller.meeting_store.close)
+        return controller
+
+    def test_saved_meetings_are_recent_with_or_without_the_database(self):
+        for use_meeting_database in (False, True):
+            with self.subTest(use_meeting_database=use_meeting_database):
+                controller = self._controller(use_meeting_database)
+                controller.settings_manager.settings.recent_meetings = []
+                meeting = Meeting(MeetingType.MIDWEEK, "Test Midweek Meeting", datetime(2026, 1, 7), time(19, 0),
+                                  [MeetingSection("Test Section", [MeetingPart("Test Part", 10)])])
+                controller.save_meeting(meeting)
+
+                file_path = os.path.join(controller.meetings_dir,
+                                         "midweek_2026-01-07_en.json")
+                self.assertEqual(controller.settings_manager.settings.recent_meetings, [file_path])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
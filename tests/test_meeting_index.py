@@ -0,0 +1,111 @@
+"""
+Tests for the meeting file metadata index in the OnTime Meeting Timer application.
+"""
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, time
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType, MeetingSource
+from src.models.meeting_index import MeetingIndex
+from src.utils.persistence import get_persistence_service
+
+
+class TestMeetingIndex(unittest.TestCase):
+    """Test cases for the MeetingIndex class"""
+
+    def setUp(self):
+        """Set up a meetings directory and an index for it"""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.meetings_dir = os.path.join(self.test_dir.name, "meetings")
+        os.makedirs(self.meetings_dir)
+        self.index_path = os.path.join(self.test_dir.name, "meeting_index.json")
+        self.index = MeetingIndex(self.meetings_dir, self.index_path)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        get_persistence_service().flush()
+        self.test_dir.cleanup()
+
+    def _write_meeting(self, meeting_type, date, source, language="en"):
+        """Write a meeting file the way MeetingController.save_meeting names it"""
+        meeting = Meeting(
+            meeting_type=meeting_type,
+            title=f"{meeting_type.value} {date:%Y-%m-%d}",
+            date=date,
+            start_time=time(19, 0),
+            sections=[MeetingSection("Section", [MeetingPart("Part 1", 10)])],
+            language=language,
+            source=source
+        )
+        filename = f"{meeting_type.value}_{date:%Y-%m-%d}_{language}.json"
+        with open(os.path.join(self.meetings_dir, filename), 'w', encoding='utf-8') as f:
+            json.dump(meeting.to_dict(), f, indent=2)
+        return filename
+
+    def test_candidates_prefer_recent_scraped(self):
+        """Scraped meetings come first, newest first, then manual ones"""
+        old = self._write_meeting(MeetingType.MIDWEEK, datetime(2026, 1, 7), MeetingSource.SCRAPED)
+        new = self._write_meeting(MeetingType.MIDWEEK, datetime(2026, 1, 14), MeetingSource.SCRAPED)
+        manual = self._write_meeting(MeetingType.MIDWEEK, datetime(2026, 1, 21), MeetingSource.MANUAL)
+        weekend = self._write_meeting(MeetingType.WEEKEND, datetime(2026, 1, 10), MeetingSource.SCRAPED)
+
+        self.assertTrue(self.index.refresh())
+        self.assertEqual(self.index.candidates(MeetingType.MIDWEEK), [new, old, manual])
+        self.assertEqual(self.index.candidates(MeetingType.WEEKEND), [weekend])
+
+    def test_unchanged_files_are_not_reread(self):
+        """A second refresh with no changes does not open any file"""
+        self._write_meeting(MeetingType.MIDWEEK, datetime(2026, 1, 7), MeetingSource.SCRAPED)
+        self.index.refresh()
+
+        with patch.object(self.index, '_read_entry') as read_entry:
+            self.assertFalse(self.index.refresh())
+        read_entry.assert_not_called()
+
+    def test_index_persists_and_tracks_removals(self):
+        """A new index instance reuses the saved entries and drops deleted files"""
+        filename = self._write_meeting(MeetingType.WEEKEND, datetime(2026, 1, 10), MeetingSource.MANUAL)
+        self.index.refresh()
+        get_persistence_service().flush()
+
+        reloaded = MeetingIndex(self.meetings_dir, self.index_path)
+        self.assertEqual(reloaded.entries()[filename]['source'], "manual")
+
+        os.remove(os.path.join(self.meetings_dir, filename))
+        self.assertTrue(reloaded.refresh())
+        self.assertEqual(reloaded.candidates(MeetingType.WEEKEND), [])
+
+    def test_update_from_save_avoids_parse(self):
+        """An entry recorded at save time only needs its mtime adopted on refresh"""
+        meeting = Meeting(
+            meeting_type=MeetingType.MIDWEEK,
+            title="Saved",
+            date=datetime(2026, 1, 7),
+            start_time=time(19, 0),
+            sections=[],
+        )
+        filename = "midweek_2026-01-07_en.json"
+        content = get_persistence_service().save_json(
+            os.path.join(self.meetings_dir, filename), meeting.to_dict(), indent=2
+        )
+        self.index.update(filename, meeting, content)
+
+        with patch('src.models.meeting_index.json.loads') as loads:
+            self.index.refresh()
+        loads.assert_not_called()
+
+        entry = self.index.entries()[filename]
+        self.assertIsNotNone(entry['mtime'])
+        self.assertEqual(entry['type'], "midweek")
+
+
+if __name__ == '__main__':
+    unittest.main()
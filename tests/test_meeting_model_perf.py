@@ -0,0 +1,150 @@
+"""
+Memory and throughput benchmark for the meeting model with thousands of parts.
+
+Run directly for a report:
+    python tests/test_meeting_model_perf.py [parts]
+
+Under pytest the same benchmark runs with a small size to check it still works.
+"""
+import copy
+import sys
+import timeit
+import tracemalloc
+import unittest
+from datetime import datetime, time
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.models.meeting_serializer import meeting_from_dict, meeting_to_dict
+
+PARTS_PER_SECTION = 50
+
+
+def build_meeting(part_count: int) -> Meeting:
+    """Build a custom meeting with the given number of parts"""
+    sections = []
+    for section_index in range(0, part_count, PARTS_PER_SECTION):
+        count = min(PARTS_PER_SECTION, part_count - section_index)
+        sections.append(MeetingSection(
+            f"Section {section_index // PARTS_PER_SECTION + 1}",
+            [MeetingPart(f"Part {section_index + i + 1}", 1 + (section_index + i) % 15)
+             for i in range(count)]
+        ))
+    return Meeting(
+        meeting_type=MeetingType.CUSTOM,
+        title="Benchmark Meeting",
+        date=datetime(2026, 1, 7),
+        start_time=time(19, 0),
+        sections=sections
+    )
+
+
+def measure_memory(part_count: int) -> int:
+    """Bytes allocated to build a meeting and its flattened view"""
+    tracemalloc.start()
+    meeting = build_meeting(part_count)
+    meeting.total_duration_minutes
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def run_benchmark(part_count: int, number: int) -> dict:
+    """Time the common read operations on a meeting with part_count parts"""
+    meeting = build_meeting(part_count)
+    last = part_count - 1
+
+    def edit_then_total():
+        # A duration change invalidates the cached view
+        part = meeting.sections[0].parts[0]
+        part.duration_minutes = part.duration_minutes
+        return meeting.total_duration_minutes
+
+    operations = {
+        'total_duration_minutes': lambda: meeting.total_duration_minutes,
+        'get_all_parts': meeting.get_all_parts,
+        'get_part_indices(last)': lambda: meeting.get_part_indices(last),
+        'parts_hash': meeting.parts_hash,
+        'edit + total (rebuild)': edit_then_total,
+    }
+
+    results = {'memory_bytes': measure_memory(part_count)}
+    for name, operation in operations.items():
+        results[name] = timeit.timeit(operation, number=number) / number
+    return results
+
+
+class TestMeetingModelBenchmark(unittest.TestCase):
+    """Smoke test for the benchmark and the cached part view it exercises"""
+
+    def test_benchmark_runs(self):
+        """The benchmark runs and the cached view gives correct answers"""
+        results = run_benchmark(part_count=500, number=5)
+        self.assertGreater(results['memory_bytes'], 0)
+
+        meeting = build_meeting(500)
+        self.assertEqual(meeting.part_count, 500)
+        self.assertEqual(meeting.get_part_indices(499), (9, 49))
+        self.assertEqual(meeting.total_duration_minutes,
+                         sum(part.duration_minutes for part in meeting.get_all_parts()))
+
+
+class TestPartsViewInvalidation(unittest.TestCase):
+    """Test cases for the per-meeting invalidation of the cached part view"""
+
+    def test_editing_one_meeting_keeps_the_view_of_another(self):
+        meeting_a = build_meeting(100)
+        meeting_b = build_meeting(100)
+        parts_b = meeting_b.get_all_parts()
+        view_b = meeting_b._parts_view
+        generation_b = meeting_b.generation
+
+        meeting_a.sections[0].parts[0].duration_minutes = 30
+        meeting_a.sections[1].parts.append(MeetingPart("Extra", 5))
+        meeting_a.sections.append(MeetingSection("Extra", [MeetingPart("Extra", 5)]))
+        build_meeting(10)
+
+        self.assertEqual(meeting_b.generation, generation_b)
+        self.assertIs(meeting_b._view(), view_b)
+        self.assertEqual(meeting_b.get_all_parts(), parts_b)
+        self.assertEqual(meeting_a.part_count, 102)
+
+    def test_changes_reach_their_own_meeting(self):
+        """Parts and sections added, loaded or copied report to the meeting holding them"""
+        built = build_meeting(100)
+        meetings = {'built': built, 'loaded': meeting_from_dict(meeting_to_dict(built)),
+                    'copied': copy.deepcopy(built)}
+        for name, meeting in meetings.items():
+            with self.subTest(name):
+                total = meeting.total_duration_minutes
+                meeting.sections[0].parts[0].duration_minutes += 10
+                self.assertEqual(meeting.total_duration_minutes, total + 10)
+
+                part = MeetingPart("Added", 7)
+                meeting.sections[-1].parts.insert(0, part)
+                self.assertEqual(meeting.total_duration_minutes, total + 17)
+                part.duration_minutes = 1
+                self.assertEqual(meeting.total_duration_minutes, total + 11)
+
+                section = MeetingSection("Added", [])
+                meeting.sections.append(section)
+                section.parts.append(MeetingPart("Added", 4))
+                self.assertEqual(meeting.total_duration_minutes, total + 15)
+        self.assertEqual(built.total_duration_minutes, meetings['loaded'].total_duration_minutes)
+
+
+def main():
+    part_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    results = run_benchmark(part_count, number=200)
+
+    print(f"Meeting with {part_count} parts")
+    print(f"  {'memory':<28}{results.pop('memory_bytes') / 1024:>10.1f} KB")
+    for name, seconds in results.items():
+        print(f"  {name:<28}{seconds * 1e6:>10.2f} us")
+
+
+if __name__ == '__main__':
+    main()
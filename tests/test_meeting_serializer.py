@@ -0,0 +1,160 @@
+"""
+Tests and benchmark for the versioned meeting serializer in the OnTime Meeting Timer application.
+
+Run directly to compare Meeting.to_dict/from_dict + json with the serializer:
+    python tests/test_meeting_serializer.py [meetings]
+"""
+import io
+import json
+import random
+import string
+import sys
+import time as time_module
+import unittest
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType, MeetingSource
+from src.models import meeting_serializer
+
+TEXT_ALPHABET = string.ascii_letters + string.digits + " |:\"'\\/\n\té€中文🎵"
+
+
+def random_text(rng: random.Random, max_length: int = 30) -> str:
+    return ''.join(rng.choice(TEXT_ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def random_meeting(rng: random.Random) -> Meeting:
+    """Build a meeting with random content covering every field"""
+    sections = []
+    for _ in range(rng.randint(0, 4)):
+        parts = []
+        for _ in range(rng.randint(0, 8)):
+            duration = rng.randint(0, 120)
+            parts.append(MeetingPart(
+                title=random_text(rng),
+                duration_minutes=duration,
+                presenter=random_text(rng, 10),
+                notes=random_text(rng, 50),
+                is_completed=rng.random() < 0.3,
+                original_duration_minutes=rng.choice([None, rng.randint(1, 120)])
+            ))
+        sections.append(MeetingSection(random_text(rng), parts))
+
+    return Meeting(
+        meeting_type=rng.choice(list(MeetingType)),
+        title=random_text(rng),
+        date=datetime(2020, 1, 1) + timedelta(days=rng.randint(0, 3650),
+                                              seconds=rng.randint(0, 86399)),
+        start_time=time(rng.randint(0, 23), rng.randint(0, 59)),
+        sections=sections,
+        language=rng.choice(["en", "it", "fr", "es", "de", "ja", "zh"]),
+        target_duration_minutes=rng.choice([None, rng.randint(30, 180)]),
+        source=rng.choice(list(MeetingSource))
+    )
+
+
+class TestMeetingSerializer(unittest.TestCase):
+    """Test cases for meeting_serializer"""
+
+    def test_round_trip_fuzz(self):
+        """Random meetings survive dict and text round trips unchanged"""
+        rng = random.Random(1234)
+        for _ in range(300):
+            meeting = random_meeting(rng)
+
+            data = meeting_serializer.meeting_to_dict(meeting)
+            self.assertEqual(meeting_serializer.meeting_from_dict(data), meeting)
+            self.assertEqual(meeting_serializer.loads(meeting_serializer.dumps(meeting)), meeting)
+            self.assertEqual(meeting_serializer.loads(meeting_serializer.dumps(meeting, indent=True)), meeting)
+
+            # Same layout as Meeting.to_dict plus the schema version, readable both ways
+            legacy = meeting.to_dict()
+            self.assertEqual({k: v for k, v in data.items() if k != 'schema_version'}, legacy)
+            self.assertEqual(meeting_serializer.meeting_from_dict(legacy), meeting)
+            self.assertEqual(Meeting.from_dict(data), meeting)
+
+    def test_stdlib_json_fallback(self):
+        """Text round trips work without orjson"""
+        rng = random.Random(99)
+        with patch.object(meeting_serializer, 'orjson', None):
+            for _ in range(50):
+                meeting = random_meeting(rng)
+                self.assertEqual(meeting_serializer.loads(meeting_serializer.dumps(meeting)), meeting)
+
+    def test_decoded_meeting_tracks_changes(self):
+        """Meetings built by the fast decoder still invalidate their cached part view"""
+        meeting = meeting_serializer.loads(meeting_serializer.dumps(
+            Meeting(MeetingType.MIDWEEK, "Test", datetime(2026, 1, 7), time(19, 0),
+                    [MeetingSection("Section", [MeetingPart("Part", 10)])])
+        ))
+        self.assertEqual(meeting.total_duration_minutes, 10)
+        meeting.sections[0].parts.append(MeetingPart("Another", 5))
+        self.assertEqual(meeting.total_duration_minutes, 15)
+
+    def test_schema_version(self):
+        """Newer schema versions are rejected; unknown sources fall back to scraped"""
+        data = meeting_serializer.meeting_to_dict(
+            Meeting(MeetingType.WEEKEND, "Test", datetime(2026, 1, 10), time(10, 0), [])
+        )
+        data['source'] = "unknown"
+        self.assertEqual(meeting_serializer.meeting_from_dict(data).source, MeetingSource.SCRAPED)
+
+        data['schema_version'] = meeting_serializer.SCHEMA_VERSION + 1
+        with self.assertRaises(ValueError):
+            meeting_serializer.meeting_from_dict(data)
+
+    def test_streaming_reader(self):
+        """JSON Lines exports are read back one meeting at a time, skipping bad lines"""
+        rng = random.Random(7)
+        meetings = [random_meeting(rng) for _ in range(20)]
+
+        buffer = io.StringIO()
+        self.assertEqual(meeting_serializer.write_meetings(meetings, buffer), 20)
+        buffer.write("not json\n\n")
+        buffer.seek(0)
+
+        self.assertEqual(list(meeting_serializer.iter_meetings(buffer)), meetings)
+
+
+def run_benchmark(count: int) -> dict:
+    """Time save + load of count synthetic meetings with both paths"""
+    rng = random.Random(42)
+    meetings = [random_meeting(rng) for _ in range(count)]
+    results = {}
+
+    start = time_module.perf_counter()
+    texts = [json.dumps(m.to_dict()) for m in meetings]
+    results['to_dict + json.dumps'] = time_module.perf_counter() - start
+
+    start = time_module.perf_counter()
+    for text in texts:
+        Meeting.from_dict(json.loads(text))
+    results['json.loads + from_dict'] = time_module.perf_counter() - start
+
+    start = time_module.perf_counter()
+    texts = [meeting_serializer.dumps(m) for m in meetings]
+    results['serializer.dumps'] = time_module.perf_counter() - start
+
+    start = time_module.perf_counter()
+    for text in texts:
+        meeting_serializer.loads(text)
+    results['serializer.loads'] = time_module.perf_counter() - start
+
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    backend = "orjson" if meeting_serializer.orjson is not None else "json"
+    print(f"{count} synthetic meetings (serializer backend: {backend})")
+    for name, seconds in run_benchmark(count).items():
+        print(f"  {name:<26}{seconds * 1000:>10.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
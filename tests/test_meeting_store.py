@@ -0,0 +1,129 @@
+"""
+Tests for the SQLite meeting store in the OnTime Meeting Timer application.
+"""
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, time
+
+# Add the parent directory to the path so we can import the application code
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType, MeetingSource
+from src.models.meeting_store import MeetingStore
+
+
+class TestMeetingStore(unittest.TestCase):
+    """Test cases for the MeetingStore class"""
+
+    def setUp(self):
+        """Set up a store in a temporary directory"""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.store = MeetingStore(os.path.join(self.test_dir.name, "meetings.db"))
+
+    def tearDown(self):
+        """Clean up test environment"""
+        self.store.close()
+        self.test_dir.cleanup()
+
+    def _create_meeting(self, meeting_type=MeetingType.MIDWEEK, date=datetime(2026, 1, 7),
+                        language="en", source=MeetingSource.SCRAPED, title="Meeting"):
+        """Create a small test meeting"""
+        return Meeting(
+            meeting_type=meeting_type,
+            title=title,
+            date=date,
+            start_time=time(19, 0),
+            sections=[MeetingSection("Section", [MeetingPart("Part 1", 10)])],
+            language=language,
+            source=source
+        )
+
+    def test_save_and_load(self):
+        """A saved meeting round-trips through the database"""
+        meeting = self._create_meeting()
+        self.store.save_meeting(meeting)
+
+        loaded = self.store.get_meeting(MeetingType.MIDWEEK, "2026-01-07", "en")
+        self.assertEqual(loaded.to_dict(), meeting.to_dict())
+
+    def test_save_replaces_same_meeting(self):
+        """Saving the same type, date and language again replaces the row"""
+        self.store.save_meeting(self._create_meeting(title="Old"))
+        self.store.save_meeting(self._create_meeting(title="New"))
+
+        self.assertEqual(self.store.count(), 1)
+        self.assertEqual(self.store.load_latest(MeetingType.MIDWEEK).title, "New")
+
+    def test_load_best_prefers_scraped(self):
+        """The most recent scraped meeting wins over a newer manual one"""
+        self.store.save_meeting(self._create_meeting(date=datetime(2026, 1, 7), title="Old scraped"))
+        self.store.save_meeting(self._create_meeting(date=datetime(2026, 1, 14), title="New scraped"))
+        self.store.save_meeting(self._create_meeting(date=datetime(2026, 1, 21), title="Manual",
+                                                     source=MeetingSource.MANUAL))
+        self.store.save_meeting(self._create_meeting(MeetingType.WEEKEND, title="Weekend",
+                                                     source=MeetingSource.MANUAL))
+
+        self.assertEqual(self.store.load_best(MeetingType.MIDWEEK).title, "New scraped")
+        self.assertEqual(self.store.load_best(MeetingType.WEEKEND).title, "Weekend")
+        self.assertIsNone(self.store.load_best(MeetingType.CUSTOM))
+
+    def test_prune(self):
+        """Meetings saved before the cutoff are deleted, unless kept"""
+        old = [self._create_meeting(date=datetime(2026, 1, day)) for day in (7, 14, 21)]
+        self.store._save_many(old, [1000.0] * len(old))
+        self.store.save_meeting(self._create_meeting(date=datetime(2026, 10, 14)))
+
+        removed, freed = self.store.prune(2000.0, keep={"midweek_2026-01-14_en.json"})
+        self.assertEqual(removed, 2)
+        self.assertGreater(freed, 0)
+        self.assertEqual(self.store.count(), 2)
+        self.assertIsNotNone(self.store.get_meeting(MeetingType.MIDWEEK, "2026-01-14", "en"))
+        self.assertIsNotNone(self.store.get_meeting(MeetingType.MIDWEEK, "2026-10-14", "en"))
+        self.assertEqual(self.store.prune(2000.0, keep={"midweek_2026-01-14_en.json"}), (0, 0))
+
+    def test_import_and_export_json(self):
+        """JSON meeting files are migrated once and can be exported again"""
+        json_dir = os.path.join(self.test_dir.name, "meetings")
+        os.makedirs(json_dir)
+        meeting = self._create_meeting()
+        with open(os.path.join(json_dir, "midweek_2026-01-07_en.json"), 'w', encoding='utf-8') as f:
+            json.dump(meeting.to_dict(), f, indent=2)
+        with open(os.path.join(json_dir, "broken.json"), 'w', encoding='utf-8') as f:
+            f.write("not json")
+
+        self.assertFalse(self.store.json_migrated)
+        self.assertEqual(self.store.import_json_dir(json_dir), 1)
+        self.assertTrue(self.store.json_migrated)
+
+        # Re-importing unchanged files does not replace newer database rows
+        self.store.save_meeting(self._create_meeting(title="Edited"))
+        self.assertEqual(self.store.import_json_dir(json_dir), 0)
+
+        export_dir = os.path.join(self.test_dir.name, "export")
+        self.assertEqual(self.store.export_json(export_dir), 1)
+        with open(os.path.join(export_dir, "midweek_2026-01-07_en.json"), 'r', encoding='utf-8') as f:
+            self.assertEqual(Meeting.from_dict(json.load(f)).title, "Edited")
+
+    def test_export_and_import_jsonl(self):
+        """A JSON Lines export imports into another store in batches"""
+        for day in range(1, 8):
+            self.store.save_meeting(self._create_meeting(date=datetime(2026, 1, day), title=f"Day {day}"))
+
+        export_path = os.path.join(self.test_dir.name, "meetings.jsonl")
+        self.assertEqual(self.store.export_jsonl(export_path), 7)
+
+        other = MeetingStore(os.path.join(self.test_dir.name, "other.db"))
+        try:
+            self.assertEqual(other.import_jsonl(export_path, batch_size=3), 7)
+            self.assertEqual(other.count(), 7)
+            self.assertEqual(other.load_latest(MeetingType.MIDWEEK).title, "Day 7")
+        finally:
+            other.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the template cache of the MeetingTemplate class.
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import MeetingType
+from src.models import meeting_template
+from src.models.meeting_template import MeetingTemplate, TemplateType
+from src.utils.persistence import get_persistence_service
+
+
+class TestMeetingTemplateCache(unittest.TestCase):
+    """Test cases for cached template loading"""
+
+    def setUp(self):
+        """Point the template directories at a temporary directory"""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.user_dir = Path(self.test_dir.name) / "user"
+        self.default_dir = Path(self.test_dir.name) / "default"
+        self.default_dir.mkdir()
+
+        patchers = [
+            patch.object(MeetingTemplate, 'TEMPLATES_DIR', self.user_dir),
+            patch.object(MeetingTemplate, 'DEFAULT_TEMPLATES_DIR', self.default_dir),
+            patch.object(MeetingTemplate, '_template_cache', {}),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.manager = MeetingTemplate()
+        self._write(self.default_dir / "midweek_template.json", "Default midweek", 10)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        get_persistence_service().flush()
+        self.test_dir.cleanup()
+
+    def _write(self, path, part_title, duration):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "title": "Midweek Meeting",
+                "language": "it",
+                "sections": [{"title": "Section", "parts": [
+                    {"title": part_title, "duration_minutes": duration}
+                ]}]
+            }, f)
+
+    def _create(self):
+        return self.manager.create_meeting_from_template(
+            TemplateType.MIDWEEK, datetime(2026, 1, 7), time(19, 0)
+        )
+
+    def test_meetings_are_cloned_without_rereading(self):
+        """Only the first meeting reads the template file; later meetings are independent clones"""
+        with patch.object(meeting_template.json, 'load', wraps=json.load) as load:
+            first = self._create()
+            second = self._create()
+            self.assertEqual(load.call_count, 1)
+
+        self.assertEqual(first.meeting_type, MeetingType.MIDWEEK)
+        self.assertEqual(first.language, "it")
+        self.assertEqual(first.sections[0].parts[0].title, "Default midweek")
+
+        first.sections[0].parts[0].duration_minutes = 99
+        self.assertEqual(second.sections[0].parts[0].duration_minutes, 10)
+        self.assertEqual(self._create().sections[0].parts[0].duration_minutes, 10)
+
+    def test_changed_file_is_reloaded(self):
+        """A template file is parsed again when its mtime or size changes"""
+        self._create()
+        path = self.default_dir / "midweek_template.json"
+        self._write(path, "Changed midweek", 12)
+        os.utime(path, ns=(1, 1))
+
+        self.assertEqual(self._create().sections[0].parts[0].title, "Changed midweek")
+
+    def test_user_template_overrides_default(self):
+        """A saved user template is used immediately, even before it is written"""
+        self._create()
+        template = self.manager.get_template(TemplateType.MIDWEEK)
+        template['sections'][0]['parts'][0]['title'] = "User midweek"
+        self.assertTrue(self.manager.save_template(TemplateType.MIDWEEK, template))
+
+        self.assertEqual(self._create().sections[0].parts[0].title, "User midweek")
+        get_persistence_service().flush()
+        self.assertEqual(self._create().sections[0].parts[0].title, "User midweek")
+
+    def test_get_template_returns_copy(self):
+        """Editing the returned dictionary does not change the cached template"""
+        self.manager.get_template(TemplateType.MIDWEEK)['sections'].clear()
+        self.assertEqual(len(self.manager.get_template(TemplateType.MIDWEEK)['sections']), 1)
+
+    def test_minimal_template_fallback(self):
+        """Without template files a minimal template is used"""
+        meeting = self.manager.create_meeting_from_template(
+            TemplateType.WEEKEND, datetime(2026, 1, 10), time(10, 0)
+        )
+        self.assertEqual(meeting.title, "Weekend Meeting")
+        self.assertEqual(len(meeting.sections), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
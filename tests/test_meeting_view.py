@@ -0,0 +1,132 @@
+"""
+Tests for the incremental meeting parts model in the OnTime Meeting Timer application.
+"""
+import unittest
+from datetime import datetime, time
+
+# Add the parent directory to the path so we can import the application code
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.views.meeting_view import MeetingPartsModel
+
+
+class TestMeetingPartsModel(unittest.TestCase):
+    """Test cases for MeetingPartsModel"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a QApplication instance if one doesn't exist"""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set up a model with a two-section meeting"""
+        self.meeting = Meeting(
+            meeting_type=MeetingType.MIDWEEK,
+            title="Test Meeting",
+            date=datetime(2026, 1, 7),
+            start_time=time(19, 0),
+            sections=[
+                MeetingSection("Section 1", [MeetingPart("Part 1", 10), MeetingPart("Part 2", 15)]),
+                MeetingSection("Section 2", [MeetingPart("Part 3", 5), MeetingPart("Part 4", 20)]),
+            ]
+        )
+        self.model = MeetingPartsModel()
+        self.model.set_meeting(self.meeting)
+
+        # Track changed rows as (section or None, row)
+        self.changed = []
+        self.resets = 0
+        self.model.dataChanged.connect(self._on_data_changed)
+        self.model.modelReset.connect(self._on_reset)
+
+    def _on_data_changed(self, top_left, bottom_right, roles=None):
+        parent = top_left.parent()
+        self.changed.append((parent.row() if parent.isValid() else None, top_left.row()))
+
+    def _on_reset(self):
+        self.resets += 1
+
+    def test_structure_and_lookup(self):
+        """Sections are top-level rows and parts are addressed by global index"""
+        self.assertEqual(self.model.rowCount(), 2)
+        section = self.model.index(1, 0)
+        self.assertEqual(self.model.rowCount(section), 2)
+        self.assertEqual(section.data(), "Section 2")
+        self.assertEqual(self.model.index(1, 1).data(), "25 min")
+
+        index = self.model.part_index(2)
+        self.assertEqual(index.data(), "Part 3")
+        self.assertEqual(index.parent().row(), 1)
+        self.assertEqual(index.data(MeetingPartsModel.ITEM_ROLE), ("part", 2))
+        self.assertEqual(self.model.part_location(3), (1, 1))
+        self.assertEqual(self.model.global_part_index(1, 1), 3)
+
+    def test_highlight_only_touches_two_rows(self):
+        """Moving the highlight repaints the previous and the new current part"""
+        self.model.set_current_part(1)
+        self.changed.clear()
+
+        self.model.set_current_part(2)
+
+        self.assertCountEqual(self.changed, [(0, 1), (1, 0)])
+        self.assertEqual(self.model.part_index(2, 2).data(), "Current")
+        self.assertEqual(self.model.part_index(1, 2).data(), "Pending")
+        self.assertEqual(self.resets, 0)
+
+    def test_completion(self):
+        """Completing a part repaints just that row"""
+        self.model.set_part_completed(0)
+        self.assertEqual(self.changed, [(0, 0)])
+        self.assertEqual(self.model.part_index(0, 2).data(), "Completed")
+
+    def test_redistribution_repaints_changed_rows_and_section_totals(self):
+        """Re-setting the same meeting only repaints rows whose values changed"""
+        part = self.meeting.sections[1].parts[1]
+        part.original_duration_minutes = part.duration_minutes
+        part.duration_minutes = 12
+
+        self.model.set_meeting(self.meeting)
+
+        self.assertEqual(self.resets, 0)
+        self.assertEqual(self.changed, [(1, 1), (None, 1)])
+        self.assertEqual(self.model.part_index(3, 1).data(), "12 min (was 20)")
+        self.assertIsNotNone(self.model.part_index(3, 1).data(Qt.ItemDataRole.ToolTipRole))
+
+    def test_structure_change_resets(self):
+        """Adding a part rebuilds the model"""
+        self.meeting.sections[0].parts.append(MeetingPart("Part 5", 3))
+        self.model.set_meeting(self.meeting)
+
+        self.assertEqual(self.resets, 1)
+        self.assertEqual(self.model.part_index(2).data(), "Part 5")
+        self.assertEqual(self.model.part_location(4), (1, 1))
+
+    def test_structure_change_keeps_progress_on_the_same_parts(self):
+        """Current and completed markers follow their parts to the new global indices"""
+        self.model.set_part_completed(0)
+        self.model.set_part_completed(2)
+        self.model.set_current_part(3)
+
+        removed = self.meeting.sections[0].parts.pop(0)
+        self.meeting.sections[1].parts.insert(0, MeetingPart("Part 5", 3))
+        self.model.set_meeting(self.meeting)
+
+        self.assertEqual(self.resets, 1)
+        statuses = [self.model.part_index(index, 2).data() for index in range(4)]
+        self.assertEqual(statuses, ["Pending", "Pending", "Completed", "Current"])
+
+        # A part coming back after removal is a new part as far as progress goes
+        self.meeting.sections[0].parts.insert(0, removed)
+        self.model.set_meeting(self.meeting)
+        self.assertEqual(self.model.part_index(0, 2).data(), "Pending")
+        self.assertEqual(self.model.part_index(4, 2).data(), "Current")
+
+
+if __name__ == '__main__':
+    unittest.main()
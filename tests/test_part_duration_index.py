@@ -0,0 +1,177 @@
+"""
+Tests and benchmark for the single-pass part duration index used by MeetingScraper.
+
+The index must give the same answers as the original four-scan search, which is
+kept here as the reference. Run directly to time both on the saved pages in
+tests/mock_data and on a larger synthetic page:
+    python tests/test_part_duration_index.py [repeat]
+"""
+import random
+import re
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from src.utils.scraper import MeetingScraper, PartDurationIndex
+
+MOCK_DIR = Path(__file__).parent / "mock_data"
+PART_NUMBERS = range(0, 16)
+
+
+def reference_find_duration(scraper, part_num, soup):
+    """The original MeetingScraper._find_duration_for_part (one to four scans per part)"""
+    for h3 in soup.find_all(['h3']):
+        h3_text = h3.get_text().strip()
+        part_match = re.match(r'(\d+)\.\s+(.*)', h3_text)
+        if part_match and int(part_match.group(1)) == part_num:
+            next_p = h3.find_next('p')
+            if next_p:
+                duration = scraper._extract_duration(next_p.get_text().strip())
+                if duration:
+                    return duration
+            duration = scraper._extract_duration(h3_text)
+            if duration:
+                return duration
+
+    for strong in soup.find_all('strong'):
+        strong_text = strong.get_text().strip()
+        part_match = re.match(r'(\d+)\.\s+(.*)', strong_text)
+        if part_match and int(part_match.group(1)) == part_num:
+            parent = strong.parent
+            if parent:
+                duration = scraper._extract_duration(parent.get_text().strip())
+                if duration:
+                    return duration
+                next_elem = parent.find_next_sibling()
+                if next_elem:
+                    duration = scraper._extract_duration(next_elem.get_text().strip())
+                    if duration:
+                        return duration
+
+    part_pattern = re.compile(rf'^{part_num}\.\s')
+    for elem in soup.find_all(['p', 'span', 'strong', 'h3']):
+        elem_text = elem.get_text().strip()
+        if part_pattern.match(elem_text):
+            duration = scraper._extract_duration(elem_text)
+            if duration:
+                return duration
+            next_elem = elem.find_next()
+            if next_elem:
+                duration = scraper._extract_duration(next_elem.get_text().strip())
+                if duration:
+                    return duration
+
+    for elem in soup.find_all():
+        text = elem.get_text().strip()
+        if f"{part_num}." in text:
+            duration = scraper._extract_duration(text)
+            if duration:
+                return duration
+            next_elem = elem.find_next()
+            if next_elem:
+                duration = scraper._extract_duration(next_elem.get_text().strip())
+                if duration:
+                    return duration
+    return None
+
+
+def synthetic_page(rng: random.Random, parts: int = 60, noise: int = 400) -> str:
+    """A large workbook-like page: numbered parts in varied markup among nested noise"""
+    chunks = ["<html><head><script>var x = '3. 7. (9 min.)';</script></head><body>"]
+    for number in range(1, parts + 1):
+        minutes = rng.randint(1, 30)
+        style = rng.randrange(6)
+        if style == 0:
+            chunks.append(f"<h3><strong>{number}. Part</strong></h3><div><p>({minutes} min.)</p></div>")
+        elif style == 1:
+            chunks.append(f"<h3>{number}. Part ({minutes} min.)</h3>")
+        elif style == 2:
+            chunks.append(f"<p><strong>{number}. Part</strong> ({minutes} min.) text</p>")
+        elif style == 3:
+            chunks.append(f"<div><span>{number}. Part</span><span>{minutes} minute</span></div>")
+        elif style == 4:
+            chunks.append(f"<div><em>see {number}. below</em><b>({minutes})</b></div>")
+        else:
+            chunks.append(f"<h3>{number}. Part without time</h3>")
+        for _ in range(rng.randint(0, noise // parts)):
+            depth = rng.randint(1, 6)
+            chunks.append("<div>" * depth + f"Verse {rng.randint(1, 99)}:{rng.randint(1, 40)}" + "</div>" * depth)
+    chunks.append("</body></html>")
+    return "".join(chunks)
+
+
+def fixture_pages():
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(MOCK_DIR.glob("*.html"))}
+
+
+class TestPartDurationIndex(unittest.TestCase):
+    """The index answers exactly like the original search"""
+
+    def setUp(self):
+        self.scraper = MeetingScraper()
+
+    def assert_same_answers(self, name, html):
+        soup = BeautifulSoup(html, "html.parser")
+        index = PartDurationIndex(soup, self.scraper._extract_duration)
+        for part_num in PART_NUMBERS:
+            with self.subTest(page=name, part=part_num):
+                self.assertEqual(index.duration_for(part_num),
+                                 reference_find_duration(self.scraper, part_num, soup))
+
+    def test_fixture_pages(self):
+        for name, html in fixture_pages().items():
+            self.assert_same_answers(name, html)
+
+    def test_workbook_page(self):
+        """Answers on the saved workbook page, quirks of the original search included"""
+        soup = BeautifulSoup((MOCK_DIR / "wol_midweek.html").read_text(encoding="utf-8"), "html.parser")
+        self.assertEqual(
+            [self.scraper._find_duration_for_part(n, soup) for n in range(1, 10)],
+            [10, 10, 3, 3, 4, 5, 1, 30, 45]
+        )
+
+    def test_synthetic_pages(self):
+        rng = random.Random(41)
+        for seed in range(5):
+            self.assert_same_answers(f"synthetic-{seed}", synthetic_page(rng, parts=15, noise=60))
+
+
+def run_benchmark(repeat: int = 3):
+    """Seconds to resolve PART_NUMBERS on each page, original search vs index"""
+    scraper = MeetingScraper()
+    pages = fixture_pages()
+    pages["synthetic (60 parts)"] = synthetic_page(random.Random(1))
+    results = {}
+    for name, html in pages.items():
+        soup = BeautifulSoup(html, "html.parser")
+        start = time.perf_counter()
+        for _ in range(repeat):
+            expected = [reference_find_duration(scraper, n, soup) for n in PART_NUMBERS]
+        reference_seconds = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            index = PartDurationIndex(soup, scraper._extract_duration)
+            actual = [index.duration_for(n) for n in PART_NUMBERS]
+        index_seconds = (time.perf_counter() - start) / repeat
+        results[name] = (reference_seconds, index_seconds, actual == expected)
+    return results
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    print(f"Durations of parts {PART_NUMBERS.start}-{PART_NUMBERS.stop - 1} per page (mean of {repeat} runs)")
+    print(f"  {'page':<24}{'original':>12}{'index':>12}{'speedup':>10}  same")
+    for name, (reference, index, same) in run_benchmark(repeat).items():
+        print(f"  {name:<24}{reference * 1000:>10.1f}ms{index * 1000:>10.1f}ms"
+              f"{reference / index:>9.1f}x  {'yes' if same else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
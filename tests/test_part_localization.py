@@ -0,0 +1,60 @@
+"""
+Tests for the localization of scraped part title markers.
+"""
+import sys
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.part_localization import get_part_translations, localize_part_title
+
+
+class TestPartLocalization(unittest.TestCase):
+    """Test cases for localize_part_title"""
+
+    def test_song_markers(self):
+        """Song markers with and without numbers in each supported format"""
+        cases = {
+            "OPENING_SONG_PRAYER|99": "Song 99 and Prayer",
+            "OPENING_SONG_PRAYER": "Opening Song and Prayer",
+            "MIDDLE_SONG|12": "Song 12",
+            "MIDDLE_SONG 12": "Song 12",
+            "MIDDLE_SONG": "Song",
+            "CLOSING_SONG_PRAYER|100": "Song 100 and Prayer",
+            "CLOSING_SONG_PRAYER |100": "Song 100 and Prayer",
+            "CLOSING_SONG_PRAYER [100": "Song 100 and Prayer",
+            "CLOSING_SONG_PRAYER": "Closing Song and Prayer",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(localize_part_title("en", raw), expected)
+
+    def test_comment_markers(self):
+        """Comment markers only match the whole title"""
+        self.assertEqual(localize_part_title("it", "OPENING_COMMENTS"), "Commenti introduttivi")
+        self.assertEqual(localize_part_title("de", "CONCLUDING_COMMENTS"), "Schlussworte")
+        self.assertEqual(localize_part_title("en", "OPENING_COMMENTS extra"), "OPENING_COMMENTS extra")
+
+    def test_other_titles_unchanged(self):
+        """Regular titles and already localized titles pass through"""
+        for title in ("Bible Reading", "Song 99 and Prayer", "", "song|5"):
+            self.assertEqual(localize_part_title("en", title), title)
+
+    def test_languages(self):
+        """Each language uses its own text; unknown languages fall back to English"""
+        self.assertEqual(localize_part_title("fr", "MIDDLE_SONG|7"), "Cantique 7")
+        self.assertEqual(localize_part_title("ja", "OPENING_SONG_PRAYER|1"), "歌 1 と祈り")
+        self.assertEqual(localize_part_title("xx", "MIDDLE_SONG|7"), "Song 7")
+        self.assertEqual(get_part_translations("xx")["co_talk"], "Circuit Overseer Talk")
+        self.assertEqual(get_part_translations("es")["service_talk"], "Discurso de servicio")
+
+    def test_translations_are_read_only(self):
+        """The shared translation tables cannot be modified through the lookup"""
+        with self.assertRaises(TypeError):
+            get_part_translations("en")["song"] = "Hymn"
+
+
+if __name__ == '__main__':
+    unittest.main()
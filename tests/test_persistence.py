@@ -0,0 +1,78 @@
+"""
+Tests for the write-behind persistence service in the OnTime Meeting Timer application.
+"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.persistence import PersistenceService, FsyncPolicy
+
+
+class TestPersistenceService(unittest.TestCase):
+    """Test cases for debounced, atomic JSON writes"""
+
+    def setUp(self):
+        """Set up a service with a long delay so writes only happen on flush"""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.file_path = Path(self.test_dir.name) / "data.json"
+        self.service = PersistenceService(delay=60, fsync_policy=FsyncPolicy.NONE)
+
+    def tearDown(self):
+        """Clean up test environment"""
+        self.service.flush()
+        self.test_dir.cleanup()
+
+    def test_write_is_deferred_until_flush(self):
+        """Saves are queued and only reach disk when due or flushed"""
+        self.service.save_json(self.file_path, {"value": 1})
+        self.assertTrue(self.service.has_pending(self.file_path))
+        self.assertFalse(self.file_path.exists())
+
+        self.assertTrue(self.service.flush(self.file_path))
+        self.assertFalse(self.service.has_pending(self.file_path))
+        self.assertEqual(json.loads(self.file_path.read_text(encoding='utf-8')), {"value": 1})
+
+    def test_rapid_saves_collapse_into_one_write(self):
+        """Only the last of several queued saves is written"""
+        with patch.object(self.service, '_write_atomic', wraps=self.service._write_atomic) as write:
+            for value in range(10):
+                self.service.save_json(self.file_path, {"value": value})
+            self.service.flush()
+
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(json.loads(self.file_path.read_text(encoding='utf-8')), {"value": 9})
+
+    def test_data_is_serialized_at_save_time(self):
+        """Mutating the data after saving does not change what is written"""
+        data = {"items": [1]}
+        self.service.save_json(self.file_path, data)
+        data["items"].append(2)
+        self.service.flush()
+
+        self.assertEqual(json.loads(self.file_path.read_text(encoding='utf-8')), {"items": [1]})
+
+    def test_atomic_replace_leaves_no_temp_file(self):
+        """The previous file is replaced and no temp file is left behind"""
+        self.file_path.write_text('{"old": true}', encoding='utf-8')
+        self.service.fsync_policy = FsyncPolicy.FULL
+        self.service.save_json(self.file_path, {"old": False}, indent=2)
+        self.service.flush()
+
+        self.assertEqual(json.loads(self.file_path.read_text(encoding='utf-8')), {"old": False})
+        self.assertEqual([p.name for p in Path(self.test_dir.name).iterdir()], ["data.json"])
+
+    def test_unserializable_data_raises_immediately(self):
+        """Serialization errors surface to the caller instead of the writer thread"""
+        with self.assertRaises(TypeError):
+            self.service.save_json(self.file_path, {"value": object()})
+        self.assertFalse(self.service.has_pending(self.file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for the opt-in timer hot path tracer.
+"""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.profiling import Histogram, Tracer, TICK_HANDLER
+
+
+class _FakeQTimer:
+    """Stand-in for the QTimer driving Timer._update_timer"""
+
+    def __init__(self, interval=100):
+        self._interval = interval
+
+    def isActive(self):
+        return True
+
+    def interval(self):
+        return self._interval
+
+
+class Timer:
+    """Class named like the real timer so its tick method is traced as the tick handler"""
+
+    def __init__(self):
+        self._timer = _FakeQTimer()
+        self.calls = 0
+
+    def _update_timer(self):
+        self.calls += 1
+
+    def plain(self, value):
+        return value * 2
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for the log-scale histogram"""
+
+    def test_percentiles(self):
+        histogram = Histogram()
+        for value in [10] * 90 + [1000] * 9 + [50000]:
+            histogram.add(value)
+        stats = histogram.to_dict()
+        self.assertEqual(stats['count'], 100)
+        self.assertEqual(stats['p50_us'], 16)
+        self.assertEqual(stats['p95_us'], 1024)
+        self.assertEqual(stats['max_us'], 50000)
+        self.assertEqual(sum(stats['buckets_us'].values()) + stats['overflow'], 100)
+
+
+class TestTracer(unittest.TestCase):
+    """Test cases for Tracer"""
+
+    def setUp(self):
+        self.tracer = Tracer()
+        self.addCleanup(self.tracer.disable)
+
+    def test_disabled_leaves_class_untouched(self):
+        """Nothing is wrapped until the tracer is enabled"""
+        original = Timer.__dict__['plain']
+        self.tracer.enable(targets=())
+        self.assertIs(Timer.__dict__['plain'], original)
+
+    def test_instrument_and_restore(self):
+        """Wrapped handlers are timed, keep their result and are restored on disable"""
+        original = Timer.__dict__['plain']
+        self.tracer.instrument(Timer, 'plain')
+        self.assertIsNot(Timer.__dict__['plain'], original)
+        self.assertEqual(Timer().plain(4), 8)
+        self.assertEqual(self.tracer.handlers['Timer.plain'].count, 1)
+
+        self.tracer.disable()
+        self.assertIs(Timer.__dict__['plain'], original)
+
+    def test_late_and_dropped_ticks(self):
+        """Gaps longer than 1.5 intervals count as late, with the missed ticks dropped"""
+        self.tracer.instrument(Timer, '_update_timer')
+        timer = Timer()
+        for now in (0.0, 0.1, 0.2, 0.55, 0.65):
+            self.tracer._record_tick(timer, now)
+        self.assertEqual(self.tracer.ticks, 5)
+        self.assertEqual(self.tracer.late_ticks, 1)
+        self.assertEqual(self.tracer.dropped_ticks, 3)
+
+        timer._update_timer()
+        self.assertEqual(timer.calls, 1)
+        self.assertEqual(self.tracer.handlers[TICK_HANDLER].count, 1)
+
+    def test_dump_formats(self):
+        """The summary and Chrome trace dumps are valid JSON"""
+        self.tracer.record('Handler.run', 1.0, 1.002)
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = json.loads(self.tracer.dump(Path(tmp) / 's.json', 'json').read_text())
+            self.assertEqual(summary['handlers']['Handler.run']['count'], 1)
+
+            trace = json.loads(self.tracer.dump(Path(tmp) / 't.json', 'chrome').read_text())
+            event = trace['traceEvents'][0]
+            self.assertEqual((event['name'], event['ph']), ('Handler.run', 'X'))
+            self.assertAlmostEqual(event['dur'], 2000, delta=1)
+
+            with self.assertRaises(ValueError):
+                self.tracer.dump(Path(tmp) / 'x.json', 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
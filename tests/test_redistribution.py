@@ -0,0 +1,117 @@
+"""
+Tests for the duration redistribution solver.
+"""
+import random
+import sys
+import unittest
+from datetime import datetime, time
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.models.redistribution import apportion, plan_redistribution
+from src.models.transition_rules import TransitionPlan
+
+
+class TestApportion(unittest.TestCase):
+    """Test cases for the largest remainder apportionment"""
+
+    def test_largest_remainder(self):
+        """Leftover units go to the largest fractional remainders, not the last item"""
+        # Exact shares: 3.33.., 3.33.., 3.33.. -> one leftover unit to the first
+        self.assertEqual(apportion([1, 1, 1], 10, [0, 0, 0], [None, None, None]), [4, 3, 3])
+        # Shares 2.6, 5.2, 2.2 -> floors 2, 5, 2 and the leftover goes to 2.6
+        self.assertEqual(apportion([26, 52, 22], 10, [0, 0, 0], [None, None, None]), [3, 5, 2])
+
+    def test_bounds(self):
+        """Items outside their bounds are fixed and the rest re-shared"""
+        self.assertEqual(apportion([1, 1, 8], 10, [3, 1, 1], [None, None, None]), [3, 1, 6])
+        self.assertEqual(apportion([1, 1, 8], 20, [1, 1, 1], [None, None, 10]), [5, 5, 10])
+        with self.assertRaises(ValueError):
+            apportion([1, 1], 1, [1, 1], [None, None])
+        with self.assertRaises(ValueError):
+            apportion([1, 1], 10, [1, 1], [4, 4])
+
+    def test_random_totals_and_bounds(self):
+        """Results always sum to the total and stay within bounds"""
+        rng = random.Random(5)
+        for _ in range(500):
+            count = rng.randint(1, 12)
+            weights = [rng.choice([0, rng.random() * 30]) for _ in range(count)]
+            minimums = [rng.randint(0, 3) for _ in range(count)]
+            maximums = [rng.choice([None, m + rng.randint(0, 20)]) for m in minimums]
+            low = sum(minimums)
+            high = sum(m for m in maximums if m is not None) if None not in maximums else low + 100
+            total = rng.randint(low, high)
+
+            result = apportion(weights, total, minimums, maximums)
+            self.assertEqual(sum(result), total)
+            for value, minimum, maximum in zip(result, minimums, maximums):
+                self.assertGreaterEqual(value, minimum)
+                if maximum is not None:
+                    self.assertLessEqual(value, maximum)
+
+
+class TestPlanRedistribution(unittest.TestCase):
+    """Test cases for plan_redistribution"""
+
+    def setUp(self):
+        self.meeting = Meeting(
+            meeting_type=MeetingType.MIDWEEK,
+            title="Meeting",
+            date=datetime(2026, 1, 7),
+            start_time=time(19, 0),
+            sections=[
+                MeetingSection("A", [MeetingPart("A1", 10), MeetingPart("A2", 10)]),
+                MeetingSection("B", [MeetingPart("B1", 20), MeetingPart("B2", 5), MeetingPart("B3", 5)]),
+            ]
+        )
+        self.parts = self.meeting.get_all_parts()
+        # Midweek rules: transitions after A2 and B1 only
+        self.transitions = TransitionPlan(MeetingType.MIDWEEK, self.parts)
+
+    def _plan(self, minutes_available, from_index=1, **kwargs):
+        return plan_redistribution(
+            self.parts, self.transitions.between,
+            current_index=0, current_elapsed=300, current_remaining=300,
+            from_index=from_index, seconds_available=minutes_available * 60, **kwargs
+        )
+
+    def test_plan_fits_target(self):
+        """Planned parts fill the time left after the running part and transitions"""
+        # 5 min left of the running part + 2 transitions = 7 fixed minutes
+        result = self._plan(7 + 20)
+        self.assertTrue(result['success'])
+        new_minutes = [new for _, _, new in result['adjusted_parts']]
+        self.assertEqual(sum(new_minutes), 20)
+        self.assertEqual(new_minutes, [5, 10, 3, 2])
+        self.assertEqual(result['planned_seconds'], 27 * 60)
+        # Dry run: nothing changed
+        self.assertEqual(self.parts[1].duration_minutes, 10)
+
+    def test_locked_and_max(self):
+        """Locked parts keep their duration and maximums cap the others"""
+        result = self._plan(7 + 40, locked={2}, max_minutes={3: 6})
+        adjusted = {idx: new for idx, _, new in result['adjusted_parts']}
+        self.assertNotIn(2, adjusted)
+        self.assertEqual(sum(adjusted.values()), 20)
+        self.assertLessEqual(adjusted[3], 6)
+
+    def test_current_part_included(self):
+        """The running part keeps at least its elapsed time"""
+        result = self._plan(8, from_index=0)
+        self.assertTrue(result['success'])
+        adjusted = {idx: new for idx, _, new in result['adjusted_parts']}
+        self.assertGreaterEqual(adjusted[0], 6)
+
+    def test_not_enough_time(self):
+        """Too little time is reported instead of producing zero-minute parts"""
+        result = self._plan(7 + 2)
+        self.assertFalse(result['success'])
+        self.assertIn('Not enough time', result['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests for the planned meeting schedule used for what-if queries.
+"""
+import sys
+import unittest
+from datetime import datetime, time
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.models.schedule import MeetingSchedule
+
+
+def build_midweek() -> Meeting:
+    """Midweek meeting shaped like the scraped ones (opening, talks, CBS, review, closing)"""
+    return Meeting(
+        meeting_type=MeetingType.MIDWEEK,
+        title="Midweek",
+        date=datetime(2026, 1, 7),
+        start_time=time(19, 0),
+        sections=[
+            MeetingSection("Treasures", [MeetingPart("Opening Song and Prayer", 5),
+                                         MeetingPart("Talk", 10)]),
+            MeetingSection("Ministry", [MeetingPart("Demonstration", 4)]),
+            MeetingSection("Living", [MeetingPart("Congregation Bible Study", 30),
+                                      MeetingPart("Review", 3),
+                                      MeetingPart("Closing Song and Prayer", 5)]),
+            MeetingSection("Empty", []),
+        ]
+    )
+
+
+class TestMeetingSchedule(unittest.TestCase):
+    """Test cases for MeetingSchedule"""
+
+    def setUp(self):
+        self.meeting = build_midweek()
+        self.parts = self.meeting.get_all_parts()
+        self.schedule = MeetingSchedule(MeetingType.MIDWEEK, self.parts,
+                                        self.meeting.section_indices, len(self.meeting.sections))
+
+    def test_offsets(self):
+        """Start and end offsets include the transitions before each part"""
+        self.assertEqual(self.schedule.start_offset(0), 0)
+        self.assertEqual(self.schedule.start_offset(2), (5 + 10 + 1) * 60)
+        self.assertEqual(self.schedule.end_offset(3), (5 + 10 + 1 + 4 + 1 + 30) * 60)
+        self.assertEqual(self.schedule.total_seconds, (57 + 2) * 60)
+        self.assertEqual(self.schedule.durations_between(1, 4), 44 * 60)
+        self.assertEqual(self.schedule.section_end_offset(1), (5 + 10 + 1 + 4) * 60)
+        self.assertIsNone(self.schedule.section_end_offset(3))
+
+    def test_what_if_queries(self):
+        """Overrun, latest start and slack queries against the prefix sums"""
+        # Running the talk (part 1) with 4 minutes left
+        remaining = self.schedule.remaining_seconds(1, 240)
+        self.assertEqual(remaining, 240 + (1 + 4 + 1 + 30 + 3 + 5) * 60)
+        self.assertEqual(self.schedule.predicted_ends(1, 240, [(3, 120), (0, 120)]),
+                         [remaining + 120, remaining])
+
+        # To end 60 minutes after the start, the CBS must start by minute 60 - 38
+        self.assertEqual(self.schedule.latest_start(3, 60 * 60), (60 - 38) * 60)
+
+        # 7 minutes in with 4 left of the talk that should end at minute 15: 4 minutes ahead
+        slack = self.schedule.section_slack(1, 7 * 60, 240)
+        self.assertEqual(slack, [240, 240, 240, None])
+        slack = self.schedule.section_slack(3, 30 * 60, 0)
+        self.assertEqual(slack, [None, None, (51 - 30) * 60, None])
+
+    def test_section_slack_is_steady_on_time(self):
+        """On plan, the slack stays constant between timer ticks"""
+        end = self.schedule.end_offset(1)
+        for step in range(0, 600):
+            now_offset = 5 * 60 + step / 10
+            with self.subTest(now_offset=now_offset):
+                # Remaining time from the float deadline, and as the whole seconds the timer shows
+                self.assertEqual(self.schedule.section_slack(1, now_offset, end - now_offset), [0, 0, 0, None])
+                self.assertEqual(self.schedule.section_slack(1, now_offset, int(end - now_offset), 0),
+                                 [0, 0, 0, None])
+
+    def test_section_slack_changes_once_per_minute(self):
+        """In overtime the slack falls one minute at a time, without flickering at the boundary"""
+        end = self.schedule.end_offset(1)
+        previous = None
+        values = []
+        for step in range(0, 3000):
+            # Overrunning, with +-5 s jitter in the measurement
+            now_offset = end + step / 10 + (5 if step % 2 else -5)
+            previous = self.schedule.section_slack(1, now_offset, 0, previous)[0]
+            if not values or values[-1] != previous:
+                values.append(previous)
+        self.assertEqual(values, [0, -60, -120, -180, -240])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests and benchmark for the compiled scraper pattern registry.
+
+Run directly to compare the inline re.search calls the scrapers used to make
+with the registry, for every supported language:
+    python tests/test_scraper_patterns.py [repeat]
+"""
+import random
+import re
+import sys
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.epub_scraper import EPUBMeetingScraper
+from src.utils.scraper_patterns import (
+    SUPPORTED_LANGUAGES, get_patterns, get_pattern_stats, reset_pattern_stats
+)
+
+# The grammars as they were written inline in the scrapers
+INLINE_DURATION = [
+    r'\((\d+)\s*min\.?\)',
+    r'(?<!\()(\d+)\s*min\.?(?!\))',
+    r'(\d+)(?:\s*|-)\s*minute',
+    r'(\d+)\s*(?:min|m)(?:\.|,|\s|$)',
+    r'\((\d+)\)',
+]
+INLINE_SONG = [
+    r'(?:Song|SONG|Cantico|CANTICO|Cantique|CANTIQUE|Canción|CANCIÓN|Lied|LIED)\s+(\d{1,3})',
+    r'(\d{1,3})\s*(?:Song|SONG|Cantico|CANTICO|Cantique|CANTIQUE|Canción|CANCIÓN|Lied|LIED)',
+]
+INLINE_WEB_SONG = r'[Ss][Oo][Nn][Gg]\s+(\d+)'  # MeetingScraper, case-sensitive
+
+SAMPLE_TEXTS = {
+    "en": ["1. “Call Out at the Top of Your Throat” (10 min.)", "Song 80 and Prayer | Opening Comments (1 min.)",
+           "Use a tract. 5 minute talk", "Discuss the needs of the congregation with the audience."],
+    "it": ["1. “Grida a squarciagola” (10 min)", "Cantico 80 e preghiera | Commenti introduttivi (1 min)",
+           "Discorso di 5 minuti", "Considerate i bisogni della congregazione."],
+    "fr": ["1. « Crie à pleine gorge » (10 min)", "Cantique 80 et prière | Paroles d’introduction (1 min)",
+           "Exposé (5 min)", "Examinez les besoins de l’assemblée."],
+    "es": ["1. “Grita a todo pulmón” (10 mins.)", "Canción 80 y oración | Palabras de introducción (1 min.)",
+           "Discurso de 5 minutos", "Analice las necesidades de la congregación."],
+    "de": ["1. „Ruf aus vollem Hals“ (10 Min.)", "Lied 80 und Gebet | Einleitende Worte (1 Min.)",
+           "Ansprache (5 Min.)", "Besprecht die Bedürfnisse der Versammlung."],
+    "pt": ["1. “Grite a plenos pulmões” (10 min)", "Cântico 80 e oração | Comentários iniciais (1 min)",
+           "Discurso de 5 minutos", "Analise as necessidades da congregação."],
+    "ja": ["1. 「声を限りに叫べ」(10分)", "歌 80 と祈り | 開会の言葉(1分)", "話(5分)", "会衆の必要を話し合う。"],
+    "ko": ["1. “목청껏 외쳐라” (10분)", "노래 80번과 기도 | 소개말 (1분)", "연설 (5분)", "회중의 필요를 토의한다."],
+    "zh": ["1. “要放声呼喊”(10分钟)", "唱诗80首和祷告 | 开场白(1分钟)", "演讲(5分钟)", "讨论会众的需要。"],
+}
+
+
+def inline_search(patterns, text, accept=lambda value: True):
+    """First accepted capture, trying each pattern's leftmost match in order (the old code)"""
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match and accept(int(match.group(1))):
+            return int(match.group(1))
+    return None
+
+
+class TestScraperPatterns(unittest.TestCase):
+    """Test cases for the pattern registry"""
+
+    def test_supported_languages(self):
+        """Every EPUB language has grammars, shared between lookups"""
+        self.assertEqual(set(SUPPORTED_LANGUAGES), set(EPUBMeetingScraper.LANG_CODES))
+        for language in SUPPORTED_LANGUAGES:
+            self.assertIs(get_patterns(language), get_patterns(language))
+
+    def test_english_matches_inline_grammar(self):
+        """English answers are those of the old inline patterns"""
+        patterns = get_patterns("en")
+        rng = random.Random(42)
+        alphabet = "0123456789 ()min.ute,-MSongLIEDcantico"
+        for _ in range(5000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            self.assertEqual(patterns.find_duration(text), inline_search(INLINE_DURATION, text), text)
+            self.assertEqual(patterns.find_song(text),
+                             inline_search(INLINE_SONG, text, lambda n: 1 <= n <= 200), text)
+
+    def test_web_song_matches_inline_grammar(self):
+        """MeetingScraper song numbers are those of its old inline pattern"""
+        patterns = get_patterns("en")
+        rng = random.Random(42)
+        alphabet = "0123456789 \tsongSONGLied|Read"
+        texts = ["Lied 12 | Song 80", "Read 3 Songs", "Song 1234", "Song 250", "sOnG\t7"]
+        texts += [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(5000)]
+        for text in texts:
+            match = re.search(INLINE_WEB_SONG, text)
+            self.assertEqual(patterns.find_web_song(text), int(match.group(1)) if match else None, text)
+
+    def test_language_samples(self):
+        """Durations and songs are found in every supported language"""
+        for language, texts in SAMPLE_TEXTS.items():
+            patterns = get_patterns(language)
+            with self.subTest(language=language):
+                self.assertEqual(patterns.find_duration(texts[0]), 10)
+                self.assertEqual(patterns.find_song(texts[1]), 80)
+                self.assertEqual(patterns.find_duration(texts[2]), 5)
+                self.assertIsNone(patterns.find_duration(texts[3]))
+
+    def test_stats(self):
+        reset_pattern_stats()
+        patterns = get_patterns("fr")
+        patterns.find_duration("(4 min)")
+        patterns.find_duration("pas de durée")
+        patterns.find_song("Cantique 12")
+        stats = get_pattern_stats()["fr"]
+        self.assertEqual(stats["duration"], {"hits": 1, "misses": 1})
+        self.assertEqual(stats["song"], {"hits": 1, "misses": 0})
+
+
+def run_benchmark(repeat: int = 2000):
+    """Seconds per language: inline re.search calls vs the registry"""
+    results = {}
+    for language in SUPPORTED_LANGUAGES:
+        texts = SAMPLE_TEXTS[language]
+        patterns = get_patterns(language)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                inline_search(INLINE_DURATION, text)
+                inline_search(INLINE_SONG, text, lambda n: 1 <= n <= 200)
+        inline_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in texts:
+                patterns.find_duration(text)
+                patterns.find_song(text)
+        registry_seconds = time.perf_counter() - start
+        results[language] = (inline_seconds, registry_seconds)
+    return results
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"Duration and song lookups on sample texts ({repeat} rounds)")
+    print(f"  {'language':<10}{'inline':>10}{'registry':>12}{'speedup':>10}")
+    for language, (inline, registry) in run_benchmark(repeat).items():
+        print(f"  {language:<10}{inline * 1000:>8.1f}ms{registry * 1000:>10.1f}ms{inline / registry:>9.1f}x")
+    print("Lookups:", get_pattern_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -1,611 +1,413 @@
 """
-Updated test script for the improved MeetingScraper with performance timing.
-This tests both midweek and weekend meeting extraction with speed benchmarks.
+Offline benchmark of the meeting scrapers: MeetingScraper, OptimizedMeetingScraper and EPUBMeetingScraper.
+
+Every scraper runs against a local stand-in for wol.jw.org, the JW API and the
+CDN, serving the recorded pages in tests/mock_data (EPUBs are assembled from
+the templates in tests/mock_data/epub, with weeks around today's date), so the
+timings do not depend on the network. Two scenarios are measured:
+
+    cold  empty cache: links and pages (or EPUBs) are fetched and parsed
+    warm  a second update in the same session, with everything cached
+
+Run directly for a timing and memory table (peak traced allocations of one
+extra round):
+    python tests/test_scraper_perf.py [--rounds N] [--scenario cold|warm|all]
 """
-import os
+import argparse
+import hashlib
+import io
+import json
+import random
+import statistics
 import sys
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-import re
-import shutil
-from pathlib import Path
+import tempfile
 import time
-from typing import Dict, List
-import logging
-logging.basicConfig(filename='epub_test.log', filemode='w', level=logging.INFO, format='%(message)s')
+import tracemalloc
+import unittest
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from string import Template
+from typing import Dict, List, Optional
+from unittest.mock import patch
+from urllib.parse import parse_qs
 
-from src.utils.optimized_scraper import OptimizedMeetingScraper
-from src.utils.scraper import MeetingScraper
-from src.models.meeting import MeetingType
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# EPUB scraper import
+from bs4 import BeautifulSoup
+
+from src.models.meeting import MeetingType
 from src.utils.epub_scraper import EPUBMeetingScraper
+from src.utils.optimized_scraper import OptimizedMeetingScraper, page_texts
+from src.utils.scraper import MeetingScraper
+from tests.test_http_client import StandInServer
+from tests.test_part_duration_index import fixture_pages, synthetic_page
+
+MOCK_DIR = Path(__file__).parent / "mock_data"
+EPUB_DIR = MOCK_DIR / "epub"
+
+ENGINES = {
+    "MeetingScraper": MeetingScraper,
+    "OptimizedMeetingScraper": OptimizedMeetingScraper,
+    "EPUBMeetingScraper": EPUBMeetingScraper,
+}
+SCENARIOS = ("cold", "warm")
+
+# Paths of the recorded wol.jw.org pages
+WOL_PAGES = {
+    "/en/wol/meetings/r1/lp-e": "wol_meetings.html",
+    "/en/wol/lf/r1/lp-e/202025": "wol_midweek.html",
+    "/en/wol/d/r1/lp-e/2025047": "wol_weekend.html",
+}
+
+
+# ----------------------------------------------------------------------
+# Recorded EPUB fixtures
+
+def _template(name: str) -> Template:
+    return Template((EPUB_DIR / name).read_text(encoding="utf-8"))
+
+
+def _mondays(year: int, month: int, months: int) -> List[date]:
+    """Mondays falling in `months` months starting with year/month"""
+    day = date(year, month, 1)
+    day += timedelta(days=-day.weekday() % 7)
+    end_year, end_month = divmod(year * 12 + month - 1 + months, 12)
+    end = date(end_year, end_month + 1, 1)
+    mondays = []
+    while day < end:
+        mondays.append(day)
+        day += timedelta(weeks=1)
+    return mondays
+
+
+def _week_range(monday: date, year: bool = False) -> str:
+    """'October 19-25' or 'September 28–October 4' (with ', 2026' if year)"""
+    sunday = monday + timedelta(days=6)
+    if sunday.month == monday.month:
+        text = f"{monday:%B} {monday.day}-{sunday.day}"
+    else:
+        text = f"{monday:%B} {monday.day}–{sunday:%B} {sunday.day}"
+    return f"{text}, {sunday.year}" if year else text
+
+
+def _epub(files: Dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as epub:
+        epub.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        epub.writestr("META-INF/container.xml", '<?xml version="1.0"?><container version="1.0"/>')
+        for name, content in files.items():
+            epub.writestr(f"OEBPS/{name}", content)
+    return buffer.getvalue()
+
+
+def workbook_epub(issue: str) -> bytes:
+    """Meeting workbook for a two-month issue ("202609" covers September and October)"""
+    rng = random.Random(issue)
+    week = _template("mwb_week.xhtml")
+    files, entries = {}, []
+    for number, monday in enumerate(_mondays(int(issue[:4]), int(issue[4:]), 2), start=1):
+        label = _week_range(monday).upper()
+        files[f"week{number}.xhtml"] = week.substitute(
+            date=label, opening_song=rng.randint(1, 160), middle_song=rng.randint(1, 160),
+            closing_song=rng.randint(1, 160))
+        entries.append(f'<li id="chapter{number + 1}"><a href="week{number}.xhtml">{label}</a>'
+                       f'<ol><li><a href="week{number}.xhtml#p2">ISAIAH 58-59</a></li></ol></li>')
+    files["toc.xhtml"] = _template("mwb_toc.xhtml").substitute(entries="\n".join(entries))
+    return _epub(files)
+
+
+def watchtower_epub(issue: str) -> bytes:
+    """Study edition, whose articles are studied two months after the issue month"""
+    rng = random.Random(issue)
+    article = _template("w_article.xhtml")
+    year, month = divmod(int(issue[:4]) * 12 + int(issue[4:]) + 1, 12)
+    files, entries = {}, []
+    for number, monday in enumerate(_mondays(year, month + 1, 1), start=1):
+        title = f"Study Article {number}: Keep Encouraging One Another"
+        paragraphs = "\n".join(
+            f'<p id="p{10 + n}" data-pid="{10 + n}"><span class="parNum">{n}</span> '
+            f'{" ".join(rng.choice(["Jehovah", "meetings", "comment", "love", "faith", "prepare"]) for _ in range(40))}.</p>'
+            for n in range(1, 21))
+        files[f"article{number}.xhtml"] = article.substitute(
+            title=title, number=number, opening_song=rng.randint(1, 160), closing_song=rng.randint(1, 160),
+            paragraphs=paragraphs)
+        entries.append(f'<h3>{_week_range(monday, year=True)}</h3>\n'
+                       f'<p><a href="article{number}.xhtml">{title}</a></p>')
+    files["toc.xhtml"] = _template("w_toc.xhtml").substitute(entries="\n".join(entries))
+    return _epub(files)
+
+
+def _issues(today: date) -> Dict[str, List[str]]:
+    """Issues of each publication around today, enough for any upcoming week"""
+    months = [divmod(today.year * 12 + today.month - 1 + offset, 12) for offset in range(-6, 6)]
+    months = [(year, month + 1) for year, month in months]
+    return {
+        'mwb': [f"{year}{month:02d}" for year, month in months if month % 2 == 1],
+        'w': [f"{year}{month:02d}" for year, month in months],
+    }
+
+
+class OfflineWeb:
+    """Local stand-in for wol.jw.org, the JW API and the CDN, serving the recorded fixtures
+
+    Used as a context manager, which points MeetingScraper and EPUBMeetingScraper at it.
+    """
+
+    def __init__(self, today: Optional[date] = None):
+        routes = {path: [(200, (MOCK_DIR / name).read_bytes())] for path, name in WOL_PAGES.items()}
+        self.server = StandInServer(routes, route=self._route)
+        builders = {'mwb': workbook_epub, 'w': watchtower_epub}
+        for publication, issues in _issues(today or date.today()).items():
+            for issue in issues:
+                epub = builders[publication](issue)
+                epub_path = f"/epub/{publication}_{issue}_E.epub"
+                self.server.routes[epub_path] = [(200, epub)]
+                answer = {"files": {"E": {"EPUB": [{
+                    "file": {"url": self.server.url + epub_path, "checksum": hashlib.md5(epub).hexdigest()},
+                    "filesize": len(epub),
+                }]}}}
+                self.server.routes[f"/api/{publication}/{issue}"] = [(200, json.dumps(answer).encode())]
+        self._patches = [
+            patch.object(MeetingScraper, "BASE_URL", self.server.url),
+            patch.object(EPUBMeetingScraper, "API_BASE_URL", self.server.url + "/api"),
+        ]
+
+    @staticmethod
+    def _route(path: str, query: str) -> str:
+        if path == "/api":
+            params = parse_qs(query)
+            return f"/api/{params['pub'][0]}/{params['issue'][0]}"
+        return path
+
+    def requests(self) -> int:
+        return sum(self.server.hits.values())
+
+    def __enter__(self):
+        self.server.__enter__()
+        for patcher in self._patches:
+            patcher.start()
+        return self
+
+    def __exit__(self, *exc):
+        for patcher in reversed(self._patches):
+            patcher.stop()
+        self.server.__exit__(*exc)
+
+
+# ----------------------------------------------------------------------
+# Benchmark harness
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one scraper in one scenario"""
+    engine: str
+    scenario: str
+    seconds: List[float] = field(default_factory=list)
+    peak_bytes: int = 0
+    requests: int = 0     # HTTP requests per round
+    meetings: int = 0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            'min': min(self.seconds),
+            'max': max(self.seconds),
+            'mean': statistics.mean(self.seconds),
+            'stddev': statistics.stdev(self.seconds) if len(self.seconds) > 1 else 0.0,
+            'median': statistics.median(self.seconds),
+        }
 
-# Add the parent directory to sys.path so we can import modules from there
-script_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(script_dir)
-sys.path.insert(0, parent_dir)
 
+def _update(engine: str, cache_dir: Path, language: str):
+    """One update_meetings() of a new scraper using cache_dir"""
+    engine_class = ENGINES[engine]
+    with patch.object(engine_class, "CACHE_DIR", cache_dir):
+        return engine_class(language).update_meetings()
 
 
-def clear_all_cache_once():
-    """Clear the entire cache directory ONCE at the start"""
-    try:
-        from platformdirs import user_cache_dir
-    except ImportError:
-        cache_dir = Path.home() / ".meeting_timer_cache"
-    else:
-        cache_dir = Path(user_cache_dir("MeetingTimer"))
-    
-    if cache_dir.exists():
-        logging.info(f"Clearing cache directory: {cache_dir}")
-        shutil.rmtree(cache_dir)
-        logging.info("Cache cleared successfully!")
-    else:
-        logging.info("Cache directory doesn't exist - no need to clear")
-
-
-def test_epub_full():
-    """Test EPUB scraper with multiple languages"""
-    logging.info("=== EPUB MULTI-LANGUAGE TEST ===")
-
-    languages_to_test = ["en", "it", "fr", "es", "de"]
-    timing_results = TimingResults()
-
-    # Clear cache ONCE at the beginning, not between languages!
-    clear_all_cache_once()
-
-    for lang in languages_to_test:
-        logging.info(f"\n{'='*60}")
-        logging.info(f"Testing EPUB scraper with language: {lang.upper()}")
-        logging.info('='*60)
-
-        # DO NOT clear cache here! Each language should have its own cache file
-        scraper = EPUBMeetingScraper(language=lang)
-
-        # Test current meetings first
-        logging.info(f"\n[{lang}] Fetching current meetings:")
-        for m_type in [MeetingType.MIDWEEK, MeetingType.WEEKEND]:
-            meeting = scraper.get_meeting_for_current_week(meeting_type=m_type)
-            if meeting:
-                logging.info(f"\n--- {m_type.value.upper()} MEETING ---")
-                logging.info(f"Title: {meeting.title}")
-                logging.info(f"Date: {meeting.date.strftime('%Y-%m-%d')}")
-                logging.info(f"Total Duration: {meeting.total_duration_minutes} minutes")
-                logging.info(f"Sections: {len(meeting.sections)}")
-                for i, section in enumerate(meeting.sections):
-                    logging.info(f"  Section {i+1}: {section.title} ({section.total_duration_minutes} min, {len(section.parts)} parts)")
+def benchmark(engine: str, scenario: str, web: OfflineWeb, rounds: int = 5, language: str = "en") -> BenchmarkResult:
+    """Time `rounds` updates, plus one more under tracemalloc for the memory peak"""
+    result = BenchmarkResult(engine, scenario)
+    with tempfile.TemporaryDirectory() as warm_dir:
+        def run_round(trace: bool = False):
+            if scenario == "cold":
+                OptimizedMeetingScraper.clear_parsed_cache()
+                cache = tempfile.TemporaryDirectory()
+                cache_dir = Path(cache.name)
             else:
-                logging.info(f"\n--- {m_type.value.upper()} MEETING ---")
-                logging.info("No meeting found for current week.")
-
-        # Time the update process
-        total_start_time = time.time()
-        try:
-            meetings = scraper.update_meetings()
-            total_time = time.time() - total_start_time
-
-            logging.info(f"\n✓ Total: {total_time:.3f}s")
-            logging.info(f"✓ Meetings: {len(meetings)}")
-
-            timing_results.add_result(lang, "EPUB", total_time, len(meetings))
-
-            # Display meeting details
-            for meeting_type, meeting in meetings.items():
-                logging.info(f"\n--- {meeting_type.value.upper()} MEETING ---")
-                logging.info(f"Title: {meeting.title}")
-                logging.info(f"Date: {meeting.date.strftime('%Y-%m-%d')}")
-                logging.info(f"Total Duration: {meeting.total_duration_minutes} minutes")
-                logging.info(f"Sections: {len(meeting.sections)}")
-                
-                for i, section in enumerate(meeting.sections):
-                    logging.info(f"  Section {i+1}: {section.title} ({section.total_duration_minutes} min, {len(section.parts)} parts)")
-
-            # Check cache file
-            logging.info(f"[{lang}] Cache file: {scraper.cache_path}")
-            if scraper.cache_path.exists():
-                cache_size = scraper.cache_path.stat().st_size
-                logging.info(f"[{lang}] ✅ Cache file exists ({cache_size} bytes)")
-            else:
-                logging.info(f"[{lang}] ❌ Cache file missing!")
-
-        except Exception as e:
-            total_time = time.time() - total_start_time
-            logging.info(f"[{lang.upper()}] Error: {str(e)} (after {total_time:.3f}s)")
-            timing_results.add_result(lang, "EPUB", total_time, 0)
-
-        logging.info(f"[{lang}] Test complete. Meetings found: {len(meetings)}")
-
-    timing_results.print_summary()
-
-    
-    # Show final cache status
-    logging.info(f"\n{'='*80}")
-    logging.info("FINAL CACHE STATUS")
-    logging.info('='*80)
-    
-    try:
-        from platformdirs import user_cache_dir
-        cache_dir = Path(user_cache_dir("MeetingTimer"))
-    except ImportError:
-        cache_dir = Path.home() / ".meeting_timer_cache"
-    
-    if cache_dir.exists():
-        cache_files = list(cache_dir.glob("*_meetings_cache.json"))
-        logging.info(f"Cache directory: {cache_dir}")
-        logging.info(f"Cache files found: {len(cache_files)}")
-        
-        for cache_file in cache_files:
-            lang = cache_file.name.split('_')[0]
-            size = cache_file.stat().st_size
-            logging.info(f"  {lang.upper()}: {cache_file.name} ({size} bytes)")
-    else:
-        logging.info("No cache directory found!")
-
-def test_single_language_debug(language: str = "de"):
-    """Test a single language with detailed debugging"""
-    logging.info(f"\n{'='*60}")
-    logging.info(f"SINGLE LANGUAGE DEBUG: {language.upper()}")
-    logging.info('='*60)
-    
-    # Clear cache for clean test
-    clear_all_cache_once()
-    
-    scraper = EPUBMeetingScraper(language=language)
-
-    # Print the internal log if available
-    if hasattr(scraper, "_last_log_lines"):
-        log_lines = scraper._last_log_lines
-        log_path = f"epub_meeting_log_{language}.txt"
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(log_lines))
-        logging.info(f"📄 Internal log written to {log_path}")
-
-    logging.info(f"1. Language: {language}")
-    logging.info(f"2. Language code: {scraper.lang_code}")
-    logging.info(f"3. Cache path: {scraper.cache_path}")
-
-    # Test issue calculation
-    mwb_issue, w_issue = scraper._get_current_issue_dates()
-    logging.info(f"4. MWB issue: {mwb_issue}")
-    logging.info(f"5. WT issue: {w_issue}")
-
-    # Test the full process
-    logging.info(f"\n6. Running full update process...")
-    start_time = time.time()
-
-    try:
-        meetings = scraper.update_meetings()
-        elapsed = time.time() - start_time
-
-        # Print the internal log if available
-        if hasattr(scraper, "_last_log_lines"):
-            log_lines = scraper._last_log_lines
-            log_path = f"epub_meeting_log_{language}.txt"
-            with open(log_path, "w", encoding="utf-8") as f:
-                f.write("\n".join(log_lines))
-            logging.info(f"📄 Internal log written to {log_path}")
-
-        logging.info(f"   ✅ Success in {elapsed:.3f}s")
-        logging.info(f"   Meetings found: {len(meetings)}")
-
-        for meeting_type, meeting in meetings.items():
-            logging.info(f"   - {meeting_type.name}: {meeting.title}")
-
-        # Check cache
-        if scraper.cache_path.exists():
-            size = scraper.cache_path.stat().st_size
-            logging.info(f"   Cache: {scraper.cache_path.name} ({size} bytes)")
-        else:
-            logging.info(f"   ❌ No cache file created!")
-
-    except Exception as e:
-        elapsed = time.time() - start_time
-        logging.info(f"   ❌ Error after {elapsed:.3f}s: {e}")
-        import traceback
-        traceback.print_exc()
-
-class TimingResults:
-    """Class to store and display timing results"""
-    
-    def __init__(self):
-        self.results = {}
-    
-    def add_result(self, language: str, method: str, duration: float, meetings_count: int):
-        """Add a timing result"""
-        if language not in self.results:
-            self.results[language] = {}
-        self.results[language][method] = {
-            'duration': duration,
-            'meetings_count': meetings_count,
-            'meetings_per_second': meetings_count / duration if duration > 0 else 0
-        }
-    
-    def print_summary(self):
-        """Print a summary of all timing results"""
-        logging.info("\n" + "="*80)
-        logging.info("PERFORMANCE SUMMARY")
-        logging.info("="*80)
-        
-        for language, methods in self.results.items():
-            logging.info(f"\n{language.upper()}:")
-            for method, data in methods.items():
-                logging.info(f"  {method:20s}: {data['duration']:6.2f}s ({data['meetings_count']} meetings, {data['meetings_per_second']:.2f} meetings/s)")
-        
-        # Calculate averages
-        if len(self.results) > 1:
-            logging.info("\nAVERAGES:")
-            method_totals = {}
-            
-            for language, methods in self.results.items():
-                for method, data in methods.items():
-                    if method not in method_totals:
-                        method_totals[method] = {'total_time': 0, 'total_meetings': 0, 'count': 0}
-                    
-                    method_totals[method]['total_time'] += data['duration']
-                    method_totals[method]['total_meetings'] += data['meetings_count']
-                    method_totals[method]['count'] += 1
-            
-            for method, totals in method_totals.items():
-                avg_time = totals['total_time'] / totals['count']
-                avg_meetings = totals['total_meetings'] / totals['count']
-                avg_rate = avg_meetings / avg_time if avg_time > 0 else 0
-                logging.info(f"  {method:20s}: {avg_time:6.2f}s avg ({avg_meetings:.1f} meetings, {avg_rate:.2f} meetings/s)")
-
-
-def test_optimized_vs_original():
-    """Test optimized version vs original - MAIN COMPARISON"""
-    logging.info("=== OPTIMIZED vs ORIGINAL COMPARISON ===")
-    
-    # Test original
-    logging.info("\n1. Testing ORIGINAL implementation...")
-    clear_all_cache_once()
-    original_scraper = MeetingScraper("en")
-
-    start_time = time.time()
-    original_meetings = original_scraper.update_meetings()
-    original_time = time.time() - start_time
-
-    logging.info(f"✓ Original: {original_time:.2f}s ({len(original_meetings)} meetings)")
-
-    # Test optimized
-    logging.info("\n2. Testing OPTIMIZED implementation...")
-    clear_all_cache_once()
-    optimized_scraper = OptimizedMeetingScraper("en")
-
-    start_time = time.time()
-    optimized_meetings = optimized_scraper.update_meetings()
-    optimized_time = time.time() - start_time
-
-    logging.info(f"✓ Optimized: {optimized_time:.2f}s ({len(optimized_meetings)} meetings)")
-
-    # Test EPUB
-    logging.info("\n3. Testing EPUB implementation...")
-    clear_all_cache_once()
-    epub_scraper = EPUBMeetingScraper("en")
-
-    start_time = time.time()
-    epub_meetings = epub_scraper.update_meetings()
-    epub_time = time.time() - start_time
-
-    logging.info(f"✓ EPUB: {epub_time:.2f}s ({len(epub_meetings)} meetings)")
-
-    # Compare results
-    if original_time > 0:
-        speedup = original_time / optimized_time if optimized_time > 0 else float('inf')
-        improvement = ((original_time - optimized_time) / original_time) * 100
-
-        logging.info(f"\n📊 RESULTS:")
-        logging.info(f"   Speedup: {speedup:.1f}x faster")
-        logging.info(f"   Improvement: {improvement:.1f}%")
-        logging.info(f"   Time saved: {original_time - optimized_time:.1f}s")
-
-        target_met = "✅" if optimized_time < 9.0 else "❌"
-        logging.info(f"   Single-digit target (<9s): {target_met}")
-
-        if optimized_time < 9.0:
-            logging.info("🎉 SUCCESS! Single-digit performance achieved!")
-        elif speedup > 2.0:
-            logging.info("🚀 Great improvement! Close to single-digit target.")
-        else:
-            logging.info("⚠️  Need more optimization for single-digit target.")
-
-        # EPUB comparison block
-        if original_time > 0:
-            epub_speedup = original_time / epub_time if epub_time > 0 else float('inf')
-            epub_improvement = ((original_time - epub_time) / original_time) * 100
-
-            logging.info(f"\n📊 EPUB RESULTS:")
-            logging.info(f"   Speedup vs Original: {epub_speedup:.1f}x faster")
-            logging.info(f"   Improvement: {epub_improvement:.1f}%")
-            logging.info(f"   Time saved: {original_time - epub_time:.1f}s")
-
-            target_met = "✅" if epub_time < 9.0 else "❌"
-            logging.info(f"   Single-digit target (<9s): {target_met}")
-
-    return original_time, optimized_time
-
-def test_optimized_with_detailed_timing():
-    """Test optimized scraper with detailed timing breakdown"""
-    logging.info("=== OPTIMIZED SCRAPER DETAILED TIMING ===")
-    clear_all_cache_once()
-    
-    language = "en"
-    scraper = OptimizedMeetingScraper(language=language)
-    
-    logging.info(f"Testing detailed timing for {language.upper()} (optimized)...")
-    
-    # Step 1: Time URL fetching
-    logging.info("\n1. Fetching meeting URLs...")
-    start_time = time.time()
-    meeting_links = scraper.get_current_meeting_urls()
-    url_fetch_time = time.time() - start_time
-    logging.info(f"   URL fetch time: {url_fetch_time:.3f}s")
-    logging.info(f"   Found {len(meeting_links)} meeting URLs")
-    
-    # Step 2: Time complete scraping
-    logging.info("\n2. Complete optimized scraping:")
-    start_time = time.time()
-    meetings = scraper.update_meetings()
-    total_time = time.time() - start_time
-    
-    logging.info(f"   Total time: {total_time:.3f}s")
-    logging.info(f"   Meetings retrieved: {len(meetings)}")
-    
-    for meeting_type, meeting in meetings.items():
-        logging.info(f"   ✓ {meeting_type.value}: {meeting.title}")
-        logging.info(f"     - Sections: {len(meeting.sections)}")
-        logging.info(f"     - Total parts: {sum(len(s.parts) for s in meeting.sections)}")
-    
-    # Step 3: Cache performance test
-    logging.info("\n3. Cache performance test:")
-    logging.info("   Testing cached retrieval...")
-    
-    start_time = time.time()
-    meetings_cached = scraper.update_meetings()  # Should be much faster due to cache
-    cached_time = time.time() - start_time
-    
-    logging.info(f"   Cached retrieval: {cached_time:.3f}s")
-    
-    if total_time > 0:
-        cache_speedup = total_time / cached_time if cached_time > 0 else float('inf')
-        logging.info(f"   Cache speedup: {cache_speedup:.1f}x faster")
-
-def test_single_digit_attempt():
-    """Quick test to see if we hit single digits"""
-    logging.info("🎯 SINGLE-DIGIT ATTEMPT (OPTIMIZED)")
-    
-    clear_all_cache_once()
-    scraper = OptimizedMeetingScraper("en")
-    
-    start_time = time.time()
-    meetings = scraper.update_meetings()
-    total_time = time.time() - start_time
-    
-    result = "✅ SUCCESS!" if total_time < 9.0 else "❌ Not yet"
-    logging.info(f"{result} Time: {total_time:.2f}s (target: <9s)")
-    logging.info(f"Meetings: {len(meetings)}")
-    
-    return total_time
-
-def test_optimized_multi_language():
-    """Test optimized scraper with multiple languages"""
-    logging.info("=== OPTIMIZED MULTI-LANGUAGE TEST ===")
-    
-    languages_to_test = ["en", "it", "fr", "es", "de"]
-    timing_results = TimingResults()
-    
-    for lang in languages_to_test:
-        logging.info(f"\n{'='*60}")
-        logging.info(f"Testing OPTIMIZED scraper with language: {lang.upper()}")
-        logging.info('='*60)
-        
-        clear_all_cache_once()  # Clear cache for each language test
-        scraper = OptimizedMeetingScraper(language=lang)
-        
-        # Time the entire process
-        total_start_time = time.time()
-        
-        try:
-            logging.info("Fetching meeting URLs...")
-            url_start_time = time.time()
-            meeting_links = scraper.get_current_meeting_urls()
-            url_fetch_time = time.time() - url_start_time
-            
-            logging.info(f"URL fetch completed in {url_fetch_time:.3f}s")
-            logging.info(f"Found URLs:")
-            for meeting_type, url in meeting_links.items():
-                logging.info(f"- {meeting_type.value}: {url}")
-            
-            # Time the scraping process
-            scrape_start_time = time.time()
-            meetings = scraper.update_meetings()
-            scrape_time = time.time() - scrape_start_time
-            
-            total_time = time.time() - total_start_time
-            
-            logging.info(f"\nTIMING RESULTS:")
-            logging.info(f"- URL fetch: {url_fetch_time:.3f}s")
-            logging.info(f"- Scraping:  {scrape_time:.3f}s")
-            logging.info(f"- Total:     {total_time:.3f}s")
-            
-            timing_results.add_result(lang, "Total", total_time, len(meetings))
-            timing_results.add_result(lang, "Scraping", scrape_time, len(meetings))
-            
-            # Show meeting details
-            for meeting_type, meeting in meetings.items():
-                logging.info(f"\n--- {meeting_type.value.upper()} MEETING ---")
-                logging.info(f"Title: {meeting.title}")
-                logging.info(f"Date: {meeting.date.strftime('%Y-%m-%d')}")
-                logging.info(f"Total Duration: {meeting.total_duration_minutes} minutes")
-                logging.info(f"Sections: {len(meeting.sections)}")
-                
-                for i, section in enumerate(meeting.sections):
-                    logging.info(f"  Section {i+1}: {section.title} ({section.total_duration_minutes} min, {len(section.parts)} parts)")
-            
-            logging.info(f"\n--- SUMMARY FOR {lang.upper()} ---")
-            logging.info(f"Successfully tested {len(meetings)} meeting types in {total_time:.3f}s")
-            
-            # Check if single-digit target met
-            if total_time < 9.0:
-                logging.info(f"🎯 Single-digit target MET! ({total_time:.2f}s)")
-            else:
-                logging.info(f"⏱️  Single-digit target missed ({total_time:.2f}s)")
-            
-        except Exception as e:
-            total_time = time.time() - total_start_time
-            logging.info(f"[{lang.upper()}] Error: {str(e)} (after {total_time:.3f}s)")
-            timing_results.add_result(lang, "Total", total_time, 0)
-    
-    timing_results.print_summary()
-
-def benchmark_optimized_cache_performance():
-    """Benchmark optimized scraper cache performance"""
-    logging.info("=== OPTIMIZED CACHE PERFORMANCE BENCHMARK ===")
-    
-    language = "en"
-    scraper = OptimizedMeetingScraper(language=language)
-    
-    # Test 1: Cold cache (no cache)
-    logging.info("1. Cold cache test...")
-    clear_all_cache_once()
-    
-    start_time = time.time()
-    meetings_cold = scraper.update_meetings()
-    cold_time = time.time() - start_time
-    logging.info(f"   Cold cache: {cold_time:.3f}s ({len(meetings_cold)} meetings)")
-    
-    # Test 2: Warm cache (should use cached data)
-    logging.info("2. Warm cache test...")
-    
-    start_time = time.time()
-    meetings_warm = scraper.update_meetings()
-    warm_time = time.time() - start_time
-    logging.info(f"   Warm cache: {warm_time:.3f}s ({len(meetings_warm)} meetings)")
-    
-    if cold_time > 0 and warm_time > 0:
-        cache_improvement = ((cold_time - warm_time) / cold_time) * 100
-        cache_speedup = cold_time / warm_time
-        logging.info(f"   Cache improvement: {cache_speedup:.1f}x faster ({cache_improvement:.1f}% improvement)")
-    
-    # Test 3: Multiple runs to test consistency
-    logging.info("3. Consistency test (5 runs with cache)...")
-    
-    times = []
-    for i in range(5):
-        start_time = time.time()
-        meetings = scraper.update_meetings()
-        run_time = time.time() - start_time
-        times.append(run_time)
-        logging.info(f"   Run {i+1}: {run_time:.3f}s")
-    
-    avg_time = sum(times) / len(times)
-    min_time = min(times)
-    max_time = max(times)
-    
-    logging.info(f"   Average: {avg_time:.3f}s")
-    logging.info(f"   Range: {min_time:.3f}s - {max_time:.3f}s")
-
-def test_pre_scan_feature():
-    """Test the pre-scan all languages feature"""
-    logging.info("=== PRE-SCAN ALL LANGUAGES FEATURE ===")
-    
-    clear_all_cache_once()
-    languages = ["en", "it", "fr"]  # Test subset for speed
-    
-    logging.info(f"Testing pre-scan feature with {languages}...")
-    start_time = time.time()
-    
-    all_urls = OptimizedMeetingScraper.pre_scan_all_languages(languages)
-    
-    pre_scan_time = time.time() - start_time
-    
-    logging.info(f"Pre-scan completed in {pre_scan_time:.2f}s")
-    logging.info(f"Found URLs for {len(all_urls)} languages:")
-    
-    for lang, urls in all_urls.items():
-        logging.info(f"  {lang}: {len(urls)} meeting URLs")
-    
-    # Now test individual scraping with pre-populated cache
-    logging.info("\nTesting individual scraping with pre-populated cache...")
-    
-    for lang in languages:
-        logging.info(f"\nScraping {lang} with cached URLs...")
-        start_time = time.time()
-        
-        scraper = OptimizedMeetingScraper(lang)
-        meetings = scraper.update_meetings()
-        
-        scrape_time = time.time() - start_time
-        logging.info(f"  {lang}: {scrape_time:.2f}s ({len(meetings)} meetings)")
-
-# LEGACY FUNCTIONS for backward compatibility
-def test_parallel_vs_sequential_speed():
-    """Legacy function - now compares optimized vs original"""
-    print("NOTE: Converting to optimized vs original comparison...")
-    return test_optimized_vs_original()
-
-def test_with_detailed_timing():
-    """Legacy function - now uses optimized scraper"""
-    print("NOTE: Using optimized scraper for detailed timing...")
-    return test_optimized_with_detailed_timing()
-
-def test_live_scraper_with_timing():
-    """Legacy function - now uses optimized multi-language test"""
-    print("NOTE: Using optimized multi-language test...")
-    return test_optimized_multi_language()
-
-def benchmark_cache_performance():
-    """Legacy function - now uses optimized cache benchmark"""
-    print("NOTE: Using optimized cache benchmark...")
-    return benchmark_optimized_cache_performance()
-
-if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--speed-test":
-            test_optimized_vs_original()
-        elif sys.argv[1] == "--optimized":
-            test_optimized_vs_original()
-        elif sys.argv[1] == "--single-digit":
-            test_single_digit_attempt()
-        elif sys.argv[1] == "--detailed":
-            test_optimized_with_detailed_timing()
-        elif sys.argv[1] == "--full":
-            test_optimized_multi_language()
-        elif sys.argv[1] == "--cache":
-            benchmark_optimized_cache_performance()
-        elif sys.argv[1] == "--pre-scan":
-            test_pre_scan_feature()
-        elif sys.argv[1] == "--epub-full":
-            test_epub_full()
-        elif sys.argv[1] == "--single-language-debug":
-            lang = sys.argv[2] if len(sys.argv) > 2 else "de"
-            test_single_language_debug(lang)
-        elif sys.argv[1] == "--all":
-            logging.info("Running all optimized performance tests...\n")
-            test_optimized_vs_original()
-            logging.info("\n" + "="*100 + "\n")
-            test_optimized_with_detailed_timing()
-            logging.info("\n" + "="*100 + "\n")
-            benchmark_optimized_cache_performance()
-            logging.info("\n" + "="*100 + "\n")
-            test_pre_scan_feature()
-        else:
-            logging.info("Unknown option. Use --help for usage.")
-    else:
-        logging.info("Usage:")
-        logging.info("  python test_scraper.py --speed-test   # Compare optimized vs original")
-        logging.info("  python test_scraper.py --optimized    # Same as --speed-test")
-        logging.info("  python test_scraper.py --single-digit # Quick single-digit test")
-        logging.info("  python test_scraper.py --detailed     # Detailed timing breakdown")
-        logging.info("  python test_scraper.py --full         # Multi-language test")
-        logging.info("  python test_scraper.py --cache        # Cache performance test")
-        logging.info("  python test_scraper.py --pre-scan     # Test pre-scan feature")
-        logging.info("  python test_scraper.py --epub-full    # EPUB multi-language test")
-        logging.info("  python test_scraper.py --all          # Run all performance tests")
-        logging.info("")
-        logging.info("Running optimized vs original comparison...")
-        test_optimized_vs_original()
\ No newline at end of file
+                cache, cache_dir = None, Path(warm_dir)
+            try:
+                requests = web.requests()
+                if trace:
+                    tracemalloc.start()
+                start = time.perf_counter()
+                meetings = _update(engine, cache_dir, language)
+                elapsed = time.perf_counter() - start
+                if trace:
+                    result.peak_bytes = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                result.requests = web.requests() - requests
+                result.meetings = len(meetings)
+                return elapsed
+            finally:
+                if cache:
+                    cache.cleanup()
+
+        if scenario == "warm":
+            OptimizedMeetingScraper.clear_parsed_cache()
+            _update(engine, Path(warm_dir), language)
+        result.seconds = [run_round() for _ in range(rounds)]
+        run_round(trace=True)
+    return result
+
+
+def run_benchmarks(rounds: int = 5, scenarios=SCENARIOS, engines=tuple(ENGINES)) -> List[BenchmarkResult]:
+    with OfflineWeb() as web:
+        return [benchmark(engine, scenario, web, rounds) for scenario in scenarios for engine in engines]
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """pytest-benchmark style tables, one per scenario, fastest first"""
+    lines = []
+    columns = ("Min", "Max", "Mean", "StdDev", "Median")
+    for scenario in dict.fromkeys(result.scenario for result in results):
+        group = sorted((r for r in results if r.scenario == scenario), key=lambda r: r.stats['mean'])
+        header = (f"{'Name (time in ms)':<26}" + "".join(f"{column:>10}" for column in columns)
+                  + f"{'Rounds':>8}{'Peak (KiB)':>12}{'Requests':>10}{'Meetings':>10}")
+        title = f" benchmark '{scenario}': {len(group)} tests "
+        lines.append(title.center(len(header), '-'))
+        lines.append(header)
+        lines.append('-' * len(header))
+        for result in group:
+            stats = result.stats
+            lines.append(f"{result.engine:<26}" + "".join(f"{stats[key] * 1000:>10.2f}" for key in
+                                                           ('min', 'max', 'mean', 'stddev', 'median'))
+                         + f"{len(result.seconds):>8}{result.peak_bytes / 1024:>12.0f}"
+                         + f"{result.requests:>10}{result.meetings:>10}")
+        lines.append('-' * len(header))
+        lines.append("")
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# Tests
+
+def _summary(meetings):
+    """Meeting contents, leaving out the start time (the time they were scraped)"""
+    return {
+        meeting_type: (meeting.title, meeting.date,
+                       [(section.title, [(part.title, part.duration_minutes) for part in section.parts])
+                        for section in meeting.sections])
+        for meeting_type, meeting in meetings.items()
+    }
+
+
+class OfflineTestCase(unittest.TestCase):
+    """Scrapers use temporary caches and the offline stand-in"""
+
+    def setUp(self):
+        self.web = OfflineWeb()
+        self.web.__enter__()
+        self.addCleanup(self.web.__exit__)
+        OptimizedMeetingScraper.clear_parsed_cache()
+
+    def update(self, engine: str):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        return _update(engine, Path(tmp.name), "en")
+
+
+class TestOptimizedMeetingScraper(OfflineTestCase):
+    """Test cases for OptimizedMeetingScraper"""
+
+    def test_same_meetings_as_original(self):
+        original = self.update("MeetingScraper")
+        self.assertEqual(set(original), {MeetingType.MIDWEEK, MeetingType.WEEKEND})
+        self.assertEqual(_summary(self.update("OptimizedMeetingScraper")), _summary(original))
+
+    def test_parsed_meetings_are_reused(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(OptimizedMeetingScraper, "CACHE_DIR", Path(tmp)):
+            scraper = OptimizedMeetingScraper("en")
+            first = scraper.update_meetings()
+            with patch.object(OptimizedMeetingScraper, "_parse_midweek_meeting") as parse:
+                second = scraper.update_meetings()
+            parse.assert_not_called()
+        self.assertEqual(_summary(second), _summary(first))
+        # Each caller gets its own copy to edit
+        self.assertIsNot(second[MeetingType.MIDWEEK], first[MeetingType.MIDWEEK])
+        second[MeetingType.MIDWEEK].sections[0].parts[0].title = "Edited"
+        self.assertNotEqual(_summary(scraper.update_meetings()), _summary(second))
+
+    def test_pages_are_fetched_in_parallel(self):
+        def slow(body):
+            def answer():
+                time.sleep(0.2)
+                return body
+            return answer
+
+        for path in ("/en/wol/lf/r1/lp-e/202025", "/en/wol/d/r1/lp-e/2025047"):
+            self.web.server.routes[path] = [(200, slow(self.web.server.routes[path][0][1]))]
+        self.assertEqual(len(self.update("OptimizedMeetingScraper")), 2)
+        self.assertEqual(self.web.server.max_active, 2)
+
+    def test_pre_scan_all_languages(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(OptimizedMeetingScraper, "CACHE_DIR", Path(tmp)):
+            links = OptimizedMeetingScraper.pre_scan_all_languages(["en", "it"])
+            # "it" has no recorded meetings page
+            self.assertEqual(list(links), ["en"])
+            self.assertEqual(links["en"][MeetingType.WEEKEND], self.web.server.url + "/en/wol/d/r1/lp-e/2025047")
+            requests = self.web.requests()
+            self.assertEqual(OptimizedMeetingScraper("en").get_current_meeting_urls(), links["en"])
+            self.assertEqual(self.web.requests(), requests)
+
+    def test_page_texts_match_get_text(self):
+        pages = fixture_pages()
+        rng = random.Random(47)
+        for seed in range(3):
+            pages[f"synthetic-{seed}"] = synthetic_page(rng, parts=15, noise=60)
+        pages["special strings"] = ("<div>a<script>s</script><!--c--><![CDATA[d]]><style>t</style>"
+                                    "<template><p>u</p></template>  </div>")
+        for name, html in pages.items():
+            with self.subTest(page=name):
+                soup = BeautifulSoup(html, "html.parser")
+                texts = page_texts(soup)
+                for tag in [soup, *soup.find_all(True)]:
+                    self.assertEqual(texts[id(tag)], tag.get_text().strip())
+
+
+class TestBenchmark(unittest.TestCase):
+    """The benchmark runs offline for every scraper and scenario"""
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(rounds=2)
+        self.assertEqual([(r.engine, r.scenario) for r in results],
+                         [(engine, scenario) for scenario in SCENARIOS for engine in ENGINES])
+        for result in results:
+            with self.subTest(engine=result.engine, scenario=result.scenario):
+                self.assertEqual(len(result.seconds), 2)
+                self.assertGreater(result.peak_bytes, 0)
+                self.assertGreaterEqual(result.meetings, 1)
+                if result.scenario == "cold":
+                    self.assertGreater(result.requests, 0)
+                else:
+                    self.assertEqual(result.requests, 0)
+        self.assertIn("benchmark 'warm': 3 tests", format_results(results))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=5, help="timed rounds per scraper (default 5)")
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    args = parser.parse_args(argv)
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    print(f"Meeting scrapers against the offline stand-in, {datetime.now():%Y-%m-%d}")
+    print(format_results(run_benchmarks(args.rounds, scenarios)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Tests for the SessionManager crash-recovery journal in the OnTime Meeting Timer application.
+"""
+import json
+import tempfile
+import unittest
+from datetime import datetime, time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add the parent directory to the path so we can import the application code
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import Meeting, MeetingSection, MeetingPart, MeetingType
+from src.models.session import SessionManager
+from src.models.timer import TimerState
+
+
+class TestSessionManager(unittest.TestCase):
+    """Test cases for session snapshots and the event journal"""
+
+    def setUp(self):
+        """Set up a session manager with a fake timer controller"""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.manager = SessionManager(Path(self.test_dir.name))
+
+        # Plain attributes are enough: only state is read from the controller
+        self.controller = MagicMock()
+        self.controller.current_part_index = 0
+        self.controller._in_transition = False
+        self.controller._next_part_after_transition = -1
+        self.controller._total_overtime_seconds = 0
+        self.controller.timer.state = TimerState.RUNNING
+        self.controller.timer.total_seconds = 300
+        self.controller.timer.elapsed_seconds = 0
+        self.controller.timer.remaining_seconds = 300
+        self.manager._timer_controller = self.controller
+
+        meeting = Meeting(
+            meeting_type=MeetingType.MIDWEEK,
+            title="Test Meeting",
+            date=datetime(2026, 1, 7),
+            start_time=time(19, 0),
+            sections=[MeetingSection("Section", [MeetingPart("Part 1", 5), MeetingPart("Part 2", 10)])]
+        )
+        with patch.object(self.manager, '_save_meeting_for_recovery'):
+            self.manager.start_session(meeting, "midweek_2026-01-07_en.json")
+
+    def tearDown(self):
+        """Clean up test environment"""
+        self.test_dir.cleanup()
+
+    def _pause_at(self, remaining: int):
+        """Simulate pausing the timer with the given remaining time"""
+        self.controller.timer.state = TimerState.PAUSED
+        self.controller.timer.remaining_seconds = remaining
+        self.controller.timer.elapsed_seconds = 300 - remaining
+        self.manager.record_event("paused")
+        self.manager._flush_events()
+
+    def test_snapshot_written_on_start(self):
+        """Starting a session writes a snapshot with the controller state"""
+        with open(self.manager.session_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        self.assertFalse(data['clean_exit'])
+        self.assertEqual(data['current_part_index'], 0)
+        self.assertEqual(data['timer_state'], "RUNNING")
+        self.assertFalse(self.manager.session_file.with_name("session.json.tmp").exists())
+
+    def test_recovery_replays_journal(self):
+        """Recovery applies journal entries on top of the snapshot"""
+        self._pause_at(120)
+
+        self.controller.current_part_index = 1
+        self.controller.timer.state = TimerState.RUNNING
+        self.controller.timer.total_seconds = 600
+        self.controller.timer.remaining_seconds = 600
+        self.manager.record_event("running")
+        self.manager.record_event("part_change")
+        self.manager._flush_events()
+
+        # Both events of the part change are coalesced into one entry
+        lines = self.manager.journal_file.read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])['events'], ["running", "part_change"])
+
+        session = self.manager.check_for_recovery()
+        self.assertEqual(session.current_part_index, 1)
+        self.assertEqual(session.timer_state, "RUNNING")
+        self.assertEqual(session.total_seconds, 600)
+
+    def test_unchanged_state_is_not_written(self):
+        """Events that do not change the session state do not touch the journal"""
+        self._pause_at(120)
+        self.manager.record_event("paused")
+        self.manager._flush_events()
+
+        lines = self.manager.journal_file.read_text(encoding='utf-8').splitlines()
+        self.assertEqual(len(lines), 1)
+
+    def test_truncated_journal_entry_is_ignored(self):
+        """A partial last line from a crash mid-write does not break recovery"""
+        self._pause_at(120)
+        with open(self.manager.journal_file, 'a', encoding='utf-8') as f:
+            f.write('{"events":["running"],"timer_st')
+
+        session = self.manager.check_for_recovery()
+        self.assertIsNotNone(session)
+        self.assertEqual(session.timer_state, "PAUSED")
+        self.assertEqual(session.remaining_seconds, 120)
+
+    def test_journal_compaction(self):
+        """The journal is folded into the snapshot after enough entries"""
+        for remaining in range(SessionManager.COMPACT_AFTER_ENTRIES, 0, -1):
+            self._pause_at(remaining)
+
+        self.assertEqual(self.manager.journal_file.read_text(encoding='utf-8'), "")
+        session = self.manager.check_for_recovery()
+        self.assertEqual(session.remaining_seconds, 1)
+
+    def test_clean_end_removes_files(self):
+        """A clean exit removes both the snapshot and the journal"""
+        self._pause_at(120)
+        self.manager.end_session(clean=True)
+
+        self.assertFalse(self.manager.session_file.exists())
+        self.assertFalse(self.manager.journal_file.exists())
+        self.assertIsNone(self.manager.check_for_recovery())
+
+
+if __name__ == '__main__':
+    unittest.main()
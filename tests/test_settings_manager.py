@@ -60,8 +60,9 @@ class TestSettingsManager(unittest.TestCase):
         self.settings_manager.settings.midweek_meeting.day = DayOfWeek.MONDAY
         self.settings_manager.settings.midweek_meeting.time = time(18, 30)
         
-        # Save settings
+        # Save settings and wait for the queued write
         self.settings_manager.save_settings()
+        self.settings_manager.flush()
         
         # Verify file was created
         self.assertTrue(os.path.exists(self.settings_file))
@@ -78,8 +79,9 @@ class TestSettingsManager(unittest.TestCase):
     
     def test_file_format(self):
         """Test the format of the saved settings file"""
-        # Save default settings
+        # Save default settings and wait for the queued write
         self.settings_manager.save_settings()
+        self.settings_manager.flush()
         
         # Read the raw JSON
         with open(self.settings_file, 'r') as f:
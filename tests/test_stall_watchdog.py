@@ -0,0 +1,70 @@
+"""
+Tests for the GUI event-loop stall watchdog.
+"""
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.utils.stall_watchdog import StallWatchdog
+
+
+def _blocking_handler(seconds):
+    """Stands in for a slot that blocks the GUI thread"""
+    time.sleep(seconds)
+
+
+class TestStallWatchdog(unittest.TestCase):
+    """Test cases for StallWatchdog"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a QApplication instance if one doesn't exist"""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.watchdog = StallWatchdog(threshold_ms=100, sample_interval_ms=10)
+        self.addCleanup(self.watchdog.stop)
+
+    def _run_event_loop(self, seconds):
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.005)
+
+    def test_detects_stall_and_samples_stack(self):
+        """A blocked event loop is recorded with the blocking function as hot frame"""
+        self.watchdog.start()
+        self._run_event_loop(0.2)
+        self.assertEqual(self.watchdog.stall_count, 0)
+
+        with self.assertLogs("OnTime.Watchdog", level="WARNING") as logs:
+            _blocking_handler(0.4)
+            self._run_event_loop(0.2)
+
+        self.assertEqual(self.watchdog.stall_count, 1)
+        self.assertIn("stalled", logs.output[0])
+        stall = self.watchdog.stalls[0]
+        self.assertGreaterEqual(stall.duration_ms, 300)
+        self.assertGreater(stall.samples, 5)
+        self.assertEqual(stall.hot_frames(1)[0][0][2], "_blocking_handler")
+
+        report = self.watchdog.report()
+        self.assertEqual(report['stall_count'], 1)
+        self.assertIn("_blocking_handler", report['hot_frames'][0]['frame'])
+        self.assertIn("_blocking_handler", self.watchdog.format_report())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            saved = json.loads(self.watchdog.save_report(Path(tmp) / "stalls.json").read_text())
+        self.assertEqual(saved['stall_count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -329,6 +329,35 @@ class TestTimer(unittest.TestCase):
         # Check state
         self.assertEqual(self.timer.state, TimerState.OVERTIME)
 
+    @patch('src.models.timer.time.time')
+    def test_deadline(self, mock_time):
+        """Test the deadline only moves on pause/resume and adjustments"""
+        # Stopped timer has no deadline
+        self.assertIsNone(self.timer.deadline)
+
+        # Start at t=1000 with 60 seconds
+        mock_time.return_value = 1000.0
+        self.timer.start(60)
+        self.assertEqual(self.timer.deadline, 1060.0)
+
+        # Ticking does not move the deadline
+        mock_time.return_value = 1010.0
+        self.timer._update_timer()
+        self.assertEqual(self.timer.deadline, 1060.0)
+
+        # Paused timer has no deadline
+        self.timer.pause()
+        self.assertIsNone(self.timer.deadline)
+
+        # Resuming 5 seconds later pushes the deadline back by 5 seconds
+        mock_time.return_value = 1015.0
+        self.timer.resume()
+        self.assertEqual(self.timer.deadline, 1065.0)
+
+        # Adding a minute moves the deadline by a minute
+        self.timer.adjust_time(60)
+        self.assertEqual(self.timer.deadline, 1125.0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Tests for the chairman transition rules.
+"""
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the application code
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.meeting import MeetingPart, MeetingType
+from src.models import transition_rules
+from src.models.transition_rules import TransitionPlan, register_transition_rule
+
+
+class TestTransitionPlan(unittest.TestCase):
+    """Test cases for TransitionPlan"""
+
+    def setUp(self):
+        # Opening, talk, demonstration, CBS, review, closing
+        self.parts = [MeetingPart(title, minutes) for title, minutes in (
+            ("Opening Song and Prayer", 5), ("Talk", 10), ("Demonstration", 4),
+            ("Congregation Bible Study", 30), ("Review", 3), ("Closing Song and Prayer", 5)
+        )]
+
+    def _flags(self, plan):
+        return [plan.has_transition_after(i) for i in range(len(plan))]
+
+    def test_midweek(self):
+        """No transition after the opening, CBS, review or the last part"""
+        plan = TransitionPlan(MeetingType.MIDWEEK, self.parts)
+        self.assertEqual(self._flags(plan), [False, True, True, False, False, False])
+        self.assertEqual(plan.total, 2)
+        self.assertEqual(plan.remaining_from(2), 1)
+        self.assertEqual(plan.remaining_from(3), 0)
+        self.assertEqual(plan.between(0, 2), 1)
+
+        # A short CBS gets a transition
+        self.parts[3].duration_minutes = 20
+        self.assertEqual(TransitionPlan(MeetingType.MIDWEEK, self.parts).total, 3)
+
+    def test_weekend(self):
+        """Transitions only before the second and third parts"""
+        plan = TransitionPlan(MeetingType.WEEKEND, self.parts)
+        self.assertEqual(self._flags(plan), [True, True, False, False, False, False])
+
+    def test_default_and_registered_rules(self):
+        """Types without a rule get a transition after every part; rules are pluggable"""
+        plan = TransitionPlan(MeetingType.CUSTOM, self.parts)
+        self.assertEqual(plan.total, 5)
+        self.assertFalse(plan.has_transition_after(5))
+        self.assertFalse(plan.has_transition_after(-1))
+
+        with patch.dict(transition_rules._RULES):
+            register_transition_rule(MeetingType.CUSTOM, lambda parts, index: index % 2 == 1)
+            plan = TransitionPlan(MeetingType.CUSTOM, self.parts)
+            self.assertEqual(self._flags(plan), [False, True, False, True, False, False])
+
+    def test_empty_meeting(self):
+        """A meeting without parts has no transitions"""
+        plan = TransitionPlan(MeetingType.MIDWEEK, [])
+        self.assertEqual(plan.total, 0)
+        self.assertEqual(plan.remaining_from(0), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
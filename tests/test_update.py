@@ -4,36 +4,30 @@ Unit test for update checker for the application
 import sys
 import json
 import unittest
-import urllib.request
-import urllib.error
-import ssl
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import requests
 from PyQt6.QtWidgets import QApplication
+from src.utils.http_client import HttpClient
 from src.utils.update_checker import UpdateChecker, CURRENT_VERSION
+from tests.test_http_client import StandInServer
 
 # Ensure we have a Qt event loop for signals
 app = QApplication.instance() or QApplication(sys.argv)
 
-class FakeResponse:
-    def __init__(self, payload: dict):
-        self._data = json.dumps(payload).encode('utf-8')
-    def read(self):
-        return self._data
-    def __enter__(self):
-        return self
-    def __exit__(self, exc_type, exc, tb):
-        pass
 
 class TestUpdateChecker(unittest.TestCase):
-    def setUp(self):
-        # Restore original urlopen after every test
-        self._orig_urlopen = urllib.request.urlopen
-
-    def tearDown(self):
-        urllib.request.urlopen = self._orig_urlopen
+    def _serve_version(self, payload: dict):
+        """Serve version.json from a local server and point the checker at it"""
+        server = StandInServer({"/version.json": [(200, json.dumps(payload).encode('utf-8'))]})
+        server.__enter__()
+        self.addCleanup(server.__exit__)
+        url_patch = patch("src.utils.update_checker.UPDATE_CHECK_URL", server.url + "/version.json")
+        url_patch.start()
+        self.addCleanup(url_patch.stop)
 
     def test_is_newer_version(self):
         # older, same, and newer
@@ -44,8 +38,7 @@ class TestUpdateChecker(unittest.TestCase):
 
     def test_update_available_signal(self):
         # Simulate a remote version > CURRENT_VERSION
-        fake = {"version": "2.0.0"}
-        urllib.request.urlopen = lambda *args, **kwargs: FakeResponse(fake)
+        self._serve_version({"version": "2.0.0"})
 
         checker = UpdateChecker(silent=True)
         received = []
@@ -57,8 +50,7 @@ class TestUpdateChecker(unittest.TestCase):
 
     def test_no_update_available_signal(self):
         # Simulate remote == CURRENT_VERSION
-        fake = {"version": CURRENT_VERSION}
-        urllib.request.urlopen = lambda *args, **kwargs: FakeResponse(fake)
+        self._serve_version({"version": CURRENT_VERSION})
 
         checker = UpdateChecker(silent=True)
         received = []
@@ -68,13 +60,10 @@ class TestUpdateChecker(unittest.TestCase):
         self.assertEqual(len(received), 1)
 
     def test_error_occurred_signal_on_ssl_fail(self):
-        # Simulate an SSL error on urlopen
-        class FakeSSLReason(ssl.SSLError): pass
-        class FakeURLError(urllib.error.URLError):
-            def __init__(self):
-                super().__init__(FakeSSLReason("handshake fail"))
-
-        urllib.request.urlopen = lambda *args, **kwargs: (_ for _ in ()).throw(FakeURLError())
+        # Simulate an SSL error in the HTTP client
+        ssl_error = patch.object(HttpClient, "get", side_effect=requests.exceptions.SSLError("handshake fail"))
+        ssl_error.start()
+        self.addCleanup(ssl_error.stop)
 
         checker = UpdateChecker(silent=True)
         received = []